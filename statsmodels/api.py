@@ -1,30 +1,8 @@
-import iolib, datasets, tools
-from tools.tools import add_constant, categorical
-import regression
-from .regression.linear_model import OLS, GLS, WLS, GLSAR
-from .regression.quantile_regression import QuantReg
-from .genmod.generalized_linear_model import GLM
-from .genmod import families
-import robust
-from .robust.robust_linear_model import RLM
-from .discrete.discrete_model import (Poisson, Logit, Probit, MNLogit,
-                                      NegativeBinomial)
-from .tsa import api as tsa
-from .nonparametric import api as nonparametric
-import distributions
-from __init__ import test
+# the models and submodules are imported on first access, see
+# statsmodels.tools.lazy
+from statsmodels.tools.lazy import lazy_module as _lazy_module
 from . import version
 from info import __doc__
-from graphics.gofplots import qqplot, qqplot_2samples, qqline, ProbPlot
-from .graphics import api as graphics
-from .stats import api as stats
-from .emplike import api as emplike
-
-from .formula import api as formula
-
-from .iolib.smpickle import load_pickle as load
-
-from .tools.print_version import show_versions
 
 import os
 
@@ -36,3 +14,35 @@ if os.path.exists(chmpath):
 
 del os
 del chmpath
+
+_lazy_module(__name__,
+    modules={'iolib': 'statsmodels.iolib',
+             'datasets': 'statsmodels.datasets',
+             'tools': 'statsmodels.tools',
+             'regression': 'statsmodels.regression',
+             'families': 'statsmodels.genmod.families',
+             'robust': 'statsmodels.robust',
+             'tsa': 'statsmodels.tsa.api',
+             'nonparametric': 'statsmodels.nonparametric.api',
+             'distributions': 'statsmodels.distributions',
+             'graphics': 'statsmodels.graphics.api',
+             'stats': 'statsmodels.stats.api',
+             'emplike': 'statsmodels.emplike.api',
+             'formula': 'statsmodels.formula.api',
+             },
+    attributes=[
+        ('statsmodels.tools.tools', ['add_constant', 'categorical']),
+        ('statsmodels.regression.linear_model', ['OLS', 'GLS', 'WLS',
+                                                 'GLSAR']),
+        ('statsmodels.regression.quantile_regression', ['QuantReg']),
+        ('statsmodels.genmod.generalized_linear_model', ['GLM']),
+        ('statsmodels.robust.robust_linear_model', ['RLM']),
+        ('statsmodels.discrete.discrete_model', ['Poisson', 'Logit',
+                                                 'Probit', 'MNLogit',
+                                                 'NegativeBinomial']),
+        ('statsmodels', ['test']),
+        ('statsmodels.graphics.gofplots', ['qqplot', 'qqplot_2samples',
+                                           'qqline', 'ProbPlot']),
+        ('statsmodels.iolib.smpickle', [('load', 'load_pickle')]),
+        ('statsmodels.tools.print_version', ['show_versions']),
+        ])
@@ -23,17 +23,98 @@ def _asarray_2dcolumns(x):
     if np.asarray(x).ndim > 1 and np.asarray(x).squeeze().ndim == 1:
         return
 
-def _asarray_2d_null_rows(x):
+# number of rows that are processed at a time in the scans over the data,
+# this bounds the size of the temporary arrays
+_CHUNKSIZE = 2**14
+
+
+def _null_rows(x, chunksize=_CHUNKSIZE):
     """
-    Makes sure input is an array and is 2d. Makes sure output is 2d. True
-    indicates a null in the rows of 2d x.
+    Returns a 1d boolean array which is True for the rows of x that contain
+    a NaN. Float arrays, including memory-mapped arrays, are checked in
+    chunks of rows and are not copied.
     """
-    #Have to have the asarrays because isnull doesn't account for array-like
-    #input
     x = np.asarray(x)
     if x.ndim == 1:
         x = x[:,None]
-    return np.any(isnull(x), axis=1)[:,None]
+    if x.dtype.kind in 'biu':
+        return np.zeros(len(x), dtype=bool)
+    elif x.dtype.kind not in 'fc':
+        # object or structured arrays
+        return np.any(isnull(x), axis=1)
+    null_rows = np.empty(len(x), dtype=bool)
+    for start in range(0, len(x), chunksize):
+        chunk = x[start:start+chunksize]
+        np.isnan(chunk).any(1, out=null_rows[start:start+chunksize])
+    return null_rows
+
+
+def _column_range(x, skip=None, chunksize=_CHUNKSIZE):
+    """
+    Minimum and maximum of the columns of x in one chunked pass
+
+    Parameters
+    ----------
+    x : array-like
+        1d or 2d data
+    skip : None or 1d boolean array
+        If not None, then rows that are True in `skip` and rows that contain
+        a NaN are excluded. If None, then NaNs propagate.
+    chunksize : int
+        number of rows in a chunk
+
+    Returns
+    -------
+    null_rows : 1d boolean array or None
+        True for the rows that contain a NaN. None if `skip` is None.
+    xmin, xmax : ndarray
+        minimum and maximum of each column. These are NaN if all rows are
+        excluded.
+
+    Notes
+    -----
+    A column is constant if ``xmax - xmin == 0``. Contrary to the variance
+    this does not require a temporary array of the size of x, and it is
+    exact also for large constants.
+    """
+    x = np.asarray(x)
+    if x.ndim == 1:
+        x = x[:,None]
+    nobs, k_vars = x.shape
+    dtype = x.dtype if x.dtype.kind in 'fc' else np.float64
+    xmin = np.empty(k_vars, dtype=dtype)
+    xmin.fill(np.nan)
+    xmax = xmin.copy()
+    null_rows = None
+    if skip is not None:
+        null_rows = np.empty(nobs, dtype=bool)
+    first = True
+    for start in range(0, nobs, chunksize):
+        chunk = x[start:start+chunksize]
+        if skip is not None:
+            keep = null_rows[start:start+chunksize]
+            np.isnan(chunk).any(1, out=keep)
+            keep = ~(keep | skip[start:start+chunksize])
+            if not keep.all():
+                chunk = chunk[keep]
+            if len(chunk) == 0:
+                continue
+        if first:
+            xmin[:] = chunk.min(0)
+            xmax[:] = chunk.max(0)
+            first = False
+        else:
+            np.minimum(xmin, chunk.min(0), out=xmin)
+            np.maximum(xmax, chunk.max(0), out=xmax)
+    return null_rows, xmin, xmax
+
+
+def _asarray_2d_null_rows(x):
+    """
+    Makes sure input is an array and is 2d. Makes sure output is 2d. True
+    indicates a null in the rows of 2d x.
+    """
+    return _null_rows(x)[:,None]
 
 
 def _nan_rows(*arrs):
@@ -55,9 +136,18 @@ class ModelData(object):
     """
     Class responsible for handling input data and extracting metadata into the
     appropriate form
+
+    ndarrays, including memory-mapped arrays, are not copied unless rows
+    with NaNs are dropped or `dtype` requires a conversion. Constants and
+    NaN rows are detected in chunks of rows without temporary arrays of
+    the size of the data.
     """
     def __init__(self, endog, exog=None, missing='none', hasconst=None,
-                       **kwargs):
+                       dtype=None, **kwargs):
+        # min and max of the columns of exog if they are computed while
+        # checking for missing values
+        self._exog_range = None
+        self.missing_row_mask = None
         if missing != 'none':
             arrays, nan_idx = self._handle_missing(endog, exog, missing,
                                                        **kwargs)
@@ -73,6 +163,8 @@ class ModelData(object):
             self.orig_exog = exog
             self.endog, self.exog = self._convert_endog_exog(endog, exog)
 
+        if dtype is not None:
+            self._convert_dtype(dtype, kwargs)
         # this has side-effects, attaches k_constant and const_idx
         self._handle_constant(hasconst)
         self._check_integrity()
@@ -88,7 +180,8 @@ class ModelData(object):
                 self.const_idx = None
         else:
             try: # to detect where the constant is
-                const_idx = np.where(self.exog.var(axis = 0) == 0)[0].squeeze()
+                xmin, xmax = self._exog_range or _column_range(self.exog)[1:]
+                const_idx = np.where(xmax - xmin == 0)[0].squeeze()
                 self.k_constant = const_idx.size
                 if self.k_constant > 1:
                     raise ValueError("More than one constant detected.")
@@ -98,6 +191,25 @@ class ModelData(object):
                 self.const_idx = None
                 self.k_constant = 0
 
+    def _convert_dtype(self, dtype, kwargs):
+        """
+        Converts endog, exog and the extra float arrays to the float `dtype`.
+        Arrays that already have this dtype are not copied.
+        """
+        dtype = np.dtype(dtype)
+        if dtype.kind != 'f':
+            raise ValueError("dtype has to be a float dtype, got %s" % dtype)
+        if self.exog is not None and self.exog.dtype != dtype:
+            # rounding can make columns constant
+            self._exog_range = None
+        self.endog = np.asarray(self.endog, dtype=dtype)
+        if self.exog is not None:
+            self.exog = np.asarray(self.exog, dtype=dtype)
+        for key in kwargs:
+            value = getattr(self, key)
+            if isinstance(value, np.ndarray) and value.dtype.kind in 'fiub':
+                setattr(self, key, np.asarray(value, dtype=dtype))
+
     def _drop_nans(self, x, nan_mask):
         return x[nan_mask]
 
@@ -143,28 +255,49 @@ class ModelData(object):
                     raise ValueError("Arrays with more than 2 dimensions "
                             "aren't yet handled")
 
+        # float ndarray exog is checked for NaNs in the same chunked pass
+        # that computes the range of the columns of the remaining rows
+        scan_exog = (exog is not None and isinstance(exog, np.ndarray) and
+                     exog.dtype.kind == 'f' and exog.ndim <= 2)
+        if scan_exog:
+            combined = combined[:1] + combined[2:]
         nan_mask = _nan_rows(*combined)
         if combined_2d:
             nan_mask = _nan_rows(*(nan_mask[:,None],) + combined_2d)
+        if scan_exog:
+            combined = combined[:1] + (exog,) + combined[1:]
+            # one mask element for each row of exog, without a copy
+            rows = exog[:, 0] if exog.ndim == 2 else exog
+            nan_mask = np.broadcast_arrays(nan_mask, rows)[0]
+            exog_nan, xmin, xmax = _column_range(exog, skip=nan_mask)
+            nan_mask = nan_mask | exog_nan
+            self._exog_range = xmin, xmax
+
+        if missing not in ('raise', 'drop'):
+            raise ValueError("missing option %s not understood" % missing)
 
+        self.missing_row_mask = nan_mask
         if missing == 'raise' and np.any(nan_mask):
             raise MissingDataError("NaNs were encountered in the data")
-
-        elif missing == 'drop':
-            nan_mask = ~nan_mask
-            drop_nans = lambda x : self._drop_nans(x, nan_mask)
-            drop_nans_2d = lambda x : self._drop_nans_2d(x, nan_mask)
-            combined = dict(zip(combined_names, map(drop_nans, combined)))
-            if combined_2d:
-                combined.update(dict(zip(combined_2d_names,
-                                         map(drop_nans_2d, combined_2d))))
-            if none_array_names:
-                combined.update(dict(zip(none_array_names,
-                                         [None]*len(none_array_names)
-                                         )))
-            return combined, np.where(~nan_mask)[0].tolist()
-        else:
-            raise ValueError("missing option %s not understood" % missing)
+        elif not np.any(nan_mask):
+            # nothing to drop, keep references to the original arrays
+            combined = dict(zip(combined_names, combined))
+            combined.update(zip(combined_2d_names, combined_2d))
+            combined.update(dict.fromkeys(none_array_names))
+            return combined, []
+
+        nan_mask = ~nan_mask
+        drop_nans = lambda x : self._drop_nans(x, nan_mask)
+        drop_nans_2d = lambda x : self._drop_nans_2d(x, nan_mask)
+        combined = dict(zip(combined_names, map(drop_nans, combined)))
+        if combined_2d:
+            combined.update(dict(zip(combined_2d_names,
+                                     map(drop_nans_2d, combined_2d))))
+        if none_array_names:
+            combined.update(dict(zip(none_array_names,
+                                     [None]*len(none_array_names)
+                                     )))
+        return combined, np.where(~nan_mask)[0].tolist()
 
     def _convert_endog_exog(self, endog, exog):
 
@@ -359,11 +492,12 @@ def _make_endog_names(endog):
     return ynames
 
 def _make_exog_names(exog):
-    exog_var = exog.var(0)
-    if (exog_var == 0).any():
+    xmin, xmax = _column_range(exog)[1:]
+    exog_ptp = xmax - xmin
+    if (exog_ptp == 0).any():
         # assumes one constant in first or last position
         # avoid exception if more than one constant
-        const_idx = exog_var.argmin()
+        const_idx = (exog_ptp == 0).argmax()
         exog_names = ['x%d' % i for i in range(1,exog.shape[1])]
         exog_names.insert(const_idx, 'const')
     else:
@@ -371,9 +505,14 @@ def _make_exog_names(exog):
 
     return exog_names
 
-def handle_data(endog, exog, missing='none', hasconst=None, **kwargs):
+def handle_data(endog, exog, missing='none', hasconst=None, dtype=None,
+                **kwargs):
     """
     Given inputs
+
+    If `dtype` is not None, then endog, exog and the extra float arrays in
+    kwargs are converted to this float dtype, e.g. float32 to compute in
+    single precision.
     """
     # deal with lists and tuples up-front
     if isinstance(endog, (list, tuple)):
@@ -394,4 +533,5 @@ def handle_data(endog, exog, missing='none', hasconst=None, **kwargs):
         raise ValueError('unrecognized data structures: %s / %s' %
                          (type(endog), type(exog)))
 
-    return klass(endog, exog=exog, missing=missing, hasconst=hasconst, **kwargs)
+    return klass(endog, exog=exog, missing=missing, hasconst=hasconst,
+                 dtype=dtype, **kwargs)
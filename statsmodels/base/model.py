@@ -4,9 +4,11 @@ from statsmodels.base.data import handle_data
 from statsmodels.tools.tools import recipr, nan_dot
 from statsmodels.stats.contrast import ContrastResults
 from statsmodels.tools.decorators import (resettable_cache,
-                                                  cache_readonly)
+                                                  cache_readonly,
+                                                  ResettableCache)
 import statsmodels.base.wrapper as wrap
 from statsmodels.tools.numdiff import approx_fprime
+from statsmodels.tools.profiling import fit_profiling, current_trace
 from statsmodels.formula import handle_formula_data
 
 
@@ -31,6 +33,26 @@ _extra_param_doc = """hasconst : None or bool
         result statistics are calculated as if a constant is present. If
         False, a constant is not checked for and k_constant is set to 0.
         """
+_dtype_param_doc = """dtype : None or float dtype
+        If not None, then endog, exog and the other data arrays are converted
+        to this dtype. np.float32 computes the model in single precision,
+        which halves the memory of the data and of the intermediate arrays.
+        Arrays that already have this dtype, including memory-mapped
+        arrays, are not copied. The default None keeps the data as given.
+        With np.float32, params and bse agree with the float64 results to
+        about cond(exog) * 1e-6, use precision='mixed' instead if the
+        accuracy of float64 is needed.
+        """
+_precision_param_doc = """precision : None or 'mixed'
+        If 'mixed', then exog is stored in float32 and the products with exog,
+        e.g. X'X, X'y and the score and hessian, are accumulated in float64
+        in chunks of rows. This halves the memory of exog, params and bse
+        agree with the float64 results to about cond(exog) * 1e-7 relative
+        tolerance. See statsmodels.tools.precision. The default None
+        computes in the dtype of the data. Compared to dtype=np.float32,
+        endog and the intermediate arrays stay in float64, which is more
+        accurate, but uses more memory and is slower.
+        """
 
 class Model(object):
     __doc__ = """
@@ -46,10 +68,24 @@ class Model(object):
     will change as well.
     """ % {'params_doc' : _model_params_doc,
             'extra_params_doc' : _missing_param_doc + _extra_param_doc}
+    # None or 'mixed', see _precision_param_doc
+    precision = None
+
     def __init__(self, endog, exog=None, **kwargs):
         missing = kwargs.pop('missing', 'none')
         hasconst = kwargs.pop('hasconst', None)
-        self.data = handle_data(endog, exog, missing, hasconst, **kwargs)
+        dtype = kwargs.pop('dtype', None)
+        precision = kwargs.pop('precision', None)
+        if precision not in (None, 'mixed'):
+            raise ValueError("precision has to be None or 'mixed', got %s"
+                             % precision)
+        self.data = handle_data(endog, exog, missing, hasconst, dtype=dtype,
+                                **kwargs)
+        if precision == 'mixed' and self.data.exog is not None:
+            # only exog is stored in single precision, endog and the weights
+            # are vectors and keep their dtype
+            self.data.exog = np.asarray(self.data.exog, dtype=np.float32)
+        self.precision = precision
         self.k_constant = self.data.k_constant
         self.exog = self.data.exog
         self.endog = self.data.endog
@@ -79,7 +115,13 @@ class Model(object):
         args : extra arguments
             These are passed to the model
         kwargs : extra keyword arguments
-            These are passed to the model.
+            These are passed to the model, except for `design_cache`.
+        design_cache : None, True or DesignCache instance
+            Keyword only. If not None, then the design matrices are taken
+            from a `statsmodels.formula.formulatools.DesignCache`, True uses
+            the default cache. Designs for subsets of the data are sliced
+            from the design of the full data, see DesignCache for the
+            differences to building the design on the subset.
 
         Returns
         -------
@@ -93,9 +135,17 @@ class Model(object):
         """
         #TODO: provide a docs template for args/kwargs from child models
         #TODO: subset could use syntax. issue #469.
-        if subset is not None:
-            data= data.ix[subset]
-        endog, exog = handle_formula_data(data, None, formula)
+        design_cache = kwargs.pop('design_cache', None)
+        if design_cache is not None:
+            if design_cache is True:
+                from statsmodels.formula.formulatools import design_cache
+            endog, exog = design_cache.design(formula, data, subset, depth=1)
+            if subset is not None:
+                data = data.ix[subset]
+        else:
+            if subset is not None:
+                data= data.ix[subset]
+            endog, exog = handle_formula_data(data, None, formula)
         mod = cls(endog, exog, *args, **kwargs)
         mod.formula = formula
 
@@ -175,6 +225,7 @@ class LikelihoodModel(Model):
         """
         raise NotImplementedError
 
+    @fit_profiling
     def fit(self, start_params=None, method='newton', maxiter=100,
             full_output=True, disp=True, fargs=(), callback=None,
             retall=False, **kwargs):
@@ -350,11 +401,20 @@ class LikelihoodModel(Model):
             hess = lambda params: self.hessian(params) / nobs
             #TODO: why are score and hess positive?
 
+        trace = current_trace()
+        trace.update(method=method)
+        f = trace.counted('loglike', f)
+        score = trace.counted('score', score)
+        if hess is not None:
+            hess = trace.counted('hessian', hess)
+        callback = trace.wrap_callback(callback, start_params)
+
         func = fit_funcs[method]
-        xopt, retvals = func(f, score, start_params, fargs, kwargs,
-                             disp=disp, maxiter=maxiter, callback=callback,
-                             retall=retall, full_output=full_output,
-                             hess=hess)
+        with trace.stage('optimizer'):
+            xopt, retvals = func(f, score, start_params, fargs, kwargs,
+                                 disp=disp, maxiter=maxiter,
+                                 callback=callback, retall=retall,
+                                 full_output=full_output, hess=hess)
 
         if not full_output: # xopt should be None and retvals is argmin
             xopt = retvals
@@ -365,7 +425,8 @@ class LikelihoodModel(Model):
             Hinv = np.linalg.inv(-retvals['Hessian']) / nobs
         else:
             try:
-                Hinv = np.linalg.inv(-1 * self.hessian(xopt))
+                with trace.stage('cov_params'):
+                    Hinv = np.linalg.inv(-1 * self.hessian(xopt))
             except:
                 #might want custom warning ResultsWarning? NumericalWarning?
                 from warnings import warn
@@ -380,6 +441,7 @@ class LikelihoodModel(Model):
         #TODO: hardcode scale?
         if isinstance(retvals, dict):
             mlefit.mle_retvals = retvals
+            trace.update(converged=retvals.get('converged'))
         optim_settings = {'optimizer': method, 'start_params': start_params,
                           'maxiter': maxiter, 'full_output': full_output,
                           'disp': disp, 'fargs': fargs, 'callback': callback,
@@ -646,6 +708,19 @@ class GenericLikelihoodModel(LikelihoodModel):
     Hessian is not positive definite the covariance matrix of the parameter
     estimates based on the outer product of the Jacobian might still be valid.
 
+    The options of the numerical derivatives can be set with the keyword
+    `numdiff_kwds`, a dictionary that is used in score, jac and hessian. For
+    example, ``numdiff_kwds=dict(vectorized=True)`` can be used if loglike
+    and loglikeobs accept a 2-dim array with one parameter vector in each
+    row, and ``numdiff_kwds=dict(n_jobs=4)`` evaluates the log-likelihood
+    in parallel. See `statsmodels.tools.numdiff.approx_fprime`.
+
+    The log-likelihood at the center params of the numerical derivatives is
+    reused by the Hessian and by forward differences of the score at the same
+    params, e.g. in each step of 'newton'. This assumes that loglike only
+    depends on params. The centered differences of the default score have
+    no evaluation points in common with the Hessian.
+
 
     Examples
     --------
@@ -666,6 +741,8 @@ class GenericLikelihoodModel(LikelihoodModel):
     np.allclose(res.params, probit_res.params)
 
     """
+    numdiff_kwds = None
+
     def __init__(self, endog, exog=None, loglike=None, score=None,
                  hessian=None, missing='none', extra_params_names=None, **kwds):
     # let them be none in case user wants to use inheritance
@@ -678,6 +755,8 @@ class GenericLikelihoodModel(LikelihoodModel):
         self.confint_dist = stats.norm
 
         self.__dict__.update(kwds)
+        # copy, so that instances don't share the options
+        self.numdiff_kwds = dict(self.numdiff_kwds or {})
 
         # TODO: data structures?
 
@@ -769,12 +848,29 @@ class GenericLikelihoodModel(LikelihoodModel):
     def loglikeobs(self, params):
         return -self.nloglikeobs(params)
 
+    def _loglike_center(self, params, vectorized=False):
+        '''loglike at params, the last value is reused at the same params'''
+        params = np.asarray(params)
+        cached = getattr(self, '_center', None)
+        if (cached is not None and cached[0].shape == params.shape and
+                np.all(cached[0] == params)):
+            return cached[1]
+        if vectorized:
+            value = np.asarray(self.loglike(params[None, :])).reshape(-1)[0]
+        else:
+            value = self.loglike(params)
+        self._center = (params.copy(), value)
+        return value
+
     def score(self, params):
         '''
         Gradient of log-likelihood evaluated at params
         '''
-        kwds = {}
+        kwds = dict(self.numdiff_kwds)
         kwds.setdefault('centered', True)
+        if not kwds['centered']:
+            kwds['f0'] = self._loglike_center(params,
+                                              kwds.get('vectorized', False))
         return approx_fprime(params, self.loglike, **kwds).ravel()
 
     def jac(self, params, **kwds):
@@ -783,6 +879,7 @@ class GenericLikelihoodModel(LikelihoodModel):
         observation.
         '''
         #kwds.setdefault('epsilon', 1e-4)
+        kwds = dict(self.numdiff_kwds, **kwds)
         kwds.setdefault('centered', True)
         return approx_fprime(params, self.loglikeobs, **kwds)
 
@@ -792,7 +889,10 @@ class GenericLikelihoodModel(LikelihoodModel):
         '''
         from statsmodels.tools.numdiff import approx_hess
         # need options for hess (epsilon)
-        return approx_hess(params, self.loglike)
+        kwds = dict(self.numdiff_kwds)
+        kwds.pop('centered', None)
+        kwds['f0'] = self._loglike_center(params, kwds.get('vectorized', False))
+        return approx_hess(params, self.loglike, **kwds)
 
     def fit(self, start_params=None, method='nm', maxiter=500, full_output=1,
             disp=1, callback=None, retall=0, **kwargs):
@@ -867,18 +967,50 @@ class Results(object):
             a model y ~ log(x1) + log(x2), and transform is True, then
             you can pass a data structure that contains x1 and x2 in
             their original form. Otherwise, you'd need to log the data
-            first.
+            first. The stored design of the model is applied to the data,
+            the formula is not parsed again.
 
         Returns
         -------
         See self.model.predict
         """
         if transform and hasattr(self.model, 'formula') and exog is not None:
-            from patsy import dmatrix
-            exog = dmatrix(self.model.data.orig_exog.design_info.builder,
-                    exog)
+            from statsmodels.formula.formulatools import build_design_matrix
+            exog = build_design_matrix(
+                    self.model.data.orig_exog.design_info, exog)
         return self.model.predict(self.params, exog, *args, **kwargs)
 
+    def evict_cache(self, min_nbytes=0):
+        """
+        Remove computed arrays from the cache to reduce memory
+
+        The removed attributes, e.g. resid, fittedvalues or the HC standard
+        errors, are computed again when they are used. In contrast to
+        remove_data, the results stay usable.
+
+        Parameters
+        ----------
+        min_nbytes : int
+            Only values with at least this size in bytes are removed. The
+            default removes all computed arrays.
+
+        Returns
+        -------
+        nbytes : int
+            total size in bytes of the removed values
+
+        Notes
+        -----
+        Values cannot be computed again if the data have been removed with
+        remove_data. A global memory budget for the cached values of all
+        results is set with
+        :func:`statsmodels.tools.decorators.set_cache_budget`.
+        """
+        cache = getattr(self, '_cache', None)
+        if isinstance(cache, ResettableCache):
+            return cache.evict(min_nbytes)
+        return 0
+
 
 #TODO: public method?
 class LikelihoodModelResults(Results):
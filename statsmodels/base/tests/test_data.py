@@ -611,6 +611,73 @@ class TestMissingPandas(object):
         np.testing.assert_(data.row_labels.equals(labels))
 
 
+class TestLeanData(object):
+    @classmethod
+    def setupClass(cls):
+        np.random.seed(12345)
+        X = np.random.random((50, 4))
+        X[:,0] = 1
+        X[:,2] = 2.5
+        y = np.random.random(50)
+        y[10] = np.nan
+        X[2,3] = np.nan
+        X[14,0] = np.nan
+        # column 2 is constant after dropping the row where y is NaN
+        X[10,2] = 3.
+        cls.y, cls.X = y, X
+
+    def test_chunks(self):
+        null_rows = sm_data._null_rows(self.X, chunksize=7)
+        np.testing.assert_equal(null_rows, pandas.isnull(self.X).any(1))
+        skip = np.isnan(self.y)
+        null_rows, xmin, xmax = sm_data._column_range(self.X, skip=skip,
+                                                      chunksize=7)
+        keep = ~(np.isnan(self.X).any(1) | skip)
+        np.testing.assert_equal(xmin, self.X[keep].min(0))
+        np.testing.assert_equal(xmax, self.X[keep].max(0))
+        xmin, xmax = sm_data._column_range(self.X, chunksize=7)[1:]
+        np.testing.assert_equal(xmin, self.X.min(0))
+        np.testing.assert_equal(xmax, self.X.max(0))
+
+    def test_drop(self):
+        data = sm_data.handle_data(self.y, self.X, 'drop')
+        mask = np.isnan(np.c_[self.y, self.X]).any(1)
+        np.testing.assert_equal(data.missing_row_mask, mask)
+        np.testing.assert_equal(data.missing_row_idx, [2, 10, 14])
+        np.testing.assert_equal(data.exog, self.X[~mask])
+        # the column with NaN and the column constant after dropping are
+        # two constants, same as if the rows are dropped beforehand
+        ref = sm_data.handle_data(self.y[~mask], self.X[~mask])
+        np.testing.assert_equal(ref.k_constant, 0)
+        np.testing.assert_equal(data.k_constant, ref.k_constant)
+
+        data = sm_data.handle_data(self.y[~mask], self.X[~mask, 1:], 'drop')
+        np.testing.assert_equal(data.k_constant, 1)
+        np.testing.assert_equal(data.const_idx, 1)
+
+    def test_no_copy(self):
+        import tempfile
+        X = self.X[np.isfinite(self.X).all(1)]
+        y = np.arange(len(X), dtype=np.float32)
+        with tempfile.TemporaryFile() as fh:
+            Xm = np.memmap(fh, dtype=np.float32, shape=X.shape)
+            Xm[:] = X
+            for missing in ['none', 'drop', 'raise']:
+                data = sm_data.handle_data(y, Xm, missing)
+                np.testing.assert_(np.may_share_memory(data.exog, Xm))
+                np.testing.assert_(data.endog is y)
+                np.testing.assert_equal(data.exog.dtype, np.float32)
+                np.testing.assert_equal(data.const_idx, 0)
+            data = sm_data.handle_data(y, Xm, dtype=np.float32)
+            np.testing.assert_(np.may_share_memory(data.exog, Xm))
+            data = sm_data.handle_data(y, X, dtype=np.float32,
+                                       weights=np.ones(len(X)))
+            np.testing.assert_equal(data.exog, X.astype(np.float32))
+            np.testing.assert_equal(data.weights.dtype, np.float32)
+            np.testing.assert_raises(ValueError, sm_data.handle_data, y, X,
+                                     dtype=int)
+
+
 class TestConstant(object):
     @classmethod
     def setupClass(cls):
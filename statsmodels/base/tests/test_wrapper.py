@@ -0,0 +1,99 @@
+'''Tests for the results wrapper and benchmark of attribute access
+
+Run as a script to print the time of attribute access of wrapped and bare
+results.
+'''
+
+import pickle
+import timeit
+
+import numpy as np
+import pandas
+from numpy.testing import assert_, assert_equal
+
+import statsmodels.api as sm
+
+
+def _get_data(nobs=100):
+    np.random.seed(3456)
+    exog = pandas.DataFrame(np.random.randn(nobs, 3), columns=['a', 'b', 'c'])
+    exog['const'] = 1.
+    endog = pandas.Series(exog.sum(1) + np.random.randn(nobs), name='y')
+    return endog, exog
+
+
+class TestWrapperCache(object):
+
+    @classmethod
+    def setup_class(cls):
+        cls.endog, cls.exog = _get_data()
+        cls.res = sm.OLS(cls.endog, cls.exog).fit()
+
+    def test_memoized(self):
+        res = self.res
+        params = res.params
+        assert_(isinstance(params, pandas.Series))
+        assert_(res.params is params)
+        assert_(res.resid is res.resid)
+        assert_(res.bse is res.bse)
+        assert_equal(list(params.index), list(self.exog.columns))
+
+    def test_reset(self):
+        res = sm.OLS(self.endog, self.exog).fit()
+        resid = res.resid
+        # reset the cached value in the results
+        res._results._cache['resid'] = None
+        resid2 = res.resid
+        assert_(resid2 is not resid)
+        assert_equal(resid2.values, resid.values)
+        res._results.params = res._results.params * 2
+        assert_equal(res.params.values, 2 * self.res.params.values)
+
+    def test_pickle(self):
+        res = sm.OLS(self.endog, self.exog).fit()
+        res.params
+        state = res.__getstate__()
+        assert_('_wrapped_cache' not in state)
+        res2 = pickle.loads(pickle.dumps(res))
+        assert_equal(res2.params.values, res.params.values)
+        assert_(res2.params is res2.params)
+
+    def test_nowrap(self):
+        for mod in [sm.OLS(self.endog, self.exog),
+                    sm.WLS(self.endog, self.exog, weights=2.),
+                    sm.RLM(self.endog, self.exog),
+                    sm.GLM(self.endog, self.exog)]:
+            res = mod.fit()
+            res_bare = mod.fit(wrap=False)
+            assert_(not hasattr(res_bare, '_results'))
+            assert_(type(res_bare) is type(res._results))
+            assert_(isinstance(res_bare.params, np.ndarray))
+            assert_equal(res_bare.params, res.params.values)
+            assert_equal(res_bare.bse, res.bse.values)
+
+
+def time_access(nobs=100, number=100000):
+    '''time of reading params, bse and resid of wrapped and bare results
+
+    returns a dict with the time per access in microseconds
+    '''
+    endog, exog = _get_data(nobs)
+    mod = sm.OLS(endog, exog)
+    results = {'wrapped': mod.fit(), 'bare': mod.fit(wrap=False)}
+    times = {}
+    for name, res in results.items():
+        for attr in ['params', 'bse', 'resid']:
+            getattr(res, attr)
+            t = min(timeit.repeat(lambda: getattr(res, attr), repeat=3,
+                                  number=number))
+            times[name, attr] = 1e6 * t / number
+    return times
+
+
+if __name__ == '__main__':
+    times = time_access()
+    print '%-10s %10s %10s' % ('attribute', 'wrapped', 'bare')
+    for attr in ['params', 'bse', 'resid']:
+        print '%-10s %10.3f %10.3f' % (attr, times['wrapped', attr],
+                                       times['bare', attr])
+    print 'time per access in microseconds'
@@ -3,11 +3,23 @@ import functools
 
 import numpy as np
 
+from statsmodels.tools.decorators import _budget, _nbytes
+
+
+def _evictable(obj):
+    return (_budget.max_bytes is not None and
+            _nbytes(obj) >= _budget.min_nbytes)
+
 
 class ResultsWrapper(object):
     """
     Class which wraps a statsmodels estimation Results class and steps in to
     reattach metadata to results (if available)
+
+    Wrapped attributes are memoized. The wrapped output is reused as long as
+    the results instance returns the same object for the attribute, so
+    values that are reset in the ResettableCache of the results are wrapped
+    again on the next access.
     """
     _wrap_attrs = {}
     _wrap_methods = {}
@@ -15,38 +27,57 @@ class ResultsWrapper(object):
     def __init__(self, results):
         self._results = results
         self.__doc__ = results.__doc__
+        self._wrapped_cache = {}
 
     def __dir__(self):
         return [x for x in dir(self._results)]
 
-    def __getattribute__(self, attr):
-        get = lambda name: object.__getattribute__(self, name)
-
+    def __getattr__(self, attr):
+        # only called if attr is not found on the wrapper itself
+        dict_ = self.__dict__
         try:
-            results = get('_results')
-        except AttributeError:
-            pass
-
-        try:
-            return get(attr)
-        except AttributeError:
-            pass
+            results = dict_['_results']
+        except KeyError:
+            # not initialized, e.g. while unpickling
+            raise AttributeError(attr)
 
         obj = getattr(results, attr)
-        data = results.model.data
         how = self._wrap_attrs.get(attr)
         if how:
-            obj = data.wrap_output(obj, how=how)
+            cache = dict_.get('_wrapped_cache')
+            if cache is None:
+                cache = dict_['_wrapped_cache'] = {}
+            cached = cache.get(attr)
+            if cached is not None and cached[0] is obj:
+                return cached[1]
+            wrapped = results.model.data.wrap_output(obj, how=how)
+            # values that can be evicted from the cache of the results are
+            # not kept alive by the memo
+            if not _evictable(obj):
+                cache[attr] = (obj, wrapped)
+            return wrapped
 
         return obj
 
     def __getstate__(self):
         #print 'pickling wrapper', self.__dict__
-        return self.__dict__
+        # the wrapped outputs are recreated on access
+        dict_ = self.__dict__.copy()
+        dict_.pop('_wrapped_cache', None)
+        return dict_
 
     def __setstate__(self, dict_):
         #print 'unpickling wrapper', dict_
         self.__dict__.update(dict_)
+        self._wrapped_cache = {}
+
+    def evict_cache(self, min_nbytes=0):
+        """remove computed arrays from the cache, see Results.evict_cache
+
+        The memoized wrapped outputs are also removed.
+        """
+        self._wrapped_cache = {}
+        return self._results.evict_cache(min_nbytes=min_nbytes)
 
     def save(self, fname, remove_data=False):
         '''save a pickle of this instance
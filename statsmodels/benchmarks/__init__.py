@@ -0,0 +1,15 @@
+'''Benchmarks of the estimators and statistical functions
+
+The benchmarks measure the time and the peak memory of model fits and other
+functions on synthetic data of different sizes and on datasets in
+`statsmodels.datasets`. Run all benchmarks of the default preset with::
+
+    python -m statsmodels.benchmarks --output bench.json
+
+and compare a later run to it with ``--baseline bench.json``. See
+`statsmodels.benchmarks.runner` for the options and
+`statsmodels.benchmarks.suite` for the benchmark definitions.
+'''
+
+from statsmodels.benchmarks.suite import benchmarks, benchmark, PRESETS
+from statsmodels.benchmarks.runner import run, compare, save, load
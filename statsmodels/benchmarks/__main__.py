@@ -0,0 +1,5 @@
+import sys
+
+from statsmodels.benchmarks.runner import main
+
+sys.exit(main())
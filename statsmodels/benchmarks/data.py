@@ -0,0 +1,89 @@
+'''Synthetic data and datasets for the benchmarks
+
+All generators take the sample size and a seed, so that the same data is used
+in each run of a benchmark.
+
+License: BSD-3
+'''
+
+import numpy as np
+
+
+def _exog(nobs, k, rs):
+    '''design matrix with a constant in the first column'''
+    exog = np.empty((nobs, k))
+    exog[:, 0] = 1.
+    exog[:, 1:] = rs.randn(nobs, k - 1)
+    return exog
+
+
+def _params(k, scale):
+    # decreasing coefficients keep the linear predictor in a moderate range
+    return scale * np.linspace(1, -1, k) / np.sqrt(k)
+
+
+def make_regression(nobs, k, seed=0):
+    '''linear model with normal errors, returns endog, exog'''
+    rs = np.random.RandomState(seed)
+    exog = _exog(nobs, k, rs)
+    endog = np.dot(exog, _params(k, 1.)) + rs.randn(nobs)
+    return endog, exog
+
+
+def make_binary(nobs, k, seed=0):
+    '''logit model, returns endog, exog'''
+    rs = np.random.RandomState(seed)
+    exog = _exog(nobs, k, rs)
+    prob = 1. / (1 + np.exp(-np.dot(exog, _params(k, 1.))))
+    endog = (rs.uniform(size=nobs) < prob).astype(float)
+    return endog, exog
+
+
+def make_count(nobs, k, seed=0, alpha=0):
+    '''Poisson model, or negative binomial if alpha > 0, returns endog, exog
+    '''
+    rs = np.random.RandomState(seed)
+    exog = _exog(nobs, k, rs)
+    mu = np.exp(np.dot(exog, _params(k, 0.5)))
+    if alpha > 0:
+        # gamma mixture of Poisson with variance mu + alpha * mu**2
+        mu = mu * rs.gamma(1. / alpha, alpha, size=nobs)
+    endog = rs.poisson(mu).astype(float)
+    return endog, exog
+
+
+def make_arma(nobs, ar=(0.5,), ma=(0.3,), seed=0):
+    '''ARMA process'''
+    from statsmodels.tsa.arima_process import arma_generate_sample
+    np.random.seed(seed)
+    return arma_generate_sample(np.r_[1, -np.asarray(ar)],
+                                np.r_[1, np.asarray(ma)], nobs)
+
+
+def make_var(nobs, neqs, seed=0):
+    '''stationary VAR(1) process with `neqs` equations'''
+    rs = np.random.RandomState(seed)
+    coefs = 0.5 * np.eye(neqs) + 0.1 / neqs
+    y = np.zeros((nobs, neqs))
+    e = rs.randn(nobs, neqs)
+    y[0] = e[0]
+    for t in range(1, nobs):
+        y[t] = np.dot(coefs, y[t-1]) + e[t]
+    return y
+
+
+def make_groups(nobs, ngroups, seed=0):
+    '''group labels for cluster robust covariances'''
+    rs = np.random.RandomState(seed)
+    return np.sort(rs.randint(ngroups, size=nobs))
+
+
+def load_dataset(name):
+    '''endog and exog with constant of a dataset in statsmodels.datasets'''
+    from importlib import import_module
+    from statsmodels.tools.tools import add_constant
+    data = import_module('statsmodels.datasets.%s' % name).load()
+    exog = np.asarray(data.exog)
+    if exog.dtype.names is not None:
+        exog = exog.view(float).reshape(len(exog), -1)
+    return np.asarray(data.endog, float), add_constant(exog, prepend=True)
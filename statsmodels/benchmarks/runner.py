@@ -0,0 +1,354 @@
+'''Run the benchmarks, store the results as JSON and compare to a baseline
+
+From the command line::
+
+    python -m statsmodels.benchmarks --preset small --output bench.json
+    python -m statsmodels.benchmarks --baseline bench.json --bench ols
+
+Each benchmark case runs by default in a new python process, so that the
+peak memory of one case is not affected by the other cases. The time of a
+case is the best time per call over `repeat` repetitions, a repetition calls
+the function often enough to take at least `min_time` seconds. The first
+call is not timed.
+
+License: BSD-3
+'''
+
+import os
+import re
+import sys
+import json
+import time
+import platform
+import subprocess
+from inspect import getargspec
+
+from statsmodels.benchmarks.suite import benchmarks, PRESETS
+from statsmodels.tools.profiling import _maxrss
+
+FORMAT_VERSION = 1
+
+
+def time_func(func, repeat=3, min_time=0.1):
+    '''
+    time per call of func
+
+    Returns
+    -------
+    times : list
+        time per call in seconds for each repetition
+    '''
+    t0 = time.time()
+    func()
+    first = time.time() - t0
+    number = max(1, min(int(min_time / max(first, 1e-6)), 10000))
+    times = []
+    for _ in range(repeat):
+        t0 = time.time()
+        for _ in range(number):
+            func()
+        times.append((time.time() - t0) / number)
+    return times
+
+
+def run_case(name, params, repeat=3, min_time=0.1):
+    '''
+    run one benchmark case in this process
+
+    Returns
+    -------
+    result : dict
+        `name`, `params`, `time`, the best time per call in seconds, `times`,
+        the times of the repetitions, `peak_memory`, the increase of the peak
+        resident set size in MB during the timed calls, and `maxrss`, the
+        peak resident set size of the process in MB.
+    '''
+    func = benchmarks[name].setup(**params)
+    rss0 = _maxrss()
+    times = time_func(func, repeat=repeat, min_time=min_time)
+    maxrss = _maxrss()
+    return {'name': name, 'params': params, 'time': min(times),
+            'times': times, 'peak_memory': maxrss - rss0, 'maxrss': maxrss}
+
+
+_child = '''\
+import sys, json, warnings
+warnings.simplefilter('ignore')
+from statsmodels.benchmarks.runner import run_case
+print(json.dumps(run_case(*json.loads(sys.argv[1]))))
+'''
+
+
+def _run_isolated(name, params, repeat, min_time):
+    '''run one case in a new python process'''
+    import statsmodels
+    root = os.path.dirname(os.path.dirname(os.path.abspath(
+        statsmodels.__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([root] +
+                                        [p for p in [env.get('PYTHONPATH')]
+                                         if p])
+    args = json.dumps([name, params, repeat, min_time])
+    proc = subprocess.Popen([sys.executable, '-c', _child, args], env=env,
+                            stdout=subprocess.PIPE)
+    out = proc.communicate()[0]
+    if proc.returncode != 0:
+        raise RuntimeError('benchmark %s failed with exit status %d'
+                           % (name, proc.returncode))
+    return json.loads(out.splitlines()[-1])
+
+
+def _case_params(bench, preset, sizes):
+    if sizes is None:
+        return bench.params(preset)
+    # keep the size parameters that the benchmark takes, benchmarks
+    # without size parameters run once
+    argnames = getargspec(bench.setup).args
+    cases = []
+    for params in sizes:
+        params = dict((k, v) for k, v in params.items() if k in argnames)
+        if sorted(params) == sorted(argnames) and params not in cases:
+            cases.append(params)
+    return cases
+
+
+def select(pattern=None):
+    '''names of the benchmarks that match the regular expression pattern'''
+    if pattern is None:
+        return list(benchmarks)
+    return [name for name in benchmarks if re.search(pattern, name)]
+
+
+def run(names=None, preset='small', sizes=None, repeat=3, min_time=0.1,
+        isolate=True, verbose=False):
+    '''
+    Run benchmarks
+
+    Parameters
+    ----------
+    names : list of strings, optional
+        names of the benchmarks, the default is all benchmarks
+    preset : string
+        one of 'quick', 'small', 'medium' and 'large', defines the sizes of
+        the benchmarks
+    sizes : list of dict, optional
+        if given, then the benchmarks run with these parameters instead of
+        the sizes of the preset, e.g. ``[{'nobs': 10**6, 'k': 10}]``.
+        Benchmarks that do not take all parameters of an item are skipped
+        for this item.
+    repeat : int
+        number of repetitions of the timing
+    min_time : float
+        minimum time of a repetition in seconds
+    isolate : bool
+        If True, then each case runs in a new python process.
+    verbose : bool
+        If True, then each result is printed when it is available.
+
+    Returns
+    -------
+    results : dict
+        `meta` describes the environment, `results` is a list of the results
+        of the cases, see `run_case`.
+    '''
+    if preset not in PRESETS:
+        raise ValueError('preset has to be one of %s' % ', '.join(PRESETS))
+    if names is None:
+        names = list(benchmarks)
+    results = []
+    for name in names:
+        for params in _case_params(benchmarks[name], preset, sizes):
+            if isolate:
+                res = _run_isolated(name, params, repeat, min_time)
+            else:
+                res = run_case(name, params, repeat, min_time)
+            results.append(res)
+            if verbose:
+                print(format_results([res], header=False))
+                sys.stdout.flush()
+    return {'meta': _meta(preset, repeat), 'results': results}
+
+
+def _meta(preset, repeat):
+    import numpy
+    import scipy
+    from statsmodels import version
+    return {'format_version': FORMAT_VERSION,
+            'statsmodels': version.full_version,
+            'numpy': numpy.__version__, 'scipy': scipy.__version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'preset': preset, 'repeat': repeat}
+
+
+def save(results, fname):
+    '''save the results of `run` as JSON'''
+    with open(fname, 'w') as fh:
+        json.dump(results, fh, indent=1, sort_keys=True)
+
+
+def load(fname):
+    '''load results that were saved by `save`'''
+    with open(fname) as fh:
+        results = json.load(fh)
+    version = results.get('meta', {}).get('format_version')
+    if version != FORMAT_VERSION:
+        raise ValueError('benchmark results format %s is not supported'
+                         % version)
+    return results
+
+
+def _key(res):
+    return res['name'], json.dumps(res['params'], sort_keys=True)
+
+
+def compare(results, baseline, threshold=0.2):
+    '''
+    Compare results to baseline results
+
+    Parameters
+    ----------
+    results, baseline : dict
+        results returned by `run` or `load`
+    threshold : float
+        relative change of the time that is considered as a difference
+
+    Returns
+    -------
+    comparison : list of dict
+        one item for each case in results, with `name`, `params`, `time`,
+        `baseline_time`, `ratio` of time to baseline time, `peak_memory`,
+        `baseline_peak_memory` and `status`. Status is 'slower' or 'faster'
+        if the ratio differs by more than threshold from 1, 'new' if the case
+        is not in baseline and 'same' otherwise.
+    '''
+    base = dict((_key(res), res) for res in baseline['results'])
+    comparison = []
+    for res in results['results']:
+        row = {'name': res['name'], 'params': res['params'],
+               'time': res['time'], 'peak_memory': res['peak_memory'],
+               'baseline_time': None, 'baseline_peak_memory': None,
+               'ratio': None, 'status': 'new'}
+        bres = base.get(_key(res))
+        if bres is not None:
+            ratio = res['time'] / bres['time']
+            if ratio > 1 + threshold:
+                status = 'slower'
+            elif ratio < 1 / (1 + threshold):
+                status = 'faster'
+            else:
+                status = 'same'
+            row.update(baseline_time=bres['time'],
+                       baseline_peak_memory=bres['peak_memory'],
+                       ratio=ratio, status=status)
+        comparison.append(row)
+    return comparison
+
+
+def _format_params(params):
+    return ', '.join('%s=%s' % item for item in sorted(params.items()))
+
+
+def format_results(results, header=True):
+    '''table of results as string'''
+    lines = []
+    if header:
+        lines.append('%-20s %-20s %12s %12s' % ('benchmark', 'params',
+                                               'time (ms)', 'memory (MB)'))
+    for res in results:
+        lines.append('%-20s %-20s %12.3f %12.1f'
+                     % (res['name'], _format_params(res['params']),
+                        1e3 * res['time'], res['peak_memory']))
+    return '\n'.join(lines)
+
+
+def format_comparison(comparison):
+    '''table of a comparison as string'''
+    lines = ['%-20s %-20s %12s %12s %8s  %s'
+             % ('benchmark', 'params', 'time (ms)', 'base (ms)', 'ratio',
+                'status')]
+    for row in comparison:
+        if row['ratio'] is None:
+            base, ratio = '-', '-'
+        else:
+            base = '%.3f' % (1e3 * row['baseline_time'])
+            ratio = '%.2f' % row['ratio']
+        lines.append('%-20s %-20s %12.3f %12s %8s  %s'
+                     % (row['name'], _format_params(row['params']),
+                        1e3 * row['time'], base, ratio, row['status']))
+    return '\n'.join(lines)
+
+
+def _int_list(parser, option, values):
+    '''integers of an option that is repeated or comma separated'''
+    if values is None:
+        return None
+    try:
+        return [int(v) for value in values for v in value.split(',')]
+    except ValueError:
+        parser.error('%s needs integers, got %s' % (option, ','.join(values)))
+
+
+def main(argv=None):
+    '''command line interface, returns 1 if a benchmark is slower than the
+    baseline'''
+    from optparse import OptionParser
+    parser = OptionParser(prog='python -m statsmodels.benchmarks',
+                          description='Run the statsmodels benchmarks.')
+    parser.add_option('--preset', default='small', type='choice',
+                      choices=list(PRESETS),
+                      help='sizes of the benchmarks (default small)')
+    parser.add_option('--bench', default=None,
+                      help='regular expression for the benchmark names')
+    parser.add_option('--nobs', action='append',
+                      help='run with these nobs instead of the preset, '
+                      'comma separated or repeated')
+    parser.add_option('--k', action='append',
+                      help='run with these k instead of the preset, '
+                      'comma separated or repeated')
+    parser.add_option('--repeat', type='int', default=3)
+    parser.add_option('--output', help='save the results to this file')
+    parser.add_option('--baseline', help='compare to the results in this '
+                      'file')
+    parser.add_option('--threshold', type='float', default=0.2,
+                      help='relative change of time reported as slower '
+                      'or faster (default 0.2)')
+    parser.add_option('--no-isolate', dest='isolate', action='store_false',
+                      default=True, help='run all cases in this process')
+    parser.add_option('--list', action='store_true', default=False,
+                      help='list the benchmarks and exit')
+    args = parser.parse_args(argv)[0]
+    args.nobs = _int_list(parser, '--nobs', args.nobs)
+    args.k = _int_list(parser, '--k', args.k)
+
+    names = select(args.bench)
+    if args.list:
+        for name in names:
+            print('%-20s %s' % (name, benchmarks[name].description))
+        return 0
+
+    sizes = None
+    if args.nobs or args.k:
+        sizes = []
+        for nobs in args.nobs or [None]:
+            for k in args.k or [None]:
+                params = dict(nobs=nobs, k=k)
+                sizes.append(dict((key, v) for key, v in params.items()
+                                  if v is not None))
+
+    baseline = load(args.baseline) if args.baseline else None
+    results = run(names, preset=args.preset, sizes=sizes, repeat=args.repeat,
+                  isolate=args.isolate, verbose=baseline is None)
+    if args.output:
+        save(results, args.output)
+    if baseline is not None:
+        comparison = compare(results, baseline, threshold=args.threshold)
+        print(format_comparison(comparison))
+        if any(row['status'] == 'slower' for row in comparison):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
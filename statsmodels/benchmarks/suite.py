@@ -0,0 +1,313 @@
+'''Benchmark definitions
+
+A benchmark is a setup function that is registered with the `benchmark`
+decorator. The setup function takes the size parameters as keyword arguments,
+creates the data and returns the function that is timed, so that the data
+generation is not included in the time.
+
+The sizes of a benchmark are defined for each preset. The presets are
+
+- 'quick' : tiny sizes, used in the tests to check that all benchmarks run
+- 'small' : default, nobs up to 10**4, runs in about a minute
+- 'medium' : nobs up to 10**5 or 10**6
+- 'large' : nobs up to 10**7 and k up to 500, needs several GB of memory
+
+License: BSD-3
+'''
+
+from statsmodels.compatnp.collections import OrderedDict
+
+import numpy as np
+
+from statsmodels.benchmarks import data
+
+PRESETS = ['quick', 'small', 'medium', 'large']
+
+# registered benchmarks by name
+benchmarks = OrderedDict()
+
+
+class Benchmark(object):
+    '''
+    A registered benchmark
+
+    Parameters
+    ----------
+    name : string
+    setup : callable
+        setup(**params) returns the function that is timed
+    sizes : dict
+        maps a preset to a list of dictionaries with the parameters of setup
+    '''
+
+    def __init__(self, name, setup, sizes):
+        self.name = name
+        self.setup = setup
+        self.sizes = sizes
+        self.description = (setup.__doc__ or '').strip().split('\n')[0]
+
+    def params(self, preset):
+        '''list of parameter dictionaries of the preset'''
+        return [dict(p) for p in self.sizes.get(preset, [])]
+
+
+def benchmark(**sizes):
+    '''decorator that registers a setup function as benchmark
+
+    The keywords are the presets, the values are lists of parameter
+    dictionaries. Benchmarks without size parameters use ``[{}]``.
+    '''
+    def register(setup):
+        benchmarks[setup.__name__] = Benchmark(setup.__name__, setup, sizes)
+        return setup
+    return register
+
+
+def _sizes(quick, small, medium, large):
+    '''sizes of the presets from lists of (nobs, k) tuples'''
+    def grid(sizes):
+        return [dict(zip(('nobs', 'k'), s)) for s in sizes]
+    return dict(quick=grid(quick), small=grid(small), medium=grid(medium),
+                large=grid(large))
+
+_linear_sizes = _sizes([(200, 3)], [(1000, 5), (10000, 50)],
+                       [(10**5, 5), (10**5, 50), (10**4, 500)],
+                       [(10**7, 5), (10**6, 50), (10**5, 500)])
+
+_nonlinear_sizes = _sizes([(200, 3)], [(1000, 5), (10000, 20)],
+                          [(10**5, 5), (10**5, 50)],
+                          [(10**6, 5), (10**6, 50), (10**5, 500)])
+
+_series_sizes = _sizes([(200,)], [(1000,), (10000,)], [(10**5,), (10**6,)],
+                       [(10**6,), (10**7,)])
+
+_dataset = dict((preset, [{}]) for preset in PRESETS)
+
+
+@benchmark(**_linear_sizes)
+def ols_fit(nobs, k):
+    '''OLS fit and bse'''
+    from statsmodels.regression.linear_model import OLS
+    endog, exog = data.make_regression(nobs, k)
+    return lambda: OLS(endog, exog).fit().bse
+
+
+@benchmark(**_nonlinear_sizes)
+def glm_poisson_fit(nobs, k):
+    '''GLM Poisson fit by IRLS'''
+    from statsmodels.genmod.generalized_linear_model import GLM
+    from statsmodels.genmod.families import Poisson
+    endog, exog = data.make_count(nobs, k)
+    return lambda: GLM(endog, exog, family=Poisson()).fit().bse
+
+
+@benchmark(**_nonlinear_sizes)
+def logit_fit(nobs, k):
+    '''Logit fit by Newton'''
+    from statsmodels.discrete.discrete_model import Logit
+    endog, exog = data.make_binary(nobs, k)
+    return lambda: Logit(endog, exog).fit(disp=0).bse
+
+
+@benchmark(**_nonlinear_sizes)
+def poisson_fit(nobs, k):
+    '''Poisson fit by Newton'''
+    from statsmodels.discrete.discrete_model import Poisson
+    endog, exog = data.make_count(nobs, k)
+    return lambda: Poisson(endog, exog).fit(disp=0).bse
+
+
+@benchmark(**_linear_sizes)
+def ols_fit_mixed(nobs, k):
+    '''OLS fit and bse with float32 exog and precision='mixed'
+    '''
+    from statsmodels.regression.linear_model import OLS
+    endog, exog = data.make_regression(nobs, k)
+    exog = exog.astype(np.float32)
+    return lambda: OLS(endog, exog, precision='mixed').fit().bse
+
+
+@benchmark(**_nonlinear_sizes)
+def glm_poisson_fit_mixed(nobs, k):
+    '''GLM Poisson fit by IRLS with float32 exog and precision='mixed'
+    '''
+    from statsmodels.genmod.generalized_linear_model import GLM
+    from statsmodels.genmod.families import Poisson
+    endog, exog = data.make_count(nobs, k)
+    exog = exog.astype(np.float32)
+    return lambda: GLM(endog, exog, family=Poisson(),
+                       precision='mixed').fit().bse
+
+
+@benchmark(**_nonlinear_sizes)
+def logit_fit_mixed(nobs, k):
+    '''Logit fit by Newton with float32 exog and precision='mixed'
+    '''
+    from statsmodels.discrete.discrete_model import Logit
+    endog, exog = data.make_binary(nobs, k)
+    exog = exog.astype(np.float32)
+    return lambda: Logit(endog, exog, precision='mixed').fit(disp=0).bse
+
+
+@benchmark(**_nonlinear_sizes)
+def poisson_fit_mixed(nobs, k):
+    '''Poisson fit by Newton with float32 exog and precision='mixed'
+    '''
+    from statsmodels.discrete.discrete_model import Poisson
+    endog, exog = data.make_count(nobs, k)
+    exog = exog.astype(np.float32)
+    return lambda: Poisson(endog, exog, precision='mixed').fit(disp=0).bse
+
+
+@benchmark(**_sizes([(200, 3)], [(1000, 5), (5000, 10)],
+                    [(10**5, 5), (10**4, 50)], [(10**6, 5), (10**5, 50)]))
+def negbin_fit(nobs, k):
+    '''NegativeBinomial (NB2) fit by BFGS'''
+    from statsmodels.discrete.discrete_model import NegativeBinomial
+    endog, exog = data.make_count(nobs, k, alpha=0.5)
+    return lambda: NegativeBinomial(endog, exog).fit(disp=0,
+                                                     maxiter=200).params
+
+
+@benchmark(**_sizes([(200,)], [(500,), (2000,)], [(10**4,)], [(10**5,)]))
+def arma_fit(nobs):
+    '''ARMA(1, 1) fit by exact maximum likelihood'''
+    from statsmodels.tsa.arima_model import ARMA
+    y = data.make_arma(nobs)
+    return lambda: ARMA(y, (1, 1)).fit(disp=-1).params
+
+
+@benchmark(**_sizes([(200, 2)], [(1000, 3), (10000, 5)],
+                    [(10**5, 5), (10**4, 20)], [(10**6, 5), (10**5, 20)]))
+def var_fit(nobs, k):
+    '''VAR fit with two lags, k is the number of equations'''
+    from statsmodels.tsa.vector_ar.var_model import VAR
+    y = data.make_var(nobs, k)
+    return lambda: VAR(y).fit(2).params
+
+
+@benchmark(**_series_sizes)
+def kde_univariate_fit(nobs):
+    '''KDEUnivariate fit with FFT'''
+    from statsmodels.nonparametric.kde import KDEUnivariate
+    x = np.random.RandomState(0).randn(nobs)
+    def fit():
+        kde = KDEUnivariate(x)
+        kde.fit()
+        return kde.density
+    return fit
+
+
+@benchmark(**_sizes([(200,)], [(1000,), (5000,)], [(10**5,)], [(10**6,)]))
+def lowess(nobs):
+    '''lowess with three robustifying iterations
+
+    delta is 1% of the range of x if nobs is larger than 10**4.
+    '''
+    from statsmodels.nonparametric.smoothers_lowess import lowess
+    rs = np.random.RandomState(0)
+    x = np.sort(rs.uniform(0, 10, size=nobs))
+    y = np.sin(x) + rs.randn(nobs)
+    delta = 0.1 if nobs > 10**4 else 0.
+    return lambda: lowess(y, x, is_sorted=True, delta=delta)
+
+
+@benchmark(**_series_sizes)
+def acf(nobs):
+    '''acf with 40 lags and Ljung-Box statistic'''
+    from statsmodels.tsa.stattools import acf
+    y = data.make_arma(nobs)
+    return lambda: acf(y, nlags=40, qstat=True)
+
+
+@benchmark(**_linear_sizes)
+def sandwich_hc0(nobs, k):
+    '''heteroscedasticity robust covariance HC0 of OLS'''
+    from statsmodels.regression.linear_model import OLS
+    from statsmodels.stats.sandwich_covariance import cov_hc0
+    endog, exog = data.make_regression(nobs, k)
+    res = OLS(endog, exog).fit()
+    return lambda: cov_hc0(res)
+
+
+@benchmark(**_linear_sizes)
+def sandwich_cluster(nobs, k):
+    '''cluster robust covariance of OLS with nobs / 10 clusters'''
+    from statsmodels.regression.linear_model import OLS
+    from statsmodels.stats.sandwich_covariance import cov_cluster
+    endog, exog = data.make_regression(nobs, k)
+    groups = data.make_groups(nobs, max(nobs // 10, 2))
+    res = OLS(endog, exog).fit()
+    return lambda: cov_cluster(res, groups)
+
+
+def _sturng_args(nobs):
+    rs = np.random.RandomState(0)
+    p = rs.uniform(0.5, 0.99, size=nobs)
+    r = rs.randint(2, 21, size=nobs)
+    v = rs.randint(2, 121, size=nobs).astype(float)
+    return p, r, v
+
+
+@benchmark(**_sizes([(20,)], [(200,), (10**4,)], [(1000,), (10**5,)],
+                    [(1000,), (10**6,)]))
+def sturng(nobs):
+    '''quantiles and p-values of the studentized range, qsturng and psturng
+
+    The same values as sturng_scalar.
+    '''
+    from statsmodels.stats.libqsturng import qsturng, psturng
+    p, r, v = _sturng_args(nobs)
+    return lambda: psturng(qsturng(p, r, v), r, v)
+
+
+@benchmark(**_sizes([(20,)], [(200,)], [(1000,)], [(1000,)]))
+def sturng_scalar(nobs):
+    '''quantiles and p-values of the studentized range, scalar functions
+
+    A loop over the scalar _qsturng and _psturng, which find the p-value with
+    fminbound, as reference for sturng.
+    '''
+    from statsmodels.stats.libqsturng.qsturng_ import _qsturng, _psturng
+    p, r, v = _sturng_args(nobs)
+
+    def loop():
+        return [_psturng(_qsturng(pi, ri, vi), ri, vi)
+                for pi, ri, vi in zip(p, r, v)]
+    return loop
+
+
+@benchmark(**_dataset)
+def longley_ols():
+    '''OLS fit and summary of the longley dataset'''
+    from statsmodels.regression.linear_model import OLS
+    endog, exog = data.load_dataset('longley')
+    return lambda: OLS(endog, exog).fit().summary()
+
+
+@benchmark(**_dataset)
+def spector_logit():
+    '''Logit fit and summary of the spector dataset'''
+    from statsmodels.discrete.discrete_model import Logit
+    endog, exog = data.load_dataset('spector')
+    return lambda: Logit(endog, exog).fit(disp=0).summary()
+
+
+@benchmark(**_dataset)
+def randhie_poisson():
+    '''Poisson fit of the randhie dataset'''
+    from statsmodels.discrete.discrete_model import Poisson
+    endog, exog = data.load_dataset('randhie')
+    return lambda: Poisson(endog, exog).fit(disp=0).bse
+
+
+@benchmark(**_dataset)
+def macrodata_var():
+    '''VAR fit with lag order selection by aic of the macrodata dataset'''
+    from statsmodels.datasets import macrodata
+    from statsmodels.tsa.vector_ar.var_model import VAR
+    mdata = macrodata.load().data
+    y = np.column_stack((mdata['realgdp'], mdata['realcons'],
+                         mdata['realinv']))
+    y = np.diff(np.log(y), axis=0)
+    return lambda: VAR(y).fit(maxlags=8, ic='aic').params
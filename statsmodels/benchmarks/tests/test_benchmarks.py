@@ -0,0 +1,78 @@
+'''Tests for the benchmark runner, all benchmarks run with the quick sizes
+
+'''
+
+import os
+import json
+import shutil
+import tempfile
+import warnings
+
+from numpy.testing import assert_, assert_equal, assert_raises
+
+from statsmodels.benchmarks import runner
+from statsmodels.benchmarks.suite import benchmarks, PRESETS
+
+
+def test_presets():
+    for name, bench in benchmarks.items():
+        for preset in PRESETS:
+            assert_(len(bench.params(preset)) > 0, (name, preset))
+        assert_(bench.description)
+
+
+def test_quick():
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        results = runner.run(preset='quick', repeat=1, min_time=0,
+                             isolate=False)
+    assert_equal([r['name'] for r in results['results']], list(benchmarks))
+    for res in results['results']:
+        assert_(res['time'] > 0)
+        assert_equal(len(res['times']), 1)
+    assert_equal(results['meta']['preset'], 'quick')
+    json.dumps(results)
+
+
+def test_sizes():
+    names = runner.select('^(ols_fit|acf|longley_ols)$')
+    assert_equal(names, ['ols_fit', 'acf', 'longley_ols'])
+    results = runner.run(names, sizes=[{'nobs': 50, 'k': 2}], repeat=1,
+                         min_time=0, isolate=False)['results']
+    assert_equal([(r['name'], r['params']) for r in results],
+                 [('ols_fit', {'nobs': 50, 'k': 2}), ('acf', {'nobs': 50}),
+                  ('longley_ols', {})])
+    assert_raises(ValueError, runner.run, names, preset='huge')
+
+
+def test_isolated_compare():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        fname = os.path.join(tmpdir, 'bench.json')
+        results = runner.run(['ols_fit'], preset='quick', repeat=1,
+                             min_time=0)
+        assert_(results['results'][0]['maxrss'] > 0)
+        runner.save(results, fname)
+        baseline = runner.load(fname)
+        assert_equal(baseline['results'], results['results'])
+
+        baseline['results'][0]['time'] /= 2.
+        baseline['results'].append(dict(baseline['results'][0],
+                                        params={'nobs': 1, 'k': 1}))
+        results['results'].append(dict(results['results'][0],
+                                       params={'nobs': 2, 'k': 1}))
+        comparison = runner.compare(results, baseline)
+        assert_equal([row['status'] for row in comparison], ['slower', 'new'])
+        assert_equal(comparison[0]['ratio'], 2)
+        assert_(runner.format_comparison(comparison))
+        comparison = runner.compare(results, baseline, threshold=1.5)
+        assert_equal(comparison[0]['status'], 'same')
+
+        status = runner.main(['--bench', '^ols_fit$', '--preset', 'quick',
+                              '--repeat', '1', '--no-isolate', '--baseline',
+                              fname])
+        assert_(status in [0, 1])
+        runner.save(dict(baseline, meta={}), fname)
+        assert_raises(ValueError, runner.load, fname)
+    finally:
+        shutil.rmtree(tmpdir)
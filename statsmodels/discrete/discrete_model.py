@@ -22,6 +22,7 @@ import numpy as np
 from scipy.special import gammaln
 from scipy import stats, special, optimize  # opt just for nbin
 import statsmodels.tools.tools as tools
+from statsmodels.tools import precision
 from statsmodels.tools.decorators import (resettable_cache,
         cache_readonly)
 from statsmodels.regression.linear_model import OLS
@@ -123,8 +124,12 @@ class DiscreteModel(base.LikelihoodModel):
         statsmodels.model.LikelihoodModel.__init__
         and should contain any preprocessing that needs to be done for a model.
         """
-        self.df_model = float(tools.rank(self.exog) - 1)  # assumes constant
-        self.df_resid = float(self.exog.shape[0] - tools.rank(self.exog))
+        if self.precision == 'mixed':
+            k_rank = np.linalg.matrix_rank(precision.gram(self.exog))
+        else:
+            k_rank = tools.rank(self.exog)
+        self.df_model = float(k_rank - 1)  # assumes constant
+        self.df_resid = float(self.exog.shape[0] - k_rank)
 
     def cdf(self, X):
         """
@@ -140,7 +145,8 @@ class DiscreteModel(base.LikelihoodModel):
 
     def _check_perfect_pred(self, params, *args):
         endog = self.endog
-        fittedvalues = self.cdf(np.dot(self.exog, params[:self.exog.shape[1]]))
+        fittedvalues = self.cdf(precision.dot(self.exog,
+                                              params[:self.exog.shape[1]]))
         if (self.raise_on_perfect_prediction and
                 np.allclose(fittedvalues - endog, 0)):
             msg = "Perfect separation detected, results not available"
@@ -375,9 +381,9 @@ class BinaryModel(DiscreteModel):
         if exog is None:
             exog = self.exog
         if not linear:
-            return self.cdf(np.dot(exog, params))
+            return self.cdf(precision.dot(exog, params))
         else:
-            return np.dot(exog, params)
+            return precision.dot(exog, params)
 
     def fit_regularized(self, start_params=None, method='l1',
             maxiter='defined_by_method', full_output=1, disp=1, callback=None,
@@ -631,10 +637,11 @@ class MultinomialModel(BinaryModel):
         return margeff.reshape(len(exog), -1, order='F')
 
 class CountModel(DiscreteModel):
-    def __init__(self, endog, exog, offset=None, exposure=None, missing='none'):
+    def __init__(self, endog, exog, offset=None, exposure=None, missing='none',
+                 **kwargs):
         self._check_inputs(offset, exposure, endog) # attaches if needed
         super(CountModel, self).__init__(endog, exog, missing=missing,
-                offset=self.offset, exposure=self.exposure)
+                offset=self.offset, exposure=self.exposure, **kwargs)
         if offset is None:
             delattr(self, 'offset')
         if exposure is None:
@@ -678,10 +685,12 @@ class CountModel(DiscreteModel):
             if offset is None:
                 offset = 0
 
+        exog = np.asarray(exog)
+        linpred = precision.dot(exog, params[:exog.shape[1]])
         if not linear:
-            return np.exp(np.dot(exog, params[:exog.shape[1]]) + exposure + offset) # not cdf
+            return np.exp(linpred + exposure + offset) # not cdf
         else:
-            return np.dot(exog, params[:exog.shape[1]]) + exposure + offset
+            return linpred + exposure + offset
 
     def _derivative_predict(self, params, exog=None, transform='dydx'):
         """
@@ -782,7 +791,8 @@ class Poisson(CountModel):
     exog : array
         A reference to the exogenous design.
     """ % {'params' : base._model_params_doc,
-           'extra_params' : base._missing_param_doc}
+           'extra_params' : base._missing_param_doc +
+                            base._precision_param_doc}
 
     def cdf(self, X):
         """
@@ -863,7 +873,7 @@ class Poisson(CountModel):
         """
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
-        XB = np.dot(self.exog, params) + offset + exposure
+        XB = precision.dot(self.exog, params) + offset + exposure
         endog = self.endog
         return np.sum(-np.exp(XB) +  endog*XB - gammaln(endog+1))
 
@@ -891,7 +901,7 @@ class Poisson(CountModel):
         """
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
-        XB = np.dot(self.exog, params) + offset + exposure
+        XB = precision.dot(self.exog, params) + offset + exposure
         endog = self.endog
         #np.sum(stats.poisson.logpmf(endog, np.exp(XB)))
         return -np.exp(XB) +  endog*XB - gammaln(endog+1)
@@ -924,8 +934,8 @@ class Poisson(CountModel):
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X,params) + offset + exposure)
-        return np.dot(self.endog - L, X)
+        L = np.exp(precision.dot(X, params) + offset + exposure)
+        return precision.tdot(X, self.endog - L)
 
     def jac(self, params):
         """
@@ -954,7 +964,7 @@ class Poisson(CountModel):
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X,params) + offset + exposure)
+        L = np.exp(precision.dot(X, params) + offset + exposure)
         return (self.endog - L)[:,None] * X
 
     def hessian(self, params):
@@ -984,8 +994,8 @@ class Poisson(CountModel):
         offset = getattr(self, "offset", 0)
         exposure = getattr(self, "exposure", 0)
         X = self.exog
-        L = np.exp(np.dot(X,params) + exposure + offset)
-        return -np.dot(L*X.T, X)
+        L = np.exp(precision.dot(X, params) + exposure + offset)
+        return -precision.gram(X, L)
 
 class Logit(BinaryModel):
     __doc__ = """
@@ -1001,7 +1011,8 @@ class Logit(BinaryModel):
     exog : array
         A reference to the exogenous design.
     """ % {'params' : base._model_params_doc,
-           'extra_params' : base._missing_param_doc}
+           'extra_params' : base._missing_param_doc +
+                            base._precision_param_doc}
 
     def cdf(self, X):
         """
@@ -1073,7 +1084,7 @@ class Logit(BinaryModel):
         """
         q = 2*self.endog - 1
         X = self.exog
-        return np.sum(np.log(self.cdf(q*np.dot(X,params))))
+        return np.sum(np.log(self.cdf(q*precision.dot(X, params))))
 
     def loglikeobs(self, params):
         """
@@ -1101,7 +1112,7 @@ class Logit(BinaryModel):
         """
         q = 2*self.endog - 1
         X = self.exog
-        return np.log(self.cdf(q*np.dot(X,params)))
+        return np.log(self.cdf(q*precision.dot(X, params)))
 
     def score(self, params):
         """
@@ -1125,8 +1136,8 @@ class Logit(BinaryModel):
 
         y = self.endog
         X = self.exog
-        L = self.cdf(np.dot(X,params))
-        return np.dot(y - L,X)
+        L = self.cdf(precision.dot(X, params))
+        return precision.tdot(X, y - L)
 
     def jac(self, params):
         """
@@ -1153,7 +1164,7 @@ class Logit(BinaryModel):
 
         y = self.endog
         X = self.exog
-        L = self.cdf(np.dot(X, params))
+        L = self.cdf(precision.dot(X, params))
         return (y - L)[:,None] * X
 
     def hessian(self, params):
@@ -1176,8 +1187,8 @@ class Logit(BinaryModel):
         .. math:: \\frac{\\partial^{2}\\ln L}{\\partial\\beta\\partial\\beta^{\\prime}}=-\\sum_{i}\\Lambda_{i}\\left(1-\\Lambda_{i}\\right)x_{i}x_{i}^{\\prime}
         """
         X = self.exog
-        L = self.cdf(np.dot(X,params))
-        return -np.dot(L*(1-L)*X.T,X)
+        L = self.cdf(precision.dot(X, params))
+        return -precision.gram(X, L*(1-L))
 
     def fit(self, start_params=None, method='newton', maxiter=35,
             full_output=1, disp=1, callback=None, **kwargs):
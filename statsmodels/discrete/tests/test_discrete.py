@@ -1257,6 +1257,24 @@ def test_isdummy():
     count_ind = _isdummy(X)
     assert_equal(count_ind, [4, 6])
 
+def test_mixed_precision():
+    # float32 exog, score and hessian are accumulated in float64
+    np.random.seed(12345)
+    nobs = 20000
+    exog = sm.add_constant(np.random.randn(nobs, 3), prepend=True)
+    linpred = np.dot(exog, [0.5, 0.5, -0.5, 0.2])
+    y_logit = (np.random.uniform(size=nobs) < 1 / (1 + np.exp(-linpred)))
+    y_poisson = np.random.poisson(np.exp(linpred))
+    for klass, endog in [(Logit, y_logit), (Poisson, y_poisson)]:
+        res = klass(endog, exog).fit(disp=0)
+        mod = klass(endog, exog, precision='mixed')
+        res_mixed = mod.fit(disp=0)
+        assert_equal(mod.exog.dtype, np.float32)
+        assert_equal(res_mixed.params.dtype, np.float64)
+        assert_almost_equal(res_mixed.params / res.params, np.ones(4), 6)
+        assert_almost_equal(res_mixed.bse / res.bse, np.ones(4), 6)
+        assert_almost_equal(res_mixed.llf / res.llf, 1, 8)
+
 
 if __name__ == "__main__":
     import nose
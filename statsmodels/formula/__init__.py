@@ -1,4 +1,7 @@
 from statsmodels import NoseWrapper as Tester
 test = Tester().test
 
-from formulatools import handle_formula_data
+# patsy is imported on first access of handle_formula_data
+from statsmodels.tools.lazy import lazy_module as _lazy_module
+_lazy_module(__name__, attributes=[
+    ('statsmodels.formula.formulatools', ['handle_formula_data'])])
@@ -1,25 +1,24 @@
-from statsmodels.regression.linear_model import GLS
-gls = GLS.from_formula
-from statsmodels.regression.linear_model import WLS
-wls = WLS.from_formula
-from statsmodels.regression.linear_model import OLS
-ols = OLS.from_formula
-from statsmodels.regression.linear_model import GLSAR
-glsar = GLSAR.from_formula
-from statsmodels.genmod.generalized_linear_model import GLM
-glm = GLM.from_formula
-from statsmodels.robust.robust_linear_model import RLM
-rlm = RLM.from_formula
-from statsmodels.discrete.discrete_model import MNLogit
-mnlogit = MNLogit.from_formula
-from statsmodels.discrete.discrete_model import Logit
-logit = Logit.from_formula
-from statsmodels.discrete.discrete_model import Probit
-probit = Probit.from_formula
-from statsmodels.discrete.discrete_model import Poisson
-poisson = Poisson.from_formula
-from statsmodels.discrete.discrete_model import NegativeBinomial
-negativebinomial = NegativeBinomial.from_formula
-from statsmodels.regression.quantile_regression import QuantReg
-quantreg = QuantReg.from_formula
+# the models and patsy are imported on first access, see
+# statsmodels.tools.lazy
+from statsmodels.tools.lazy import lazy_module as _lazy_module
 
+_lazy_module(__name__, attributes=[
+    ('statsmodels.regression.linear_model',
+        ['GLS', ('gls', 'GLS.from_formula'),
+         'WLS', ('wls', 'WLS.from_formula'),
+         'OLS', ('ols', 'OLS.from_formula'),
+         'GLSAR', ('glsar', 'GLSAR.from_formula')]),
+    ('statsmodels.genmod.generalized_linear_model',
+        ['GLM', ('glm', 'GLM.from_formula')]),
+    ('statsmodels.robust.robust_linear_model',
+        ['RLM', ('rlm', 'RLM.from_formula')]),
+    ('statsmodels.discrete.discrete_model',
+        ['MNLogit', ('mnlogit', 'MNLogit.from_formula'),
+         'Logit', ('logit', 'Logit.from_formula'),
+         'Probit', ('probit', 'Probit.from_formula'),
+         'Poisson', ('poisson', 'Poisson.from_formula'),
+         'NegativeBinomial',
+         ('negativebinomial', 'NegativeBinomial.from_formula')]),
+    ('statsmodels.regression.quantile_regression',
+        ['QuantReg', ('quantreg', 'QuantReg.from_formula')]),
+    ])
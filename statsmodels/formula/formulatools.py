@@ -1,5 +1,12 @@
+import itertools
+import weakref
+from statsmodels.compatnp.collections import OrderedDict
+
+import numpy as np
+from pandas import Series
+
 import statsmodels.tools.data as data_util
-from patsy import dmatrices
+from patsy import dmatrices, dmatrix, EvalEnvironment
 
 # if users want to pass in a different formula framework, they can
 # add their handler here. how to do it interactively?
@@ -23,6 +30,10 @@ def handle_formula_data(Y, X, formula, depth=0):
         You can pass a handler by import formula_handler and adding a
         key-value pair where the key is the formula object class and
         the value is a function that returns endog, exog, formula object
+    depth : int or patsy.EvalEnvironment
+        The formula is evaluated in the namespace of the caller of the
+        function that calls handle_formula_data, or `depth` frames further
+        up. An EvalEnvironment is used as is.
 
     Returns
     -------
@@ -35,16 +46,260 @@ def handle_formula_data(Y, X, formula, depth=0):
     if isinstance(formula, tuple(formula_handler.keys())):
         return formula_handler[type(formula)]
 
+    if isinstance(depth, EvalEnvironment):
+        eval_env = depth
+    else:
+        eval_env = 2 + depth
     if X is not None:
         if data_util._is_using_pandas(Y, X):
-            return dmatrices(formula, (Y, X), 2, return_type='dataframe')
+            return dmatrices(formula, (Y, X), eval_env,
+                             return_type='dataframe')
         else:
-            return dmatrices(formula, (Y, X), 2, return_type='dataframe')
+            return dmatrices(formula, (Y, X), eval_env,
+                             return_type='dataframe')
     else:
         if data_util._is_using_pandas(Y, None):
-            return dmatrices(formula, Y, 2, return_type='dataframe')
+            return dmatrices(formula, Y, eval_env, return_type='dataframe')
+        else:
+            return dmatrices(formula, Y, eval_env, return_type='dataframe')
+
+
+class DesignCache(object):
+    """
+    LRU cache of formula designs keyed by formula and data identity
+
+    The design matrices of a formula are built once for a dataset with
+    patsy. Designs for subsets of the rows of the same dataset are sliced
+    from the cached matrices instead of parsing the formula again.
+
+    Parameters
+    ----------
+    max_entries : int
+        maximum number of cached designs
+    max_bytes : int or None
+        maximum total size of the cached design matrices in bytes. If None,
+        then only `max_entries` limits the cache.
+
+    Attributes
+    ----------
+    nbytes : int
+        total size of the cached design matrices in bytes
+
+    Notes
+    -----
+    The data is identified by the object itself, the cache keeps a weak
+    reference to it. Data that is changed in place after the design is
+    cached needs to be removed with `clear`. The cached design_info keeps
+    a reference to the namespace in which the formula was evaluated.
+
+    The design of a subset shares the stateful transforms, e.g. ``center``,
+    and the levels of categorical variables of the full data. Contrary to
+    building the design on the subset directly, columns that are constant
+    within the subset are not dropped.
+
+    Only formulas that are strings, and data that supports weak references,
+    e.g. DataFrames, are cached.
+    """
+
+    def __init__(self, max_entries=16, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """remove all cached designs"""
+        self._entries.clear()
+        self.nbytes = 0
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[-1]
+
+    def design(self, formula, data, subset=None, depth=0):
+        """
+        Returns endog and exog for the formula and a subset of the data
+
+        Parameters
+        ----------
+        formula : str
+            the formula of the model
+        data : DataFrame
+            the data for the formula
+        subset : array-like or None
+            booleans, integers or index values of the rows of data, as in
+            ``data.ix[subset]``
+        depth : int
+            the formula is evaluated in the namespace of the caller of
+            `design` if depth is 0, or `depth` frames further up
+
+        Returns
+        -------
+        endog, exog : DataFrame
+            the design matrices with patsy's design_info attached
+        """
+        eval_env = EvalEnvironment.capture(depth + 1)
+        if not isinstance(formula, basestring):
+            if subset is not None:
+                data = data.ix[subset]
+            return handle_formula_data(data, None, formula, depth=eval_env)
+
+        key = (formula, id(data))
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry[0]() is not data:
+            # id of garbage collected data has been reused
+            self.nbytes -= entry[-1]
+            entry = None
+        if entry is None:
+            entry = self._build(formula, data, eval_env)
+        if entry is None:
+            if subset is not None:
+                data = data.ix[subset]
+            return handle_formula_data(data, None, formula, depth=eval_env)
+        # most recently used entries are at the end
+        self._entries[key] = entry
+        self._evict()
+
+        endog, exog, row_map = entry[1:4]
+        if subset is None:
+            return endog, exog
+
+        # positions of the subset in data, then rows in the design
+        pos = Series(np.arange(len(data)), index=data.index).ix[subset]
+        rows = row_map[np.asarray(pos)]
+        rows = rows[rows >= 0]
+        sub_endog = endog.iloc[rows]
+        sub_exog = exog.iloc[rows]
+        sub_endog.design_info = endog.design_info
+        sub_exog.design_info = exog.design_info
+        return sub_endog, sub_exog
+
+    def _build(self, formula, data, eval_env):
+        try:
+            ref = weakref.ref(data)
+        except TypeError:
+            return None
+        if not hasattr(data, 'index') or not data.index.is_unique:
+            return None
+        endog, exog = handle_formula_data(data, None, formula, depth=eval_env)
+        # map from rows of data to rows of the design, -1 for rows that
+        # patsy dropped because of missing values
+        row_map = -np.ones(len(data), dtype=np.intp)
+        row_map[data.index.get_indexer(exog.index)] = np.arange(len(exog))
+        nbytes = endog.values.nbytes + exog.values.nbytes + row_map.nbytes
+        self.nbytes += nbytes
+        return ref, endog, exog, row_map, nbytes
+
+    def _evict(self):
+        # keep at least the most recently used entry
+        while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or
+                (self.max_bytes is not None and
+                 self.nbytes > self.max_bytes)):
+            key = next(iter(self._entries))
+            self._remove(key)
+
+
+#: default cache that is used with ``from_formula(..., design_cache=True)``
+design_cache = DesignCache()
+
+
+def _build_design_numpy(design_info, data):
+    """
+    Builds the design matrix for new data from design_info with numpy
+
+    This evaluates the factors with their stored state and builds the
+    columns of each term like patsy, but without patsy's handling of pandas
+    inputs and missing values. Returns None if the data has missing values
+    or if design_info does not provide the factor information.
+    """
+    from patsy.categorical import categorical_to_int
+    from patsy.missing import NAAction
+
+    factor_infos = getattr(design_info, 'factor_infos', None)
+    term_codings = getattr(design_info, 'term_codings', None)
+    if not factor_infos or term_codings is None:
+        return None
+
+    values = {}
+    nobs = None
+    for factor, info in factor_infos.items():
+        value = factor.eval(info.state, data)
+        if info.type == 'numerical':
+            value = np.asarray(value)
+            if value.ndim == 1:
+                value = value[:, None]
+            if (value.ndim != 2 or value.shape[1] != info.num_columns or
+                    value.dtype.kind not in 'biuf'):
+                return None
+            if np.isnan(value).any():
+                return None
         else:
-            return dmatrices(formula, Y, 2, return_type='dataframe')
+            value = np.asarray(categorical_to_int(value, info.categories,
+                                                  NAAction(), origin=factor))
+            if (value < 0).any():
+                return None
+        if nobs is not None and len(value) != nobs:
+            return None
+        nobs = len(value)
+        values[factor] = value
+
+    out = np.empty((nobs, len(design_info.column_names)))
+    for term, subterms in term_codings.items():
+        start = design_info.term_slices[term].start
+        for subterm in subterms:
+            ncols = []
+            for factor in subterm.factors:
+                if factor in subterm.contrast_matrices:
+                    ncols.append(
+                        subterm.contrast_matrices[factor].matrix.shape[1])
+                else:
+                    ncols.append(factor_infos[factor].num_columns)
+            # the first factor iterates fastest, as in patsy and R
+            combos = itertools.product(*[range(n) for n in ncols[::-1]])
+            for i, combo in enumerate(combos):
+                col = out[:, start + i]
+                col[:] = 1
+                for factor, idx in zip(subterm.factors, combo[::-1]):
+                    if factor in subterm.contrast_matrices:
+                        matrix = subterm.contrast_matrices[factor].matrix
+                        col *= matrix[values[factor], idx]
+                    else:
+                        col *= values[factor][:, idx]
+            start += subterm.num_columns
+    return out
+
+
+def build_design_matrix(design_info, data):
+    """
+    Returns the design matrix of new data for a stored design_info
+
+    Parameters
+    ----------
+    design_info : patsy.DesignInfo
+        the design_info of the exog of a model created from a formula
+    data : DataFrame or dict
+        the new data, it has to contain the variables used in the formula
+
+    Returns
+    -------
+    exog : ndarray
+        the design matrix
+
+    Notes
+    -----
+    The formula is not parsed again. If the data has no missing values,
+    then the matrix is built directly with numpy, otherwise patsy is used
+    which drops the rows with missing values.
+    """
+    exog = _build_design_numpy(design_info, data)
+    if exog is None:
+        exog = dmatrix(design_info.builder, data)
+    return exog
 
 
 def _remove_intercept_patsy(terms):
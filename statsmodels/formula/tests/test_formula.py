@@ -100,3 +100,77 @@ def test_formula_predict():
     results = ols(formula, dta).fit()
     npt.assert_almost_equal(results.fittedvalues.values,
                             results.predict(data.exog), 8)
+
+
+def _design_data():
+    import numpy as np
+    from pandas import DataFrame
+    np.random.seed(9876)
+    nobs = 200
+    dta = DataFrame({'y': np.random.randn(nobs), 'x1': np.random.randn(nobs),
+                     'x2': np.random.uniform(1, 2, nobs),
+                     'g': np.random.randint(0, 3, nobs)})
+    dta.loc[[3, 50], 'x1'] = np.nan
+    return dta
+
+
+def test_design_cache():
+    import numpy as np
+    from statsmodels.formula.formulatools import DesignCache
+    dta = _design_data()
+    formula = 'y ~ x1 + np.log(x2) + C(g) + C(g):x1'
+    cache = DesignCache()
+    subsets = [None, dta.x2 > 1.5, np.arange(10, 100), dta.index[::3]]
+    for subset in subsets:
+        model = ols(formula, dta, subset=subset, design_cache=cache)
+        model2 = ols(formula, dta, subset=subset)
+        npt.assert_equal(model.exog, model2.exog)
+        npt.assert_equal(model.endog, model2.endog)
+        npt.assert_equal(model.exog_names, model2.exog_names)
+        npt.assert_equal(np.asarray(model.data.row_labels),
+                         np.asarray(model2.data.row_labels))
+    npt.assert_equal(len(cache), 1)
+    assert model.data.orig_exog.design_info is \
+           cache.design(formula, dta)[1].design_info
+
+    # LRU eviction
+    nbytes = cache.nbytes
+    cache.max_entries = 2
+    dta2 = dta.copy()
+    dta3 = dta.copy()
+    ols(formula, dta2, design_cache=cache)
+    ols(formula, dta, design_cache=cache)
+    ols(formula, dta3, design_cache=cache)
+    npt.assert_equal(len(cache), 2)
+    keys = [key[1] for key in cache._entries]
+    npt.assert_equal(keys, [id(dta), id(dta3)])
+    cache.max_bytes = nbytes
+    ols(formula, dta, design_cache=cache)
+    npt.assert_equal(len(cache), 1)
+    npt.assert_equal(cache.nbytes, nbytes)
+
+    # formulas are evaluated in the namespace of the caller
+    double = lambda x: 2 * x
+    model = ols('y ~ double(x1)', dta, subset=dta.g == 1, design_cache=cache)
+    npt.assert_equal(model.exog[:, 1], 2 * dta.x1[dta.g == 1].dropna())
+
+
+def test_build_design_matrix():
+    import numpy as np
+    from patsy import dmatrix
+    from statsmodels.formula.formulatools import (build_design_matrix,
+                                                  _build_design_numpy)
+    dta = _design_data()
+    formula = 'y ~ x1 * np.log(x2) + C(g) + C(g):x1 + center(x2)'
+    results = ols(formula, dta).fit()
+    design_info = results.model.data.orig_exog.design_info
+    new = dta.iloc[100:150]
+    expected = dmatrix(design_info.builder, new)
+    npt.assert_almost_equal(_build_design_numpy(design_info, new), expected,
+                            14)
+    npt.assert_almost_equal(results.predict(new),
+                            results.fittedvalues.values[98:148], 12)
+    # missing values are dropped by patsy
+    new = dta.iloc[:10]
+    assert _build_design_numpy(design_info, new) is None
+    npt.assert_equal(build_design_matrix(design_info, new).shape[0], 9)
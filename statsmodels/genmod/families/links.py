@@ -5,6 +5,14 @@ Defines the link functions to be used with GLM families.
 import numpy as np
 import scipy.stats
 
+
+def _clip_tol(p, tol):
+    """tol or the machine epsilon of the floating point dtype of p"""
+    dtype = np.asarray(p).dtype
+    if issubclass(dtype.type, np.floating):
+        return max(tol, np.finfo(dtype).eps)
+    return tol
+
 #TODO: are the instance actually "aliases"
 # I used this terminology in varfuncs as well -ss
 
@@ -92,7 +100,10 @@ class Logit(Link):
         pclip : array
             Clipped probabilities
         """
-        return np.clip(p, Logit.tol, 1. - Logit.tol)
+        # 1 - tol rounds to 1 in single precision, the bounds are at least
+        # the machine epsilon of p
+        tol = _clip_tol(p, Logit.tol)
+        return np.clip(p, tol, 1. - tol)
 
     def __call__(self, p):
         """
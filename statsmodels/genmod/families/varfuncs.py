@@ -5,6 +5,7 @@ Variance functions for use with the link functions in statsmodels.family.links
 __docformat__ = 'restructuredtext'
 
 import numpy as np
+from statsmodels.genmod.families.links import _clip_tol
 
 class VarianceFunction(object):
     """
@@ -156,7 +157,8 @@ class Binomial(object):
         self.n = n
 
     def _clean(self, p):
-        return np.clip(p, Binomial.tol, 1 - Binomial.tol)
+        tol = _clip_tol(p, Binomial.tol)
+        return np.clip(p, tol, 1 - tol)
 
     def __call__(self, mu):
         """
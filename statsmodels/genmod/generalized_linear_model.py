@@ -29,6 +29,8 @@ import statsmodels.regression.linear_model as lm
 import statsmodels.base.wrapper as wrap
 
 from statsmodels.tools.sm_exceptions import PerfectSeparationError
+from statsmodels.tools.profiling import fit_profiling, current_trace
+from statsmodels.tools import precision
 
 __all__ = ['GLM']
 
@@ -182,13 +184,15 @@ class GLM(base.LikelihoodModel):
         The value of the weights after the last iteration of fit.  Only
         available after fit is called.  See statsmodels.families.family for
         the specific distribution weighting functions.
-    ''' % {'extra_params' : base._missing_param_doc}
+    ''' % {'extra_params' : base._missing_param_doc +
+                           base._dtype_param_doc + base._precision_param_doc}
 
     def __init__(self, endog, exog, family=None, offset=None, exposure=None,
-                        missing='none'):
+                        missing='none', dtype=None, precision=None):
         self._check_inputs(family, offset, exposure, endog)
         super(GLM, self).__init__(endog, exog, missing=missing,
-                                  offset=self.offset, exposure=self.exposure)
+                                  offset=self.offset, exposure=self.exposure,
+                                  dtype=dtype, precision=precision)
         if offset is None:
             delattr(self, 'offset')
         if exposure is None:
@@ -206,12 +210,20 @@ class GLM(base.LikelihoodModel):
                         'params' : [np.inf],
                         'deviance' : [np.inf]}
 
-        self.pinv_wexog = np.linalg.pinv(self.exog)
-        self.normalized_cov_params = np.dot(self.pinv_wexog,
-                                        np.transpose(self.pinv_wexog))
+        if self.precision == 'mixed':
+            # no pinv of exog, the IRLS iterations use the gram matrix
+            xtx = precision.gram(self.exog)
+            self.pinv_wexog = None
+            self.normalized_cov_params = np.linalg.pinv(xtx)
+            k_rank = np.linalg.matrix_rank(xtx)
+        else:
+            self.pinv_wexog = np.linalg.pinv(self.exog)
+            self.normalized_cov_params = np.dot(self.pinv_wexog,
+                                            np.transpose(self.pinv_wexog))
+            k_rank = rank(self.exog)
 
-        self.df_model = rank(self.exog)-1
-        self.df_resid = self.exog.shape[0] - rank(self.exog)
+        self.df_model = k_rank - 1
+        self.df_resid = self.exog.shape[0] - k_rank
 
     def _check_inputs(self, family, offset, exposure, endog):
         if family is None:
@@ -251,11 +263,11 @@ class GLM(base.LikelihoodModel):
         """
         raise NotImplementedError
 
-    def _update_history(self, tmp_result, mu, history):
+    def _update_history(self, params, mu, history):
         """
         Helper method to update history during iterative fit.
         """
-        history['params'].append(tmp_result.params)
+        history['params'].append(params)
         history['deviance'].append(self.family.deviance(self.endog, mu))
         return history
 
@@ -333,12 +345,14 @@ class GLM(base.LikelihoodModel):
         if exog is None:
             exog = self.exog
         if linear:
-            return np.dot(exog, params) + offset + exposure
+            return precision.dot(exog, params) + offset + exposure
         else:
-            return self.family.fitted(np.dot(exog, params) + exposure + \
+            return self.family.fitted(precision.dot(exog, params) + exposure +
                                                              offset)
 
-    def fit(self, maxiter=100, method='IRLS', tol=1e-8, scale=None):
+    @fit_profiling
+    def fit(self, maxiter=100, method='IRLS', tol=1e-8, scale=None,
+            wrap=True):
         '''
         Fits a generalized linear model for a given family.
 
@@ -358,12 +372,18 @@ class GLM(base.LikelihoodModel):
             `dev` is the deviance divided by df_resid
         tol : float
             Convergence tolerance.  Default is 1e-8.
+        wrap : bool
+            If True (default), the results are wrapped to reattach the
+            metadata of the data. If False, the bare GLMResults instance is
+            returned, which has no wrapping overhead on attribute access.
         '''
         endog = self.endog
         if endog.ndim > 1 and endog.shape[1] == 2:
             data_weights = endog.sum(1) # weights are total trials
         else:
-            data_weights = np.ones((endog.shape[0]))
+            # float32 exog keeps the WLS steps in single precision
+            data_weights = np.ones((endog.shape[0]),
+                                   dtype=np.result_type(self.exog, np.float32))
         self.data_weights = data_weights
         if np.shape(self.data_weights) == () and self.data_weights>1:
             self.data_weights = self.data_weights *\
@@ -383,7 +403,14 @@ class GLM(base.LikelihoodModel):
             offset = 0
         #TODO: would there ever be both and exposure and an offset?
 
-        mu = self.family.starting_mu(self.endog)
+        # mu, eta and the IRLS weights are computed in float64, only the WLS
+        # steps with float32 data are in single precision. In float32 the
+        # clipped probabilities of the Binomial round to 0 and 1.
+        if self.precision == 'mixed':
+            wls_dtype = np.float64
+        else:
+            wls_dtype = np.result_type(self.exog, np.float32)
+        mu = np.asarray(self.family.starting_mu(self.endog), dtype=np.float64)
         wlsexog = self.exog
         eta = self.family.predict(mu)
         dev = self.family.deviance(self.endog, mu)
@@ -391,6 +418,9 @@ class GLM(base.LikelihoodModel):
             raise ValueError("The first guess on the deviance function "
                              "returned a nan.  This could be a boundary "
                              " problem and should be reported.")
+        # single precision WLS steps do not resolve smaller changes of the
+        # deviance
+        tol = max(tol, np.finfo(wls_dtype).eps * np.abs(dev))
 
 
         # first guess on the deviance is assumed to be scaled by 1.
@@ -399,27 +429,45 @@ class GLM(base.LikelihoodModel):
         iteration = 0
         converged = 0
         criterion = history['deviance']
+        trace = current_trace()
+        trace.update(method='IRLS')
         while not converged:
-            self.weights = data_weights*self.family.weights(mu)
+            self.weights = np.asarray(data_weights*self.family.weights(mu),
+                                      dtype=wls_dtype)
             wlsendog = eta + self.family.link.deriv(mu) * (self.endog-mu) \
                 - offset
-            wls_results = lm.WLS(wlsendog, wlsexog, self.weights).fit()
-            eta = np.dot(self.exog, wls_results.params) + offset
+            wlsendog = np.asarray(wlsendog, dtype=wls_dtype)
+            with trace.stage('wls'):
+                if self.precision == 'mixed':
+                    wls_params, wls_cov_params = precision.lstsq(
+                        wlsexog, wlsendog, self.weights)[:2]
+                else:
+                    wls_results = lm.WLS(wlsendog, wlsexog,
+                                         self.weights).fit(wrap=False)
+                    wls_params = wls_results.params
+                    wls_cov_params = wls_results.normalized_cov_params
+            eta = np.asarray(precision.dot(self.exog, wls_params),
+                             dtype=np.float64) + offset
             mu = self.family.fitted(eta)
-            history = self._update_history(wls_results, mu, history)
+            history = self._update_history(wls_params, mu, history)
             self.scale = self.estimate_scale(mu)
             iteration += 1
+            trace.iteration(np.fabs(criterion[iteration] -
+                                    criterion[iteration-1]))
             if endog.squeeze().ndim == 1 and np.allclose(mu - endog, 0):
                 msg = "Perfect separation detected, results not available"
                 raise PerfectSeparationError(msg)
             converged = _check_convergence(criterion, iteration, tol,
                                             maxiter)
+        trace.update(converged=np.fabs(criterion[iteration] -
+                                       criterion[iteration-1]) <= tol)
         self.mu = mu
-        glm_results = GLMResults(self, wls_results.params,
-                                 wls_results.normalized_cov_params,
+        glm_results = GLMResults(self, wls_params, wls_cov_params,
                                  self.scale)
         history['iteration'] = iteration
         glm_results.fit_history = history
+        if not wrap:
+            return glm_results
         return GLMResultsWrapper(glm_results)
 
 class GLMResults(base.LikelihoodModelResults):
@@ -4,11 +4,13 @@ Test functions for models.GLM
 """
 import os
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_equal, assert_raises
+from numpy.testing import (assert_almost_equal, assert_equal, assert_raises,
+                           assert_)
 from scipy import stats
 import statsmodels.api as sm
 from statsmodels.genmod.generalized_linear_model import GLM
 from statsmodels.tools.tools import add_constant
+from statsmodels.stats import sandwich_covariance as sw
 from statsmodels.tools.sm_exceptions import PerfectSeparationError
 from nose import SkipTest
 
@@ -521,6 +523,58 @@ def test_attribute_writable_resettable():
     glm_model2 = sm.GLM(endog, exog)
     assert_equal(glm_model2.family.link.power, 1.0)
 
+def test_float32():
+    # single precision IRLS
+    data = sm.datasets.cpunish.load()
+    exog = add_constant(np.log(data.exog[:, :2]), prepend=False)
+    res = GLM(data.endog, exog, family=sm.families.Poisson()).fit()
+    mod = GLM(data.endog, exog, family=sm.families.Poisson(),
+              dtype=np.float32)
+    res32 = mod.fit()
+    assert_equal(mod.exog.dtype, np.float32)
+    assert_equal(mod.weights.dtype, np.float32)
+    assert_equal(res32.params.dtype, np.float32)
+    assert_almost_equal(res32.params / res.params, np.ones(3), DECIMAL_4)
+    assert_almost_equal(res32.bse / res.bse, np.ones(3), DECIMAL_4)
+
+def test_float32_binomial():
+    # 1 - tol of the logit link rounds to 1 in float32, mu and the IRLS
+    # weights are computed in float64
+    np.random.seed(987125)
+    exog = add_constant(np.random.randn(1000, 3))
+    endog = np.dot(exog, [1, 2, 3, 4]) + np.random.randn(1000) > 3
+    res = GLM(endog, exog, family=sm.families.Binomial()).fit()
+    mod = GLM(endog, exog, family=sm.families.Binomial(), dtype=np.float32)
+    res32 = mod.fit()
+    assert_equal(mod.exog.dtype, np.float32)
+    assert_equal(res32.params.dtype, np.float32)
+    assert_(res32.fit_history['iteration'] < 100)
+    assert_almost_equal(res32.params / res.params, np.ones(4), DECIMAL_4)
+    assert_almost_equal(res32.bse / res.bse, np.ones(4), DECIMAL_4)
+    assert_almost_equal(res32.deviance / res.deviance, 1, DECIMAL_4)
+
+def test_mixed_precision():
+    # float32 exog, IRLS in float64, the differences to float64 are due to
+    # the rounding of exog, cond(exog) is about 1e3
+    data = sm.datasets.cpunish.load()
+    exog = add_constant(np.log(data.exog[:, :2]), prepend=False)
+    for family in [sm.families.Poisson(), sm.families.Gaussian()]:
+        res = GLM(data.endog, exog, family=family).fit()
+        mod = GLM(data.endog, exog, family=family, precision='mixed')
+        res_mixed = mod.fit()
+        assert_equal(mod.exog.dtype, np.float32)
+        assert_equal(res_mixed.params.dtype, np.float64)
+        assert_equal(res_mixed.fit_history['iteration'],
+                     res.fit_history['iteration'])
+        assert_almost_equal(res_mixed.params / res.params, np.ones(3), 5)
+        assert_almost_equal(res_mixed.bse / res.bse, np.ones(3), 5)
+        assert_almost_equal(res_mixed.deviance / res.deviance, 1, 5)
+        # pinv_wexog is not computed
+        assert_(mod.pinv_wexog is None)
+        scale = res.resid_response**2
+        assert_almost_equal(sw._HCCM(res_mixed, scale) / sw._HCCM(res, scale),
+                            np.ones((3, 3)), 4)
+
 if __name__=="__main__":
     #run_module_suite()
     #taken from Fernando Perez:
@@ -1,11 +1,23 @@
-from .functional import fboxplot, rainbowplot
-from .correlation import plot_corr, plot_corr_grid
-from .gofplots import qqplot
-from .boxplots import violinplot, beanplot
-from .regressionplots import (abline_plot, plot_regress_exog, plot_fit,
-                              plot_partregress, plot_partregress_grid,
-                              plot_ccpr, plot_ccpr_grid, influence_plot,
-                              plot_leverage_resid2)
-from .factorplots import interaction_plot
-from .plottools import rainbow
-import tsaplots as tsa
+# imported on first access, matplotlib is only imported when a plot
+# function is used, see statsmodels.tools.lazy
+from statsmodels.tools.lazy import lazy_module as _lazy_module
+
+_lazy_module(__name__,
+    modules={'tsa': 'statsmodels.graphics.tsaplots'},
+    attributes=[
+        ('statsmodels.graphics.functional', ['fboxplot', 'rainbowplot']),
+        ('statsmodels.graphics.correlation', ['plot_corr', 'plot_corr_grid']),
+        ('statsmodels.graphics.gofplots', ['qqplot']),
+        ('statsmodels.graphics.boxplots', ['violinplot', 'beanplot']),
+        ('statsmodels.graphics.regressionplots', ['abline_plot',
+                                                  'plot_regress_exog',
+                                                  'plot_fit',
+                                                  'plot_partregress',
+                                                  'plot_partregress_grid',
+                                                  'plot_ccpr',
+                                                  'plot_ccpr_grid',
+                                                  'influence_plot',
+                                                  'plot_leverage_resid2']),
+        ('statsmodels.graphics.factorplots', ['interaction_plot']),
+        ('statsmodels.graphics.plottools', ['rainbow']),
+        ])
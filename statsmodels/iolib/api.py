@@ -1,4 +1,5 @@
 from foreign import StataReader, genfromdta, savetxt, StataWriter
 from table import SimpleTable, csv2st
 from smpickle import save_pickle, load_pickle
+from smarchive import save_results, load_results
 
@@ -13,6 +13,7 @@ numpy.lib.io
 from struct import unpack, calcsize, pack
 from struct import error as struct_error
 import datetime
+import io
 import sys
 import numpy as np
 from numpy.lib._iotools import _is_string_like, easy_dtype
@@ -28,6 +29,12 @@ def is_py3():
     return False
 PY3 = is_py3()
 
+# file objects that are backed by a file on disk and can be memory mapped
+if PY3:
+    _disk_file_types = (io.BufferedReader, io.FileIO)
+else:
+    _disk_file_types = (file, io.BufferedReader, io.FileIO)
+
 _date_formats = ["%tc", "%tC", "%td", "%tw", "%tm", "%tq", "%th", "%ty"]
 
 def _datetime_to_stata_elapsed(date, fmt):
@@ -148,6 +155,60 @@ def _stata_elapsed_date_to_datetime(date, fmt):
     else:
         raise ValueError("Date fmt %s not understood" % fmt)
 
+def _stata_elapsed_date_to_datetime_vec(dates, fmt):
+    """
+    Convert an array from SIF to datetime. http://www.stata.com/help.cgi?datetime
+
+    Parameters
+    ----------
+    dates : array-like
+        The Stata Internal Format dates to convert to datetime according to
+        fmt
+    fmt : str
+        The format to convert to. Can be, tc, td, tw, tm, tq, th, ty
+
+    Returns
+    -------
+    out : ndarray
+        Object array of datetime.datetime. NaN entries are returned as None.
+
+    Notes
+    -----
+    Vectorized version of `_stata_elapsed_date_to_datetime` that does the
+    calendar arithmetic with numpy datetime64 instead of looping over
+    datetime objects. See that function for the definition of the formats.
+    """
+    dates = np.asarray(dates)
+    if fmt in ["%tC", "tC"]:
+        from warnings import warn
+        warn("Encountered %tC format. Leaving in Stata Internal Format.")
+        return dates
+    dates = dates.astype(np.float64)
+    nat = np.isnan(dates)
+    dates = np.where(nat, 0, dates).astype(np.int64)
+    if fmt in ["%tc", "tc"]:
+        out = np.datetime64('1960-01-01', 'ms') + dates.astype('m8[ms]')
+    elif fmt in ["%td", "td"]:
+        out = np.datetime64('1960-01-01', 'D') + dates.astype('m8[D]')
+    elif fmt in ["%tw", "tw"]: # does not count leap days - 7 days is a week
+        year = (1960 - 1970 + dates // 52).astype('M8[Y]').astype('M8[D]')
+        out = year + ((dates % 52) * 7).astype('m8[D]')
+    elif fmt in ["%tm", "tm"]:
+        out = (12 * (1960 - 1970) + dates).astype('M8[M]')
+    elif fmt in ["%tq", "tq"]:
+        out = (12 * (1960 - 1970) + 3 * dates).astype('M8[M]')
+    elif fmt in ["%th", "th"]:
+        out = (12 * (1960 - 1970) + 6 * dates).astype('M8[M]')
+    elif fmt in ["%ty", "ty"]:
+        if np.any(dates[~nat] <= 0):
+            raise ValueError("Year 0 and before not implemented")
+        out = (dates - 1970).astype('M8[Y]')
+    else:
+        raise ValueError("Date fmt %s not understood" % fmt)
+    out = out.astype('M8[us]')
+    out[nat] = np.datetime64('NaT')
+    return out.astype(object)
+
 ### Helper classes for StataReader ###
 
 class _StataMissingValue(object):
@@ -296,8 +357,11 @@ class StataReader(object):
     MISSING_VALUES = { 'b': (-127,100), 'h': (-32767, 32740), 'l':
             (-2147483647, 2147483620), 'f': (-1.701e+38, +1.701e+38), 'd':
             (-1.798e+308, +8.988e+307) }
+    # numpy type codes of the numeric types as stored in a data record
+    RECORD_TYPES = {'b': 'i1', 'h': 'i2', 'l': 'i4', 'f': 'f4', 'd': 'f8'}
 
     def __init__(self, fname, missing_values=False, encoding=None):
+        self._header = {}
         if encoding == None:
             import locale
             self._encoding = locale.getpreferredencoding()
@@ -398,6 +462,100 @@ class StataReader(object):
             for i in range(self._header['nobs']):
                 yield self._next()
 
+    def data(self, usecols=None, start=0, stop=None, missing_flt=-999.,
+             convert_dates=True, pandas=False):
+        """
+        Returns a block of the dataset as an ndarray or DataFrame.
+
+        The records are decoded column-wise with a numpy structured dtype
+        instead of row by row. When the reader wraps a file on disk, the
+        records are memory mapped so that only the requested rows and
+        columns are copied into memory.
+
+        Parameters
+        ----------
+        usecols : list of str or int, optional
+            Names or positions of the variables to return, in the order
+            given. Default is all variables.
+        start : int
+            First observation to return.
+        stop : int, optional
+            Observation at which to stop. Default is the number of
+            observations in the file.
+        missing_flt : numeric
+            The numeric value to replace missing values with. Will be used
+            for any numeric value.
+        convert_dates : bool
+            If convert_dates is True, then Stata formatted dates will be
+            converted to datetime types according to the variable's format.
+        pandas : bool
+            Optionally return a DataFrame instead of an ndarray
+
+        Returns
+        -------
+        data : ndarray or DataFrame
+            Structured array with the selected variables as fields.
+
+        Notes
+        -----
+        Missing values are always replaced by `missing_flt`. Use `dataset`
+        with `missing_values=True` to inspect the Stata missing value codes.
+        """
+        nobs = self._header['nobs']
+        if stop is None or stop > nobs:
+            stop = nobs
+        start = min(max(start, 0), stop)
+        cols = self._usecols(usecols)
+        records = self._read_records(start, stop)
+
+        varlist = self._header['varlist']
+        fmtlist = self._header['fmtlist']
+        date_cols = [i for i in cols
+                     if convert_dates and fmtlist[i] in _date_formats]
+        dtype = [(varlist[i], object if i in date_cols
+                  else self._header['dtyplist'][i]) for i in cols]
+        data = np.empty(stop - start, dtype=np.dtype(dtype))
+        for i in cols:
+            values = self._convert_column(records, i, missing_flt)
+            if i in date_cols:
+                values = _stata_elapsed_date_to_datetime_vec(values,
+                                                             fmtlist[i])
+            data[varlist[i]] = values
+        del records
+
+        if pandas:
+            from pandas import DataFrame
+            data = DataFrame.from_records(data, index=np.arange(start, stop))
+        return data
+
+    def iterchunks(self, chunksize=100000, usecols=None, start=0, stop=None,
+                   missing_flt=-999., convert_dates=True, pandas=False):
+        """
+        Returns a generator over consecutive blocks of the dataset.
+
+        Parameters
+        ----------
+        chunksize : int
+            Number of observations in each block. The last block may be
+            shorter.
+        usecols, start, stop, missing_flt, convert_dates, pandas
+            See `data`.
+
+        Returns
+        -------
+        Generator object yielding the output of `data` for each block.
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be a positive integer")
+        nobs = self._header['nobs']
+        if stop is None or stop > nobs:
+            stop = nobs
+        for begin in range(max(start, 0), stop, chunksize):
+            yield self.data(usecols=usecols, start=begin,
+                            stop=min(begin + chunksize, stop),
+                            missing_flt=missing_flt,
+                            convert_dates=convert_dates, pandas=pandas)
+
     ### Python special methods
 
     def __len__(self):
@@ -528,6 +686,67 @@ class StataReader(object):
                     return None
         return d
 
+    def _record_dtype(self):
+        """Structured dtype of a data record as stored in the file."""
+        byteorder = self._header['byteorder']
+        return np.dtype([(name, 'S%d' % typ if type(typ) is int else
+                          byteorder + self.RECORD_TYPES[typ])
+                         for name, typ in zip(self._header['varlist'],
+                                              self._header['typlist'])])
+
+    def _usecols(self, usecols):
+        """Positions of the variables in usecols."""
+        varlist = self._header['varlist']
+        if usecols is None:
+            return range(len(varlist))
+        cols = []
+        for col in usecols:
+            if isinstance(col, basestring):
+                if col not in varlist:
+                    raise ValueError("%s is not a variable in the file" % col)
+                col = varlist.index(col)
+            elif not -len(varlist) <= col < len(varlist):
+                raise IndexError(col)
+            cols.append(col % len(varlist))
+        return cols
+
+    def _read_records(self, start, stop):
+        """Raw records start to stop, memory mapped if possible."""
+        dtype = self._record_dtype()
+        nrows = stop - start
+        if nrows <= 0:
+            return np.zeros(0, dtype=dtype)
+        offset = self._data_location + start * dtype.itemsize
+        if isinstance(self._file, _disk_file_types):
+            return np.memmap(self._file.name, dtype=dtype, mode='r',
+                             offset=offset, shape=(nrows,))
+        self._file.seek(offset)
+        byt = self._file.read(nrows * dtype.itemsize)
+        return np.frombuffer(byt, dtype=dtype, count=nrows)
+
+    def _convert_column(self, records, i, missing_flt):
+        """Column i of records with missing values and strings cleaned."""
+        typ = self._header['typlist'][i]
+        values = records[self._header['varlist'][i]]
+        if type(typ) is int:
+            # strings are null-terminated, anything after the first null
+            # byte is garbage
+            byt = np.ascontiguousarray(values).view(np.uint8)
+            byt = byt.reshape(len(values), typ).copy()
+            byt[np.cumsum(byt == 0, axis=1) > 0] = 0
+            return byt.view('S%d' % typ).ravel()
+        nmin, nmax = self.MISSING_VALUES[typ]
+        if typ == 'f':
+            # compare in double precision like the scalar reader
+            missing = values.astype(np.float64)
+        else:
+            missing = values
+        missing = (missing < nmin) | (missing > nmax)
+        values = values.astype(self._header['dtyplist'][i])
+        if missing.any():
+            values[missing] = missing_flt
+        return values
+
     def _next(self):
         typlist = self._header['typlist']
         if self._has_string_data:
@@ -978,7 +1197,7 @@ class StataWriter(object):
             return s
 
 def genfromdta(fname, missing_flt=-999., encoding=None, pandas=False,
-                convert_dates=True):
+                convert_dates=True, usecols=None):
     """
     Returns an ndarray or DataFrame from a Stata .dta file.
 
@@ -997,6 +1216,13 @@ def genfromdta(fname, missing_flt=-999., encoding=None, pandas=False,
     convert_dates : bool
         If convert_dates is True, then Stata formatted dates will be converted
         to datetime types according to the variable's format.
+    usecols : list of str or int, optional
+        Names or positions of the variables to return. Default is all
+        variables.
+
+    See also
+    --------
+    StataReader.data, StataReader.iterchunks
     """
     if isinstance(fname, basestring):
         fhd = StataReader(open(fname, 'rb'), missing_values=False,
@@ -1006,62 +1232,8 @@ def genfromdta(fname, missing_flt=-999., encoding=None, pandas=False,
                 "(got %s instead)" % type(fname))
     else:
         fhd = StataReader(fname, missing_values=False, encoding=encoding)
-#    validate_names = np.lib._iotools.NameValidator(excludelist=excludelist,
-#                                    deletechars=deletechars,
-#                                    case_sensitive=case_sensitive)
-
-    #TODO: This needs to handle the byteorder?
-    header = fhd.file_headers()
-    types = header['dtyplist']
-    nobs = header['nobs']
-    numvars = header['nvar']
-    varnames = header['varlist']
-    fmtlist = header['fmtlist']
-    dataname = header['data_label']
-    labels = header['vlblist'] # labels are thrown away unless DataArray
-                               # type is used
-    data = np.zeros((nobs,numvars))
-    stata_dta = fhd.dataset()
-
-    dt = np.dtype(zip(varnames, types))
-    data = np.zeros((nobs), dtype=dt) # init final array
-
-    for rownum,line in enumerate(stata_dta):
-        # doesn't handle missing value objects, just casts
-        # None will only work without missing value object.
-        if None in line:
-            for i,val in enumerate(line):
-                #NOTE: This will only be scalar types because missing strings
-                # are empty not None in Stata
-                if val is None:
-                    line[i] = missing_flt
-        data[rownum] = tuple(line)
-
-    if pandas:
-        from pandas import DataFrame
-        data = DataFrame.from_records(data)
-        if convert_dates:
-            cols = np.where(map(lambda x : x in _date_formats, fmtlist))[0]
-            for col in cols:
-                i = col
-                col = data.columns[col]
-                data[col] = data[col].apply(_stata_elapsed_date_to_datetime,
-                        args=(fmtlist[i],))
-    elif convert_dates:
-        #date_cols = np.where(map(lambda x : x in _date_formats,
-        #                                                    fmtlist))[0]
-        # make the dtype for the datetime types
-        cols = np.where(map(lambda x : x in _date_formats, fmtlist))[0]
-        dtype = data.dtype.descr
-        dtype = [(dt[0], object) if i in cols else dt for i,dt in
-                 enumerate(dtype)]
-        data = data.astype(dtype) # have to copy
-        for col in cols:
-            def convert(x):
-                return _stata_elapsed_date_to_datetime(x, fmtlist[col])
-            data[data.dtype.names[col]] = map(convert,
-                                              data[data.dtype.names[col]])
-    return data
+    return fhd.data(usecols=usecols, missing_flt=missing_flt,
+                    convert_dates=convert_dates, pandas=pandas)
 
 def savetxt(fname, X, names=None, fmt='%.18e', delimiter=' '):
     """
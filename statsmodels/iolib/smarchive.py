@@ -0,0 +1,406 @@
+'''Compact archive format for estimation results
+
+A results archive is a single file with a small JSON header followed by the
+raw data of the arrays. The header stores the classes of the results and the
+model, the names of the variables and the scalar statistics. The arrays,
+params and normalized_cov_params, are aligned so that they can be memory
+mapped.
+
+Loading an archive does not unpickle anything. It creates a results instance
+with a model that has the metadata but not the data of the original model.
+The statistics that only depend on params, the covariance and the stored
+scalars, e.g. bse, tvalues, pvalues, conf_int and predict for new exog, are
+available.
+
+File layout, version 1
+
+    magic string ``'\\x93SMARCHIVE'``
+    length of the header in bytes, little-endian uint32
+    header, JSON, padded with spaces to a multiple of 64 bytes
+    array data, each array starts at a multiple of 64 bytes
+
+License: BSD-3
+'''
+
+import sys
+import json
+import struct
+
+import numpy as np
+
+from statsmodels.compatnp.py3k import asbytes, asstr
+from statsmodels.base.data import ModelData, PandasData
+from statsmodels.tools.decorators import resettable_cache, CachedAttribute
+
+MAGIC = asbytes('\x93SMARCHIVE')
+FORMAT_VERSION = 1
+_ALIGN = 64
+
+# scalar statistics that are stored if the results have them
+_results_scalars = ['nobs', 'df_model', 'df_resid', 'k_constant', 'scale',
+                    'llf', 'llnull', 'llr', 'llr_pvalue', 'aic', 'bic',
+                    'rsquared', 'rsquared_adj', 'prsquared', 'fvalue',
+                    'f_pvalue', 'ssr', 'ess', 'centered_tss',
+                    'uncentered_tss', 'mse_model', 'mse_resid', 'mse_total',
+                    'deviance', 'pearson_chi2', 'k_extra', 'J', 'K']
+
+# arrays of the results, bse is stored because some models, e.g. RLM,
+# compute it from the data
+_results_arrays = ['params', 'normalized_cov_params', 'bse']
+
+# dictionaries of the results of which the scalar items are stored
+_results_dicts = ['mle_settings', 'mle_retvals', 'fit_options']
+
+# instances used by the model, e.g. the norm of RLM, that only have scalar
+# attributes, and their base class. The family of GLM is handled separately.
+_model_objects = {'M': 'statsmodels.robust.norms.RobustNorm'}
+
+# base classes of the classes in the header
+_MODEL = 'statsmodels.base.model.Model'
+_RESULTS = 'statsmodels.base.model.Results'
+_WRAPPER = 'statsmodels.base.wrapper.ResultsWrapper'
+_FAMILY = 'statsmodels.genmod.families.family.Family'
+_LINK = 'statsmodels.genmod.families.links.Link'
+
+
+class _ArchiveDataMixin(object):
+    '''data of a loaded model, has the names but not the data arrays'''
+
+    def __init__(self, xnames, ynames, k_constant=0):
+        self._cache = resettable_cache()
+        self.orig_endog = self.orig_exog = None
+        self.endog = self.exog = None
+        self.k_constant = k_constant
+        self.xnames = xnames
+        self.ynames = ynames
+
+    @property
+    def row_labels(self):
+        return None
+
+    def attach_rows(self, result):
+        return result
+
+    def attach_dates(self, result):
+        return result
+
+
+class ArchiveData(_ArchiveDataMixin, ModelData):
+    pass
+
+
+class ArchivePandasData(_ArchiveDataMixin, PandasData):
+    pass
+
+
+def _class_path(obj):
+    klass = obj if isinstance(obj, type) else type(obj)
+    return '%s.%s' % (klass.__module__, klass.__name__)
+
+
+def _import(path):
+    modname, name = path.rsplit('.', 1)
+    __import__(modname)
+    return getattr(sys.modules[modname], name, None)
+
+
+def _import_class(path, base):
+    '''
+    import a class from its dotted path in the header
+
+    Only statsmodels classes that are subclasses of `base`, the dotted path
+    of the expected base class, are imported, so that the header cannot be
+    used to create instances of arbitrary classes.
+    '''
+    if not path.startswith('statsmodels.'):
+        raise ValueError('%s is not a statsmodels class' % path)
+    klass = _import(path)
+    if not (isinstance(klass, type) and issubclass(klass, _import(base))):
+        raise ValueError('%s is not a subclass of %s' % (path, base))
+    return klass
+
+
+def _to_scalar(value):
+    '''returns value as python scalar or string, or None if it is neither'''
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, basestring):
+        return value
+    if isinstance(value, (int, long, float, np.integer, np.floating)):
+        return value.item() if isinstance(value, np.generic) else value
+    if isinstance(value, np.ndarray) and value.shape == ():
+        return _to_scalar(value[()])
+    return None
+
+
+def _scalar_items(dict_):
+    '''public scalar and string items of a dictionary'''
+    items = {}
+    for key, value in dict_.items():
+        if not isinstance(key, basestring) or key.startswith('_'):
+            continue
+        value = _to_scalar(value)
+        if value is not None:
+            items[key] = value
+    return items
+
+
+def _scalar_attrs(obj):
+    '''public scalar and string attributes of an instance'''
+    return _scalar_items(vars(obj))
+
+
+def _object_header(obj):
+    return {'class': _class_path(obj), 'attrs': _scalar_attrs(obj)}
+
+
+def _object_from_header(header, base):
+    klass = _import_class(header['class'], base)
+    obj = klass.__new__(klass)
+    obj.__dict__.update(header['attrs'])
+    return obj
+
+
+def _class_attr(klass, name):
+    '''class attribute without calling descriptors'''
+    for base in klass.__mro__:
+        if name in base.__dict__:
+            return base.__dict__[name]
+    return None
+
+
+def _set_attr(obj, name, value):
+    '''set an attribute, values of cached attributes go to the cache'''
+    attr = _class_attr(type(obj), name)
+    if isinstance(attr, CachedAttribute):
+        obj._cache[name] = value
+    elif not isinstance(attr, property):
+        setattr(obj, name, value)
+
+
+def _family_header(family):
+    return {'class': _class_path(family), 'attrs': _scalar_attrs(family),
+            'link': {'class': _class_path(family.link),
+                     'attrs': _scalar_attrs(family.link)}}
+
+
+def _family_from_header(header):
+    link = _import_class(header['link']['class'], _LINK)
+    family = _import_class(header['class'], _FAMILY)(link)
+    family.__dict__.update(header['attrs'])
+    family.link.__dict__.update(header['link']['attrs'])
+    return family
+
+
+def save_results(results, fname):
+    '''
+    Save estimation results in the archive format
+
+    Parameters
+    ----------
+    results : Results or ResultsWrapper instance
+        the estimation results, e.g. returned by the fit method of a model
+    fname : string
+        name of the file
+
+    Returns
+    -------
+    header : dict
+        the header that is written to the file
+
+    Notes
+    -----
+    Only params, normalized_cov_params and scalar statistics are stored, the
+    data and nobs-sized arrays of the model and results are not. Statistics
+    that are not yet cached are computed when the results are saved.
+
+    See Also
+    --------
+    load_results
+    '''
+    wrapper = None
+    if hasattr(results, '_results'):
+        wrapper = results
+        results = results._results
+    model = results.model
+    data = model.data
+
+    scalars = {}
+    for name in _results_scalars:
+        try:
+            value = _to_scalar(getattr(results, name))
+        except Exception:
+            continue
+        if value is not None:
+            scalars[name] = value
+    dicts = {}
+    for name in _results_dicts:
+        value = getattr(results, name, None)
+        if isinstance(value, dict):
+            dicts[name] = _scalar_items(value)
+
+    model_attrs = _scalar_attrs(model)
+    formula = model_attrs.pop('formula', None)
+    model_header = {'class': _class_path(model), 'attrs': model_attrs,
+                    'objects': {}}
+    if hasattr(model, 'family'):
+        model_header['family'] = _family_header(model.family)
+    for name in _model_objects:
+        if hasattr(model, name):
+            model_header['objects'][name] = _object_header(getattr(model,
+                                                                   name))
+
+    arrays = {}
+    offset = 0
+    blocks = []
+    for name in _results_arrays:
+        try:
+            arr = getattr(results, name)
+        except Exception:
+            continue
+        if arr is None:
+            continue
+        arr = np.ascontiguousarray(arr)
+        if arr.dtype.hasobject:
+            raise ValueError('%s has dtype object and cannot be stored'
+                             % name)
+        arrays[name] = {'dtype': arr.dtype.str, 'shape': arr.shape,
+                        'offset': offset}
+        blocks.append((offset, arr))
+        offset += -(-arr.nbytes // _ALIGN) * _ALIGN
+
+    ynames = data.ynames
+    xnames = data.xnames
+    header = {'format': 'statsmodels results archive',
+              'version': FORMAT_VERSION,
+              'results_class': _class_path(results),
+              'wrapper_class': wrapper and _class_path(wrapper),
+              'model': model_header,
+              'pandas': isinstance(data, PandasData),
+              'xnames': xnames and list(xnames),
+              'ynames': ynames,
+              'formula': formula,
+              'scalars': scalars,
+              'dicts': dicts,
+              'arrays': arrays}
+
+    header_bytes = asbytes(json.dumps(header))
+    start = len(MAGIC) + 4 + len(header_bytes)
+    header_bytes += asbytes(' ' * (-start % _ALIGN))
+    data_offset = len(MAGIC) + 4 + len(header_bytes)
+    with open(fname, 'wb') as fh:
+        fh.write(MAGIC)
+        fh.write(struct.pack('<I', len(header_bytes)))
+        fh.write(header_bytes)
+        for offset, arr in blocks:
+            fh.seek(data_offset + offset)
+            fh.write(arr.tostring())
+    return header
+
+
+def _read_header(fh):
+    magic = fh.read(len(MAGIC))
+    if magic != MAGIC:
+        raise ValueError('not a statsmodels results archive')
+    length, = struct.unpack('<I', fh.read(4))
+    header = json.loads(asstr(fh.read(length)))
+    if header['version'] > FORMAT_VERSION:
+        raise ValueError('results archive version %d is not supported, '
+                         'the highest supported version is %d'
+                         % (header['version'], FORMAT_VERSION))
+    return header, len(MAGIC) + 4 + length
+
+
+def read_header(fname):
+    '''
+    Read the header of a results archive
+
+    Parameters
+    ----------
+    fname : string
+        name of the file
+
+    Returns
+    -------
+    header : dict
+        contains the classes, variable names, scalar statistics and the
+        description of the stored arrays
+    '''
+    with open(fname, 'rb') as fh:
+        return _read_header(fh)[0]
+
+
+def load_results(fname, mmap_mode='r'):
+    '''
+    Load estimation results from an archive
+
+    Parameters
+    ----------
+    fname : string
+        name of the file written by `save_results`
+    mmap_mode : None, 'r' or 'c'
+        If not None, then the arrays are memory mapped with this mode, and
+        only read from disk when they are used. If None, then the arrays are
+        read into memory.
+
+    Returns
+    -------
+    results : Results or ResultsWrapper instance
+        The results are wrapped if the saved results were wrapped.
+
+    Notes
+    -----
+    The model of the results has the variable names and the scalar
+    attributes of the original model, but no data. Statistics that need the
+    data, e.g. resid, are not available unless they are stored scalars.
+    predict requires `exog`, the design matrix of the new observations, the
+    formula is not applied. Nothing is unpickled.
+    '''
+    with open(fname, 'rb') as fh:
+        header, data_offset = _read_header(fh)
+        arrays = {}
+        for name, info in header['arrays'].items():
+            dtype = np.dtype(str(info['dtype']))
+            shape = tuple(info['shape'])
+            offset = data_offset + info['offset']
+            if mmap_mode is not None and np.prod(shape) > 0:
+                arrays[name] = np.memmap(fname, dtype=dtype, mode=mmap_mode,
+                                         offset=offset, shape=shape)
+            else:
+                fh.seek(offset)
+                count = int(np.prod(shape))
+                arrays[name] = np.fromfile(fh, dtype=dtype,
+                                           count=count).reshape(shape)
+
+    model_header = header['model']
+    model_class = _import_class(model_header['class'], _MODEL)
+    model = model_class.__new__(model_class)
+    model.__dict__.update(model_header['attrs'])
+    if 'family' in model_header:
+        model.family = _family_from_header(model_header['family'])
+    for name, obj_header in model_header['objects'].items():
+        if name not in _model_objects:
+            raise ValueError('unknown model attribute %s' % name)
+        setattr(model, name, _object_from_header(obj_header,
+                                                 _model_objects[name]))
+    data_class = ArchivePandasData if header['pandas'] else ArchiveData
+    model.data = data_class(header['xnames'], header['ynames'],
+                            model_header['attrs'].get('k_constant', 0))
+    model.endog = model.exog = None
+
+    results_class = _import_class(header['results_class'], _RESULTS)
+    results = results_class.__new__(results_class)
+    results.model = model
+    results._cache = resettable_cache()
+    results.normalized_cov_params = None
+    if hasattr(model, 'family'):
+        results.family = model.family
+    for name, value in arrays.items():
+        _set_attr(results, name, value)
+    for name, value in header['scalars'].items():
+        _set_attr(results, name, value)
+    results.__dict__.update(header['dicts'])
+
+    if header['wrapper_class']:
+        return _import_class(header['wrapper_class'], _WRAPPER)(results)
+    return results
@@ -12,8 +12,9 @@ import pandas.util.testing as ptesting
 
 from statsmodels.compatnp.py3k import BytesIO, asbytes
 import statsmodels.api as sm
-from statsmodels.iolib.foreign import (StataWriter, genfromdta,
-            _datetime_to_stata_elapsed, _stata_elapsed_date_to_datetime)
+from statsmodels.iolib.foreign import (StataReader, StataWriter, genfromdta,
+            _datetime_to_stata_elapsed, _stata_elapsed_date_to_datetime,
+            _stata_elapsed_date_to_datetime_vec)
 from statsmodels.datasets import macrodata
 
 
@@ -171,6 +172,51 @@ def test_date_converters():
         assert_equal(_datetime_to_stata_elapsed(
                      _stata_elapsed_date_to_datetime(i, "ty"), "ty"), i)
 
+def test_date_converters_vec():
+    dates = np.array([-1e3, -100, -53, -13, -5, -1, 0, 1, 5, 13, 53, 100, 1e3])
+    for fmt in ["tc", "td", "tw", "tm", "tq", "th"]:
+        res = _stata_elapsed_date_to_datetime_vec(dates, fmt)
+        assert_equal(res.tolist(),
+                [_stata_elapsed_date_to_datetime(i, fmt) for i in dates])
+    year = np.array([1, 50, 500, 1975, 2075, np.nan])
+    res = _stata_elapsed_date_to_datetime_vec(year, "ty")
+    assert_equal(res[:-1].tolist(),
+                 [_stata_elapsed_date_to_datetime(i, "ty") for i in year[:-1]])
+    assert_(res[-1] is None)
+    assert_raises(ValueError, _stata_elapsed_date_to_datetime_vec, [0], "ty")
+
+def test_stata_reader_data():
+    fname = curdir + '/../../datasets/macrodata/macrodata.dta'
+    res2 = genfromdta(fname)
+    names = res2.dtype.names
+
+    reader = StataReader(open(fname, 'rb'))
+    res1 = reader.data(usecols=['realgdp', 3, 'year'], start=10, stop=20)
+    assert_equal(res1.dtype.names, ('realgdp', names[3], 'year'))
+    for name in res1.dtype.names:
+        assert_array_equal(res1[name], res2[name][10:20])
+
+    chunks = list(reader.iterchunks(chunksize=60, start=3))
+    nobs = len(res2) - 3
+    assert_equal([len(chunk) for chunk in chunks],
+                 [60] * (nobs // 60) + [nobs % 60])
+    assert_array_equal(np.concatenate(chunks), res2[3:])
+
+    # not memory mapped
+    reader = StataReader(BytesIO(open(fname, 'rb').read()))
+    assert_array_equal(reader.data(start=100), res2[100:])
+    res1 = reader.data(usecols=['year', 'infl'], start=5, stop=9, pandas=True)
+    assert_equal(res1.index.tolist(), range(5, 9))
+    assert_array_equal(res1['infl'], res2['infl'][5:9])
+
+def test_stata_reader_data_missing():
+    fname = os.path.join(curdir, "results/data_missing.dta")
+    rows = list(StataReader(open(fname, 'rb')).dataset())
+    dta = StataReader(open(fname, 'rb')).data(missing_flt=-999)
+    for i, row in enumerate(rows):
+        assert_equal(dta[i].tolist(),
+                     tuple(-999 if val is None else val for val in row))
+
 @dec.skipif(pandas_old)
 def test_datetime_roundtrip():
     dta = np.array([(1, datetime(2010, 1, 1), 2),
@@ -0,0 +1,139 @@
+'''Tests for the results archive format
+
+'''
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from numpy.testing import (assert_, assert_equal, assert_allclose,
+                           assert_raises)
+
+import statsmodels.api as sm
+from statsmodels.compatnp.py3k import asbytes
+from statsmodels.iolib.smarchive import (save_results, load_results,
+                                         read_header, MAGIC)
+
+
+class TestArchive(object):
+
+    @classmethod
+    def setup_class(cls):
+        cls.tmpdir = tempfile.mkdtemp(prefix='archive')
+        cls.fname = os.path.join(cls.tmpdir, 'res.smr')
+        data = sm.datasets.longley.load_pandas()
+        cls.exog = sm.add_constant(data.exog, prepend=False)
+        cls.endog = data.endog
+        spector = sm.datasets.spector.load()
+        cls.exog_bin = sm.add_constant(spector.exog, prepend=False)
+        cls.endog_bin = spector.endog
+
+    @classmethod
+    def teardown_class(cls):
+        shutil.rmtree(cls.tmpdir)
+
+    def check_results(self, res, exog, mmap_mode='r'):
+        header = save_results(res, self.fname)
+        res2 = load_results(self.fname, mmap_mode=mmap_mode)
+        assert_equal(type(res2), type(res))
+        for name in ['params', 'bse', 'tvalues', 'pvalues']:
+            assert_allclose(getattr(res2, name), getattr(res, name),
+                            rtol=1e-13)
+        for name in header['scalars']:
+            assert_equal(getattr(res2, name), getattr(res, name))
+        assert_allclose(res2.conf_int(), res.conf_int(), rtol=1e-13)
+        assert_allclose(res2.cov_params(), res.cov_params(), rtol=1e-13)
+        assert_allclose(res2.predict(exog[:5]), res.predict(exog[:5]),
+                        rtol=1e-13)
+        assert_equal(res2.model.exog_names, res.model.exog_names)
+        assert_equal(res2.model.endog_names, res.model.endog_names)
+        return res2
+
+    def test_regression(self):
+        res = sm.OLS(self.endog, self.exog).fit()
+        res2 = self.check_results(res, self.exog.values)
+        assert_equal(list(res2.params.index), list(self.exog.columns))
+        assert_(isinstance(res2._results.params, np.memmap))
+        assert_equal(res2.rsquared, res.rsquared)
+        assert_equal(res2.llf, res.llf)
+        assert_equal(res2.nobs, res.nobs)
+        res = sm.WLS(self.endog.values, self.exog.values,
+                     weights=np.arange(1, 17.)).fit()
+        res2 = self.check_results(res, self.exog.values, mmap_mode=None)
+        assert_(not isinstance(res2.params, np.memmap))
+        assert_equal(res2.model.exog_names, ['x1', 'x2', 'x3', 'x4', 'x5',
+                                             'x6', 'const'])
+
+    def test_glm_rlm(self):
+        res = sm.GLM(self.endog, self.exog,
+                     family=sm.families.Gamma(sm.families.links.log)).fit()
+        res2 = self.check_results(res, self.exog.values)
+        assert_equal(type(res2.model.family.link),
+                     sm.families.links.log)
+        assert_equal(res2.deviance, res.deviance)
+        res = sm.RLM(self.endog, self.exog,
+                     M=sm.robust.norms.HuberT(t=1.5)).fit()
+        res2 = self.check_results(res, self.exog.values)
+        assert_equal(res2.model.M.t, 1.5)
+
+    def test_discrete(self):
+        res = sm.Logit(self.endog_bin, self.exog_bin).fit(disp=0)
+        res2 = self.check_results(res, self.exog_bin)
+        assert_equal(res2.mle_retvals['converged'], True)
+        assert_equal(res2.prsquared, res.prsquared)
+
+    def test_header(self):
+        res = sm.OLS(self.endog, self.exog).fit()
+        save_results(res, self.fname)
+        header = read_header(self.fname)
+        assert_equal(header['version'], 1)
+        assert_equal(header['results_class'],
+                     'statsmodels.regression.linear_model.OLSResults')
+        assert_equal(header['arrays']['params']['shape'], [7])
+        # arrays are aligned
+        with open(self.fname, 'rb') as fh:
+            assert_equal(fh.read(len(MAGIC)), MAGIC)
+        offsets = [info['offset'] for info in header['arrays'].values()]
+        assert_equal(np.mod(offsets, 64), 0)
+
+        # newer versions raise
+        with open(self.fname, 'rb') as fh:
+            content = fh.read()
+        content = content.replace(asbytes('"version": 1'),
+                                  asbytes('"version": 9'))
+        with open(self.fname, 'wb') as fh:
+            fh.write(content)
+        assert_raises(ValueError, load_results, self.fname)
+        with open(self.fname, 'wb') as fh:
+            fh.write(asbytes('not an archive'))
+        assert_raises(ValueError, read_header, self.fname)
+
+    def test_classes(self):
+        # only statsmodels classes with the expected base class are loaded
+        res = sm.OLS(self.endog, self.exog).fit()
+        save_results(res, self.fname)
+        with open(self.fname, 'rb') as fh:
+            content = fh.read()
+        path = 'statsmodels.regression.linear_model.OLSResults'
+        for other in ['xtatsmodels.regression.linear_model.OLSResults',
+                      'statsmodels.regression.linear_model.OLS',
+                      'statsmodels.tools.tools.add_constant']:
+            # same length of the header, padded with whitespace
+            other = ('"%s"' % other).ljust(len(path) + 2)
+            with open(self.fname, 'wb') as fh:
+                fh.write(content.replace(asbytes('"%s"' % path),
+                                         asbytes(other)))
+            assert_equal(read_header(self.fname)['results_class'],
+                         other.strip()[1:-1])
+            assert_raises(ValueError, load_results, self.fname)
+
+        from statsmodels.iolib.smarchive import _import_class
+        assert_raises(ValueError, _import_class, 'os.system',
+                      'statsmodels.base.model.Results')
+        assert_raises(ValueError, _import_class,
+                      'statsmodels.tools.tools.add_constant',
+                      'statsmodels.base.model.Results')
+        assert_raises(ValueError, _import_class,
+                      'statsmodels.genmod.families.links.Log',
+                      'statsmodels.genmod.families.family.Family')
@@ -16,6 +16,7 @@ except ImportError:
     has_joblib = False
 
 import kernels
+from statsmodels.tools.profiling import fit_profiling, current_trace
 
 
 kernel_func = dict(wangryzin=kernels.wang_ryzin,
@@ -101,6 +102,7 @@ class GenericKDE (object):
     """
     Base class for density estimation and regression KDE classes.
     """
+    @fit_profiling
     def _compute_bw(self, bw):
         """
         Computes the bandwidth of the data.
@@ -132,6 +134,7 @@ class GenericKDE (object):
         else:
             # The user specified a bandwidth selection method
             self._bw_method = bw
+            current_trace().update(method=bw)
             bwfunc = self.bw_func[bw]
             res = bwfunc()
 
@@ -292,8 +295,13 @@ class GenericKDE (object):
         """
         # the initial value for the optimization is the normal_reference
         h0 = self._normal_reference()
-        bw = optimize.fmin(self.loo_likelihood, x0=h0, args=(np.log, ),
-                           maxiter=1e3, maxfun=1e3, disp=0, xtol=1e-3)
+        trace = current_trace()
+        with trace.stage('optimizer'):
+            bw = optimize.fmin(trace.counted('loo_likelihood',
+                                             self.loo_likelihood),
+                               x0=h0, args=(np.log, ), maxiter=1e3,
+                               maxfun=1e3, disp=0, xtol=1e-3,
+                               callback=trace.wrap_callback(None, h0))
         bw = self._set_bw_bounds(bw)  # bound bw if necessary
         return bw
 
@@ -316,8 +324,11 @@ class GenericKDE (object):
         (``KDEMultivariate``) kernel density estimation.
         """
         h0 = self._normal_reference()
-        bw = optimize.fmin(self.imse, x0=h0, maxiter=1e3, maxfun=1e3, disp=0,
-                           xtol=1e-3)
+        trace = current_trace()
+        with trace.stage('optimizer'):
+            bw = optimize.fmin(trace.counted('imse', self.imse), x0=h0,
+                               maxiter=1e3, maxfun=1e3, disp=0, xtol=1e-3,
+                               callback=trace.wrap_callback(None, h0))
         bw = self._set_bw_bounds(bw)  # bound bw if necessary
         return bw
 
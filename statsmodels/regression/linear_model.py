@@ -40,6 +40,8 @@ from statsmodels.tools.decorators import (resettable_cache,
         cache_readonly, cache_writable)
 import statsmodels.base.model as base
 import statsmodels.base.wrapper as wrap
+from statsmodels.tools.profiling import fit_profiling, current_trace
+from statsmodels.tools import precision
 from statsmodels.emplike.elregress import _ELRegOpts
 from scipy import optimize
 from scipy.stats import chi2
@@ -85,12 +87,19 @@ class RegressionModel(base.LikelihoodModel):
         self.wendog = self.whiten(self.endog)
         # overwrite nobs from class Model:
         self.nobs = float(self.wexog.shape[0])
-        self.rank = rank(self.exog)
+        if self.precision == 'mixed':
+            # the rank is computed from the gram matrix, without a copy of
+            # exog for the SVD
+            xtx = precision.gram(self.wexog)
+            self.normalized_cov_params = np.linalg.pinv(xtx)
+            self.rank = np.linalg.matrix_rank(xtx)
+        else:
+            self.rank = rank(self.exog)
         self.df_model = float(self.rank - self.k_constant)
         self.df_resid = self.nobs - self.rank
-        self.df_model = float(rank(self.exog) - self.k_constant)
 
-    def fit(self, method="pinv", **kwargs):
+    @fit_profiling
+    def fit(self, method="pinv", wrap=True, **kwargs):
         """
         Full fit of the model.
 
@@ -103,6 +112,12 @@ class RegressionModel(base.LikelihoodModel):
             Can be "pinv", "qr".  "pinv" uses the Moore-Penrose pseudoinverse
             to solve the least squares problem. "qr" uses the QR
             factorization.
+        wrap : bool
+            If True (default), the results are wrapped to reattach the
+            metadata of the data, e.g. pandas indices. If False, the bare
+            results instance is returned, which has no wrapping overhead
+            on attribute access. The statistics are computed on access in
+            both cases.
 
         Returns
         -------
@@ -116,25 +131,42 @@ class RegressionModel(base.LikelihoodModel):
         -----
         The fit method uses the pseudoinverse of the design/exogenous variables
         to solve the least squares minimization.
+
+        If the model has ``precision='mixed'``, then method is ignored. The
+        normal equations are solved in float64 with iterative refinement,
+        see statsmodels.tools.precision.lstsq.
         """
         exog = self.wexog
         endog = self.wendog
-
-        if method == "pinv":
+        trace = current_trace()
+
+        if self.precision == 'mixed':
+            trace.update(method='mixed')
+            with trace.stage('lstsq'):
+                beta, self.normalized_cov_params, n_iter = precision.lstsq(
+                    exog, endog,
+                    normalized_cov_params=self.normalized_cov_params)
+            trace.update(iterations=n_iter)
+        elif method == "pinv":
+            trace.update(method=method)
             if ((not hasattr(self, 'pinv_wexog')) or
                 (not hasattr(self, 'normalized_cov_params'))):
                 #print "recalculating pinv"   #for debugging
-                self.pinv_wexog = pinv_wexog = np.linalg.pinv(self.wexog)
-                self.normalized_cov_params = np.dot(pinv_wexog,
-                                                 np.transpose(pinv_wexog))
+                with trace.stage('pinv'):
+                    self.pinv_wexog = pinv_wexog = np.linalg.pinv(self.wexog)
+                    self.normalized_cov_params = np.dot(pinv_wexog,
+                                                     np.transpose(pinv_wexog))
             beta = np.dot(self.pinv_wexog, endog)
 
         elif method == "qr":
+            trace.update(method=method)
             if ((not hasattr(self, 'exog_Q')) or
                 (not hasattr(self, 'normalized_cov_params'))):
-                Q, R = np.linalg.qr(exog)
-                self.exog_Q, self.exog_R = Q, R
-                self.normalized_cov_params = np.linalg.inv(np.dot(R.T, R))
+                with trace.stage('qr'):
+                    Q, R = np.linalg.qr(exog)
+                    self.exog_Q, self.exog_R = Q, R
+                    self.normalized_cov_params = np.linalg.inv(np.dot(R.T,
+                                                                      R))
             else:
                 Q, R = self.exog_Q, self.exog_R
 
@@ -149,6 +181,8 @@ class RegressionModel(base.LikelihoodModel):
         else:
             lfit = RegressionResults(self, beta,
                        normalized_cov_params=self.normalized_cov_params)
+        if not wrap:
+            return lfit
         return RegressionResultsWrapper(lfit)
 
     def predict(self, params, exog=None):
@@ -174,7 +208,7 @@ class RegressionModel(base.LikelihoodModel):
         #SS: it needs its own predict method
         if exog is None:
             exog = self.exog
-        return np.dot(exog, params)
+        return precision.dot(exog, params)
 
 class GLS(RegressionModel):
     __doc__ = """
@@ -370,15 +404,18 @@ class WLS(RegressionModel):
     statistics such as fvalue and mse_model might not be correct, as the
     package does not yet support no-constant regression.
     """ % {'params' : base._model_params_doc,
-           'extra_params' : base._missing_param_doc + base._extra_param_doc}
+           'extra_params' : base._missing_param_doc + base._extra_param_doc +
+                           base._dtype_param_doc + base._precision_param_doc}
 
-    def __init__(self, endog, exog, weights=1., missing='none', hasconst=None):
+    def __init__(self, endog, exog, weights=1., missing='none', hasconst=None,
+                 dtype=None, precision=None):
         weights = np.array(weights)
         if weights.shape == ():
             weights = np.repeat(weights, len(endog))
         weights = weights.squeeze()
         super(WLS, self).__init__(endog, exog, missing=missing,
-                                  weights=weights, hasconst=hasconst)
+                                  weights=weights, hasconst=hasconst,
+                                  dtype=dtype, precision=precision)
         nobs = self.exog.shape[0]
         weights = self.weights
         if len(weights) != nobs and weights.size == nobs:
@@ -402,7 +439,11 @@ class WLS(RegressionModel):
         if X.ndim == 1:
             return X * np.sqrt(self.weights)
         elif X.ndim == 2:
-            return np.sqrt(self.weights)[:,None]*X
+            sqrt_weights = np.sqrt(self.weights)
+            if X.dtype == np.float32:
+                # single precision exog stays in single precision
+                sqrt_weights = sqrt_weights.astype(np.float32)
+            return sqrt_weights[:,None]*X
 
     def loglike(self, params):
         """
@@ -472,11 +513,14 @@ class OLS(WLS):
     -----
     No constant is added by the model unless you are using formulas.
     """ % {'params' : base._model_params_doc,
-           'extra_params' : base._missing_param_doc + base._extra_param_doc}
+           'extra_params' : base._missing_param_doc + base._extra_param_doc +
+                           base._dtype_param_doc + base._precision_param_doc}
     #TODO: change example to use datasets.  This was the point of datasets!
-    def __init__(self, endog, exog=None, missing='none', hasconst=None):
+    def __init__(self, endog, exog=None, missing='none', hasconst=None,
+                 dtype=None, precision=None):
         super(OLS, self).__init__(endog, exog, missing=missing,
-                                  hasconst=hasconst)
+                                  hasconst=hasconst, dtype=dtype,
+                                  precision=precision)
 
     def loglike(self, params):
         '''
@@ -1002,6 +1046,11 @@ class RegressionResults(base.LikelihoodModelResults):
 
     #TODO: make these properties reset bse
     def _HCCM(self, scale):
+        if self.model.precision == 'mixed':
+            # (X'X)^-1 X' diag(scale) X (X'X)^-1 without pinv_wexog
+            cov_p = self.normalized_cov_params
+            return np.dot(np.dot(cov_p, precision.gram(self.model.wexog,
+                                                       scale)), cov_p)
         H = np.dot(self.model.pinv_wexog,
             scale[:,None]*self.model.pinv_wexog.T)
         return H
@@ -1197,7 +1246,7 @@ class RegressionResults(base.LikelihoodModelResults):
         #TODO: reuse condno from somewhere else ?
         #condno = np.linalg.cond(np.dot(self.wexog.T, self.wexog))
         wexog = self.model.wexog
-        eigvals = np.linalg.linalg.eigvalsh(np.dot(wexog.T, wexog))
+        eigvals = np.linalg.linalg.eigvalsh(precision.gram(wexog))
         eigvals = np.sort(eigvals) #in increasing order
         condno = np.sqrt(eigvals[-1]/eigvals[0])
 
@@ -1340,7 +1389,7 @@ class RegressionResults(base.LikelihoodModelResults):
         omni, omnipv = omni_normtest(self.wresid)
         dw = durbin_watson(self.wresid)
         condno = cond(self.model.wexog)
-        eigvals = eigvalsh(np.dot(self.model.wexog.T, self.model.wexog))
+        eigvals = eigvalsh(precision.gram(self.model.wexog))
         eigvals = np.sort(eigvals) #in increasing order
         diagnostic = OrderedDict([
                      ('Omnibus:',  "%.3f" % omni),
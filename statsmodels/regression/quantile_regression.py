@@ -3,8 +3,9 @@
 '''
 Quantile regression model
 
-Model parameters are estimated using iterated reweighted least squares. The
-asymptotic covariance matrix estimated using kernel density estimation.
+Model parameters are estimated using iterated reweighted least squares or
+the Frisch-Newton interior point algorithm. The asymptotic covariance matrix
+estimated using kernel density estimation.
 
 Author: Vincent Arel-Bundock
 License: BSD-3
@@ -33,7 +34,7 @@ class QuantReg(RegressionModel):
     '''Quantile Regression
 
     Estimate a quantile regression model using iterative reweighted least
-    squares.
+    squares or the Frisch-Newton interior point method.
 
     Parameters
     ----------
@@ -51,6 +52,9 @@ class QuantReg(RegressionModel):
     Greene (2008, p.407-408), using either the logistic or gaussian kernels
     (kernel argument of the fit method).
 
+    Several quantiles can be estimated with `fit_quantiles`, which uses the
+    estimate of the neighboring quantile as starting value.
+
     References
     ----------
     General:
@@ -59,6 +63,7 @@ class QuantReg(RegressionModel):
     * Green,W. H. (2008). Econometric Analysis. Sixth Edition. International Student Edition.
     * Koenker, R. (2005). Quantile Regression. New York: Cambridge University Press.
     * LeSage, J. P.(1999). Applied Econometrics Using MATLAB,
+    * Portnoy, S. and R. Koenker (1997). The Gaussian hare and the Laplacian tortoise: computability of squared-error versus absolute-error estimators. Statistical Science 12: 279-300.
 
     Kernels (used by the fit method):
 
@@ -84,8 +89,9 @@ class QuantReg(RegressionModel):
         return data
 
     def fit(self, q=.5, vcov='robust', kernel='epa', bandwidth='hsheather',
-            max_iter=1000, p_tol=1e-6, **kwargs):
-        '''Solve by Iterative Weighted Least Squares
+            max_iter=1000, p_tol=1e-6, method='irls', start_params=None,
+            **kwargs):
+        '''Solve by Iterative Weighted Least Squares or interior point method
 
         Parameters
         ----------
@@ -113,6 +119,23 @@ class QuantReg(RegressionModel):
             - hsheather: Hall-Sheather (1988)
             - bofinger: Bofinger (1975)
             - chamberlain: Chamberlain (1994)
+
+        max_iter : int
+            maximum number of iterations
+        p_tol : float
+            convergence tolerance. For ``irls`` this is the maximum absolute
+            change in the parameters, for ``interior-point`` the duality
+            gap.
+        method : string, optimization method
+
+            - irls : iteratively reweighted least squares
+            - interior-point : Frisch-Newton primal-dual interior point
+              algorithm of Portnoy and Koenker (1997), which converges in a
+              few dozen iterations also for a large number of observations
+
+        start_params : None or array_like
+            starting values for the parameters, for example the estimate for
+            a neighboring quantile. The default is to start with OLS.
         '''
 
         if q < 0 or q > 1:
@@ -133,25 +156,81 @@ class QuantReg(RegressionModel):
         else:
             raise Exception("bandwidth must be in 'hsheather', 'bofinger', 'chamberlain'")
 
+        if vcov not in ['robust', 'iid']:
+            raise Exception("vcov must be 'robust' or 'iid'")
+
+        if start_params is not None:
+            start_params = np.asarray(start_params, dtype=float)
+            if len(start_params) != self.exog.shape[1]:
+                raise ValueError('start_params has wrong length')
+
+        if method == 'irls':
+            beta, n_iter, history = self._fit_irls(q, max_iter, p_tol,
+                                                   start_params)
+        elif method == 'interior-point':
+            beta, n_iter, history = _frisch_newton(self.endog, self.exog, q,
+                                           max_iter=max_iter, p_tol=p_tol,
+                                           start_params=start_params)
+        else:
+            raise ValueError("method must be 'irls' or 'interior-point'")
+
+        return self._results(beta, q, vcov, kernel, bandwidth, n_iter, history)
+
+    def fit_quantiles(self, quantiles, vcov='robust', kernel='epa',
+                      bandwidth='hsheather', max_iter=1000, p_tol=1e-6,
+                      method='interior-point'):
+        '''Estimate the model for a sequence of quantiles
+
+        The quantiles are estimated starting at the median, and each
+        optimization starts at the estimate of the neighboring quantile.
+        The terms of the covariance matrix that do not depend on the quantile
+        are computed only once.
+
+        Parameters
+        ----------
+        quantiles : array_like
+            quantiles, each between 0 and 1
+        vcov, kernel, bandwidth, max_iter, p_tol, method :
+            see `fit`. The default method is ``interior-point``.
+
+        Returns
+        -------
+        results : list
+            results instances in the same order as `quantiles`
+        '''
+        quantiles = np.atleast_1d(quantiles)
+        results = [None] * len(quantiles)
+        # start at the median and move outwards in both directions, each fit
+        # starts at the estimate for the neighboring quantile
+        order = np.argsort(quantiles)
+        n_lower = np.searchsorted(quantiles[order], 0.5)
+        start_median = None
+        for idx in (order[n_lower:], order[:n_lower][::-1]):
+            start = start_median
+            for ii in idx:
+                res = self.fit(q=quantiles[ii], vcov=vcov, kernel=kernel,
+                               bandwidth=bandwidth, max_iter=max_iter,
+                               p_tol=p_tol, method=method, start_params=start)
+                start = res._results.params
+                if start_median is None:
+                    start_median = start
+                results[ii] = res
+        return results
+
+    def _fit_irls(self, q, max_iter, p_tol, start_params=None):
         endog = self.endog
         exog = self.exog
-        nobs = self.nobs
         rank = self.rank
         n_iter = 0
         xstar = exog
 
         beta = np.ones(rank)
-        # TODO: better start, initial beta is used only for convergence check
-
-        # Note the following doesn't work yet,
-        # the iteration loop always starts with OLS as initial beta
-#        if start_params is not None:
-#            if len(start_params) != rank:
-#                raise ValueError('start_params has wrong length')
-#            beta = start_params
-#        else:
-#            # start with OLS
-#            beta = np.dot(np.linalg.pinv(exog), endog)
+        if start_params is not None:
+            # the first iteration uses the weights of the start_params
+            # instead of the OLS weights
+            beta = start_params
+            xstar = exog / _irls_weights(endog - np.dot(exog, beta),
+                                         q)[:, np.newaxis]
 
         diff = 10
         cycle = False
@@ -163,12 +242,7 @@ class QuantReg(RegressionModel):
             xtx = np.dot(xstar.T, exog)
             xty = np.dot(xstar.T, endog)
             beta = np.dot(pinv(xtx), xty)
-            resid = endog - np.dot(exog, beta)
-
-            mask = np.abs(resid) < .000001
-            resid[mask] = np.sign(resid[mask]) * .000001
-            resid = np.where(resid < 0, q * resid, (1-q) * resid)
-            resid = np.abs(resid)
+            resid = _irls_weights(endog - np.dot(exog, beta), q)
             xstar = exog / resid[:, np.newaxis]
             diff = np.max(np.abs(beta - beta0))
             history['params'].append(beta)
@@ -185,26 +259,37 @@ class QuantReg(RegressionModel):
         if n_iter == max_iter:
             warnings.warn("Maximum number of iterations (1000) reached.")
 
+        return beta, n_iter, history
+
+    def _results(self, beta, q, vcov, kernel, bandwidth, n_iter, history):
+        endog = self.endog
+        exog = self.exog
+        nobs = self.nobs
+
+        # terms that do not depend on the quantile are shared across fits
+        if not hasattr(self, '_xtxi'):
+            self._xtxi = pinv(np.dot(exog.T, exog))
+            self._endog_std = np.std(endog)
+        xtxi = self._xtxi
+
         e = endog - np.dot(exog, beta)
         # Greene (2008, p.407) writes that Stata 6 uses this bandwidth:
         # h = 0.9 * np.std(e) / (nobs**0.2)
         # Instead, we calculate bandwidth as in Stata 12
-        iqre = stats.scoreatpercentile(e, 75) - stats.scoreatpercentile(e, 25)
+        q25, q75 = np.percentile(e, [25, 75])
+        iqre = q75 - q25
         h = bandwidth(nobs, q)
-        h = min(np.std(endog),
+        h = min(self._endog_std,
                 iqre / 1.34) * (norm.ppf(q + h) - norm.ppf(q - h))
 
         fhat0 = 1. / (nobs * h) * np.sum(kernel(e / h))
 
         if vcov == 'robust':
             d = np.where(e > 0, (q/fhat0)**2, ((1-q)/fhat0)**2)
-            xtxi = pinv(np.dot(exog.T, exog))
             xtdx = np.dot(exog.T * d[np.newaxis, :], exog)
             vcov = chain_dot(xtxi, xtdx, xtxi)
         elif vcov == 'iid':
-            vcov = (1. / fhat0)**2 * q * (1 - q) * pinv(np.dot(exog.T, exog))
-        else:
-            raise Exception("vcov must be 'robust' or 'iid'")
+            vcov = (1. / fhat0)**2 * q * (1 - q) * xtxi
 
         lfit = QuantRegResults(self, beta, normalized_cov_params=vcov)
 
@@ -217,6 +302,131 @@ class QuantReg(RegressionModel):
         return RegressionResultsWrapper(lfit)
 
 
+def _irls_weights(resid, q):
+    mask = np.abs(resid) < .000001
+    resid[mask] = np.sign(resid[mask]) * .000001
+    resid = np.where(resid < 0, q * resid, (1-q) * resid)
+    return np.abs(resid)
+
+
+def _step_bound(x, dx):
+    # largest step length that keeps x + step * dx nonnegative
+    neg = dx < 0
+    if not neg.any():
+        return 1e20
+    return np.min(-x[neg] / dx[neg])
+
+
+def _frisch_newton(endog, exog, q, max_iter=50, p_tol=1e-6, start_params=None,
+                   beta=0.99995):
+    '''Frisch-Newton interior point algorithm for quantile regression
+
+    Solves the dual linear program
+
+        max_a  endog'a  subject to  exog'a = (1 - q) exog'1,  0 <= a <= 1
+
+    with Mehrotra predictor-corrector steps, following the rqfnb Fortran
+    implementation in Koenker's quantreg package. The parameters are the (negative) dual
+    variables of the equality constraint. Each iteration solves one weighted
+    least squares problem, through the k x k normal equations.
+
+    Parameters
+    ----------
+    endog : ndarray, 1-D
+    exog : ndarray, 2-D
+    q : float
+        quantile
+    max_iter : int
+        maximum number of iterations
+    p_tol : float
+        tolerance for the duality gap
+    start_params : None or ndarray
+        starting value of the parameters. The primal starts always at the
+        feasible interior point ``a = 1 - q``.
+    beta : float
+        fraction of the step to the boundary that is taken
+
+    Returns
+    -------
+    params : ndarray
+    n_iter : int
+    history : dict
+        params and duality gap in each iteration
+    '''
+    nobs = exog.shape[0]
+
+    def solve(xqx, rhs):
+        try:
+            return np.linalg.solve(xqx, rhs)
+        except np.linalg.LinAlgError:
+            return np.dot(pinv(xqx), rhs)
+
+    c = -endog
+    x = (1. - q) * np.ones(nobs)
+    s = 1. - x
+    if start_params is None:
+        params = np.linalg.lstsq(exog, endog)[0]
+    else:
+        params = start_params.copy()
+    # y is the dual solution, r the dual slack
+    y = -params
+    r = c - np.dot(exog, y)
+    small = np.abs(r) < p_tol
+    z = np.where(r > 0, r, 0.) + p_tol * small
+    w = np.where(r < 0, -r, 0.) + p_tol * small
+    gap = np.dot(z, x) + np.dot(w, s)
+
+    history = dict(params=[], gap=[])
+    n_iter = 0
+    while gap > p_tol and n_iter < max_iter:
+        n_iter += 1
+        # affine scaling step
+        qw = 1. / (z / x + w / s)
+        r = z - w
+        xq = exog * qw[:, None]
+        xqx = np.dot(xq.T, exog)
+        dy = solve(xqx, np.dot(xq.T, r))
+        dx = qw * (np.dot(exog, dy) - r)
+        ds = -dx
+        dz = -z * (dx / x + 1.)
+        dw = -w * (ds / s + 1.)
+        fp = min(beta * min(_step_bound(x, dx), _step_bound(s, ds)), 1.)
+        fd = min(beta * min(_step_bound(w, dw), _step_bound(z, dz)), 1.)
+
+        if min(fp, fd) < 1:
+            # centering and corrector step
+            mu = np.dot(z, x) + np.dot(w, s)
+            g = (np.dot(z + fd * dz, x + fp * dx) +
+                 np.dot(w + fd * dw, s + fp * ds))
+            mu = mu * (g / mu)**3 / (2. * nobs)
+            xinv = 1. / x
+            sinv = 1. / s
+            dxdz = dx * dz * xinv
+            dsdw = ds * dw * sinv
+            xi = mu * (xinv - sinv)
+            dy = solve(xqx, np.dot(xq.T, r + dxdz - dsdw - xi))
+            dx = qw * (np.dot(exog, dy) + xi - r - dxdz + dsdw)
+            ds = -dx
+            dz = mu * xinv - z - xinv * z * dx - dxdz
+            dw = mu * sinv - w - sinv * w * ds - dsdw
+            fp = min(beta * min(_step_bound(x, dx), _step_bound(s, ds)), 1.)
+            fd = min(beta * min(_step_bound(w, dw), _step_bound(z, dz)), 1.)
+
+        x += fp * dx
+        s += fp * ds
+        y += fd * dy
+        w += fd * dw
+        z += fd * dz
+        gap = np.dot(z, x) + np.dot(w, s)
+        history['params'].append(-y)
+        history['gap'].append(gap)
+
+    if n_iter == max_iter:
+        warnings.warn("Maximum number of iterations (%d) reached." % max_iter)
+
+    return -y, n_iter, history
+
+
 def _parzen(u):
     z = np.where(np.abs(u) <= .5, 4./3 - 8. * u**2 + 8. * np.abs(u)**3,
                  8. * (1 - np.abs(u))**3 / 3.)
@@ -109,6 +109,29 @@ def test_fitted_residuals():
     assert_almost_equal(np.array(res.predict()), Rquantreg.fittedvalues, 5)
     assert_almost_equal(np.array(res.resid), Rquantreg.residuals, 5)
 
+    res = QuantReg(y, X).fit(q=.1, method='interior-point')
+    assert_almost_equal(np.array(res.fittedvalues), Rquantreg.fittedvalues, 5)
+    assert_almost_equal(np.array(res.resid), Rquantreg.residuals, 5)
+
+def test_fit_quantiles():
+    data = sm.datasets.engel.load_pandas().data
+    y, X = dmatrices('foodexp ~ income', data, return_type='dataframe')
+    mod = QuantReg(y, X)
+    quantiles = [.75, .1, .5, .25, .9]
+    # the sign of residuals at the vertex is not well defined, which
+    # affects the robust covariance, so we compare with iid
+    res = mod.fit_quantiles(quantiles, vcov='iid')
+    for q, res1 in zip(quantiles, res):
+        res2 = mod.fit(q=q, vcov='iid', method='interior-point')
+        assert_equal(res1.q, q)
+        assert_allclose(res1.params, res2.params, rtol=1e-8)
+        assert_allclose(res1.bse, res2.bse, rtol=1e-6)
+        assert_allclose(res1.sparsity, res2.sparsity, rtol=1e-6)
+
+    # irls with start values from a neighboring quantile
+    res3 = mod.fit(q=.75, start_params=res[2].params)
+    assert_allclose(res3.params, res[0].params, rtol=1e-5)
+
 
 class TestEpanechnikovHsheatherQ75(CheckModelResultsMixin):
     # Vincent Arel-Bundock also spot-checked q=.1
@@ -119,6 +142,16 @@ class TestEpanechnikovHsheatherQ75(CheckModelResultsMixin):
         cls.res1 = QuantReg(y, X).fit(q=.75, vcov='iid', kernel='epa', bandwidth='hsheather')
         cls.res2 = epanechnikov_hsheather_q75
 
+class TestEpanechnikovHsheatherQ75IP(CheckModelResultsMixin):
+    @classmethod
+    def setUp(cls):
+        data = sm.datasets.engel.load_pandas().data
+        y, X = dmatrices('foodexp ~ income', data, return_type='dataframe')
+        cls.res1 = QuantReg(y, X).fit(q=.75, vcov='iid', kernel='epa',
+                                      bandwidth='hsheather',
+                                      method='interior-point')
+        cls.res2 = epanechnikov_hsheather_q75
+
 class TestEpanechnikovBofinger(CheckModelResultsMixin):
     @classmethod
     def setUp(cls):
@@ -10,6 +10,8 @@ from scipy.linalg import toeplitz
 from statsmodels.tools.tools import add_constant, categorical
 from statsmodels.regression.linear_model import OLS, WLS, GLS, yule_walker
 from statsmodels.datasets import longley
+from statsmodels.stats import sandwich_covariance as sw
+from statsmodels.stats.outliers_influence import OLSInfluence
 from scipy.stats import t as student_t
 
 DECIMAL_4 = 4
@@ -707,6 +709,62 @@ def test_summary():
     assert_equal(table, expected)
 
 
+def test_float32():
+    # single precision OLS and WLS for well conditioned exog
+    np.random.seed(54321)
+    nobs = 1000
+    exog = add_constant(np.random.randn(nobs, 3), prepend=True)
+    endog = np.dot(exog, [1, 0.5, -0.5, 0.2]) + np.random.randn(nobs)
+    weights = np.random.uniform(0.5, 2, size=nobs)
+    for model in [lambda **kwds: OLS(endog, exog, **kwds),
+                  lambda **kwds: WLS(endog, exog, weights, **kwds)]:
+        res = model().fit()
+        res32 = model(dtype=np.float32).fit()
+        assert_equal(res32.model.wexog.dtype, np.float32)
+        assert_equal(res32.params.dtype, np.float32)
+        assert_equal(res32.model.k_constant, 1)
+        assert_almost_equal(res32.params / res.params, np.ones(4), 4)
+        assert_almost_equal(res32.bse / res.bse, np.ones(4), 4)
+
+
+def test_mixed_precision():
+    # float32 exog with float64 accumulation, nobs is larger than the
+    # chunksize of the products
+    np.random.seed(54321)
+    nobs = 20000
+    exog = add_constant(np.random.randn(nobs, 3), prepend=True)
+    endog = np.dot(exog, [1, 0.5, -0.5, 0.2]) + np.random.randn(nobs)
+    weights = np.random.uniform(0.5, 2, size=nobs)
+    for model in [lambda **kwds: OLS(endog, exog, **kwds),
+                  lambda **kwds: WLS(endog, exog, weights, **kwds)]:
+        res = model().fit()
+        res_mixed = model(precision='mixed').fit()
+        assert_equal(res_mixed.model.exog.dtype, np.float32)
+        assert_equal(res_mixed.model.wexog.dtype, np.float32)
+        assert_equal(res_mixed.params.dtype, np.float64)
+        assert_equal(res_mixed.df_resid, res.df_resid)
+        assert_almost_equal(res_mixed.params / res.params, np.ones(4), 6)
+        assert_almost_equal(res_mixed.bse / res.bse, np.ones(4), 6)
+        assert_almost_equal(res_mixed.HC0_se / res.HC0_se, np.ones(4), 6)
+        assert_almost_equal(res_mixed.rsquared, res.rsquared, 8)
+        # mixed precision models do not store pinv_wexog
+        cov_hc0 = sw.cov_hc0(res_mixed)
+        assert_almost_equal(cov_hc0 / sw.cov_hc0(res), np.ones((4, 4)), 5)
+        assert_almost_equal(sw.cov_hc1(res_mixed) / cov_hc0,
+                            nobs / res.df_resid * np.ones((4, 4)), 10)
+        hat = OLSInfluence(res_mixed).hat_matrix_diag
+        assert_almost_equal(hat / OLSInfluence(res).hat_matrix_diag,
+                            np.ones(nobs), 5)
+    assert_raises(ValueError, OLS, endog, exog, precision='half')
+
+    # summary_frame refits the model for each observation
+    res = OLS(endog[:100], exog[:100]).fit()
+    res_mixed = OLS(endog[:100], exog[:100], precision='mixed').fit()
+    frame = OLSInfluence(res).summary_frame()
+    frame_mixed = OLSInfluence(res_mixed).summary_frame()
+    assert_equal(list(frame_mixed.columns), list(frame.columns))
+    # some dfbetas are close to zero, the absolute differences are small
+    assert_almost_equal(frame_mixed.values, frame.values, 5)
 
 
 if __name__=="__main__":
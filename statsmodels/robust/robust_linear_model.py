@@ -15,6 +15,7 @@ R Venables, B Ripley. 'Modern Applied Statistics in S'  Springer, New York,
 """
 import numpy as np
 import scipy.stats as stats
+from scipy import linalg
 
 from statsmodels.tools.decorators import (cache_readonly,
                                                   resettable_cache)
@@ -24,13 +25,110 @@ import statsmodels.robust.norms as norms
 import statsmodels.robust.scale as scale
 import statsmodels.base.model as base
 import statsmodels.base.wrapper as wrap
+from statsmodels.tools.profiling import fit_profiling, current_trace
 
-__all__ = ['RLM']
+__all__ = ['RLM', 'rlm_batch']
 
 def _check_convergence(criterion, iteration, tol, maxiter):
     return not (np.any(np.fabs(criterion[iteration] -
                 criterion[iteration-1]) > tol) and iteration < maxiter)
 
+# largest ratio of the diagonal elements of the Cholesky factor for which
+# the normal equations are used, the factor has the condition number of the
+# weighted design and the normal equations lose twice its digits
+_COND_MAX = 1e4
+
+def _wls_solve(endog, exog, weights, wexog):
+    """
+    Weighted least squares parameters from the normal equations.
+
+    `wexog` is a buffer with the shape of exog that is overwritten. If the
+    Cholesky factorization fails or the weighted design is badly conditioned,
+    then the minimum norm least squares solution of the whitened data is
+    returned as in WLS.
+    """
+    np.multiply(exog, weights[:, None], out=wexog)
+    xtwx = np.dot(wexog.T, exog)
+    xtwy = np.dot(wexog.T, endog)
+    try:
+        factor = linalg.cho_factor(xtwx)
+    except np.linalg.LinAlgError:
+        factor = None
+    if factor is not None:
+        diag = np.abs(np.diag(factor[0]))
+        if diag.min() * _COND_MAX > diag.max():
+            return linalg.cho_solve(factor, xtwy)
+    # singular or badly conditioned design
+    sqrt_weights = np.sqrt(weights)
+    np.multiply(exog, sqrt_weights[:, None], out=wexog)
+    return np.linalg.lstsq(wexog, endog * sqrt_weights, rcond=1e-15)[0]
+
+def _rlm_irls(endog, exog, params, M, estimate_scale, scale, df_resid,
+              maxiter, tol, update_scale, conv, wexog=None):
+    """
+    IRLS iterations for RLM starting at the least squares estimate `params`.
+
+    Each iteration solves the weighted normal equations, reusing one buffer
+    `wexog` for the weighted design. The history contains the same information as
+    the history of separate WLS fits, `scale` in the history is the WLS scale
+    and not the robust scale estimate.
+
+    Returns
+    -------
+    params, scale, weights, history
+    """
+    history = dict(params = [np.inf], scale = [])
+    if conv == 'coefs':
+        criterion = history['params']
+    elif conv == 'dev':
+        history.update(dict(deviance = [np.inf]))
+        criterion = history['deviance']
+    elif conv == 'sresid':
+        history.update(dict(sresid = [np.inf]))
+        criterion = history['sresid']
+    elif conv == 'weights':
+        history.update(dict(weights = [np.inf]))
+        criterion = history['weights']
+
+    def update_history(params, resid, weights):
+        wls_scale = np.dot(weights, resid**2) / df_resid
+        history['params'].append(params)
+        history['scale'].append(wls_scale)
+        if conv == 'dev':
+            history['deviance'].append(M(resid / wls_scale).sum())
+        elif conv == 'sresid':
+            history['sresid'].append(resid / wls_scale)
+        elif conv == 'weights':
+            history['weights'].append(weights)
+
+    trace = current_trace()
+    trace.update(method='IRLS')
+    if wexog is None:
+        wexog = np.empty_like(exog)
+    weights = np.ones(exog.shape[0])
+    resid = endog - np.dot(exog, params)
+    # the least squares fit counts as one iteration
+    update_history(params, resid, weights)
+    iteration = 1
+    converged = 0
+    while not converged:
+        weights = M.weights(resid / scale)
+        with trace.stage('wls'):
+            params = _wls_solve(endog, exog, weights, wexog)
+        resid = endog - np.dot(exog, params)
+        if update_scale is True:
+            with trace.stage('scale'):
+                scale = estimate_scale(resid)
+        update_history(params, resid, weights)
+        iteration += 1
+        change = np.max(np.fabs(criterion[iteration] -
+                                criterion[iteration-1]))
+        trace.iteration(change)
+        converged = _check_convergence(criterion, iteration, tol, maxiter)
+    trace.update(converged=change <= tol)
+    history['iteration'] = iteration
+    return params, scale, weights, history
+
 class RLM(base.LikelihoodModel):
     __doc__ = """
     Robust Linear Models
@@ -126,8 +224,9 @@ class RLM(base.LikelihoodModel):
         self.pinv_wexog = np.linalg.pinv(self.exog)
         self.normalized_cov_params = np.dot(self.pinv_wexog,
                                         np.transpose(self.pinv_wexog))
-        self.df_resid = np.float(self.exog.shape[0] - rank(self.exog))
-        self.df_model = np.float(rank(self.exog)-1)
+        k_exog = rank(self.exog)
+        self.df_resid = np.float(self.exog.shape[0] - k_exog)
+        self.df_model = np.float(k_exog - 1)
         self.nobs = float(self.endog.shape[0])
 
     def score(self, params):
@@ -170,17 +269,6 @@ class RLM(base.LikelihoodModel):
         return self.M((self.endog - tmp_results.fittedvalues) /
                           tmp_results.scale).sum()
 
-    def _update_history(self, tmp_results, history, conv):
-        history['params'].append(tmp_results.params)
-        history['scale'].append(tmp_results.scale)
-        if conv == 'dev':
-            history['deviance'].append(self.deviance(tmp_results))
-        elif conv == 'sresid':
-            history['sresid'].append(tmp_results.resid/tmp_results.scale)
-        elif conv == 'weights':
-            history['weights'].append(tmp_results.model.weights)
-        return history
-
     def _estimate_scale(self, resid):
         """
         Estimates the scale based on the option provided to the fit method.
@@ -195,8 +283,9 @@ class RLM(base.LikelihoodModel):
         else:
             return scale.scale_est(self, resid)**2
 
+    @fit_profiling
     def fit(self, maxiter=50, tol=1e-8, scale_est='mad', init=None, cov='H1',
-            update_scale=True, conv='dev'):
+            update_scale=True, conv='dev', wrap=True):
         """
         Fits the model using iteratively reweighted least squares.
 
@@ -237,11 +326,21 @@ class RLM(base.LikelihoodModel):
             If `update_scale` is False then the scale estimate for the
             weights is held constant over the iteration.  Otherwise, it
             is updated for each fit in the iteration.  Default is True.
+        wrap : bool
+            If True (default), the results are wrapped to reattach the
+            metadata of the data. If False, the bare RLMResults instance is
+            returned, which has no wrapping overhead on attribute access.
 
         Returns
         -------
         results : object
             statsmodels.rlm.RLMresults
+
+        Notes
+        -----
+        The weighted least squares problem in each iteration is solved from
+        the normal equations, with a fall back to the generalized inverse if
+        the weighted design is singular.
         """
         if not cov.upper() in ["H1","H2","H3"]:
             raise ValueError("Covariance matrix %s not understood" % cov)
@@ -252,40 +351,17 @@ class RLM(base.LikelihoodModel):
             raise ValueError("Convergence argument %s not understood" \
                 % conv)
         self.scale_est = scale_est
-        wls_results = lm.WLS(self.endog, self.exog).fit()
+        params = np.dot(self.pinv_wexog, self.endog)
         if not init:
-            self.scale = self._estimate_scale(wls_results.resid)
-
-        history = dict(params = [np.inf], scale = [])
-        if conv == 'coefs':
-            criterion = history['params']
-        elif conv == 'dev':
-            history.update(dict(deviance = [np.inf]))
-            criterion = history['deviance']
-        elif conv == 'sresid':
-            history.update(dict(sresid = [np.inf]))
-            criterion = history['sresid']
-        elif conv == 'weights':
-            history.update(dict(weights = [np.inf]))
-            criterion = history['weights']
-
-        # done one iteration so update
-        history = self._update_history(wls_results, history, conv)
-        iteration = 1
-        converged = 0
-        while not converged:
-            self.weights = self.M.weights(wls_results.resid/self.scale)
-            wls_results = lm.WLS(self.endog, self.exog,
-                                 weights=self.weights).fit()
-            if update_scale is True:
-                self.scale = self._estimate_scale(wls_results.resid)
-            history = self._update_history(wls_results, history, conv)
-            iteration += 1
-            converged = _check_convergence(criterion, iteration, tol, maxiter)
-        results = RLMResults(self, wls_results.params,
+            self.scale = self._estimate_scale(self.endog -
+                                              np.dot(self.exog, params))
+
+        params, self.scale, self.weights, history = _rlm_irls(self.endog,
+                self.exog, params, self.M, self._estimate_scale, self.scale,
+                self.df_resid, maxiter, tol, update_scale, conv)
+        results = RLMResults(self, params,
                             self.normalized_cov_params, self.scale)
 
-        history['iteration'] = iteration
         results.fit_history = history
         results.fit_options = dict(cov=cov.upper(), scale_est=scale_est,
                                    norm=self.M.__class__.__name__, conv=conv)
@@ -294,6 +370,8 @@ class RLM(base.LikelihoodModel):
         #doing the next causes exception
         #self.cov = self.scale_est = None #reset for additional fits
         #iteration and history could contain wrong state with repeated fit
+        if not wrap:
+            return results
         return RLMResultsWrapper(results)
 
 class RLMResults(base.LikelihoodModelResults):
@@ -570,6 +648,100 @@ class RLMResultsWrapper(lm.RegressionResultsWrapper):
     pass
 wrap.populate_wrapper(RLMResultsWrapper, RLMResults)
 
+
+def rlm_batch(endog, exog, M=None, maxiter=50, tol=1e-8, scale_est='mad',
+              update_scale=True, conv='dev'):
+    """
+    Robust linear models for several responses with a common design.
+
+    Parameters
+    ----------
+    endog : array-like
+        1d or 2d array with the response variables in columns
+    exog : array-like
+        The design matrix that is used for all responses.
+    M : statsmodels.robust.norms.RobustNorm, optional
+        The robust criterion function, the default is HuberT().
+    maxiter, tol, scale_est, update_scale, conv
+        See RLM.fit
+
+    Returns
+    -------
+    params : array
+        k_exog x n_endog array of parameter estimates
+    bse : array
+        Standard errors of the parameters based on the H1 covariance
+    scale : array
+        The robust scale estimate of each response
+    iterations : array
+        The number of IRLS iterations of each response
+
+    Notes
+    -----
+    The estimates are the same as those of ``RLM(endog[:,i], exog, M).fit``
+    for each column. The pseudoinverse and the rank of the design are
+    computed only once, the least squares start values of all responses are
+    computed in one matrix product, and the buffer for the weighted design
+    is shared by all IRLS iterations.
+
+    See also
+    --------
+    RLM
+    """
+    if M is None:
+        M = norms.HuberT()
+    conv = conv.lower()
+    if not conv in ["weights","coefs","dev","sresid"]:
+        raise ValueError("Convergence argument %s not understood" \
+            % conv)
+    endog = np.asarray(endog, dtype=float)
+    if endog.ndim == 1:
+        endog = endog[:,None]
+    exog = np.asarray(exog, dtype=float)
+    nobs, k_exog = exog.shape
+    pinv_exog = np.linalg.pinv(exog)
+    normalized_cov_params = np.dot(pinv_exog, pinv_exog.T)
+    k_rank = rank(exog)
+    df_resid = np.float(nobs - k_rank)
+    df_model = np.float(k_rank - 1)
+
+    if isinstance(scale_est, str) and scale_est.lower() == 'mad':
+        estimate_scale = scale.mad
+    elif isinstance(scale_est, str) and scale_est.lower() == 'stand_mad':
+        estimate_scale = scale.stand_mad
+    elif isinstance(scale_est, scale.HuberScale):
+        estimate_scale = lambda resid: scale_est(df_resid, nobs, resid)
+    else:
+        raise ValueError("scale_est %s not understood" % scale_est)
+
+    n_endog = endog.shape[1]
+    params_ols = np.dot(pinv_exog, endog)
+    resid_ols = endog - np.dot(exog, params_ols)
+    params = np.empty((k_exog, n_endog))
+    bse = np.empty((k_exog, n_endog))
+    scale_ = np.empty(n_endog)
+    iterations = np.empty(n_endog, int)
+    wexog = np.empty_like(exog)
+    for i in range(n_endog):
+        scale_i = estimate_scale(resid_ols[:,i])
+        params_i, scale_i, _, history = _rlm_irls(endog[:,i], exog,
+                params_ols[:,i], M, estimate_scale, scale_i, df_resid,
+                maxiter, tol, update_scale, conv, wexog=wexog)
+
+        # H1 covariance, see RLMResults.bcov_scaled
+        sresid = (endog[:,i] - np.dot(exog, params_i)) / scale_i
+        psi_deriv = M.psi_deriv(sresid)
+        m = np.mean(psi_deriv)
+        k = 1 + (df_model + 1) / nobs * np.var(psi_deriv) / m**2
+        var_params = (k**2 * np.sum(M.psi(sresid)**2) / df_resid *
+                      scale_i**2 / m**2 * np.diag(normalized_cov_params))
+
+        params[:,i] = params_i
+        bse[:,i] = np.sqrt(var_params)
+        scale_[i] = scale_i
+        iterations[i] = history['iteration']
+    return params, bse, scale_, iterations
+
 if __name__=="__main__":
 #NOTE: This is to be removed
 #Delivery Time Data is taken from Montgomery and Peck
@@ -14,6 +14,25 @@ from scipy.stats import norm as Gaussian
 import norms
 from statsmodels.tools import tools
 
+def _median(a, axis=0):
+    """
+    Median along axis by selection with np.partition, in linear time
+
+    The two middle values of an even number of elements are averaged as in
+    np.median. np.median is used for numpy versions without np.partition.
+    """
+    a = np.asarray(a)
+    if axis is None:
+        a, axis = a.ravel(), 0
+    n = a.shape[axis]
+    if n == 0 or not hasattr(np, 'partition'):
+        return np.median(a, axis=axis)
+    k = n // 2
+    if n % 2:
+        return np.partition(a, k, axis=axis).take(k, axis=axis)
+    part = np.partition(a, [k - 1, k], axis=axis)
+    return part.take([k - 1, k], axis=axis).mean(axis=axis)
+
 def mad(a, c=Gaussian.ppf(3/4.), axis=0):  # c \approx .6745
     """
     The Median Absolute Deviation along given axis of an array
@@ -34,7 +53,7 @@ def mad(a, c=Gaussian.ppf(3/4.), axis=0):  # c \approx .6745
         `mad` = median(abs(`a`))/`c`
     """
     a = np.asarray(a)
-    return np.median((np.fabs(a))/c, axis=axis)
+    return _median(np.fabs(a), axis=axis) / c
 
 def stand_mad(a, c=Gaussian.ppf(3/4.), axis=0):
     """
@@ -57,9 +76,9 @@ def stand_mad(a, c=Gaussian.ppf(3/4.), axis=0):
     """
 
     a = np.asarray(a)
-    d = np.median(a, axis = axis)
+    d = _median(a, axis = axis)
     d = tools.unsqueeze(d, axis, a.shape)
-    return np.median(np.fabs(a - d)/c, axis = axis)
+    return _median(np.fabs(a - d)/c, axis = axis)
 
 class Huber(object):
     """
@@ -236,14 +255,20 @@ class HuberScale(object):
                     Gaussian.cdf(self.d)-.5 - self.d/(np.sqrt(2*np.pi))*\
                     np.exp(-.5*self.d**2))
         s = stand_mad(resid)
-        subset = lambda x: np.less(np.fabs(resid/x),self.d)
-        chi = lambda s: subset(s)*(resid/s)**2/2+(1-subset(s))*(self.d**2/2)
+        # chi(r/s)*s**2 is r**2/2 inside and d**2*s**2/2 outside the
+        # threshold, only the squared residuals are needed in the loop
+        resid2 = resid**2
+        d2 = self.d**2
+        n_resid = resid2.shape[0]
+        def sum_chi(s):
+            subset = np.less(resid2, d2 * s**2)
+            return (np.sum(resid2[subset]) / 2. +
+                    (n_resid - subset.sum()) * d2 * s**2 / 2.)
         scalehist = [np.inf,s]
         niter = 1
         while (np.abs(scalehist[niter-1] - scalehist[niter])>self.tol \
                 and niter < self.maxiter):
-            nscale = np.sqrt(1/(nobs*h)*np.sum(chi(scalehist[-1]))*\
-                    scalehist[-1]**2)
+            nscale = np.sqrt(1/(nobs*h)*sum_chi(scalehist[-1]))
             scalehist.append(nscale)
             niter += 1
             #if niter == self.maxiter:
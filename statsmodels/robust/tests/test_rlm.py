@@ -3,7 +3,7 @@ Test functions for sm.rlm
 """
 
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_allclose
+from numpy.testing import assert_almost_equal, assert_allclose, assert_equal
 from scipy import stats
 import statsmodels.api as sm
 from statsmodels.robust.robust_linear_model import RLM
@@ -305,3 +305,48 @@ class TestRlmSresid(CheckRlmResultsMixin):
 #                        r.rlm, psi="psi.huber")
         from results.results_rlm import Huber
         self.res2 = Huber()
+
+def test_rlm_batch():
+    from statsmodels.robust.robust_linear_model import rlm_batch
+    from statsmodels.datasets.stackloss import load
+    data = load()
+    exog = sm.add_constant(data.exog, prepend=False)
+    np.random.seed(987163)
+    endog = data.endog[:,None] + np.random.standard_t(3, size=(len(exog), 3))
+    endog[:,0] = data.endog
+
+    for M, scale_est in [(sm.robust.norms.HuberT(), 'mad'),
+                         (sm.robust.norms.TukeyBiweight(),
+                          sm.robust.scale.HuberScale())]:
+        params, bse, scale, iterations = rlm_batch(endog, exog, M=M,
+                                                   scale_est=scale_est)
+        for i in range(endog.shape[1]):
+            res = RLM(endog[:,i], exog, M=M).fit(scale_est=scale_est)
+            assert_allclose(params[:,i], res.params, rtol=1e-10)
+            assert_allclose(bse[:,i], res.bse, rtol=1e-10)
+            assert_allclose(scale[i], res.scale, rtol=1e-10)
+            assert_equal(iterations[i], res.fit_history['iteration'])
+
+def test_rlm_singular():
+    # collinear design uses the minimum norm solution like WLS
+    from statsmodels.datasets.stackloss import load
+    data = load()
+    exog = sm.add_constant(data.exog, prepend=False)
+    exog_s = np.column_stack((exog, exog[:,0]))
+    res = RLM(data.endog, exog).fit()
+    res_s = RLM(data.endog, exog_s).fit()
+    assert_allclose(res_s.fittedvalues, res.fittedvalues, rtol=1e-7)
+    assert_allclose(res_s.scale, res.scale, rtol=1e-7)
+
+def test_wls_solve_ill_conditioned():
+    # nearly collinear design, the normal equations would lose 12 digits
+    from statsmodels.robust.robust_linear_model import _wls_solve
+    rs = np.random.RandomState(0)
+    nobs = 200
+    x1 = rs.randn(nobs)
+    exog = np.column_stack((np.ones(nobs), x1, x1 + 1e-6 * rs.randn(nobs)))
+    endog = exog.sum(1) + rs.randn(nobs)
+    weights = rs.uniform(0.5, 1, nobs)
+    params = sm.WLS(endog, exog, weights=weights).fit().params
+    assert_allclose(_wls_solve(endog, exog, weights, np.empty_like(exog)),
+                    params, rtol=1e-9)
@@ -59,6 +59,18 @@ class TestMad(object):
         n = scale.mad(self.X)
         assert_equal(n.shape, (10,))
 
+def test_median_partition():
+    np.random.seed(54321)
+    for shape in [(41, 10), (40, 10), (1, 3), (2, 3)]:
+        X = standard_normal(shape)
+        for axis in [0, 1, -1]:
+            assert_equal(scale._median(X, axis=axis),
+                         np.median(X, axis=axis))
+            assert_equal(scale.mad(X, axis=axis),
+                         np.median(np.fabs(X), axis=axis) /
+                         scale.Gaussian.ppf(3/4.))
+    assert_equal(scale._median(X, axis=None), np.median(X))
+
 class TestMadAxes():
     def __init__(self):
         np.random.seed(54321)
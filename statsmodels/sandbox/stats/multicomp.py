@@ -596,6 +596,8 @@ class TukeyHSDResults(object):
     confint : confidence interval for pairwise mean differences
     std_pairs : standard deviation of pairwise mean differences
     q_crit : critical value of studentized range statistic at given alpha
+    pvalues : p-values of the studentized range statistic, limited to
+        the range [0.001, 0.9]
     halfwidths : half widths of simultaneous confidence interval
 
     Notes
@@ -608,7 +610,7 @@ class TukeyHSDResults(object):
     """
     def __init__(self, mc_object, results_table, q_crit, reject=None,
                  meandiffs=None, std_pairs=None, confint=None, df_total=None,
-                 reject2=None, variance=None):
+                 reject2=None, variance=None, pvalues=None):
 
         self._multicomp = mc_object
         self._results_table = results_table
@@ -620,6 +622,7 @@ class TukeyHSDResults(object):
         self.df_total = df_total
         self.reject2 = reject2
         self.variance = variance
+        self.pvalues = pvalues
         # Taken out of _multicomp for ease of access for unknowledgeable users
         self.data = self._multicomp.data
         self.groups =self._multicomp.groups
@@ -776,32 +779,140 @@ class MultiComparison(object):
     group_order : list of strings, optional
         the desired order for the group mean results to be reported in.
 
+    Notes
+    -----
+    The groups are encoded once, with a sort, into integer labels.
+    `allpairs` and `iter_allpairs` compare all pairs of groups based on
+    the group statistics from `get_sumstats`, which is feasible also for
+    thousands of groups.
+
     '''
 
     def __init__(self, data, groups, group_order=None):
         self.data = np.asarray(data)
         self.groups = np.asarray(groups)
 
+        uni, intlab = np.unique(self.groups, return_inverse=True)
         # Allow for user-provided sorting of groups
         if group_order is None:
-            self.groupsunique, self.groupintlab = np.unique(groups,
-                                                            return_inverse=True)
+            self.groupsunique, self.groupintlab = uni, intlab
+            datalab = intlab
         else:
             #check if group_order has any names not in groups
             for grp in group_order:
-                if grp not in groups:
+                if grp not in uni:
                     raise ValueError(
                             "group_order value '%s' not found in groups"%grp)
             self.groupsunique = np.array(group_order)
-            self.groupintlab = np.zeros(len(data))
-            for name in self.groupsunique:
-                idx = np.where(self.groups == name)[0]
-                self.groupintlab[idx] = np.where(self.groupsunique == name)[0]
+            position = dict((name, i) for i, name in enumerate(group_order))
+            datalab = np.array([position.get(name, -1) for name in uni])[intlab]
+            # observations of groups not in group_order get label 0
+            self.groupintlab = np.maximum(datalab, 0)
 
-        self.datali = [data[self.groups == k] for k in self.groupsunique]
-        self.pairindices = np.triu_indices(len(self.groupsunique), 1)  #tuple
         self.nobs = self.data.shape[0]
         self.ngroups = len(self.groupsunique)
+        # split the data into groups with one stable sort
+        sortind = np.argsort(datalab, kind='mergesort')
+        nobs_groups = np.bincount(datalab[datalab >= 0],
+                                  minlength=self.ngroups)
+        start = (datalab < 0).sum()
+        self.datali = np.split(self.data[sortind[start:]],
+                               np.cumsum(nobs_groups)[:-1])
+        self.pairindices = np.triu_indices(len(self.groupsunique), 1)  #tuple
+        self._sumstats = None
+
+    def get_sumstats(self):
+        '''number of observations, mean and variance (ddof=1) of the groups
+
+        The statistics are computed once with grouped reductions and
+        cached.
+
+        Returns
+        -------
+        nobs, mean, var : ndarrays
+            statistics for each group in the order of groupsunique
+        '''
+        if self._sumstats is None:
+            self._sumstats = group_sumstats(self.data, self.groupintlab,
+                                            self.ngroups)
+        return self._sumstats
+
+    def iter_allpairs(self, method='tukey', alpha=0.05, chunksize=2**16):
+        '''iterate over the comparison of all pairs of groups in chunks
+
+        Parameters
+        ----------
+        method : {'tukey', 'games-howell', 'ttest', 'welch'}
+            pairwise comparison, see `pairwise_meandiff`
+        alpha : float
+            significance level. Only 'tukey' and 'games-howell' control
+            the familywise error rate, the t-tests are not corrected for
+            multiple testing.
+        chunksize : int
+            maximum number of pairs in each chunk
+
+        Yields
+        ------
+        res : structured ndarray
+            results for a chunk of pairs, see `pairwise_meandiff`. The
+            pairs are in the order of `pairindices`.
+        '''
+        nobs, mean, var = self.get_sumstats()
+        if method == 'tukey':
+            # pooled within group variance
+            df = (nobs - 1).sum()
+            var = ((nobs - 1) * var).sum() / df
+        else:
+            df = None
+        for idx1, idx2 in iter_pairindices(self.ngroups, chunksize):
+            yield pairwise_meandiff(mean, nobs, var, idx1, idx2,
+                                    method=method, alpha=alpha, df=df)
+
+    def allpairs(self, method='tukey', alpha=0.05, multimethod='hs',
+                 chunksize=2**16):
+        '''vectorized comparison of all pairs of groups
+
+        Parameters
+        ----------
+        method : {'tukey', 'games-howell', 'ttest', 'welch'}
+            pairwise comparison, see `pairwise_meandiff`
+        alpha : float
+            familywise error rate
+        multimethod : string or None
+            p-value correction of the t-tests, any method of
+            multipletests. This is ignored for 'tukey' and 'games-howell'
+            which are already simultaneous tests.
+        chunksize : int
+            maximum number of pairs that are processed at the same time
+
+        Returns
+        -------
+        res : structured ndarray
+            results for all pairs, see `pairwise_meandiff`. If the
+            t-tests are corrected, then reject is based on the corrected
+            p-values, which are in the additional field pval_corr. The
+            confidence intervals of the t-tests are not corrected.
+
+        See Also
+        --------
+        iter_allpairs : iterator over chunks of pairs
+        allpairtest : generic version for any two sample test
+        '''
+        res = np.concatenate(list(self.iter_allpairs(method=method,
+                                                     alpha=alpha,
+                                                     chunksize=chunksize)))
+        if method in ['ttest', 'welch'] and multimethod is not None:
+            reject, pvals_corrected = multipletests(res['pvalue'],
+                                                    alpha=alpha,
+                                                    method=multimethod)[:2]
+            res_corr = np.empty(len(res), dtype=pairs_dtype[:-1] +
+                                [('pval_corr', float), ('reject', np.bool8)])
+            for name in res.dtype.names:
+                res_corr[name] = res[name]
+            res_corr['pval_corr'] = pvals_corrected
+            res_corr['reject'] = reject
+            res = res_corr
+        return res
 
     def getranks(self):
         '''convert data to rankdata and attach
@@ -878,10 +989,16 @@ class MultiComparison(object):
         results from multipletests are in different order
         pval_corrected can be larger than 1 ???
         '''
-        res = []
-        for i,j in zip(*self.pairindices):
-            res.append(testfunc(self.datali[i], self.datali[j]))
-        res = np.array(res)
+        if testfunc is stats.ttest_ind:
+            # vectorized from the group statistics
+            res = np.concatenate([np.column_stack((-r['statistic'],
+                                                   r['pvalue']))
+                                  for r in self.iter_allpairs(method='ttest')])
+        else:
+            res = []
+            for i,j in zip(*self.pairindices):
+                res.append(testfunc(self.datali[i], self.datali[j]))
+            res = np.array(res)
         reject, pvals_corrected, alphacSidak, alphacBonf = \
                 multipletests(res[:, pvalidx], alpha=0.05, method=method)
         #print np.column_stack([res[:,0],res[:,1], reject, pvals_corrected])
@@ -944,7 +1061,18 @@ class MultiComparison(object):
         var_ = np.var(self.groupstats.groupdemean(), ddof=len(gmeans))
         #res contains: 0:(idx1, idx2), 1:reject, 2:meandiffs, 3: std_pairs, 4:confint, 5:q_crit,
         #6:df_total, 7:reject2
-        res = tukeyhsd(gmeans, gnobs, var_, df=None, alpha=alpha, q_crit=None)
+        # same as tukeyhsd, but pairs are processed in chunks instead of
+        # (ngroups, ngroups) arrays
+        df_total = (gnobs - 1).sum()
+        pairs = np.concatenate([pairwise_meandiff(gmeans, gnobs, var_,
+                                                  idx1, idx2, method='tukey',
+                                                  alpha=alpha, df=df_total)
+                       for idx1, idx2 in iter_pairindices(len(gmeans), 2**16)])
+        confint = np.column_stack((pairs['lower'], pairs['upper']))
+        res = ((pairs['group1'], pairs['group2']), pairs['reject'],
+               pairs['meandiff'], pairs['std_pair'], confint,
+               get_tukeyQcrit2(len(gmeans), df_total, alpha=alpha), df_total,
+               pairs['reject'])
 
         resarr = np.array(zip(res[0][0], res[0][1],
                                   np.round(res[2],4),
@@ -962,7 +1090,8 @@ class MultiComparison(object):
                               'FWER=%4.2f' % alpha
 
         return TukeyHSDResults(self, results_table, res[5], res[1], res[2],
-                               res[3], res[4], res[6], res[7], var_)
+                               res[3], res[4], res[6], res[7], var_,
+                               pvalues=pairs['pvalue'])
 
 
 
@@ -1324,6 +1453,193 @@ def simultaneous_ci(q_crit, var, groupnobs, pairindices=None):
 
     return (q_crit / np.sqrt(2))*w
 
+def group_sumstats(data, groupintlab, ngroups=None):
+    '''number of observations, mean and variance of each group
+
+    The statistics are computed with grouped reductions (bincount) in a
+    single pass over the data for the sums and one for the squared
+    deviations from the group means.
+
+    Parameters
+    ----------
+    data : array_like, 1d
+        data of all groups
+    groupintlab : array_like, 1d, int
+        integer group labels in range(ngroups)
+    ngroups : int, optional
+        number of groups, default is the largest label plus one
+
+    Returns
+    -------
+    nobs : ndarray
+        number of observations in each group
+    mean : ndarray
+        mean of each group
+    var : ndarray
+        variance of each group with ddof=1
+
+    '''
+    data = np.asarray(data, dtype=float)
+    groupintlab = np.asarray(groupintlab).astype(int)
+    if ngroups is None:
+        ngroups = groupintlab.max() + 1
+    nobs = np.bincount(groupintlab, minlength=ngroups)
+    mean = np.bincount(groupintlab, weights=data, minlength=ngroups) * 1. / nobs
+    resid = data - mean[groupintlab]
+    ss = np.bincount(groupintlab, weights=resid**2, minlength=ngroups)
+    return nobs, mean, ss / (nobs - 1.)
+
+def iter_pairindices(n_groups, chunksize=None):
+    '''iterate over the indices of all pairs of groups in chunks
+
+    The pairs are in the order of ``np.triu_indices(n_groups, 1)``, but
+    only one chunk of at most `chunksize` pairs is held in memory.
+
+    Parameters
+    ----------
+    n_groups : int
+        number of groups
+    chunksize : int or None
+        maximum number of pairs in each chunk. If None, then all pairs
+        are returned in one chunk.
+
+    Yields
+    ------
+    idx1, idx2 : ndarrays
+        indices of the first and the second group of each pair
+
+    '''
+    n_pairs = n_groups * (n_groups - 1) // 2
+    if chunksize is None:
+        chunksize = max(n_pairs, 1)
+    # linear index of the first pair in each row of the upper triangle
+    rowstart = np.concatenate(([0], np.cumsum(np.arange(n_groups - 1, 1, -1,
+                                                        dtype=np.int64))))
+    for start in range(0, n_pairs, chunksize):
+        k = np.arange(start, min(start + chunksize, n_pairs), dtype=np.int64)
+        idx1 = np.searchsorted(rowstart, k, side='right') - 1
+        idx2 = k - rowstart[idx1] + idx1 + 1
+        yield idx1, idx2
+
+pairs_dtype = [('group1', int),
+               ('group2', int),
+               ('meandiff', float),
+               ('std_pair', float),
+               ('statistic', float),
+               ('df', float),
+               ('pvalue', float),
+               ('lower', float),
+               ('upper', float),
+               ('reject', np.bool8)]
+
+def pairwise_meandiff(mean_all, nobs_all, var_all, idx1, idx2,
+                      method='tukey', alpha=0.05, df=None):
+    '''vectorized comparison of the means for the given pairs of groups
+
+    Parameters
+    ----------
+    mean_all, nobs_all, var_all : array_like
+        mean, number of observations and variance (ddof=1) of all groups.
+        For method 'tukey' var_all can be the pooled variance.
+    idx1, idx2 : ndarrays
+        indices of the first and the second group of each pair, for
+        example from ``iter_pairindices``
+    method : {'tukey', 'games-howell', 'ttest', 'welch'}
+        * 'tukey' : Tukey HSD with pooled variance of all groups
+        * 'games-howell' : Games-Howell test for unequal variances, which
+          uses the studentized range with Welch's degrees of freedom
+        * 'ttest' : two sample t-test with pooled variance of the pair,
+          as in scipy.stats.ttest_ind
+        * 'welch' : two sample t-test with unequal variances
+    alpha : float
+        significance level. For 'tukey' and 'games-howell' the confidence
+        intervals and reject are simultaneous for all pairs of the groups,
+        for the t-tests they are not adjusted for multiple testing.
+    df : float, optional
+        degrees of freedom of the pooled variance for 'tukey', default is
+        the sum of nobs_all - 1.
+
+    Returns
+    -------
+    res : structured ndarray
+        with fields group1, group2, meandiff (mean of group2 minus mean of
+        group1), std_pair, statistic, df, pvalue, lower, upper, reject
+
+    Notes
+    -----
+    The p-values of the studentized range are from ``psturng`` and are
+    limited to the range [0.001, 0.9] of its table. Welch's degrees of
+    freedom of 'games-howell' are below 2 for pairs with a group of two
+    observations, which are outside of the table. The quantile and the
+    p-value of these pairs are computed by numerical integration with
+    ``exact=True``, and the p-values are not limited.
+
+    '''
+    from statsmodels.stats.libqsturng import qsturng, psturng
+    mean_all = np.asarray(mean_all, dtype=float)
+    nobs_all = np.asarray(nobs_all, dtype=float)
+    var_all = np.asarray(var_all, dtype=float)
+    n_groups = len(mean_all)
+
+    meandiff = mean_all[idx2] - mean_all[idx1]
+    n1, n2 = nobs_all[idx1], nobs_all[idx2]
+    if method == 'tukey':
+        if var_all.size > 1:
+            var_all = ((nobs_all - 1) * var_all).sum() / (nobs_all - 1).sum()
+        if df is None:
+            df = (nobs_all - 1).sum()
+        std_pair = np.sqrt(var_all / 2. * (1. / n1 + 1. / n2))
+        crit = qsturng(1 - alpha, n_groups, df)
+        df = df * np.ones(len(meandiff))
+    elif method in ['games-howell', 'welch']:
+        vn1, vn2 = var_all[idx1] / n1, var_all[idx2] / n2
+        std_pair = np.sqrt(vn1 + vn2)
+        df = (vn1 + vn2)**2 / (vn1**2 / (n1 - 1) + vn2**2 / (n2 - 1))
+        if method == 'games-howell':
+            std_pair /= np.sqrt(2.)
+            # the approximation of the studentized range needs df >= 2
+            exact = df < 2
+            crit = qsturng(1 - alpha, n_groups, np.maximum(df, 2))
+            if exact.any():
+                crit[exact] = qsturng(1 - alpha, n_groups, df[exact],
+                                      exact=True)
+        else:
+            crit = stats.t.isf(alpha / 2., df)
+    elif method == 'ttest':
+        df = n1 + n2 - 2
+        var_pair = ((n1 - 1) * var_all[idx1] + (n2 - 1) * var_all[idx2]) / df
+        std_pair = np.sqrt(var_pair * (1. / n1 + 1. / n2))
+        # few distinct df, quantile of t is expensive
+        df_unique, df_inv = np.unique(df, return_inverse=True)
+        crit = stats.t.isf(alpha / 2., df_unique)[df_inv]
+    else:
+        raise ValueError('method not recognized')
+
+    statistic = meandiff / std_pair
+    if method == 'tukey':
+        pvalue = psturng(np.abs(statistic), n_groups, df)
+    elif method == 'games-howell':
+        pvalue = psturng(np.abs(statistic), n_groups, np.maximum(df, 2))
+        if exact.any():
+            pvalue[exact] = psturng(np.abs(statistic[exact]), n_groups,
+                                    df[exact], exact=True)
+    else:
+        pvalue = 2 * stats.t.sf(np.abs(statistic), df)
+    crit_int = crit * std_pair
+
+    res = np.empty(len(meandiff), dtype=pairs_dtype)
+    res['group1'] = idx1
+    res['group2'] = idx2
+    res['meandiff'] = meandiff
+    res['std_pair'] = std_pair
+    res['statistic'] = statistic
+    res['df'] = df
+    res['pvalue'] = pvalue
+    res['lower'] = meandiff - crit_int
+    res['upper'] = meandiff + crit_int
+    res['reject'] = np.abs(meandiff) > crit_int
+    return res
+
 def distance_st_range(mean_all, nobs_all, var_all, df=None, triu=False):
     '''pairwise distance matrix, outsourced from tukeyhsd
 
@@ -67,13 +67,18 @@ def anderson_statistic(x, dist='norm', fit=True, params=(), axis=0):
     return A2
 
 
-def normal_ad(x, axis=0):
+def normal_ad(x, axis=0, table=None):
     '''Anderson-Darling test for normal distribution unknown mean and variance
 
     Parameters
     ----------
     x : array_like
         data array, currently only 1d
+    table : None or TableDist instance
+        If None, then the pvalue is based on an approximation formula.
+        Otherwise the pvalue is interpolated in the table, for example a
+        Monte Carlo table from
+        ``statsmodels.stats.mctools.get_crit_table('normal_ad', sizes)``
 
     Returns
     -------
@@ -88,6 +93,9 @@ def normal_ad(x, axis=0):
     ad2 = anderson_statistic(x, dist='norm', fit=True, axis=axis)
     n = x.shape[axis]
 
+    if table is not None:
+        return ad2, table.prob(ad2, n)
+
     ad2a = ad2 * (1 + 0.75/n + 2.25/n**2)
 
     if np.size(ad2a) == 1:
@@ -1,54 +1,61 @@
 # pylint: disable=W0611
-import diagnostic
-from .diagnostic import (
-            acorr_ljungbox, acorr_breush_godfrey,
-            CompareCox, compare_cox, CompareJ, compare_j,
-            HetGoldfeldQuandt, het_goldfeldquandt,
-            het_breushpagan, het_white, het_arch,
-            linear_harvey_collier, linear_rainbow, linear_lm,
-            breaks_cusumolsresid, breaks_hansen, recursive_olsresiduals,
-            unitroot_adf,
-            normal_ad, lillifors
-            )
-
-import multicomp
-from .multitest import (multipletests, fdrcorrection, fdrcorrection_twostage)
-from .multicomp import tukeyhsd
-import gof
-from .gof import (powerdiscrepancy, gof_chisquare_discrete,
-                  chisquare_effectsize)
-import stattools
-from .stattools import durbin_watson, omni_normtest, jarque_bera
-
-import sandwich_covariance
-from .sandwich_covariance import (
-            cov_cluster, cov_cluster_2groups, cov_nw_panel,
-            cov_hac, cov_white_simple,
-            cov_hc0, cov_hc1, cov_hc2, cov_hc3,
-            se_cov
-            )
-
-from .weightstats import (DescrStatsW, CompareMeans, ttest_ind, ttost_ind,
-                         ttost_paired, ztest, ztost, zconfint)
-
-from .proportion import (binom_test_reject_interval, binom_test,
-            binom_tost, binom_tost_reject_interval,
-            power_binom_tost, power_ztost_prop,
-            proportion_confint, proportion_effectsize,
-            proportions_chisquare, proportions_chisquare_allpairs,
-            proportions_chisquare_pairscontrol, proportions_ztest,
-            proportions_ztost)
-
-from .power import (TTestPower, TTestIndPower, GofChisquarePower,
-                    NormalIndPower, FTestAnovaPower, FTestPower,
-                    tt_solve_power, tt_ind_solve_power, zt_ind_solve_power)
-
-from .descriptivestats import Describe
-
-from .anova import anova_lm
-
-import moment_helpers
-from .correlation_tools import corr_nearest, corr_clipped, cov_nearest
-
-from statsmodels.sandbox.stats.runs import (mcnemar, cochrans_q,
-                        symmetry_bowker, Runs, runstest_1samp, runstest_2samp)
+# imported on first access, see statsmodels.tools.lazy
+from statsmodels.tools.lazy import lazy_module as _lazy_module
+
+_lazy_module(__name__,
+    modules={'diagnostic': 'statsmodels.stats.diagnostic',
+             'multicomp': 'statsmodels.stats.multicomp',
+             'gof': 'statsmodels.stats.gof',
+             'stattools': 'statsmodels.stats.stattools',
+             'sandwich_covariance': 'statsmodels.stats.sandwich_covariance',
+             'moment_helpers': 'statsmodels.stats.moment_helpers',
+             },
+    attributes=[
+        ('statsmodels.stats.diagnostic', [
+            'acorr_ljungbox', 'acorr_breush_godfrey',
+            'CompareCox', 'compare_cox', 'CompareJ', 'compare_j',
+            'HetGoldfeldQuandt', 'het_goldfeldquandt',
+            'het_breushpagan', 'het_white', 'het_arch',
+            'linear_harvey_collier', 'linear_rainbow', 'linear_lm',
+            'breaks_cusumolsresid', 'breaks_hansen', 'recursive_olsresiduals',
+            'unitroot_adf',
+            'normal_ad', 'lillifors']),
+        ('statsmodels.stats.multitest', [
+            'multipletests', 'fdrcorrection', 'fdrcorrection_twostage',
+            'multipletests_batch', 'fdrcorrection_stream']),
+        ('statsmodels.stats.multicomp', ['tukeyhsd']),
+        ('statsmodels.stats.gof', [
+            'powerdiscrepancy', 'gof_chisquare_discrete',
+            'chisquare_effectsize']),
+        ('statsmodels.stats.stattools', [
+            'durbin_watson', 'omni_normtest', 'jarque_bera']),
+        ('statsmodels.stats.sandwich_covariance', [
+            'cov_cluster', 'cov_cluster_2groups', 'cov_cluster_multiway',
+            'cov_nw_panel', 'cov_hac', 'cov_white_simple',
+            'ClusterGroups', 'SandwichCovariance',
+            'cov_hc0', 'cov_hc1', 'cov_hc2', 'cov_hc3',
+            'se_cov']),
+        ('statsmodels.stats.weightstats', [
+            'DescrStatsW', 'DescrStatsWAccumulator', 'CompareMeans',
+            'ttest_ind', 'ttost_ind', 'ttost_paired', 'ztest', 'ztost',
+            'zconfint']),
+        ('statsmodels.stats.proportion', [
+            'binom_test_reject_interval', 'binom_test',
+            'binom_tost', 'binom_tost_reject_interval',
+            'power_binom_tost', 'power_ztost_prop',
+            'proportion_confint', 'proportion_effectsize',
+            'proportions_chisquare', 'proportions_chisquare_allpairs',
+            'proportions_chisquare_pairscontrol', 'proportions_ztest',
+            'proportions_ztost']),
+        ('statsmodels.stats.power', [
+            'TTestPower', 'TTestIndPower', 'GofChisquarePower',
+            'NormalIndPower', 'FTestAnovaPower', 'FTestPower',
+            'tt_solve_power', 'tt_ind_solve_power', 'zt_ind_solve_power']),
+        ('statsmodels.stats.descriptivestats', ['Describe']),
+        ('statsmodels.stats.anova', ['anova_lm']),
+        ('statsmodels.stats.correlation_tools', [
+            'corr_nearest', 'corr_clipped', 'cov_nearest']),
+        ('statsmodels.sandbox.stats.runs', [
+            'mcnemar', 'cochrans_q', 'symmetry_bowker', 'Runs',
+            'runstest_1samp', 'runstest_2samp']),
+        ])
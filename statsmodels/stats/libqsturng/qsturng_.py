@@ -26,12 +26,15 @@ see:
 import math
 import scipy.stats
 import numpy as np
+from scipy import special
 
 from scipy.optimize import fminbound
 
+from statsmodels.tools.rootfinding import _illinois_vec
+
 inf = np.inf
 
-__version__ = '0.2.3'
+__version__ = '0.3'
 
 # changelog
 # 0.1   - initial release
@@ -43,6 +46,10 @@ __version__ = '0.2.3'
 #         select_vs
 #       - pysturng tester added.
 # 0.2.3 - uses np.inf and np.isinf
+# 0.3   - qsturng and psturng are array native, the A table is also kept as
+#         an array for vectorized lookups and interpolation. The scalar
+#         versions are kept as _qsturng and _psturng.
+#       - exact option computes the distribution by numerical integration
 
 # Gleason's table was derived using least square estimation on the tabled
 # r values for combinations of p and v. In total there are 206
@@ -385,6 +392,19 @@ def _isfloat(x):
 
     return True
 
+# Coefficients of the rational approximations in _phi
+_phi_a = (-3.969683028665376e+01,  2.209460984245205e+02, \
+          -2.759285104469687e+02,  1.383577518672690e+02, \
+          -3.066479806614716e+01,  2.506628277459239e+00)
+_phi_b = (-5.447609879822406e+01,  1.615858368580409e+02, \
+          -1.556989798598866e+02,  6.680131188771972e+01, \
+          -1.328068155288572e+01 )
+_phi_c = (-7.784894002430293e-03, -3.223964580411365e-01, \
+          -2.400758277161838e+00, -2.549732539343734e+00, \
+           4.374664141464968e+00,  2.938163982698783e+00)
+_phi_d = ( 7.784695709041462e-03,  3.224671290700398e-01, \
+           2.445134137142996e+00,  3.754408661907416e+00)
+
 ##def _phi(p):
 ##    """returns the pth quantile inverse norm"""
 ##    return scipy.stats.norm.isf(p)
@@ -420,17 +440,7 @@ def _phi( p ):
         raise ValueError( "Argument to ltqnorm %f must be in open interval (0,1)" % p )
 
     # Coefficients in rational approximations.
-    a = (-3.969683028665376e+01,  2.209460984245205e+02, \
-         -2.759285104469687e+02,  1.383577518672690e+02, \
-         -3.066479806614716e+01,  2.506628277459239e+00)
-    b = (-5.447609879822406e+01,  1.615858368580409e+02, \
-         -1.556989798598866e+02,  6.680131188771972e+01, \
-         -1.328068155288572e+01 )
-    c = (-7.784894002430293e-03, -3.223964580411365e-01, \
-         -2.400758277161838e+00, -2.549732539343734e+00, \
-          4.374664141464968e+00,  2.938163982698783e+00)
-    d = ( 7.784695709041462e-03,  3.224671290700398e-01, \
-          2.445134137142996e+00,  3.754408661907416e+00)
+    a, b, c, d = _phi_a, _phi_b, _phi_c, _phi_d
 
     # Define break-points.
     plow  = 0.02425
@@ -753,11 +763,223 @@ def _qsturng(p, r, v):
     return math.sqrt(2) * -y * \
            scipy.stats.t.isf((1.+p)/2., (v,1e38)[v>1e38])
 
-# make a qsturng functinon that will accept list-like objects
-_vqsturng = np.vectorize(_qsturng)
-_vqsturng.__doc__ = """vector version of qsturng"""
+# The A table as arrays for vectorized lookups. Rows are p_keys, columns are
+# _v_tbl, which adds v = 1 to v_keys. Entries for v = 1 with p < .9 are nan.
+_p_tbl = np.array(p_keys)
+_v_tbl = np.array([1.] + v_keys)
+_A_tbl = np.empty((len(_p_tbl), len(_v_tbl), 4))
+_A_tbl.fill(np.nan)
+for (_p, _v), _a in A.items():
+    _A_tbl[p_keys.index(_p), list(_v_tbl).index(_v)] = _a
+del _p, _v, _a
+
+# break points of _select_ps, the index of p0 in p_keys is the number of
+# break points that are <= p
+_p_breaks = np.array([.5, .675, .7625, .825, .875, .9125, .95, .975, .99])
+
+def _phi_vec(p):
+    """vectorized version of _phi, requires 0 < p < 1"""
+    a, b, c, d = _phi_a, _phi_b, _phi_c, _phi_d
+    plow = 0.02425
+    p = np.asarray(p, dtype=float)
+
+    # tails, p < plow uses the lower and p > 1 - plow the upper region
+    tail = (p < plow) | (p > 1 - plow)
+    pt = np.where(tail, np.where(p < .5, p, 1 - p), plow)
+    q = np.sqrt(-2 * np.log(pt))
+    x_tail = (((((c[0]*q+c[1])*q+c[2])*q+c[3])*q+c[4])*q+c[5]) / \
+             ((((d[0]*q+d[1])*q+d[2])*q+d[3])*q+1)
+    x_tail = np.where(p < .5, -x_tail, x_tail)
+
+    q = p - 0.5
+    r = q*q
+    x_mid = -(((((a[0]*r+a[1])*r+a[2])*r+a[3])*r+a[4])*r+a[5])*q / \
+            (((((b[0]*r+b[1])*r+b[2])*r+b[3])*r+b[4])*r+1)
+    return np.where(tail, x_tail, x_mid)
+
+def _ptransform_vec(p):
+    """vectorized version of _ptransform"""
+    return -1. / (1. + 1.5 * _phi_vec((1. + p)/2.))
+
+def _func_vec(a, p, r, v):
+    """vectorized version of _func, a has the coefficients in the last axis"""
+    lr = np.log(r - 1.)
+    f = a[...,0]*lr + a[...,1]*lr**2 + a[...,2]*lr**3 + a[...,3]*lr**4
+
+    # eq. 2.7 and 2.8 corrections
+    r3 = (r == 3)
+    if np.any(r3):
+        v_ = np.where(np.isinf(v), 1e38, v)
+        corr = -0.002 / (1. + 12. * _phi_vec(p)**2) + \
+               np.where(v <= 4.364, 1./517. - 1./(312.*v_), 1./(191.*v_))
+        f = f + np.where(r3, corr, 0.)
+
+    return -f
+
+def _tisf(p, v):
+    """t.isf((1 + p) / 2, v) with v = inf replaced by 1e38"""
+    return scipy.stats.t.isf((1. + p)/2., np.minimum(v, 1e38))
+
+def _quad_interp(x, x0, x1, x2, y0, y1, y2, forward):
+    """quadratic interpolation through three points at x
+
+    the derivative at x1 is taken from the interval (x1, x2) where forward
+    is true, and from (x0, x1) otherwise.
+    """
+    d2 = 2.*((y2-y1)/(x2-x1) - (y1-y0)/(x1-x0))/(x2-x0)
+    d1 = np.where(forward, (y2-y1)/(x2-x1) - 0.5*d2*(x2-x1),
+                           (y1-y0)/(x1-x0) + 0.5*d2*(x1-x0))
+    return (d2/2.)*(x-x1)**2. + d1*(x-x1) + y1
+
+def _interpolate_p_vec(p, r, iv):
+    """
+    vectorized version of _interpolate_p, v is given by its index iv
+    in _v_tbl
+    """
+    v = _v_tbl[iv]
+    i0 = np.searchsorted(_p_breaks, p, side='right')
+    # v = 1 is only tabled for p >= .9, use .9, .95 and .975 for .9 <= p
+    # < .9125 instead of failing
+    i0 = np.where((iv == 0) & (i0 < 6), 6, i0)
+    p0, p1, p2 = _p_tbl[i0], _p_tbl[i0+1], _p_tbl[i0+2]
+
+    y0 = _func_vec(_A_tbl[i0, iv], p0, r, v) + 1.
+    y1 = _func_vec(_A_tbl[i0+1, iv], p1, r, v) + 1.
+    y2 = _func_vec(_A_tbl[i0+2, iv], p2, r, v) + 1.
+
+    y = np.empty(p.shape)
+    rv = r / v
+
+    # p > .85: ordinate and abcissa transformation, .5 < p <= .85:
+    # ordinate transformation, both with quadratic interpolation
+    quad = p > .5
+    if np.any(quad):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            y_log0 = np.log(y0[quad] + rv[quad])
+            y_log1 = np.log(y1[quad] + rv[quad])
+            y_log2 = np.log(y2[quad] + rv[quad])
+        pq, p0q, p1q, p2q = p[quad], p0[quad], p1[quad], p2[quad]
+        trans = pq > .85
+        x, x0, x1, x2 = [np.where(trans, _ptransform_vec(pp), pp)
+                         for pp in (pq, p0q, p1q, p2q)]
+        y_log = _quad_interp(x, x0, x1, x2, y_log0, y_log1, y_log2,
+                             (p2q + p0q) >= (p1q + p1q))
+        y[quad] = np.exp(y_log) - rv[quad]
+
+    # p <= .5: linear interpolation in q and p
+    lin = ~quad
+    if np.any(lin):
+        pl, p0l, p1l, vl = p[lin], p0[lin], p1[lin], v[lin]
+        q0 = math.sqrt(2) * -y0[lin] * _tisf(p0l, vl)
+        q1 = math.sqrt(2) * -y1[lin] * _tisf(p1l, vl)
+        q = (q1-q0)/(p1l-p0l) * (pl-p0l) + q0
+        y[lin] = -q / (math.sqrt(2) * _tisf(pl, vl))
+
+    return y
+
+def _select_vs_vec(v, p):
+    """vectorized version of _select_vs, returns the index of v1 in _v_tbl"""
+    iv1 = np.floor(v + .5) - 1
+    iv1 = np.where(p >= .9, np.where(v < 2.5, 1, iv1),
+                            np.where(v < 3.5, 2, iv1))
+    for v_low, iv in [(19.5, 19), (24., 20), (30., 21), (40., 22), (60., 23),
+                      (120., 24)]:
+        iv1 = np.where(v >= v_low, iv, iv1)
+    return iv1.astype(int)
+
+def _interpolate_v_vec(p, r, v, ip):
+    """
+    vectorized version of _interpolate_v, p is given by its index ip in
+    p_keys
+    """
+    iv1 = _select_vs_vec(v, p)
+    v0, v1, v2 = _v_tbl[iv1-1], _v_tbl[iv1], _v_tbl[iv1+1]
+
+    y0_sq = (_func_vec(_A_tbl[ip, iv1-1], p, r, v0) + 1.)**2.
+    y1_sq = (_func_vec(_A_tbl[ip, iv1], p, r, v1) + 1.)**2.
+    y2_sq = (_func_vec(_A_tbl[ip, iv1+1], p, r, v2) + 1.)**2.
+
+    # if v2 is inf set to a big number so interpolation
+    # calculations will work
+    v2 = np.minimum(v2, 1e38)
+
+    # transform v
+    v_, v0_, v1_, v2_ = 1./v, 1./v0, 1./v1, 1./v2
+
+    return np.sqrt(_quad_interp(v_, v0_, v1_, v2_, y0_sq, y1_sq, y2_sq,
+                                (v2_ + v0_) >= (v1_ + v1_)))
+
+def _interpolate_pv_vec(p, r, v):
+    """quadratic interpolation in p and v when neither is in the table"""
+    iv1 = _select_vs_vec(v, p)
 
-def qsturng(p, r, v):
+    # calculate r0, r1, and r2
+    r0_sq = _interpolate_p_vec(p, r, iv1-1)**2
+    r1_sq = _interpolate_p_vec(p, r, iv1)**2
+    r2_sq = _interpolate_p_vec(p, r, iv1+1)**2
+
+    # transform v
+    v_, v0_, v1_, v2_ = 1./v, 1./_v_tbl[iv1-1], 1./_v_tbl[iv1], \
+                        1./_v_tbl[iv1+1]
+
+    return np.sqrt(_quad_interp(v_, v0_, v1_, v2_, r0_sq, r1_sq, r2_sq,
+                                (v2_ + v0_) >= (v1_ + v1_)))
+
+def _check_r(r):
+    if np.any(r <= 1):
+        raise ValueError('r must be > 1')
+
+def _qsturng_vec(p, r, v):
+    """
+    vectorized version of _qsturng for 1d arrays of equal length
+
+    Each element is computed with the same case distinction as in _qsturng,
+    but all elements of a case are computed together on arrays.
+    """
+    if np.any((p < .1) | (p > .999)):
+        raise ValueError('p must be between .1 and .999')
+    if np.any((p < .9) & (v < 2)):
+        raise ValueError('v must be > 2 when p < .9')
+    if np.any((p >= .9) & (v < 1)):
+        raise ValueError('v must be > 1 when p >= .9')
+    _check_r(r)
+
+    ip = np.minimum(np.searchsorted(_p_tbl, p), len(_p_tbl) - 1)
+    p_in = _p_tbl[ip] == p
+    v_in = np.in1d(v, v_keys) | ((v == 1) & (p >= .9))
+
+    y = np.empty(p.shape)
+
+    # The easy case. A tabled value is requested.
+    case = p_in & v_in
+    if np.any(case):
+        iv = np.searchsorted(_v_tbl, v[case])
+        y[case] = _func_vec(_A_tbl[ip[case], iv], p[case], r[case],
+                            v[case]) + 1.
+
+    # quadratic interpolation in p and 1/v
+    case = ~p_in & ~v_in
+    if np.any(case):
+        y[case] = _interpolate_pv_vec(p[case], r[case], v[case])
+
+    case = p_in & ~v_in
+    if np.any(case):
+        y[case] = _interpolate_v_vec(p[case], r[case], v[case], ip[case])
+
+    case = ~p_in & v_in
+    if np.any(case):
+        iv = np.searchsorted(_v_tbl, v[case])
+        y[case] = _interpolate_p_vec(p[case], r[case], iv)
+
+    return math.sqrt(2) * -y * _tisf(p, v)
+
+def _broadcast(*args):
+    """float arrays of the broadcast shape, and whether all are scalar"""
+    scalar = all(np.ndim(x) == 0 for x in args)
+    args = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in args])
+    return [x.ravel() for x in args], args[0].shape, scalar
+
+def qsturng(p, r, v, exact=False):
     """Approximates the quantile p for a studentized range
        distribution having v degrees of freedom and r samples
        for probability p.
@@ -778,17 +1000,31 @@ def qsturng(p, r, v):
             v >=1 and v >= inf
         else:
             v >=2 and v >= inf
+    exact : bool
+        If True, the quantile is computed by inverting the distribution
+        function obtained by numerical integration instead of Gleason's
+        approximation. This is much slower, but the relative error of q is
+        about 1e-10 or less, and it allows any 0 < p < 1 and v > 0.
 
     Returns
     -------
     q : (scalar, array_like)
         approximation of the Studentized Range
 
-    """
+    Notes
+    -----
+    The arguments are broadcast against each other. The table lookups and
+    interpolations are computed on whole arrays.
 
-    if all(map(_isfloat, [p, r, v])):
-        return _qsturng(p, r, v)
-    return _vqsturng(p, r, v)
+    """
+    (p, r, v), shape, scalar = _broadcast(p, r, v)
+    if exact:
+        q = _qsturng_exact(p, r, v)
+    else:
+        q = _qsturng_vec(p, r, v)
+    if scalar:
+        return q[0]
+    return q.reshape(shape)
 
 ##def _qsturng0(p, r, v):
 ####    print 'q0',p
@@ -835,10 +1071,33 @@ def _psturng(q, r, v):
             return .001
         return 1. - fminbound(opt_func, .1, .999, args=(r,v))
 
-_vpsturng = np.vectorize(_psturng)
-_vpsturng.__doc__ = """vector version of psturng"""
+def _psturng_vec(q, r, v):
+    """
+    vectorized version of _psturng for 1d arrays of equal length
 
-def psturng(q, r, v):
+    q = qsturng(p, r, v) is solved for p by vectorized root finding.
+    """
+    if np.any(q < 0.):
+        raise ValueError('q should be >= 0')
+    _check_r(r)
+
+    p_low = np.where(v == 1, .9, .1)
+    q_low = _qsturng_vec(p_low, r, v)
+    q_high = _qsturng_vec(np.repeat(.999, len(q)), r, v)
+
+    p = np.where(q < q_low, p_low, .999)
+    inner = np.nonzero((q >= q_low) & (q <= q_high))[0]
+    if len(inner):
+        qi, ri, vi = q[inner], r[inner], v[inner]
+        func = lambda pp, idx: _qsturng_vec(pp, ri[idx], vi[idx]) - qi[idx]
+        p[inner] = _illinois_vec(func, p_low[inner], p[inner] * 0 + .999,
+                                 xtol=1e-10, fa=q_low[inner] - qi,
+                                 fb=q_high[inner] - qi)[0]
+        # stay in the table range in spite of rounding
+        p[inner] = np.clip(p[inner], p_low[inner], .999)
+    return 1. - p
+
+def psturng(q, r, v, exact=False):
     """Evaluates the probability from 0 to q for a studentized
        range having v degrees of freedom and r samples.
 
@@ -857,6 +1116,9 @@ def psturng(q, r, v):
             v >=1 and v >= inf
         else:
             v >=2 and v >= inf
+    exact : bool
+        If True, the probability is computed by numerical integration
+        instead of inverting Gleason's approximation, and it is not bound.
 
     Returns
     -------
@@ -867,9 +1129,125 @@ def psturng(q, r, v):
         Values between .5 and .9 are 1st order appoximations.
 
     """
-    if all(map(_isfloat, [q, r, v])):
-        return _psturng(q, r, v)
-    return _vpsturng(q, r, v)
+    (q, r, v), shape, scalar = _broadcast(q, r, v)
+    if exact:
+        if np.any(q < 0.):
+            raise ValueError('q should be >= 0')
+        _check_r(r)
+        p = 1. - _sturng_cdf(q, r, v)
+    else:
+        p = _psturng_vec(q, r, v)
+    if scalar:
+        return p[0]
+    return p.reshape(shape)
+
+# Gauss-Legendre nodes and weights on [-1, 1] for the composite rules of
+# the exact distribution
+_gl_nodes, _gl_weights = np.polynomial.legendre.leggauss(16)
+
+def _composite_gl(lower, upper, n_intervals):
+    """
+    nodes and weights of composite Gauss-Legendre rules on [lower, upper]
+
+    lower and upper are arrays, the nodes are in the last axis.
+    """
+    lower = np.asarray(lower, dtype=float)[..., None]
+    upper = np.asarray(upper, dtype=float)[..., None]
+    edges = np.linspace(0, 1, n_intervals + 1)
+    half = (edges[1:] - edges[:-1]) / 2.
+    mid = (edges[1:] + edges[:-1]) / 2.
+    x = (mid[:, None] + half[:, None] * _gl_nodes).ravel()
+    w = (half[:, None] * _gl_weights).ravel()
+    return lower + (upper - lower) * x, (upper - lower) * w
+
+# nodes for the integral over the normal density in the range probability
+_z_nodes, _z_weights = _composite_gl(-8.5, 8.5, 16)
+
+def _prange(w, r):
+    """
+    probability that the range of r standard normal samples is below w
+
+    w and r broadcast against each other, the normal integration nodes
+    are added as a last axis
+    """
+    z = _z_nodes
+    diff = special.ndtr(z) - special.ndtr(z - w[..., None])
+    integrand = np.exp((r[..., None] - 1) * np.log(np.maximum(diff, 1e-300))
+                       + np.log(r[..., None]) - z**2 / 2.)
+    return np.dot(integrand, _z_weights) / math.sqrt(2 * np.pi)
+
+def _sturng_cdf(q, r, v, chunksize=32):
+    """
+    distribution function of the studentized range by numerical integration
+
+    P(Q < q) = int f(s; v) P_r(q s) ds, where s is distributed as
+    sqrt(chi2(v) / v) and P_r is the distribution of the range of r
+    standard normal samples.
+    """
+    cdf = np.empty(len(q))
+    for start in range(0, len(q), chunksize):
+        sl = slice(start, start + chunksize)
+        qc, rc, vc = q[sl], r[sl], v[sl]
+        out = np.empty(len(qc))
+
+        inf_v = np.isinf(vc)
+        if np.any(inf_v):
+            out[inf_v] = _prange(qc[inf_v], rc[inf_v])
+
+        fin = ~inf_v
+        if np.any(fin):
+            vf = vc[fin]
+            s_low = np.sqrt(scipy.stats.chi2.ppf(1e-14, vf) / vf)
+            s_high = np.sqrt(scipy.stats.chi2.isf(1e-14, vf) / vf)
+            # integrate over log(s) with intervals of at most length 1, the
+            # range of log(s) is wide and the density of s is not smooth at
+            # 0 for small v
+            log_low, log_high = np.log(s_low), np.log(s_high)
+            n_intervals = max(8, int(np.ceil(np.max(log_high - log_low))))
+            log_s, ws = _composite_gl(log_low, log_high, n_intervals)
+            s = np.exp(log_s)
+            vv = vf[:, None]
+            log_dens = (np.log(2.) + vv / 2. * np.log(vv / 2.) -
+                        special.gammaln(vv / 2.) + vv * log_s -
+                        vv * s**2 / 2.)
+            prange = _prange(qc[fin, None] * s, rc[fin, None])
+            out[fin] = (np.exp(log_dens) * ws * prange).sum(-1)
+
+        cdf[sl] = out
+    return np.clip(cdf, 0., 1.)
+
+def _qsturng_exact(p, r, v):
+    """quantile of the studentized range by inverting _sturng_cdf"""
+    if np.any((p <= 0) | (p >= 1)):
+        raise ValueError('p must be in the open interval (0, 1)')
+    if np.any(v <= 0):
+        raise ValueError('v must be > 0')
+    _check_r(r)
+
+    # start from the approximation restricted to its range
+    p_a = np.clip(p, .1, .999)
+    p_a = np.where(v < 2, np.maximum(p_a, .9), p_a)
+    q0 = _qsturng_vec(p_a, r, np.maximum(v, 1))
+
+    func = lambda qq, idx: _sturng_cdf(qq, r[idx], v[idx]) - p[idx]
+    idx = np.arange(len(p))
+    a, b = q0 * .8, q0 * 1.25
+    fa, fb = func(a, idx), func(b, idx)
+    # widen the bracket where needed
+    for i in range(60):
+        low = np.nonzero(fa > 0)[0]
+        if len(low) == 0:
+            break
+        a[low] /= 2.
+        fa[low] = func(a[low], low)
+    for i in range(60):
+        high = np.nonzero(fb < 0)[0]
+        if len(high) == 0:
+            break
+        b[high] *= 2.
+        fb[high] = func(b[high], high)
+
+    return _illinois_vec(func, a, b, xtol=1e-10, fa=fa, fb=fb)[0]
 
 ##p, r, v = .9, 10, 20
 ##print
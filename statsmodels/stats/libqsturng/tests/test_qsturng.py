@@ -9,11 +9,13 @@ from __future__ import with_statement
 
 from numpy.testing import TestCase, rand, assert_, assert_equal, \
     assert_almost_equal, assert_array_almost_equal, assert_array_equal, \
-    assert_approx_equal, assert_raises, run_module_suite, dec
+    assert_approx_equal, assert_raises, run_module_suite, dec, \
+    assert_allclose
 
 import numpy as np
 
 from statsmodels.stats.libqsturng import qsturng, psturng,p_keys,v_keys
+from statsmodels.stats.libqsturng.qsturng_ import _qsturng, _psturng
 
 def read_ch(fname):
     with open(fname) as f:
@@ -128,6 +130,51 @@ class test_qsturng(TestCase):
         errors = np.abs(qs-qsturng(ps,rs,vs))/qs
         assert_equal(np.array([]), np.where(errors > .03)[0])
 
+    def test_vectorized_to_scalar(self):
+        "array evaluation reproduces the scalar implementation"
+        np.random.seed(9876)
+        n = 200
+        ps = np.random.random(n)*(.999 - .1) + .1
+        rs = np.random.random_integers(2, 100, n).astype(float)
+        vs = np.random.random(n)*998. + 2.
+        vs[:10] = np.inf
+        ps[10:20] = np.random.random(10)*(.999 - .9125) + .9125
+        vs[10:20] = 1.
+        expected = [_qsturng(p, r, v) for p, r, v in zip(ps, rs, vs)]
+        assert_array_almost_equal(qsturng(ps, rs, vs), expected, 12)
+        # v = 1 between the .9 and .95 table entries
+        q = qsturng([.9, .905, .95], 5, 1)
+        assert_(np.all(np.diff(q) > 0))
+
+    def test_broadcast(self):
+        "inputs broadcast against each other"
+        ps = np.array([[.9], [.95], [.99]])
+        rs = np.array([3, 5, 10])
+        q = qsturng(ps, rs, 20)
+        assert_equal(q.shape, (3, 3))
+        for i in range(3):
+            for j in range(3):
+                assert_almost_equal(q[i, j], _qsturng(ps[i, 0], rs[j], 20),
+                                    12)
+
+    def test_exact(self):
+        "exact integration against qtukey from R"
+        import os
+        curdir = os.path.dirname(os.path.abspath(__file__))
+        ps, rs, vs, qs = read_ch(os.path.split(os.path.split(curdir)[0])[0]
+                                 + '/tests/results/bootleg.csv')
+        ps, rs, vs, qs = [np.array(x[:20]) for x in (ps, rs, vs, qs)]
+        assert_array_almost_equal(qsturng(ps, rs, vs, exact=True) / qs,
+                                  np.ones(20), 5)
+        # qtukey is accurate to about 1e-6, the reference values below are
+        # from nested adaptive quadrature with scipy.integrate.quad, also
+        # for infinite, small and fractional degrees of freedom
+        ps = [.95, .95, .99, .5]
+        rs = [3, 3, 100, 2]
+        vs = [np.inf, 1, 2, 1.5]
+        qs = [3.3144931554, 26.9755298695, 50.3813945142, 1.23403520622]
+        assert_allclose(qsturng(ps, rs, vs, exact=True), qs, rtol=1e-9)
+
 class test_psturng(TestCase):
     def test_scalar(self):
         "scalar input -> scalar output"
@@ -192,6 +239,29 @@ class test_psturng(TestCase):
 
         assert_equal(np.array([]), np.where(errors > 1e-5)[0])
 
+    def test_vectorized_to_scalar(self):
+        "array evaluation agrees with the scalar implementation"
+        np.random.seed(9876)
+        n = 50
+        ps = np.random.random(n)*(.999 - .1) + .1
+        rs = np.random.random_integers(2, 100, n).astype(float)
+        vs = np.random.random(n)*998. + 2.
+        qs = qsturng(ps, rs, vs)
+        # outside of the tabled range
+        qs[:5] *= .1
+        qs[5:10] *= 10
+        expected = [_psturng(q, r, v) for q, r, v in zip(qs, rs, vs)]
+        assert_array_almost_equal(psturng(qs, rs, vs), expected, 5)
+        assert_array_almost_equal(psturng(qs[10:], rs[10:], vs[10:]),
+                                  1 - ps[10:], 8)
+
+    def test_exact(self):
+        ps = np.array([.5, .9, .95, .99])
+        qs = qsturng(ps, 4, 12, exact=True)
+        assert_array_almost_equal(psturng(qs, 4, 12, exact=True), 1 - ps, 8)
+        # approximate and exact agree up to the table interpolation error
+        assert_array_almost_equal(psturng(qs, 4, 12), 1 - ps, 3)
+
 ##     def test_more_exotic_stuff(self, level=3):
 ##         something_obscure_and_expensive()
 
@@ -178,7 +178,7 @@ def pval_lf(Dmax, n):
     return pval
 
 
-def kstest_normal(x, pvalmethod='approx'):
+def kstest_normal(x, pvalmethod='approx', table=None):
     '''Lillifors test for normality,
 
     Kolmogorov Smirnov test with estimated mean and variance
@@ -196,6 +196,10 @@ def kstest_normal(x, pvalmethod='approx'):
         large n (n>900). Values in the table are linearly interpolated.
         Values outside the range will be returned as bounds, 0.2 for large and
         0.001 for small pvalues.
+    table : None or TableDist instance
+        If pvalmethod is 'table', then this table is used instead of the
+        table of Dalal and Wilkinson, for example a Monte Carlo table from
+        ``statsmodels.stats.mctools.get_crit_table('kstest_normal', sizes)``
 
     Returns
     -------
@@ -225,7 +229,9 @@ def kstest_normal(x, pvalmethod='approx'):
         pval = pval_lf(d_ks, nobs)
     elif pvalmethod == 'table':
         #pval = pval_lftable(d_ks, nobs)
-        pval = lillifors_table.prob(d_ks, nobs)
+        if table is None:
+            table = lillifors_table
+        pval = table.prob(d_ks, nobs)
 
     return d_ks, pval
 
@@ -0,0 +1,784 @@
+'''Monte Carlo Studies for statistical tests and critical value tables
+
+Most of it should also be usable for Bootstrap, and for MC for estimators.
+Takes the sample generator, dgb, and the statistical results, statistic,
+as functions in the argument.
+
+The replications are split into chunks, each chunk has its own RandomState
+that is seeded from the seed of the run. Chunks can be distributed over
+several processes with joblib. The results do not depend on the number of
+processes.
+
+If the Monte Carlo results are not stored, then they are accumulated in a
+histogram, and quantiles and cdf are computed from the histogram.
+
+Author: Josef Perktold (josef-pktd)
+License: BSD-3
+
+
+TODOs, Design
+-------------
+Use distribution function to keep track of MC results, ECDF, non-paramatric?
+Large parts are similar to a 2d array of independent multivariate random
+variables. Joint distribution is not used (yet).
+
+I guess this is currently only for one sided test statistics, e.g. for
+two-sided tests basend on t or normal distribution use the absolute value.
+
+'''
+
+import os
+import hashlib
+
+import numpy as np
+from scipy import stats
+
+from statsmodels.iolib.table import SimpleTable
+from statsmodels.tools.parallel import parallel_func
+
+
+class MCHistogram(object):
+    '''incremental histogram of Monte Carlo results
+
+    Values inside the range ``[lower, upper]`` of a column are counted in
+    `nbins` bins of equal width. Values outside of the range are kept, so
+    the tails are exact. Histograms of different chunks are combined with
+    `merge`.
+
+    Parameters
+    ----------
+    lower, upper : array_like, 1d
+        range of the bins for each column of the Monte Carlo results
+    nbins : int
+        number of bins
+
+    Attributes
+    ----------
+    nobs : int
+        number of replications
+    counts : ndarray, (nbins, ncols)
+        counts in bins
+    low, high : list of ndarrays
+        values below and above the range for each column
+    '''
+
+    def __init__(self, lower, upper, nbins=10000):
+        self.lower = np.atleast_1d(np.asarray(lower, float))
+        self.upper = np.atleast_1d(np.asarray(upper, float))
+        self.nbins = nbins
+        ncols = len(self.lower)
+        self.width = (self.upper - self.lower) / nbins
+        self.width[self.width <= 0] = 1.
+        self.nobs = 0
+        self.counts = np.zeros((nbins, ncols), np.int64)
+        self.low = [np.empty(0) for _ in range(ncols)]
+        self.high = [np.empty(0) for _ in range(ncols)]
+
+    def update(self, res):
+        '''add a 2-d array of Monte Carlo results, replications in rows
+        '''
+        res = np.asarray(res, float).reshape(len(res), -1)
+        self.nobs += len(res)
+        for j in range(res.shape[1]):
+            col = res[:, j]
+            below = col < self.lower[j]
+            above = col > self.upper[j]
+            self.low[j] = np.concatenate((self.low[j], col[below]))
+            self.high[j] = np.concatenate((self.high[j], col[above]))
+            inside = col[~(below | above)]
+            ibin = ((inside - self.lower[j]) / self.width[j]).astype(int)
+            np.clip(ibin, 0, self.nbins - 1, out=ibin)
+            self.counts[:, j] += np.bincount(ibin, minlength=self.nbins)
+        return self
+
+    def merge(self, other):
+        '''add the counts of another histogram with the same bins
+        '''
+        self.nobs += other.nobs
+        self.counts += other.counts
+        self.low = [np.concatenate(lh) for lh in zip(self.low, other.low)]
+        self.high = [np.concatenate(lh) for lh in zip(self.high, other.high)]
+        return self
+
+    def ppf(self, frac, idx=0):
+        '''quantiles of column idx, order statistic at ``int(nobs * frac)``
+
+        Inside the range of the bins the order statistics are linearly
+        interpolated.
+        '''
+        frac = np.asarray(frac, float)
+        k = np.clip((self.nobs * frac).astype(int), 0, self.nobs - 1)
+        low = np.sort(self.low[idx])
+        high = np.sort(self.high[idx])
+        counts = self.counts[:, idx]
+        cumcounts = len(low) + np.cumsum(counts)
+        res = np.empty(k.shape)
+        for i, ki in np.ndenumerate(k):
+            if ki < len(low):
+                res[i] = low[ki]
+            elif ki >= cumcounts[-1]:
+                res[i] = high[ki - cumcounts[-1]]
+            else:
+                b = np.searchsorted(cumcounts, ki, side='right')
+                before = cumcounts[b] - counts[b]
+                res[i] = self.lower[idx] + self.width[idx] * (
+                              b + (ki - before + 0.5) / counts[b])
+        return res
+
+    def cdf(self, x, idx=0):
+        '''fraction of replications of column idx that are smaller than x
+        '''
+        x = np.asarray(x, float)
+        low = np.sort(self.low[idx])
+        high = np.sort(self.high[idx])
+        cumcounts = np.concatenate(([0], np.cumsum(self.counts[:, idx])))
+        pos = (x - self.lower[idx]) / self.width[idx]
+        pos = np.clip(pos, 0, self.nbins)
+        b = np.minimum(pos.astype(int), self.nbins - 1)
+        inside = cumcounts[b] + (pos - b) * self.counts[:, idx][b]
+        nless = (np.searchsorted(low, x) + np.where(x > self.lower[idx],
+                                                    inside, 0) +
+                 np.searchsorted(high, x))
+        return nless / float(self.nobs)
+
+
+def _draw_seeds(seed, size):
+    '''seeds for independent random streams
+
+    If seed is None, then the seeds are drawn from the global numpy random
+    state, so that results can be reproduced with np.random.seed.
+    '''
+    if seed is None:
+        return np.random.randint(0, 2**31 - 1, size=size)
+    return np.random.RandomState(seed).randint(0, 2**31 - 1, size=size)
+
+def _mc_chunks(dgp, statistic, seeds, chunksizes, batch, statindices,
+               dgpargs, statsargs, histargs):
+    '''run the Monte Carlo replications for several chunks
+
+    each chunk uses its own RandomState, returns the results of all chunks
+    as an array, or accumulated in a MCHistogram if histargs is not None
+    '''
+    hist = MCHistogram(*histargs) if histargs is not None else None
+    if not batch:
+        state = np.random.get_state()
+    results = []
+    for seed, nrepl in zip(seeds, chunksizes):
+        if batch:
+            rs = np.random.RandomState(seed)
+            res = np.asarray(statistic(dgp(nrepl, rs, *dgpargs), *statsargs))
+            res = res.reshape(nrepl, -1)
+        else:
+            # dgp uses the global random state
+            np.random.seed(seed)
+            res = np.array([np.ravel(statistic(dgp(*dgpargs), *statsargs))
+                            for _ in range(nrepl)])
+        if statindices is not None:
+            res = res[:, statindices]
+        if hist is not None:
+            hist.update(res)
+        else:
+            results.append(res)
+    if not batch:
+        np.random.set_state(state)
+    if hist is not None:
+        return hist
+    return np.concatenate(results)
+
+
+#copied from stattools
+class StatTestMC(object):
+    """class to run Monte Carlo study on a statistical test'''
+
+    TODO
+    print summary, for quantiles and for histogram
+    draft in trying out script log
+
+    Parameters
+    ----------
+    dgp : callable
+        Function that generates the data to be used in Monte Carlo that should
+        return a new sample with each call. If batch is True, then it is
+        called as ``dgp(nrepl, random_state, *dgpargs)`` and returns the
+        samples of nrepl replications.
+    statistic : callable
+        Function that calculates the test statistic, which can return either
+        a single statistic or a 1d array_like (tuple, list, ndarray).
+        If batch is True, then it returns an array with nrepl rows.
+        see also statindices in description of run
+    batch : bool
+        If False (default), then the dgp and the statistic are called once
+        for each replication, and dgp uses the global numpy random state.
+        If True, then they are called for a chunk of replications and dgp
+        uses the RandomState instance that is given as argument.
+
+    Attributes
+    ----------
+    many methods store intermediate results
+
+    self.mcres : ndarray (nrepl, nreturns) or (nrepl, len(statindices))
+        Monte Carlo results stored by run if store is True
+    self.mchist : MCHistogram
+        accumulated Monte Carlo results if store is False
+
+
+    Notes
+    -----
+
+    .. Warning::
+       This is (currently) designed for a single call to run. If run is
+       called a second time with different arguments, then some attributes might
+       not be updated, and, therefore, not correspond to the same run.
+
+    .. Warning::
+       Under Construction, don't expect stability in Api or implementation
+
+
+    Examples
+    --------
+
+    Define a function that defines our test statistic:
+
+    def lb(x):
+        s,p = acorr_ljungbox(x, lags=4)
+        return np.r_[s, p]
+
+    Note lb returns eight values.
+
+    Define a random sample generator, for example 500 independently, normal
+    distributed observations in a sample:
+
+
+    def normalnoisesim(nobs=500, loc=0.0):
+        return (loc+np.random.randn(nobs))
+
+    Create instance and run Monte Carlo. Using statindices=range(4) means that
+    only the first for values of the return of the statistic (lb) are stored
+    in the Monte Carlo results.
+
+    mc1 = StatTestMC(normalnoisesim, lb)
+    mc1.run(5000, statindices=range(4))
+
+    Most of the other methods take an idx which indicates for which columns
+    the results should be presented, e.g.
+
+    print mc1.cdf(crit, [1,2,3])[1]
+
+    A vectorized Monte Carlo with two processes that does not store the
+    replications:
+
+    def normalsim(nrepl, random_state, nobs=500):
+        return random_state.randn(nrepl, nobs)
+
+    def skew(x):
+        return stats.skew(x, axis=1)
+
+    mc2 = StatTestMC(normalsim, skew, batch=True)
+    mc2.run(100000, n_jobs=2, seed=12345, store=False)
+    print mc2.quantiles(0, [0.025, 0.975])
+
+
+    """
+
+    def __init__(self, dgp, statistic, batch=False):
+        self.dgp = dgp #staticmethod(dgp)  #no self
+        self.statistic = statistic # staticmethod(statistic)  #no self
+        self.batch = batch
+
+    def run(self, nrepl, statindices=None, dgpargs=[], statsargs=[],
+            n_jobs=1, seed=None, chunksize=1000, store=True, nbins=10000):
+        '''run the actual Monte Carlo and save results
+
+        Parameters
+        ----------
+        nrepl : int
+            number of Monte Carlo repetitions
+        statindices : None or list of integers
+           determines which values of the return of the statistic
+           functions are stored in the Monte Carlo. Default None
+           means the entire return. If statindices is a list of
+           integers, then it will be used as index into the return.
+        dgpargs : tuple
+           optional parameters for the DGP
+        statsargs : tuple
+           optional parameters for the statistics function
+        n_jobs : int
+           number of processes, -1 uses all cpus. Requires joblib.
+        seed : None or int
+           seed for the random numbers of the chunks. If None, then the
+           seeds of the chunks are drawn from the global numpy random state.
+        chunksize : int
+           number of replications in a chunk
+        store : bool
+           If True, then the Monte Carlo results are stored in `mcres`.
+           If False, then they are accumulated in a histogram `mchist`,
+           the first chunk determines the range of the bins.
+        nbins : int
+           number of bins of the histogram if store is False
+
+        Returns
+        -------
+        None, all results are attached
+
+
+        '''
+        self.nrepl = nrepl
+        self.statindices = statindices
+        self.dgpargs = dgpargs
+        self.statsargs = statsargs
+        self.store = store
+
+        # independent random streams for chunks, results do not depend on
+        # n_jobs
+        nchunks = -(-nrepl // chunksize)
+        seeds = _draw_seeds(seed, nchunks)
+        chunksizes = [chunksize] * nchunks
+        chunksizes[-1] = nrepl - chunksize * (nchunks - 1)
+
+        args = (self.dgp, self.statistic)
+        kwds = (self.batch, statindices, dgpargs, statsargs)
+        # the first chunk determines number of returns and range of bins
+        mcres0 = _mc_chunks(*(args + (seeds[:1], chunksizes[:1]) + kwds +
+                              (None,)))
+        self.nreturn = mcres0.shape[1]
+        histargs = None
+        if not store:
+            histargs = (mcres0.min(0), mcres0.max(0), nbins)
+            self.mchist = MCHistogram(*histargs).update(mcres0)
+
+        parallel, p_func, n_jobs = parallel_func(_mc_chunks, n_jobs,
+                                                 verbose=0)
+        groups = np.array_split(np.arange(1, nchunks), max(n_jobs, 1))
+        groups = [g for g in groups if len(g)]
+        res = parallel(p_func(*(args + (seeds[g], [chunksizes[i] for i in g])
+                                + kwds + (histargs,))) for g in groups)
+
+        if store:
+            mcres = np.concatenate([mcres0] + list(res))
+            if statindices is None and self.nreturn == 1:
+                #single return statistic
+                mcres = mcres[:, 0]
+            self.mcres = mcres
+        else:
+            for r in res:
+                self.mchist.merge(r)
+            if hasattr(self, 'mcres'):
+                del self.mcres
+        if hasattr(self, 'mcressort'):
+            del self.mcressort
+
+    def _check_stored(self):
+        if not self.store:
+            raise ValueError('Monte Carlo results are not stored, '
+                             'use run with store=True')
+
+    def histogram(self, idx=None, critval=None):
+        '''calculate histogram values
+
+        does not do any plotting
+
+        I don't remember what I wanted here, looks similar to the new cdf
+        method, but this also does a binned pdf (self.histo)
+
+
+        '''
+        if not self.store:
+            if idx is None:
+                if self.nreturn > 1:
+                    raise ValueError('currently only 1 statistic at a time')
+                idx = 0
+            if critval is None:
+                mchist = self.mchist
+                mcmin = min(mchist.lower[idx], mchist.low[idx].min()
+                            if len(mchist.low[idx]) else np.inf)
+                mcmax = max(mchist.upper[idx], mchist.high[idx].max()
+                            if len(mchist.high[idx]) else -np.inf)
+                bins = np.linspace(mcmin, mcmax, 11)
+                cdf = np.r_[self.mchist.cdf(bins[:-1], idx), 1]
+            else:
+                bins = np.r_[-np.inf, critval, np.inf]
+                cdf = np.r_[0, self.mchist.cdf(critval, idx), 1]
+            counts = np.diff(np.round(cdf * self.nrepl)).astype(int)
+            histo = (counts, bins)
+        elif self.mcres.ndim == 2:
+            if  not idx is None:
+                mcres = self.mcres[:,idx]
+            else:
+                raise ValueError('currently only 1 statistic at a time')
+        else:
+            mcres = self.mcres
+
+        if not self.store:
+            pass
+        elif critval is None:
+            histo = np.histogram(mcres, bins=10)
+        else:
+            histo = np.histogram(mcres,
+                                 bins=np.r_[-np.inf, critval, np.inf])
+
+        self.histo = histo
+        self.cumhisto = np.cumsum(histo[0])*1./self.nrepl
+        self.cumhistoreversed = np.cumsum(histo[0][::-1])[::-1]*1./self.nrepl
+        return histo, self.cumhisto, self.cumhistoreversed
+
+    #use cache decorator instead
+    def get_mc_sorted(self):
+        self._check_stored()
+        if not hasattr(self, 'mcressort'):
+            self.mcressort = np.sort(self.mcres, axis=0)
+        return self.mcressort
+
+
+    def quantiles(self, idx=None, frac=[0.01, 0.025, 0.05, 0.1, 0.975]):
+        '''calculate quantiles of Monte Carlo results
+
+        similar to ppf
+
+        Parameters
+        ----------
+        idx : None or list of integers
+            List of indices into the Monte Carlo results (columns) that should
+            be used in the calculation
+        frac : array_like, float
+            Defines which quantiles should be calculated. For example a frac
+            of 0.1 finds the 10% quantile, x such that cdf(x)=0.1
+
+        Returns
+        -------
+        frac : ndarray
+            same values as input, TODO: I should drop this again ?
+        quantiles : ndarray, (len(frac), len(idx))
+            the quantiles with frac in rows and idx variables in columns
+
+        Notes
+        -----
+
+        rename to ppf ? make frac required
+        change sequence idx, frac
+
+        If the results are not stored, then the quantiles are linearly
+        interpolated within the bins of the histogram.
+
+        '''
+        self.frac = frac = np.asarray(frac)
+
+        if not self.store:
+            if idx is None:
+                idx = 0
+            if np.ndim(idx) == 0:
+                return frac, self.mchist.ppf(frac, idx)
+            return frac, np.column_stack([self.mchist.ppf(frac, i)
+                                          for i in idx])
+
+        if self.mcres.ndim == 2:
+            if idx is None:
+                raise ValueError('currently only 1 statistic at a time')
+
+        mc_sorted = self.get_mc_sorted()[:,idx]
+        return frac, mc_sorted[(self.nrepl*frac).astype(int)]
+
+    def cdf(self, x, idx=None):
+        '''calculate cumulative probabilities of Monte Carlo results
+
+        Parameters
+        ----------
+        idx : None or list of integers
+            List of indices into the Monte Carlo results (columns) that should
+            be used in the calculation
+        frac : array_like, float
+            Defines which quantiles should be calculated. For example a frac
+            of 0.1 finds the 10% quantile, x such that cdf(x)=0.1
+
+        Returns
+        -------
+        x : ndarray
+            same as input, TODO: I should drop this again ?
+        probs : ndarray, (len(x), len(idx))
+            the quantiles with frac in rows and idx variables in columns
+
+
+
+        '''
+        idx = np.atleast_1d(idx).tolist()  #assure iterable, use list ?
+
+        x = np.asarray(x)
+        #TODO:autodetect or explicit option ?
+        if x.ndim > 1 and x.shape[1]==len(idx):
+            use_xi = True
+        else:
+            use_xi = False
+
+        if self.store:
+            mc_sorted = self.get_mc_sorted()
+            if mc_sorted.ndim == 1:
+                mc_sorted = mc_sorted[:, None]
+
+        x_ = x  #alias
+        probs = []
+        for i,ix in enumerate(idx):
+            if ix is None:
+                ix = 0
+            if use_xi:
+                x_ = x[:,i]
+            if self.store:
+                probs.append(np.searchsorted(mc_sorted[:,ix], x_) /
+                             float(self.nrepl))
+            else:
+                probs.append(self.mchist.cdf(x_, ix))
+        probs = np.asarray(probs).T
+        return x, probs
+
+    def plot_hist(self, idx, distpdf=None, bins=50, ax=None, kwds=None):
+        '''plot the histogram against a reference distribution
+
+        Parameters
+        ----------
+        idx : None or list of integers
+            List of indices into the Monte Carlo results (columns) that should
+            be used in the calculation
+        distpdf : callable
+            probability density function of reference distribution
+        bins : integer or array_like
+            used unchanged for matplotlibs hist call
+        ax : TODO: not implemented yet
+        kwds : None or tuple of dicts
+            extra keyword options to the calls to the matplotlib functions,
+            first dictionary is for his, second dictionary for plot of the
+            reference distribution
+
+        Returns
+        -------
+        None
+
+
+        '''
+        self._check_stored()
+        if kwds is None:
+            kwds = ({},{})
+        if self.mcres.ndim == 2:
+            if not idx is None:
+                mcres = self.mcres[:,idx]
+            else:
+                raise ValueError('currently only 1 statistic at a time')
+        else:
+            mcres = self.mcres
+
+        lsp = np.linspace(mcres.min(), mcres.max(), 100)
+
+
+        import matplotlib.pyplot as plt
+        #I don't want to figure this out now
+#        if ax=None:
+#            fig = plt.figure()
+#            ax = fig.addaxis()
+        fig = plt.figure()
+        plt.hist(mcres, bins=bins, normed=True, **kwds[0])
+        plt.plot(lsp, distpdf(lsp), 'r', **kwds[1])
+
+
+    def summary_quantiles(self, idx, distppf, frac=[0.01, 0.025, 0.05, 0.1, 0.975],
+                          varnames=None, title=None):
+        '''summary table for quantiles (critical values)
+
+        Parameters
+        ----------
+        idx : None or list of integers
+            List of indices into the Monte Carlo results (columns) that should
+            be used in the calculation
+        distppf : callable
+            probability density function of reference distribution
+            TODO: use `crit` values instead or additional, see summary_cdf
+        frac : array_like, float
+            probabilities for which
+        varnames : None, or list of strings
+            optional list of variable names, same length as idx
+
+        Returns
+        -------
+        table : instance of SimpleTable
+            use `print table` to see results
+
+        '''
+        idx = np.atleast_1d(idx)  #assure iterable, use list ?
+
+        quant, mcq = self.quantiles(idx, frac=frac)
+        #not sure whether this will work with single quantile
+        #crit = stats.chi2([2,4]).ppf(np.atleast_2d(quant).T)
+        crit = distppf(np.atleast_2d(quant).T)
+        mml=[]
+        for i, ix in enumerate(idx):  #TODO: hardcoded 2 ?
+            mml.extend([mcq[:,i], crit[:,i]])
+        #mmlar = np.column_stack(mml)
+        mmlar = np.column_stack([quant] + mml)
+        #print mmlar.shape
+        if title:
+            title = title +' Quantiles (critical values)'
+        else:
+            title='Quantiles (critical values)'
+        #TODO use stub instead
+        if varnames is None:
+            varnames = ['var%d' % i for i in range(mmlar.shape[1]//2)]
+        headers = ['\nprob'] + ['%s\n%s' % (i, t) for i in varnames for t in ['mc', 'dist']]
+        return SimpleTable(mmlar,
+                          txt_fmt={'data_fmts': ["%#6.3f"]+["%#10.4f"]*(mmlar.shape[1]-1)},
+                          title=title,
+                          headers=headers)
+
+    def summary_cdf(self, idx, frac, crit, varnames=None, title=None):
+        '''summary table for cumulative density function
+
+
+        Parameters
+        ----------
+        idx : None or list of integers
+            List of indices into the Monte Carlo results (columns) that should
+            be used in the calculation
+        frac : array_like, float
+            probabilities for which
+        crit : array_like
+            values for which cdf is calculated
+        varnames : None, or list of strings
+            optional list of variable names, same length as idx
+
+        Returns
+        -------
+        table : instance of SimpleTable
+            use `print table` to see results
+
+
+        '''
+        idx = np.atleast_1d(idx)  #assure iterable, use list ?
+
+
+        mml=[]
+        #TODO:need broadcasting in cdf
+        for i in range(len(idx)):
+            #print i, mc1.cdf(crit[:,i], [idx[i]])[1].ravel()
+            mml.append(self.cdf(crit[:,i], [idx[i]])[1].ravel())
+        #mml = self.cdf(crit, idx)[1]
+        #mmlar = np.column_stack(mml)
+        #print mml[0].shape, np.shape(frac)
+        mmlar = np.column_stack([frac] + mml)
+        #print mmlar.shape
+        if title:
+            title = title +' Probabilites'
+        else:
+            title='Probabilities'
+        #TODO use stub instead
+        #headers = ['\nprob'] + ['var%d\n%s' % (i, t) for i in range(mmlar.shape[1]-1) for t in ['mc']]
+
+        if varnames is None:
+            varnames = ['var%d' % i for i in range(mmlar.shape[1]-1)]
+        headers = ['prob'] + varnames
+        return SimpleTable(mmlar,
+                          txt_fmt={'data_fmts': ["%#6.3f"]+["%#10.4f"]*(np.array(mml).shape[1]-1)},
+                          title=title,
+                          headers=headers)
+
+
+#Critical value tables for tests of normality
+#--------------------------------------------
+
+def _normal_dgp(nrepl, random_state, nobs):
+    return random_state.standard_normal((nrepl, nobs))
+
+
+def _kstest_normal_stat(x):
+    '''Lilliefors statistic for each row of x
+    '''
+    nobs = x.shape[1]
+    z = (x - x.mean(1)[:, None]) / x.std(1, ddof=1)[:, None]
+    cdfvals = stats.norm.cdf(np.sort(z, axis=1))
+    Dplus = (np.arange(1.0, nobs+1)/nobs - cdfvals).max(1)
+    Dmin = (cdfvals - np.arange(0.0, nobs)/nobs).max(1)
+    return np.maximum(Dplus, Dmin)
+
+
+def _normal_ad_stat(x):
+    '''Anderson-Darling statistic for each row of x
+    '''
+    from statsmodels.stats.adnorm import anderson_statistic
+    return anderson_statistic(x, dist='norm', fit=True, axis=1)
+
+
+_crit_statistics = {'kstest_normal': _kstest_normal_stat,
+                    'normal_ad': _normal_ad_stat}
+
+_crit_alpha = np.array([0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.15, 0.2,
+                        0.25, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 0.99])
+
+
+def get_crit_table(test, sizes, alpha=None, nrepl=100000, seed=None,
+                   n_jobs=1, chunksize=1000, cache=True, data_home=None):
+    '''Monte Carlo table of critical values for tests of normality
+
+    Parameters
+    ----------
+    test : {'kstest_normal', 'normal_ad'}
+        test statistic, Lilliefors or Anderson-Darling test for normality
+        with estimated mean and variance
+    sizes : array_like, 1d
+        increasing sample sizes for the rows of the table
+    alpha : None or array_like, 1d
+        increasing upper tail probabilities for the columns of the table.
+        The default is a grid from 0.001 to 0.99.
+    nrepl : int
+        number of Monte Carlo replications for each sample size
+    seed : None or int
+        seed for the random numbers
+    n_jobs : int
+        number of processes used in the Monte Carlo
+    chunksize : int
+        number of replications in a chunk
+    cache : bool
+        If True, then the table is saved in the folder `mc_tables` in the
+        statsmodels data home, and loaded if it already exists for the same
+        arguments.
+    data_home : None or string
+        see ``statsmodels.datasets.get_data_home``
+
+    Returns
+    -------
+    table : TableDist instance
+        The ``prob`` method returns the p-value of a test statistic. The
+        table can be used in ``kstest_normal`` and ``normal_ad``.
+
+    Notes
+    -----
+    The replications are not stored, the critical values are quantiles of
+    the histogram that is accumulated in the Monte Carlo.
+
+    Examples
+    --------
+    >>> table = get_crit_table('kstest_normal', [10, 20, 50, 100], seed=0)
+    >>> kstest_normal(x, pvalmethod='table', table=table)
+    '''
+    from statsmodels.stats.tabledist import TableDist
+
+    statistic = _crit_statistics[test]
+    sizes = np.asarray(sizes, float)
+    alpha = _crit_alpha if alpha is None else np.asarray(alpha, float)
+
+    if cache:
+        from statsmodels.datasets.utils import get_data_home
+        key = repr((test, sizes.tolist(), alpha.tolist(), nrepl, seed))
+        fname = '%s_%s.npz' % (test, hashlib.md5(key.encode('utf-8')).hexdigest()[:16])
+        dirname = os.path.join(get_data_home(data_home), 'mc_tables')
+        fname = os.path.join(dirname, fname)
+        if os.path.exists(fname):
+            res = np.load(fname)
+            return TableDist(res['alpha'], res['size'], res['crit'])
+
+    seeds = _draw_seeds(seed, len(sizes))
+    crit = np.empty((len(sizes), len(alpha)))
+    mc = StatTestMC(_normal_dgp, statistic, batch=True)
+    for i, nobs in enumerate(sizes):
+        mc.run(nrepl, dgpargs=(int(nobs),), n_jobs=n_jobs, seed=seeds[i],
+               chunksize=chunksize, store=False)
+        crit[i] = mc.quantiles(0, 1 - alpha)[1]
+
+    if cache:
+        if not os.path.exists(dirname):
+            os.makedirs(dirname)
+        np.savez(fname, alpha=alpha, size=sizes, crit=crit, nrepl=nrepl)
+    return TableDist(alpha, sizes, crit)
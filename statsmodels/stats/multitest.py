@@ -115,6 +115,10 @@ def multipletests(pvals, alpha=0.05, method='hs', returnsorted=False):
     fdr_gbs: high power, fdr control for independent case and only small
     violation in positively correlated case
 
+    The p-values are sorted once. Hommel's procedure is computed in
+    O(n log n) with a convex hull of the sorted p-values.
+    ``multipletests_batch`` corrects many families of tests at once.
+
 
     there will be API changes.
 
@@ -124,114 +128,220 @@ def multipletests(pvals, alpha=0.05, method='hs', returnsorted=False):
 
     '''
     pvals = np.asarray(pvals)
-    alphaf = alpha  # Notation ?
     sortind = np.argsort(pvals)
     pvals = pvals[sortind]
     sortrevind = sortind.argsort()
-    ntests = len(pvals)
+
+    res = _multipletests_sorted(pvals[None, :], alpha, method)
+    reject, pvals_corrected = res[0][0], res[1][0]
+    alphacSidak, alphacBonf = res[2:]
+
+    if returnsorted:
+        return reject, pvals_corrected, alphacSidak, alphacBonf
+    else:
+        return (reject[sortrevind], pvals_corrected[sortrevind], alphacSidak,
+                alphacBonf)
+
+
+def multipletests_batch(pvals, alpha=0.05, method='hs', axis=-1):
+    '''multiple testing correction for many families of tests at once
+
+    Parameters
+    ----------
+    pvals : array_like
+        uncorrected p-values. Each 1-D slice along `axis` is one family of
+        tests that is corrected separately.
+    alpha : float
+        FWER or FDR, e.g. 0.1
+    method : string
+        Method used for testing and adjustment of pvalues, see
+        ``multipletests`` for the available methods.
+    axis : int
+        axis of `pvals` along which the tests of a family are stored
+
+    Returns
+    -------
+    reject : array, boolean
+        true for hypothesis that can be rejected for given alpha, same shape
+        as `pvals`
+    pvals_corrected : array
+        p-values corrected for multiple tests, same shape as `pvals`
+    alphacSidak: float
+        corrected alpha for Sidak method
+    alphacBonf: float
+        corrected alpha for Bonferroni method
+
+    Notes
+    -----
+    The p-values are sorted once along `axis` and all families are corrected
+    with vectorized operations on the sorted array. The results are the same
+    as calling ``multipletests`` on each family, but without the Python loop
+    over families. Only the Hommel procedure still loops over families.
+
+    Examples
+    --------
+    >>> pvals = np.random.uniform(size=(1000, 20))
+    >>> reject, pvals_corrected = multipletests_batch(pvals, method='fdr_bh',
+    ...                                               axis=1)[:2]
+    '''
+    pvals = np.asarray(pvals, dtype=float)
+    if pvals.ndim == 0:
+        raise ValueError('pvals needs to be at least 1-dimensional')
+    ndim = pvals.ndim
+    pvals = np.rollaxis(pvals, axis, ndim)
+    axis = axis % ndim
+    shape = pvals.shape
+    pvals = pvals.reshape(-1, shape[-1])
+
+    sortind = np.argsort(pvals, axis=1)
+    rows = np.arange(pvals.shape[0])[:, None]
+    res = _multipletests_sorted(pvals[rows, sortind], alpha, method)
+
+    reject = np.empty(pvals.shape, dtype=bool)
+    reject[rows, sortind] = res[0]
+    pvals_corrected = np.empty(pvals.shape)
+    pvals_corrected[rows, sortind] = res[1]
+
+    reject = np.rollaxis(reject.reshape(shape), ndim - 1, axis)
+    pvals_corrected = np.rollaxis(pvals_corrected.reshape(shape), ndim - 1,
+                                  axis)
+    return reject, pvals_corrected, res[2], res[3]
+
+
+def _multipletests_sorted(pvals, alpha, method):
+    '''multipletests for a 2-D array of p-values sorted along axis 1
+
+    Each row is one family of tests. Returns reject and pvals_corrected
+    for the sorted p-values, and the Sidak and Bonferroni corrected alpha.
+    '''
+    method = multitest_alias.get(method.lower())
+    if method is None:
+        raise ValueError('method not recognized')
+
+    alphaf = alpha  # Notation ?
+    ntests = pvals.shape[1]
     alphacSidak = 1 - np.power((1. - alphaf), 1./ntests)
     alphacBonf = alphaf / float(ntests)
-    if method.lower() in ['b', 'bonf', 'bonferroni']:
+    # number of remaining hypotheses in step-down and step-up procedures
+    nremain = np.arange(ntests, 0, -1)
+
+    if method == 'b':
         reject = pvals <= alphacBonf
         pvals_corrected = pvals * float(ntests)
 
-    elif method.lower() in ['s', 'sidak']:
+    elif method == 's':
         reject = pvals <= alphacSidak
         pvals_corrected = 1 - np.power((1. - pvals), ntests)
 
-    elif method.lower() in ['hs', 'holm-sidak']:
-        alphacSidak_all = 1 - np.power((1. - alphaf),
-                                       1./np.arange(ntests, 0, -1))
-        notreject = pvals > alphacSidak_all
-
-        nr_index = np.nonzero(notreject)[0]
-        if nr_index.size == 0:
-            # nonreject is empty, all rejected
-            notrejectmin = len(pvals)
-        else:
-            notrejectmin = np.min(nr_index)
-        notreject[notrejectmin:] = True
-        reject = ~notreject
-        pvals_corrected_raw = 1 - np.power((1. - pvals),
-                                           np.arange(ntests, 0, -1))
-        pvals_corrected = np.maximum.accumulate(pvals_corrected_raw)
-
-    elif method.lower() in ['h', 'holm']:
-        notreject = pvals > alphaf / np.arange(ntests, 0, -1)
-        nr_index = np.nonzero(notreject)[0]
-        if nr_index.size == 0:
-            # nonreject is empty, all rejected
-            notrejectmin = len(pvals)
-        else:
-            notrejectmin = np.min(nr_index)
-        notreject[notrejectmin:] = True
-        reject = ~notreject
-        pvals_corrected_raw = pvals * np.arange(ntests, 0, -1)
-        pvals_corrected = np.maximum.accumulate(pvals_corrected_raw)
-
-    elif method.lower() in ['sh', 'simes-hochberg']:
-        alphash = alphaf / np.arange(ntests, 0, -1)
-        reject = pvals <= alphash
-        rejind = np.nonzero(reject)
-        if rejind[0].size > 0:
-            rejectmax = np.max(np.nonzero(reject))
-            reject[:rejectmax] = True
-        pvals_corrected_raw = np.arange(ntests, 0, -1) * pvals
-        pvals_corrected = np.minimum.accumulate(pvals_corrected_raw[::-1])[::-1]
-
-    elif method.lower() in ['ho', 'hommel']:
-        a=pvals.copy()
-        for m in range(ntests, 1, -1):
-            cim = np.min(m * pvals[-m:] / np.arange(1,m+1.))
-            a[-m:] = np.maximum(a[-m:], cim)
-            a[:-m] = np.maximum(a[:-m], np.minimum(m * pvals[:-m], cim))
-        pvals_corrected = a
-        reject = a <= alphaf
-
-    elif method.lower() in ['fdr_bh', 'fdr_i', 'fdr_p', 'fdri', 'fdrp']:
-        # delegate, call with sorted pvals
-        reject, pvals_corrected = fdrcorrection(pvals, alpha=alpha,
-                                                 method='indep')
-    elif method.lower() in ['fdr_by', 'fdr_n', 'fdr_c', 'fdrn', 'fdrcorr']:
-        # delegate, call with sorted pvals
-        reject, pvals_corrected = fdrcorrection(pvals, alpha=alpha,
-                                                 method='n')
-    elif method.lower() in ['fdr_tsbky', 'fdr_2sbky', 'fdr_twostage']:
-        # delegate, call with sorted pvals
-        reject, pvals_corrected = fdrcorrection_twostage(pvals, alpha=alpha,
-                                                         method='bky')[:2]
-    elif method.lower() in ['fdr_tsbh', 'fdr_2sbh']:
-        # delegate, call with sorted pvals
-        reject, pvals_corrected = fdrcorrection_twostage(pvals, alpha=alpha,
-                                                         method='bh')[:2]
-
-    elif method.lower() in ['fdr_gbs']:
+    elif method == 'hs':
+        alphacSidak_all = 1 - np.power((1. - alphaf), 1. / nremain)
+        # step-down: reject until the first hypothesis that is not rejected
+        reject = np.logical_and.accumulate(pvals <= alphacSidak_all, axis=1)
+        pvals_corrected_raw = 1 - np.power((1. - pvals), nremain)
+        pvals_corrected = np.maximum.accumulate(pvals_corrected_raw, axis=1)
+
+    elif method == 'h':
+        reject = np.logical_and.accumulate(pvals <= alphaf / nremain, axis=1)
+        pvals_corrected_raw = pvals * nremain
+        pvals_corrected = np.maximum.accumulate(pvals_corrected_raw, axis=1)
+
+    elif method == 'sh':
+        reject = _step_up(pvals <= alphaf / nremain)
+        pvals_corrected_raw = nremain * pvals
+        pvals_corrected = np.minimum.accumulate(pvals_corrected_raw[:, ::-1],
+                                                axis=1)[:, ::-1]
+
+    elif method == 'ho':
+        pvals_corrected = np.empty(pvals.shape)
+        for i in range(pvals.shape[0]):
+            pvals_corrected[i] = _hommel_sorted(pvals[i])
+        reject = pvals_corrected <= alphaf
+
+    elif method in ['fdr_bh', 'fdr_by']:
+        ecdffactor = _ecdf(pvals[0])
+        if method == 'fdr_by':
+            ecdffactor /= np.sum(1. / np.arange(1, ntests + 1))
+        reject = _step_up(pvals <= ecdffactor * alpha)
+        pvals_corrected_raw = pvals / ecdffactor
+        pvals_corrected = np.minimum.accumulate(pvals_corrected_raw[:, ::-1],
+                                                axis=1)[:, ::-1]
+
+    elif method in ['fdr_tsbh', 'fdr_tsbky']:
+        reject, pvals_corrected = _fdrcorrection_twostage_sorted(
+                pvals, alpha=alpha, method=method[6:])[:2]
+
+    elif method == 'fdr_gbs':
         #adaptive stepdown in Gavrilov, Benjamini, Sarkar, Annals of Statistics 2009
-##        notreject = pvals > alphaf / np.arange(ntests, 0, -1) #alphacSidak
-##        notrejectmin = np.min(np.nonzero(notreject))
-##        notreject[notrejectmin:] = True
-##        reject = ~notreject
-
         ii = np.arange(1, ntests + 1)
         q = (ntests + 1. - ii)/ii * pvals / (1. - pvals)
-        pvals_corrected_raw = np.maximum.accumulate(q) #up requirementd
+        pvals_corrected_raw = np.maximum.accumulate(q, axis=1) #up requirementd
 
-        pvals_corrected = np.minimum.accumulate(pvals_corrected_raw[::-1])[::-1]
+        pvals_corrected = np.minimum.accumulate(pvals_corrected_raw[:, ::-1],
+                                                axis=1)[:, ::-1]
         reject = pvals_corrected <= alpha
 
-    else:
-        raise ValueError('method not recognized')
+    pvals_corrected[pvals_corrected>1] = 1
+    return reject, pvals_corrected, alphacSidak, alphacBonf
 
 
-    if not pvals_corrected is None: #not necessary anymore
-        pvals_corrected[pvals_corrected>1] = 1
-    if returnsorted:
-        return reject, pvals_corrected, alphacSidak, alphacBonf
-    else:
-        if pvals_corrected is None:
-            return reject[sortrevind], pvals_corrected, alphacSidak, alphacBonf
-        else:
-            return reject[sortrevind], pvals_corrected[sortrevind], alphacSidak, alphacBonf
+def _step_up(reject):
+    '''reject all hypotheses up to the last rejected one in each row
+    '''
+    return np.logical_or.accumulate(reject[:, ::-1], axis=1)[:, ::-1]
+
+
+def _hommel_sorted(pvals):
+    '''Hommel adjusted p-values for sorted 1-D p-values in O(n log n)
+
+    The Simes p-value of the set of the m largest p-values is
+    ``c_m = m * min_j p_(n-m+j) / j``. It is the minimal slope from the point
+    (n-m, 0) to the points (k, p_(k)), k > n-m, which is attained at a vertex
+    of the lower convex hull of these points. The hull is built from the
+    right, and the tangent vertex only moves to the left.
+
+    Hommel's procedure rejects H_i at level a if ``h(a) p_i <= a``, where
+    ``h(a) = max{m : c_m > a}``. With ``u_m = max_{k >= m} c_k`` the adjusted
+    p-value is ``min_m max(u_{m+1}, m p_i)``, which is found by binary search.
+
+    Reference: Meijer, Krebs and Goeman (2019), Hommel's procedure in linear
+    time, Biometrical Journal.
+    '''
+    n = len(pvals)
+    # slope[s] = min_{k > s} p_(k) / (k - s), 1-based k, s = 0, ..., n-1
+    slope = np.empty(n)
+    pv = pvals.tolist()
+    hull = []   # indices of hull vertices, leftmost vertex is last
+    pos = 0     # position of tangent vertex in hull
+    for s in range(n - 1, -1, -1):
+        # add point (s + 1, p_(s+1)) as leftmost point of the lower hull
+        ps = pv[s]
+        while len(hull) >= 2:
+            b, c = hull[-1], hull[-2]
+            if (b - s) * (pv[c] - pv[b]) - (pv[b] - ps) * (c - b) > 0:
+                break
+            hull.pop()
+        hull.append(s)
+        pos = min(pos, len(hull) - 1)
+        # tangent from (s, 0), k - s = index - s + 1
+        k = hull[pos]
+        best = pv[k] / (k - s + 1.)
+        while pos + 1 < len(hull):
+            k = hull[pos + 1]
+            cand = pv[k] / (k - s + 1.)
+            if cand > best:
+                break
+            best = cand
+            pos += 1
+        slope[s] = best
+
+    m = np.arange(1, n + 1)
+    c = m * slope[::-1]                                 # c_1, ..., c_n
+    u = np.maximum.accumulate(c[::-1])[::-1]            # u_1, ..., u_n
+    u_next = np.append(u[1:], 0)                        # u_2, ..., u_{n+1}
+    # u_{m+1} / m is nonincreasing, first m with m p_i >= u_{m+1}
+    mstar = np.searchsorted(-u_next / m, -pvals, side='left') + 1
+    return np.minimum(mstar * pvals, u[mstar - 1])
+
 
 #TODO: rename drop 0 at end
 def fdrcorrection(pvals, alpha=0.05, method='indep'):
@@ -352,7 +462,28 @@ def fdrcorrection_twostage(pvals, alpha=0.05, method='bky', iter=False):
     TODO: What should be returned?
 
     '''
-    ntests = len(pvals)
+    pvals = np.asarray(pvals)
+    sortind = np.argsort(pvals)
+    sortrevind = sortind.argsort()
+
+    rej, pvalscorr, m0, alpha_stages = _fdrcorrection_twostage_sorted(
+            pvals[sortind][None, :], alpha=alpha, method=method, iter=iter)
+    alpha_stages = [a[0] for a in alpha_stages if not np.isnan(a[0])]
+    return rej[0][sortrevind], pvalscorr[0][sortrevind], m0[0], alpha_stages
+
+
+def _fdrcorrection_twostage_sorted(pvals, alpha=0.05, method='bky',
+                                   iter=False):
+    '''two stage fdr correction for a 2-D array sorted along axis 1
+
+    The fdr_bh corrected p-values do not depend on alpha, they are computed
+    once. Each stage only needs the number of rejections at the new alpha,
+    so the p-values are not sorted again.
+
+    alpha_stages is a list with an array of the alpha of each family at each
+    stage, nan if the family has already stopped.
+    '''
+    nfam, ntests = pvals.shape
     if method == 'bky':
         fact = (1.+alpha)
         alpha_prime = alpha / fact
@@ -362,31 +493,163 @@ def fdrcorrection_twostage(pvals, alpha=0.05, method='bky', iter=False):
     else:
         raise ValueError("only 'bky' and 'bh' are available as method")
 
-    alpha_stages = [alpha_prime]
-    rej, pvalscorr = fdrcorrection(pvals, alpha=alpha_prime, method='indep')
-    r1 = rej.sum()
-    if (r1 == 0) or (r1 == ntests):
-        return rej, pvalscorr * fact, ntests - r1, alpha_stages
-    ri_old = r1
-
-    while 1:
-        ntests0 = 1.0 * ntests - ri_old
-        alpha_star = alpha_prime * ntests / ntests0
-        alpha_stages.append(alpha_star)
-        #print ntests0, alpha_star
-        rej, pvalscorr = fdrcorrection(pvals, alpha=alpha_star, method='indep')
-        ri = rej.sum()
-        if (not iter) or ri == ri_old:
+    ecdffactor = _ecdf(pvals[0])
+
+    def nrejected(idx, alpha_):
+        # step-up: index of largest p-value below the rejection line
+        below = pvals[idx] <= ecdffactor * alpha_[:, None]
+        last = ntests - np.argmax(below[:, ::-1], axis=1)
+        return np.where(below.any(1), last, 0)
+
+    pvalscorr = np.minimum.accumulate((pvals / ecdffactor)[:, ::-1],
+                                      axis=1)[:, ::-1]
+    pvalscorr[pvalscorr>1] = 1
+
+    alpha_stages = [np.repeat(alpha_prime, nfam)]
+    allidx = np.arange(nfam)
+    ri = nrejected(allidx, alpha_stages[0])
+    # families with no or all rejections stop after the first stage
+    ntests0 = np.repeat(1.0 * ntests, nfam)
+    active = (ri > 0) & (ri < ntests)
+    ri_old = ri.copy()
+
+    while active.any():
+        idx = allidx[active]
+        ntests0[idx] = 1.0 * ntests - ri_old[idx]
+        alpha_star = alpha_prime * ntests / ntests0[idx]
+        stage = np.empty(nfam)
+        stage.fill(np.nan)
+        stage[idx] = alpha_star
+        alpha_stages.append(stage)
+        ri[idx] = nrejected(idx, alpha_star)
+        if not iter:
             break
-        elif ri < ri_old:
+        elif (ri[idx] < ri_old[idx]).any():
             # prevent cycles and endless loops
             raise RuntimeError(" oops - shouldn't be here")
-        ri_old = ri
+        # stop if all hypotheses are rejected, estimated m0 would be zero
+        active[idx] = (ri[idx] != ri_old[idx]) & (ri[idx] < ntests)
+        ri_old[idx] = ri[idx]
 
     # make adjustment to pvalscorr to reflect estimated number of Non-Null cases
     # decision is then pvalscorr < alpha  (or <=)
-    pvalscorr *= ntests0 * 1.0 /  ntests
-    if method == 'bky':
-        pvalscorr *= (1. + alpha)
+    pvalscorr *= (ntests0 * fact / ntests)[:, None]
+    rej = np.arange(ntests) < ri[:, None]
 
     return rej, pvalscorr, ntests - ri, alpha_stages
+
+
+def _iter_chunks(pvals, chunksize):
+    '''iterate over chunks of p-values, pvals is array or callable
+    '''
+    if callable(pvals):
+        for chunk in pvals():
+            yield np.asarray(chunk, dtype=float).ravel()
+    else:
+        for start in range(0, len(pvals), chunksize):
+            yield np.asarray(pvals[start:start + chunksize],
+                             dtype=float).ravel()
+
+
+def fdrcorrection_stream(pvals, alpha=0.05, method='indep',
+                         chunksize=1000000, nbins=100000):
+    '''fdr correction in two passes with bounded memory
+
+    This is the Benjamini/Hochberg, or Benjamini/Yekutieli, procedure of
+    ``fdrcorrection`` for a large number of p-values that are read in chunks,
+    for example from a memory mapped file on disk.
+
+    Parameters
+    ----------
+    pvals : array_like or callable
+        If array_like, for example a numpy memmap, then it is read in slices
+        of length `chunksize`. If callable, then calling it without arguments
+        returns an iterable over 1-D arrays of p-values. It is called twice
+        and needs to return the same p-values each time.
+    alpha : float
+        error rate
+    method : {'indep', 'negcorr')
+        see ``fdrcorrection``
+    chunksize : int
+        number of p-values that are read at once if `pvals` is array_like
+    nbins : int
+        number of log-spaced bins between 1e-300 and 1 that are used in the
+        first pass
+
+    Returns
+    -------
+    threshold : float
+        A hypothesis is rejected if its p-value is smaller than or equal to
+        threshold. Zero if no hypothesis is rejected.
+    nrejected : int
+        number of rejected hypotheses
+    ntests : int
+        number of p-values
+
+    Notes
+    -----
+    The first pass counts the p-values in log-spaced bins. The counts at the
+    bin edges determine which bins can contain the largest p-value that is
+    below the rejection line ``k alpha / ntests``. The second pass keeps only
+    the p-values in those bins, which are sorted to find the exact threshold.
+    Memory is proportional to `nbins` and to the number of p-values close to
+    the threshold.
+
+    The result is the same as with ``fdrcorrection``, ``reject`` is
+    ``pvals <= threshold``. Corrected p-values are not computed, since they
+    depend on the ranks of all p-values.
+    '''
+    edges = np.logspace(-300, 0, nbins + 1)
+    counts = np.zeros(nbins + 2, dtype=np.int64)
+    for chunk in _iter_chunks(pvals, chunksize):
+        counts += np.bincount(np.searchsorted(edges, chunk, side='left'),
+                              minlength=nbins + 2)
+    ntests = counts.sum()
+    if ntests == 0:
+        return 0., 0, 0
+
+    if method in ['i', 'indep', 'p', 'poscorr']:
+        alpha_ = alpha
+    elif method in ['n', 'negcorr']:
+        alpha_ = alpha / np.sum(1./np.arange(1, ntests+1))
+    else:
+        raise ValueError('only indep and necorr implemented')
+    slope = ntests / alpha_
+
+    # number of p-values less than or equal to each edge
+    nbelow = np.cumsum(counts)[:nbins + 1]
+    # a p-value p is below the rejection line if nbelow(p) >= p * slope
+    # the largest p-value below the last such edge qualifies
+    ok = np.nonzero(nbelow >= edges * slope)[0]
+    last = ok[-1] if ok.size else -1
+    # bins above last edge that can contain a qualifying p-value
+    lower = np.concatenate(([0.], edges[:-1]))
+    cand = np.zeros(nbins + 2, dtype=bool)
+    cand[last + 1:nbins + 1] = nbelow[last + 1:] > lower[last + 1:] * slope
+
+    # second pass
+    pmax_last = 0.
+    keep = []
+    for chunk in _iter_chunks(pvals, chunksize):
+        if last >= 0:
+            below = chunk[chunk <= edges[last]]
+            if below.size:
+                pmax_last = max(pmax_last, below.max())
+        mask = cand[np.searchsorted(edges, chunk, side='left')]
+        if mask.any():
+            keep.append(chunk[mask])
+
+    threshold, nrejected = pmax_last, (nbelow[last] if last >= 0 else 0)
+    if keep:
+        keep = np.sort(np.concatenate(keep))
+        ibin = np.searchsorted(edges, keep, side='left')
+        nprev = np.concatenate(([0], nbelow))[ibin]
+        # count in the same bin of p-values less than or equal to keep
+        nle = (np.searchsorted(keep, keep, side='right') -
+               np.searchsorted(ibin, ibin, side='left'))
+        nle += nprev
+        qual = np.nonzero(nle >= keep * slope)[0]
+        if qual.size:
+            threshold, nrejected = keep[qual[-1]], nle[qual[-1]]
+
+    return threshold, int(nrejected), int(ntests)
@@ -12,6 +12,7 @@ import numpy as np
 
 from statsmodels.regression.linear_model import OLS
 from statsmodels.tools.decorators import cache_readonly
+from statsmodels.tools import precision
 from statsmodels.stats.multitest import multipletests
 from statsmodels.tools.tools import maybe_unwrap_results
 
@@ -218,7 +219,13 @@ class OLSInfluence(object):
         -----
         temporarily calculated here, this should go to model class
         '''
-        return (self.exog * self.results.model.pinv_wexog.T).sum(1)
+        model = self.results.model
+        if model.precision == 'mixed':
+            # pinv_wexog.T is wexog (X'X)^(-1), it is not stored
+            pinv_wexog_t = precision.dot(model.wexog,
+                                         model.normalized_cov_params)
+            return (self.exog * pinv_wexog_t).sum(1)
+        return (self.exog * model.pinv_wexog.T).sum(1)
 
     @cache_readonly
     def resid_press(self):
@@ -739,3 +746,185 @@ def summary_table(res, alpha=0.05):
 
     return st, data, ss2
 
+
+
+# streaming influence measures for large datasets
+
+influence_columns = ['hat_diag', 'standard_resid', 'student_resid', 'cooks_d',
+                     'dffits_internal', 'dffits']
+
+def iter_influence_measures(results, chunksize=100000):
+    '''influence and outlier measures for OLS results in chunks of observations
+
+    Parameters
+    ----------
+    results : Regression Results instance
+        currently assumes the results are from an OLS regression
+    chunksize : int
+        number of observations in each chunk
+
+    Yields
+    ------
+    start : int
+        index of the first observation in the chunk
+    measures : ndarray, (nobs_chunk, 6)
+        measures for the observations in the chunk, the columns are in the
+        order of `influence_columns`: hat_diag, standard_resid, student_resid,
+        cooks_d, dffits_internal and dffits.
+
+    Notes
+    -----
+    The measures are the same as those of OLSInfluence with the same names as
+    in `OLSInfluence.summary_frame`. The measures that are based on the leave
+    one observation out regressions use the closed form of the error
+    variance without observation i ::
+
+        sigma2_(i) = (ssr - resid_i**2 / (1 - h_i)) / (df_resid - 1)
+
+    so that no auxiliary regression is needed. Only arrays for one chunk are
+    created, the memory requirement is independent of the number of
+    observations, besides the data of the model.
+
+    See Also
+    --------
+    OLSInfluence
+    write_influence_measures
+    influence_topk
+    '''
+    results = maybe_unwrap_results(results)
+    exog = results.model.wexog
+    endog = results.model.wendog
+    nobs, k_vars = exog.shape
+    xtxi = np.asarray(results.normalized_cov_params)
+    params = np.asarray(results.params)
+    df_resid = results.df_resid
+    mse_resid = results.mse_resid
+    ssr = mse_resid * df_resid
+
+    for start in range(0, nobs, chunksize):
+        x = exog[start:start + chunksize]
+        hii = (np.dot(x, xtxi) * x).sum(1)
+        resid = endog[start:start + chunksize] - np.dot(x, params)
+        one_minus_h = 1 - hii
+        sigma2_not_obsi = (ssr - resid**2 / one_minus_h) / (df_resid - 1)
+        hat_factor = np.sqrt(hii / one_minus_h)
+
+        measures = np.empty((len(hii), len(influence_columns)))
+        measures[:,0] = hii
+        measures[:,1] = resid / np.sqrt(mse_resid * one_minus_h)
+        measures[:,2] = resid / np.sqrt(sigma2_not_obsi * one_minus_h)
+        measures[:,3] = measures[:,1]**2 / k_vars * hii / one_minus_h
+        measures[:,4] = measures[:,1] * hat_factor
+        measures[:,5] = measures[:,2] * hat_factor
+        yield start, measures
+
+def write_influence_measures(results, fname, format=None, chunksize=100000,
+                             float_fmt='%.10g'):
+    '''write influence and outlier measures to a csv or npy file in chunks
+
+    Parameters
+    ----------
+    results : Regression Results instance
+        currently assumes the results are from an OLS regression
+    fname : string
+        file name
+    format : None, 'csv' or 'npy'
+        If None, then the format is 'npy' if fname ends with '.npy' and
+        'csv' otherwise.
+    chunksize : int
+        number of observations that are computed and written at a time
+    float_fmt : string
+        format for the measures in the csv file
+
+    Returns
+    -------
+    measures : memmap or None
+        For 'npy' the memory mapped array with the observation index in the
+        first column and the measures in `influence_columns` in the remaining
+        columns. None for 'csv'.
+
+    Notes
+    -----
+    The csv file has a header line with 'obs' and the names in
+    `influence_columns`. No SimpleTable or DataFrame is created, the memory
+    requirement is that of one chunk.
+
+    See Also
+    --------
+    iter_influence_measures
+    '''
+    if format is None:
+        format = 'npy' if fname.endswith('.npy') else 'csv'
+    nobs = maybe_unwrap_results(results).model.wexog.shape[0]
+    ncols = len(influence_columns) + 1
+
+    if format == 'npy':
+        out = np.lib.format.open_memmap(fname, mode='w+', dtype=np.float64,
+                                        shape=(nobs, ncols))
+        for start, measures in iter_influence_measures(results, chunksize):
+            stop = start + len(measures)
+            out[start:stop, 0] = np.arange(start, stop)
+            out[start:stop, 1:] = measures
+        out.flush()
+        return out
+    elif format == 'csv':
+        fmt = ['%d'] + [float_fmt] * (ncols - 1)
+        with open(fname, 'w') as fh:
+            fh.write(','.join(['obs'] + influence_columns) + '\n')
+            for start, measures in iter_influence_measures(results,
+                                                           chunksize):
+                obs = np.arange(start, start + len(measures))
+                np.savetxt(fh, np.column_stack((obs, measures)), fmt=fmt,
+                           delimiter=',')
+    else:
+        raise ValueError("format must be 'csv' or 'npy'")
+
+def influence_topk(results, k=10, measure='cooks_d', chunksize=100000):
+    '''observations with the largest influence or outlier measure
+
+    Parameters
+    ----------
+    results : Regression Results instance
+        currently assumes the results are from an OLS regression
+    k : int
+        number of observations to select
+    measure : string
+        one of the names in `influence_columns`. Residuals and dffits are
+        ranked by their absolute value.
+    chunksize : int
+        number of observations that are processed at a time
+
+    Returns
+    -------
+    idx : ndarray
+        indices of the k observations with the largest measure, in
+        decreasing order of the measure
+    values : ndarray
+        values of the measure, with sign, for these observations
+
+    Notes
+    -----
+    The selection is done with a partial sort of each chunk together with
+    the current candidates, only the final k values are sorted.
+
+    See Also
+    --------
+    iter_influence_measures
+    '''
+    if measure not in influence_columns:
+        raise ValueError('measure must be one of ' +
+                         ', '.join(influence_columns))
+    col = influence_columns.index(measure)
+    best_idx = np.empty(0, dtype=int)
+    best_val = np.empty(0)
+    for start, measures in iter_influence_measures(results, chunksize):
+        idx = np.concatenate((best_idx,
+                              np.arange(start, start + len(measures))))
+        val = np.concatenate((best_val, measures[:, col]))
+        if len(val) > k:
+            keep = np.argpartition(-np.abs(val), k - 1)[:k]
+            idx, val = idx[keep], val[keep]
+        best_idx, best_val = idx, val
+
+    order = np.argsort(-np.abs(best_val), kind='mergesort')
+    return best_idx[order], best_val[order]
@@ -31,9 +31,28 @@ refactoring
 
 """
 
+from statsmodels.compatnp.collections import OrderedDict
 import numpy as np
 from scipy import stats, optimize
-from statsmodels.tools.rootfinding import brentq_expanding
+from statsmodels.tools.rootfinding import brentq_expanding, brentq_expanding_vec
+
+def _nan_tail(func, crit, df, nc):
+    '''evaluate a tail function of nct, nan where crit is nan
+
+    the generic methods loop endlessly with nan,
+    https://github.com/scipy/scipy/issues/2667
+    '''
+    crit, df, nc = np.broadcast_arrays(crit, df, nc)
+    isnan = np.isnan(crit)
+    if not isnan.any():
+        return func(crit, df, nc)
+    if crit.ndim == 0:
+        return np.nan
+    res = np.empty(crit.shape)
+    res.fill(np.nan)
+    ok = ~isnan
+    res[ok] = func(crit[ok], df[ok], nc[ok])
+    return res
 
 def ttest_power(effect_size, nobs, alpha, df=None, alternative='two-sided'):
     '''Calculate power of a ttest
@@ -55,18 +74,13 @@ def ttest_power(effect_size, nobs, alpha, df=None, alternative='two-sided'):
         crit_upp = stats.t.isf(alpha_, df)
         #print crit_upp, df, d*np.sqrt(nobs)
         # use private methods, generic methods return nan with negative d
-        if np.any(np.isnan(crit_upp)):
-            # avoid endless loop, https://github.com/scipy/scipy/issues/2667
-            pow_ = np.nan
-        else:
-            pow_ = stats.nct._sf(crit_upp, df, d*np.sqrt(nobs))
+        # avoid endless loop with nan, elementwise in _nan_tail
+        pow_ = _nan_tail(stats.nct._sf, crit_upp, df, d*np.sqrt(nobs))
     if alternative in ['two-sided', '2s', 'smaller']:
         crit_low = stats.t.ppf(alpha_, df)
         #print crit_low, df, d*np.sqrt(nobs)
-        if np.any(np.isnan(crit_low)):
-            pow_ = np.nan
-        else:
-            pow_ += stats.nct._cdf(crit_low, df, d*np.sqrt(nobs))
+        pow_ = pow_ + _nan_tail(stats.nct._cdf, crit_low, df,
+                                d*np.sqrt(nobs))
     return pow_
 
 def normal_power(effect_size, nobs, alpha, alternative='two-sided', sigma=1.):
@@ -158,6 +172,11 @@ class Power(object):
     '''
 
     def __init__(self, **kwds):
+        # memoized results of solve_power, bounded by the total number of
+        # cached values
+        self.cache_maxsize = 10**6
+        self._solve_cache = OrderedDict()
+        self._solve_cache_size = 0
         self.__dict__.update(kwds)
         # used only for instance level start values
         self.start_ttp = dict(effect_size=0.01, nobs=10., alpha=0.15,
@@ -194,6 +213,14 @@ class Power(object):
 
         exactly one needs to be ``None``, all others need numeric values
 
+        The numeric values can be arrays that broadcast against each other.
+        In this case the solutions for all elements are found at the same
+        time with vectorized root finding, see ``_solve_power_vec``.
+
+        Solutions are memoized, repeated calls with the same arguments
+        return the cached value. Set ``cache_maxsize`` to zero to disable
+        the cache.
+
         *attaches*
 
         cache_fit_res : list
@@ -202,6 +229,8 @@ class Power(object):
             The first element is the success indicator, one if successful.
             The remaining elements contain the return information of the up to
             three solvers that have been tried.
+            For array arguments, the first element is an array that indicates
+            convergence for each element.
 
 
         '''
@@ -218,6 +247,20 @@ class Power(object):
             del kwds['power']
             return self.power(**kwds)
 
+        cache_key = self._get_cache_key(key, kwds)
+        if cache_key in self._solve_cache:
+            val, fit_res = self._solve_cache.pop(cache_key)
+            # reinsert as most recently used
+            self._solve_cache[cache_key] = (val, fit_res)
+            self.cache_fit_res = fit_res
+            return np.copy(val) if np.ndim(val) > 0 else val
+
+        if any(np.ndim(v) > 0 for v in kwds.itervalues()
+               if not isinstance(v, basestring)):
+            val = self._solve_power_vec(key, kwds)
+            self._cache_solution(cache_key, val)
+            return val
+
         self._counter = 0
         def func(x):
             kwds[key] = x
@@ -280,8 +323,84 @@ class Power(object):
         #attach fit_res, for reading only, should be needed only for debugging
         fit_res.insert(0, success)
         self.cache_fit_res = fit_res
+        if success == 1:
+            self._cache_solution(cache_key, val)
         return val
 
+    def _get_cache_key(self, key, kwds):
+        '''hashable key of the arguments and start values of solve_power'''
+        def hashable(v):
+            if isinstance(v, dict):
+                return tuple((k, hashable(vi)) for k, vi in sorted(v.items()))
+            if isinstance(v, tuple):
+                return tuple(hashable(vi) for vi in v)
+            if np.ndim(v) > 0:
+                v = np.asarray(v)
+                v = (v.shape, v.dtype.str, v.tostring())
+            return v
+        start = (self.start_ttp.get(key), self.start_bqexp.get(key, {}))
+        return (getattr(self, 'ddof', None), hashable(start), hashable(kwds))
+
+    def _cache_solution(self, cache_key, val):
+        '''store a solution, dropping the least recently used ones'''
+        size = np.size(val)
+        if size <= self.cache_maxsize:
+            if np.ndim(val) > 0:
+                val = val.copy()
+            self._solve_cache[cache_key] = (val, self.cache_fit_res)
+            self._solve_cache_size += size
+        while self._solve_cache_size > self.cache_maxsize:
+            old_val = self._solve_cache.popitem(last=False)[1][0]
+            self._solve_cache_size -= np.size(old_val)
+
+    def _solve_power_vec(self, key, kwds):
+        '''solve for key with array arguments by vectorized root finding
+
+        The numeric arguments are broadcast and each distinct combination
+        of parameters is solved once. All roots are found at the same
+        time with ``brentq_expanding_vec`` based on the same starting
+        bounds as in the scalar case. Elements that do not converge are
+        nan and a ConvergenceWarning is issued.
+        '''
+        names = [k for k, v in sorted(kwds.items())
+                 if k != key and not isinstance(v, basestring)]
+        extra = dict((k, v) for k, v in kwds.items()
+                     if k != key and isinstance(v, basestring))
+        values = np.broadcast_arrays(*[np.asarray(kwds[k], dtype=float)
+                                       for k in names])
+        shape = values[0].shape
+        params = np.column_stack([v.ravel() for v in values])
+
+        # solve only once for repeated combinations of the parameters
+        params = np.ascontiguousarray(params)
+        rows = params.view(np.dtype((np.void,
+                                     params.dtype.itemsize * len(names))))
+        _, idx_uni, idx_inv = np.unique(rows.ravel(), return_index=True,
+                                        return_inverse=True)
+        params = dict(zip(names, params[idx_uni].T))
+
+        def func(x, idx):
+            kwds_ = dict((k, v[idx]) for k, v in params.items())
+            kwds_.update(extra)
+            kwds_[key] = x
+            return self._power_identity(**kwds_)
+
+        # starting bounds can depend on the parameters
+        fit_kwds = {}
+        for k, v in self.start_bqexp[key].items():
+            if np.size(v) > 1:
+                v = np.broadcast_arrays(v, values[0])[0].ravel()[idx_uni]
+            fit_kwds[k] = v
+        val, converged = brentq_expanding_vec(func, len(idx_uni), **fit_kwds)
+
+        if not converged.all():
+            import warnings
+            from statsmodels.tools.sm_exceptions import ConvergenceWarning
+            warnings.warn('finding solution failed for %d elements' %
+                          (~converged).sum(), ConvergenceWarning)
+        self.cache_fit_res = [converged[idx_inv].reshape(shape)]
+        return val[idx_inv].reshape(shape)
+
     def plot_power(self, dep_var='nobs', nobs=None, effect_size=None,
                    alpha=0.05, ax=None, title=None, plt_kwds=None, **kwds):
         '''plot power with number of observations or effect size on x-axis
@@ -339,25 +458,32 @@ class Power(object):
         if dep_var == 'nobs':
             colors = rainbow(len(effect_size))
             colors = [colormap(i) for i in np.linspace(0, 0.9, len(effect_size))]
+            # power for all curves in one call
+            powers = self.power(np.asarray(effect_size)[:, None], nobs, alpha,
+                                **kwds)
             for ii, es in enumerate(effect_size):
-                power = self.power(es, nobs, alpha, **kwds)
+                power = powers[ii]
                 ax.plot(nobs, power, lw=lw, alpha=plt_alpha,
                         color=colors[ii], label='es=%4.2F' % es)
                 xlabel = 'Number of Observations'
         elif dep_var in ['effect size', 'effect_size', 'es']:
             colors = rainbow(len(nobs))
             colors = [colormap(i) for i in np.linspace(0, 0.9, len(nobs))]
+            powers = self.power(effect_size, np.asarray(nobs)[:, None], alpha,
+                                **kwds)
             for ii, n in enumerate(nobs):
-                power = self.power(effect_size, n, alpha, **kwds)
+                power = powers[ii]
                 ax.plot(effect_size, power, lw=lw, alpha=plt_alpha,
                         color=colors[ii], label='N=%4.2F' % n)
                 xlabel = 'Effect Size'
         elif dep_var in ['alpha']:
             # experimental nobs as defining separate lines
             colors = rainbow(len(nobs))
+            powers = self.power(effect_size, np.asarray(nobs)[:, None], alpha,
+                                **kwds)
 
             for ii, n in enumerate(nobs):
-                power = self.power(effect_size, n, alpha, **kwds)
+                power = powers[ii]
                 ax.plot(alpha, power, lw=lw, alpha=plt_alpha,
                         color=colors[ii], label='N=%4.2F' % n)
                 xlabel = 'alpha'
@@ -644,7 +770,14 @@ class NormalIndPower(Power):
         ddof = self.ddof  # for correlation, ddof=3
 
         # get effective nobs, factor for std of test statistic
-        if ratio > 0:
+        if np.size(ratio) > 1:
+            # elementwise version of the scalar branches below
+            nobs2 = nobs1*ratio
+            with np.errstate(divide='ignore'):
+                nobs = np.where(ratio > 0,
+                                1./ (1. / (nobs1 - ddof) + 1. / (nobs2 - ddof)),
+                                nobs1 - ddof)
+        elif ratio > 0:
             nobs2 = nobs1*ratio
             #equivalent to nobs = n1*n2/(n1+n2)=n1*ratio/(1+ratio)
             nobs = 1./ (1. / (nobs1 - ddof) + 1. / (nobs2 - ddof))
@@ -897,8 +1030,9 @@ class FTestAnovaPower(Power):
             self.start_ttp['nobs'] = k_groups * 10
             self.start_bqexp['nobs'] = dict(low=k_groups * 2,
                                             start_upp=k_groups * 10)
-        # first attempt at special casing
-        if effect_size is None:
+        # first attempt at special casing, scalar only
+        is_array = any(np.ndim(v) > 0 for v in [nobs, alpha, power, k_groups])
+        if effect_size is None and not is_array:
             return self._solve_effect_size(effect_size=effect_size,
                                            nobs=nobs,
                                            alpha=alpha,
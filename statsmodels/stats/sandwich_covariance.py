@@ -72,6 +72,8 @@ TODO
 * automatic lag-length selection for Newey-West HAC,
   -> added: nlag = floor[4(T/100)^(2/9)]  Reference: xtscc paper, Newey-West
      note this will not be optimal in the panel context, see Peterson
+  -> added: hac_bandwidth, Newey-West (1994) plug-in for Bartlett, Parzen
+     and QS kernels
 * HAC should maybe return the chosen nlags
 * get consistent notation, varies by paper, S, scale, sigma?
 * replace diag(hat_matrix) calculations in cov_hc2, cov_hc3
@@ -104,13 +106,15 @@ Statistics 90, no. 3 (2008): 414–427.
 
 import numpy as np
 
-from statsmodels.tools.grouputils import Group
+from statsmodels.tools import precision
 from statsmodels.stats.moment_helpers import se_cov
 
-__all__ = ['cov_cluster', 'cov_cluster_2groups', 'cov_hac', 'cov_nw_panel',
-           'cov_white_simple',
+__all__ = ['cov_cluster', 'cov_cluster_2groups', 'cov_cluster_multiway',
+           'cov_hac', 'cov_nw_panel', 'cov_white_simple',
            'cov_hc0', 'cov_hc1', 'cov_hc2', 'cov_hc3',
-           'se_cov', 'weights_bartlett', 'weights_uniform']
+           'se_cov', 'weights_bartlett', 'weights_uniform', 'weights_parzen',
+           'weights_qs', 'kernel_weights', 'hac_bandwidth',
+           'ClusterGroups', 'SandwichCovariance']
 
 
 
@@ -158,6 +162,17 @@ __all__ = ['cov_cluster', 'cov_cluster_2groups', 'cov_hac', 'cov_nw_panel',
 
 '''
 
+def _pinv_wexog_factors(model):
+    '''
+    (X'X)^(-1) and X of pinv_wexog for models with precision='mixed'
+
+    These models do not store pinv_wexog, pinv(x) = (X'X)^(-1) X' is not
+    computed, the products with the float32 design are accumulated in float64
+    instead. GLM has no wexog, its pinv_wexog is the pinv of exog.
+    '''
+    wexog = getattr(model, 'wexog', model.exog)
+    return model.normalized_cov_params, wexog
+
 def _HCCM(results, scale):
     '''
     sandwich with pinv(x) * diag(scale) * pinv(x).T
@@ -165,6 +180,9 @@ def _HCCM(results, scale):
     where pinv(x) = (X'X)^(-1) X
     and scale is (nobs,)
     '''
+    if results.model.precision == 'mixed':
+        cov_p, wexog = _pinv_wexog_factors(results.model)
+        return np.dot(np.dot(cov_p, precision.gram(wexog, scale)), cov_p)
     H = np.dot(results.model.pinv_wexog,
         scale[:,None]*results.model.pinv_wexog.T)
     return H
@@ -237,6 +255,13 @@ def _HCCM1(results, scale):
         robust covariance matrix for the parameter estimates
 
     '''
+    if results.model.precision == 'mixed':
+        cov_p, wexog = _pinv_wexog_factors(results.model)
+        if scale.ndim == 1:
+            xsx = precision.gram(wexog, scale)
+        else:
+            xsx = precision.tdot(wexog, np.dot(scale, wexog))
+        return np.dot(np.dot(cov_p, xsx), cov_p)
     if scale.ndim == 1:
         H = np.dot(results.model.pinv_wexog,
                    scale[:,None]*results.model.pinv_wexog.T)
@@ -313,7 +338,131 @@ def weights_uniform(nlags):
     #with lag zero
     return np.ones(nlags+1.)
 
-def S_hac_simple(x, nlags=None, weights_func=weights_bartlett):
+def weights_parzen(nlags):
+    '''Parzen weights for HAC
+
+    Parameters
+    ----------
+    nlags : int
+       highest lag in the kernel window, this does not include the zero lag
+
+    Returns
+    -------
+    kernel : ndarray, (nlags+1,)
+        weights for Parzen kernel
+
+    '''
+    return kernel_weights('parzen', nlags + 1., nlags)
+
+def weights_qs(nlags, bandwidth=None):
+    '''Quadratic Spectral weights for HAC
+
+    Parameters
+    ----------
+    nlags : int
+       highest lag in the kernel window, this does not include the zero lag
+    bandwidth : float or None
+       bandwidth of the kernel. If None, then nlags + 1 is used as for the
+       truncated kernels. The QS kernel does not truncate, so the bandwidth
+       should be smaller than nlags for a close approximation.
+
+    Returns
+    -------
+    kernel : ndarray, (nlags+1,)
+        weights for Quadratic Spectral kernel
+
+    '''
+    if bandwidth is None:
+        bandwidth = nlags + 1.
+    return kernel_weights('qs', bandwidth, nlags)
+
+def kernel_weights(kernel, bandwidth, nlags):
+    '''kernel weights k(j / bandwidth) for lags j = 0, ..., nlags
+
+    Parameters
+    ----------
+    kernel : str
+       'bartlett', 'uniform', 'parzen' or 'qs' (Quadratic Spectral)
+    bandwidth : float
+       bandwidth of the kernel. The truncated kernels have zero weight for
+       lags larger or equal to the bandwidth, weights_bartlett(nlags)
+       corresponds to a bandwidth of nlags + 1.
+    nlags : int
+       highest lag for which a weight is returned
+
+    Returns
+    -------
+    kernel : ndarray, (nlags+1,)
+        kernel weights
+
+    '''
+    x = np.arange(nlags + 1) / float(bandwidth)
+    if kernel == 'bartlett':
+        return np.maximum(1 - x, 0)
+    elif kernel == 'uniform':
+        return (x < 1).astype(np.float64)
+    elif kernel == 'parzen':
+        return np.where(x <= 0.5, 1 - 6 * x**2 + 6 * x**3,
+                        np.where(x < 1, 2 * (1 - x)**3, 0))
+    elif kernel == 'qs':
+        z = 6 * np.pi * x[1:] / 5.
+        w = 25. / (12 * np.pi**2 * x[1:]**2) * (np.sin(z) / z - np.cos(z))
+        return np.concatenate(([1.], w))
+    else:
+        raise ValueError("kernel %s not understood" % kernel)
+
+# characteristic exponent q and constant c of the kernels, Newey and West
+# (1994), and constant and exponent of the rule for the preliminary number of
+# lags, n = floor(c_pre * (nobs / 100)**rate)
+_kernel_bandwidth_constants = {'bartlett' : (1, 1.1447, 4, 2./9),
+                               'parzen' : (2, 2.6614, 4, 4./25),
+                               'qs' : (2, 1.3221, 3, 2./25)}
+
+def hac_bandwidth(x, kernel='bartlett'):
+    '''automatic bandwidth selection for HAC of Newey and West (1994)
+
+    Parameters
+    ----------
+    x : ndarray (nobs,) or (nobs, k_var)
+        data, for HAC this is array of x_i * u_i
+    kernel : str
+       'bartlett', 'parzen' or 'qs'
+
+    Returns
+    -------
+    bandwidth : float
+        estimated optimal bandwidth. For the truncated kernels, the
+        highest lag with non-zero weight is ceil(bandwidth) - 1.
+
+    Notes
+    -----
+    The columns of x are aggregated with equal weights. The preliminary
+    number of lags is floor(4 (nobs/100)^(2/9)) for 'bartlett',
+    floor(4 (nobs/100)^(4/25)) for 'parzen' and floor(3 (nobs/100)^(2/25))
+    for 'qs'.
+
+    References
+    ----------
+    Newey, W.K. and West, K.D. (1994) "Automatic Lag Selection in Covariance
+    Matrix Estimation", Review of Economic Studies 61, 631-653.
+
+    '''
+    if kernel not in _kernel_bandwidth_constants:
+        raise ValueError("automatic bandwidth not available for kernel %s"
+                         % kernel)
+    q, c, c_pre, rate = _kernel_bandwidth_constants[kernel]
+    x = np.asarray(x)
+    h = x.sum(1) if x.ndim == 2 else x
+    nobs = len(h)
+    n_pre = int(np.floor(c_pre * (nobs / 100.)**rate))
+    sigma = np.array([np.dot(h[j:], h[:nobs - j]) for j in range(n_pre + 1)])
+    j = np.arange(1, n_pre + 1)
+    s0 = sigma[0] + 2 * sigma[1:].sum()
+    sq = 2 * np.dot(j**q, sigma[1:])
+    gamma = c * ((sq / s0)**2)**(1. / (2 * q + 1))
+    return gamma * nobs**(1. / (2 * q + 1))
+
+def S_hac_simple(x, nlags=None, weights_func=weights_bartlett, use_fft=None):
     '''inner covariance matrix for HAC (Newey, West) sandwich
 
     assumes we have a single time series with zero axis consecutive, equal
@@ -330,6 +479,10 @@ def S_hac_simple(x, nlags=None, weights_func=weights_bartlett):
     weights_func : callable
         weights_func is called with nlags as argument to get the kernel
         weights. default are Bartlett weights
+    use_fft : bool or None
+        If True, the weighted sum of autocovariances is computed with an FFT
+        convolution instead of a loop over lags. If None (default), the FFT
+        is used if nlags is large.
 
     Returns
     -------
@@ -352,13 +505,84 @@ def S_hac_simple(x, nlags=None, weights_func=weights_bartlett):
 
     weights = weights_func(nlags)
 
-    S = weights[0] * np.dot(x.T, x)  #weights[0] just for completeness, is 1
+    return _hac_sum(x, weights, use_fft=use_fft)
 
-    for lag in range(1, nlags+1):
-        s = np.dot(x[lag:].T, x[:-lag])
-        S += weights[lag] * (s + s.T)
+def _hac_sum(x, weights, use_fft=None):
+    '''kernel weighted sum of autocovariances, sum_j w_j (G_j + G_j')
 
-    return S
+    x is (nobs, k_vars), weights are for lags 0 to len(weights) - 1.
+
+    If use_fft is True, then the sum is computed as x' W x, where W is the
+    Toeplitz matrix of the weights, with W x obtained by FFT convolution.
+    This is O(k_vars nobs log(nobs)) independent of the number of lags,
+    while the loop over lags is O(nlags nobs k_vars**2). If use_fft is None,
+    then the FFT is used when the number of lags is large.
+    '''
+    nobs, k_vars = x.shape
+    weights = np.asarray(weights, dtype=np.float64)[:nobs]
+    nlags = len(weights) - 1
+    if use_fft is None:
+        use_fft = nlags * k_vars > 4 * np.log2(max(nobs, 2)) + 64
+
+    if not use_fft:
+        S = weights[0] * np.dot(x.T, x)  #weights[0] just for completeness, is 1
+        for lag in range(1, nlags+1):
+            s = np.dot(x[lag:].T, x[:-lag])
+            S += weights[lag] * (s + s.T)
+        return S
+
+    kernel = np.concatenate((weights[:0:-1], weights))
+    nfft = 2**int(np.ceil(np.log2(nobs + 2 * nlags)))
+    xw = np.fft.irfft(np.fft.rfft(x, n=nfft, axis=0) *
+                      np.fft.rfft(kernel, n=nfft)[:, None], n=nfft, axis=0)
+    S = np.dot(x.T, xw[nlags:nlags + nobs])
+    return (S + S.T) / 2.
+
+def _hac_kernel_weights(x, kernel='bartlett', bandwidth=None):
+    '''kernel weights and bandwidth used by S_hac_kernel'''
+    nobs = x.shape[0]
+    if bandwidth is None:
+        bandwidth = np.floor(4 * (nobs / 100.)**(2./9.)) + 1
+    elif bandwidth == 'auto':
+        bandwidth = hac_bandwidth(x, kernel=kernel)
+    if kernel == 'qs':
+        nlags = nobs - 1
+    else:
+        nlags = min(int(np.ceil(bandwidth)) - 1, nobs - 1)
+    return kernel_weights(kernel, bandwidth, nlags), bandwidth
+
+def S_hac_kernel(x, kernel='bartlett', bandwidth=None, use_fft=None):
+    '''inner covariance matrix for HAC sandwich with a choice of kernel
+
+    assumes we have a single time series with zero axis consecutive, equal
+    spaced time periods
+
+    Parameters
+    ----------
+    x : ndarray (nobs,) or (nobs, k_var)
+        data, for HAC this is array of x_i * u_i
+    kernel : str
+        'bartlett' (default), 'uniform', 'parzen' or 'qs', see
+        `kernel_weights`
+    bandwidth : float, 'auto' or None
+        bandwidth of the kernel. If None, then the same default as in
+        S_hac_simple is used, bandwidth = floor(4(T/100)^(2/9)) + 1. If
+        'auto', then the bandwidth is estimated with `hac_bandwidth`.
+    use_fft : bool or None
+        see S_hac_simple. The QS kernel uses all lags, so the FFT is
+        the default for it.
+
+    Returns
+    -------
+    S : ndarray, (k_vars, k_vars)
+        inner covariance matrix for sandwich
+
+    '''
+    if x.ndim == 1:
+        x = x[:,None]
+    weights, bandwidth = _hac_kernel_weights(x, kernel=kernel,
+                                             bandwidth=bandwidth)
+    return _hac_sum(x, weights, use_fft=use_fft)
 
 def S_white_simple(x):
     '''inner covariance matrix for White heteroscedastistity sandwich
@@ -454,7 +678,12 @@ def S_crosssection(x, group):
 
     This is used by cov_cluster and indirectly verified
 
+    If group is a ClusterGroups instance, then its cached group indexing is
+    used for the group sums.
+
     '''
+    if isinstance(group, ClusterGroups):
+        return _S_cluster(x, group)[0]
     x_group_sums = group_sums(x, group).T  #TODO: why transposed
 
     return S_white_simple(x_group_sums)
@@ -478,8 +707,12 @@ def cov_cluster(results, group, use_correction=True):
     Parameters
     ----------
     results : result instance
-       result of a regression, uses results.model.exog and results.resid
-       TODO: this should use wexog instead
+       result of a regression, GLM or discrete model. Uses the whitened
+       exog and residuals for regression models and the score contributions
+       otherwise.
+    group : array_like or ClusterGroups
+       group labels, (nobs,). A ClusterGroups instance with one dimension
+       can be used to reuse the group indexing across calls.
     use_correction : bool
        If true (default), then the small sample correction factor is used.
 
@@ -492,15 +725,21 @@ def cov_cluster(results, group, use_correction=True):
     -----
     same result as Stata in UCLA example and same as Peterson
 
+    See Also
+    --------
+    cov_cluster_multiway, SandwichCovariance
+
     '''
-    #TODO: currently used version of groupsums requires 2d resid
-    xu = results.model.exog * results.resid[:, None]
-    scale = S_crosssection(xu, group)
+    xu, hessian_inv = _get_sandwich_arrays(results)
+    groups = _as_cluster_groups(group)
+    if groups.n_dims != 1:
+        raise ValueError('group needs to be one-dimensional, use '
+                         'cov_cluster_multiway for several groups')
+    scale, n_groups = _S_cluster(xu, groups)
 
-    nobs, k_vars = results.model.exog.shape
-    n_groups = len(np.unique(group)) #replace with stored group attributes if available
+    nobs, k_vars = xu.shape
 
-    cov_c = _HCCM2(results, scale)
+    cov_c = _sandwich(hessian_inv, scale)
 
     if use_correction:
         cov_c *= n_groups / (n_groups - 1.) * ((nobs-1.) / float(nobs - k_vars))
@@ -513,8 +752,9 @@ def cov_cluster_2groups(results, group, group2=None, use_correction=True):
     Parameters
     ----------
     results : result instance
-       result of a regression, uses results.model.exog and results.resid
-       TODO: this should use wexog instead
+       result of a regression, GLM or discrete model. Uses the whitened
+       exog and residuals for regression models and the score contributions
+       otherwise.
     use_correction : bool
        If true (default), then the small sample correction factor is used.
 
@@ -545,21 +785,17 @@ def cov_cluster_2groups(results, group, group2=None, use_correction=True):
     else:
         group0 = group
         group1 = group2
-        group = (group0, group1)
-
-
-    cov0 = cov_cluster(results, group0, use_correction=use_correction)
-    #[0] because we get still also returns bse
-    cov1 = cov_cluster(results, group1, use_correction=use_correction)
 
-    group_intersection = Group(group)
-    #cov of cluster formed by intersection of two groups
-    cov01 = cov_cluster(results,
-                        group_intersection.group_int,
-                        use_correction=use_correction)
 
+    xu, hessian_inv = _get_sandwich_arrays(results)
+    groups = ClusterGroups((group0, group1))
+    #includes the cov of cluster formed by intersection of two groups
+    S_both, (S0, S1) = _S_cluster_multiway(xu, groups,
+                                          use_correction=use_correction)
+    cov0 = _sandwich(hessian_inv, S0)
+    cov1 = _sandwich(hessian_inv, S1)
     #robust cov matrix for union of groups
-    cov_both = cov0 + cov1 - cov01
+    cov_both = _sandwich(hessian_inv, S_both)
 
     #return all three (for now?)
     return cov_both, cov0, cov1
@@ -572,8 +808,9 @@ def cov_white_simple(results, use_correction=True):
     Parameters
     ----------
     results : result instance
-       result of a regression, uses results.model.exog and results.resid
-       TODO: this should use wexog instead
+       result of a regression, GLM or discrete model. Uses the whitened
+       exog and residuals for regression models and the score contributions
+       otherwise.
 
     Returns
     -------
@@ -593,13 +830,13 @@ def cov_white_simple(results, use_correction=True):
         with small sample corrections
 
     '''
-    xu = results.model.exog * results.resid[:, None]
+    xu, hessian_inv = _get_sandwich_arrays(results)
     sigma = S_white_simple(xu)
 
-    cov_w = _HCCM2(results, sigma)  #add bread to sandwich
+    cov_w = _sandwich(hessian_inv, sigma)  #add bread to sandwich
 
     if use_correction:
-        nobs, k_vars = results.model.exog.shape
+        nobs, k_vars = xu.shape
         cov_w *= nobs / float(nobs - k_vars)
 
     return cov_w
@@ -617,8 +854,9 @@ def cov_hac_simple(results, nlags=None, weights_func=weights_bartlett,
     Parameters
     ----------
     results : result instance
-       result of a regression, uses results.model.exog and results.resid
-       TODO: this should use wexog instead
+       result of a regression, GLM or discrete model. Uses the whitened
+       exog and residuals for regression models and the score contributions
+       otherwise.
     nlags : int or None
         highest lag to include in kernel window. If None, then
         nlags = floor[4(T/100)^(2/9)] is used.
@@ -639,13 +877,13 @@ def cov_hac_simple(results, nlags=None, weights_func=weights_bartlett,
     options might change when other kernels besides Bartlett are available.
 
     '''
-    xu = results.model.exog * results.resid[:, None]
+    xu, hessian_inv = _get_sandwich_arrays(results)
     sigma = S_hac_simple(xu, nlags=nlags, weights_func=weights_func)
 
-    cov_hac = _HCCM2(results, sigma)
+    cov_hac = _sandwich(hessian_inv, sigma)
 
     if use_correction:
-        nobs, k_vars = results.model.exog.shape
+        nobs, k_vars = xu.shape
         cov_hac *= nobs / float(nobs - k_vars)
 
     return cov_hac
@@ -685,12 +923,25 @@ def S_nw_panel(xw, weights, groupidx):
 
     no reference for this, just accounting for time indices
     '''
+    codes = -np.ones(xw.shape[0], dtype=int)
+    for i, (l, u) in enumerate(groupidx):
+        codes[l:u] = i
+    if not np.any([l + len(weights) - 1 < u for l, u in groupidx]):
+        raise ValueError('all groups are empty taking lags')
+    return _S_nw_panel_codes(xw, weights, codes)
+
+def _S_nw_panel_codes(xw, weights, codes):
+    '''S_nw_panel with group membership given by integer codes
+
+    observations with negative codes are not in any group and only enter
+    the zero lag term
+    '''
     nlags = len(weights)-1
 
     S = weights[0] * np.dot(xw.T, xw)  #weights just for completeness
-    for lag in range(1, nlags+1):
-        xw0, xwlag = lagged_groups(xw, lag, groupidx)
-        s = np.dot(xw0.T, xwlag)
+    for lag in range(1, min(nlags, xw.shape[0] - 1) + 1):
+        same = (codes[lag:] == codes[:-lag]) & (codes[lag:] >= 0)
+        s = np.dot((xw[lag:] * same[:, None]).T, xw[:-lag])
         S += weights[lag] * (s + s.T)
     return S
 
@@ -706,8 +957,9 @@ def cov_nw_panel(results, nlags, groupidx, weights_func=weights_bartlett,
     Parameters
     ----------
     results : result instance
-       result of a regression, uses results.model.exog and results.resid
-       TODO: this should use wexog instead
+       result of a regression, GLM or discrete model. Uses the whitened
+       exog and residuals for regression models and the score contributions
+       otherwise.
     nlags : int or None
         Highest lag to include in kernel window. Currently, no default
         because the optimal length will depend on the number of observations
@@ -749,12 +1001,12 @@ def cov_nw_panel(results, nlags, groupidx, weights_func=weights_bartlett,
     else:
         weights = weights_func(nlags)
 
-    xw = (results.model.exog * results.resid[:,None])
+    xw, hessian_inv = _get_sandwich_arrays(results)
 
     S_hac = S_nw_panel(xw, weights, groupidx)
-    cov_hac = _HCCM2(results, S_hac)
+    cov_hac = _sandwich(hessian_inv, S_hac)
     if use_correction:
-        nobs, k_vars = results.model.exog.shape
+        nobs, k_vars = xw.shape
         if use_correction == 'hac':
             cov_hac *= nobs / float(nobs - k_vars)
         elif use_correction in ['c', 'clu', 'cluster']:
@@ -777,8 +1029,9 @@ def cov_nw_groupsum(results, nlags, time, weights_func=weights_bartlett,
     Parameters
     ----------
     results : result instance
-       result of a regression, uses results.model.exog and results.resid
-       TODO: this should use wexog instead
+       result of a regression, GLM or discrete model. Uses the whitened
+       exog and residuals for regression models and the score contributions
+       otherwise.
     nlags : int or None
         Highest lag to include in kernel window. Currently, no default
         because the optimal length will depend on the number of observations
@@ -824,13 +1077,13 @@ def cov_nw_groupsum(results, nlags, time, weights_func=weights_bartlett,
 
     '''
 
-    xw = (results.model.exog * results.resid[:,None])
+    xw, hessian_inv = _get_sandwich_arrays(results)
 
     #S_hac = S_nw_panel(xw, weights, groupidx)
     S_hac = S_hac_groupsum(xw, time, nlags=nlags, weights_func=weights_func)
-    cov_hac = _HCCM2(results, S_hac)
+    cov_hac = _sandwich(hessian_inv, S_hac)
     if use_correction:
-        nobs, k_vars = results.model.exog.shape
+        nobs, k_vars = xw.shape
         if use_correction == 'hac':
             cov_hac *= nobs / float(nobs - k_vars)
         elif use_correction in ['c', 'cluster']:
@@ -841,3 +1094,355 @@ def cov_nw_groupsum(results, nlags, time, weights_func=weights_bartlett,
     return cov_hac
 
 
+
+
+#---------------------- cached group indexing and covariance engine
+
+def _get_sandwich_arrays(results):
+    '''score contributions and inverse Hessian of a results instance
+
+    Returns
+    -------
+    xu : ndarray, (nobs, k_params)
+        score contributions, exog * resid for linear regression models
+    hessian_inv : ndarray, (k_params, k_params)
+        bread of the sandwich, results.normalized_cov_params
+
+    '''
+    model = results.model
+    if hasattr(model, 'jac'):
+        # discrete and generic likelihood models
+        xu = model.jac(results.params)
+    elif hasattr(results, 'family'):
+        # GLM, x * (y - mu) / (g'(mu) V(mu)), with IRLS weights in the bread
+        mu = results.mu
+        family = results.family
+        resid = results.resid_response / (family.link.deriv(mu) *
+                                          family.variance(mu))
+        xu = model.exog * resid[:, None]
+    else:
+        xu = model.exog * results.resid[:, None]
+    return xu, results.normalized_cov_params
+
+def _sandwich(hessian_inv, scale):
+    '''sandwich hessian_inv * scale * hessian_inv.T'''
+    return np.dot(np.dot(hessian_inv, scale), hessian_inv.T)
+
+class ClusterGroups(object):
+    '''precomputed group indexing for cluster robust covariances
+
+    The integer coding of the groups, and the sort order and group
+    boundaries used for the group sums, are computed once and cached, so
+    that the same instance can be reused for several covariance matrices
+    and several models on the same sample.
+
+    Parameters
+    ----------
+    groups : array_like or tuple of array_like
+        (nobs,) or (nobs, n_dims) array, or tuple of (nobs,) arrays, with
+        the group labels for each cluster dimension. A list is converted
+        to an array, only a tuple gives several dimensions. Labels can be of any
+        type that np.unique can sort.
+
+    Attributes
+    ----------
+    codes : list of ndarray
+        integer group codes in range(n_groups) for each dimension
+    n_groups : list of int
+        number of groups for each dimension
+    nobs : int
+    n_dims : int
+
+    '''
+
+    def __init__(self, groups):
+        if isinstance(groups, tuple):
+            groups = [np.asarray(g) for g in groups]
+        else:
+            groups = np.asarray(groups)
+            if groups.ndim == 1:
+                groups = [groups]
+            else:
+                groups = [groups[:, i] for i in range(groups.shape[1])]
+        self.codes = []
+        self.n_groups = []
+        for g in groups:
+            uniques, codes = np.unique(g, return_inverse=True)
+            self.codes.append(codes)
+            self.n_groups.append(len(uniques))
+        self.nobs = len(self.codes[0])
+        self.n_dims = len(self.codes)
+        self._cache = {}
+
+    def _index(self, dims=None):
+        '''codes, n_groups, sort order and group starts of an intersection'''
+        if dims is None:
+            dims = range(self.n_dims)
+        dims = tuple(sorted(dims))
+        if dims not in self._cache:
+            if len(dims) == 1:
+                codes, n_groups = self.codes[dims[0]], self.n_groups[dims[0]]
+            else:
+                codes, n_groups = self._index(dims[:-1])[:2]
+                combined = (codes.astype(np.int64) * self.n_groups[dims[-1]] +
+                            self.codes[dims[-1]])
+                uniques, codes = np.unique(combined, return_inverse=True)
+                n_groups = len(uniques)
+            if np.all(codes[1:] >= codes[:-1]):
+                order = None
+                codes_sorted = codes
+            else:
+                order = np.argsort(codes, kind='mergesort')
+                codes_sorted = codes[order]
+            starts = np.concatenate(([0],
+                                     np.nonzero(np.diff(codes_sorted))[0] + 1))
+            self._cache[dims] = (codes, n_groups, order, starts)
+        return self._cache[dims]
+
+    def group_int(self, dims=None):
+        '''integer group codes for the intersection of the dimensions dims
+
+        If dims is None, then all dimensions are used.
+        '''
+        return self._index(dims)[0]
+
+    def get_n_groups(self, dims=None):
+        '''number of groups in the intersection of the dimensions dims'''
+        return self._index(dims)[1]
+
+    def group_sums(self, x, dims=None):
+        '''sum of x within each group of the intersection of dims
+
+        Parameters
+        ----------
+        x : ndarray, (nobs,) or (nobs, k_vars)
+        dims : sequence of int or None
+            dimensions that define the groups. If None, then all dimensions
+            are used.
+
+        Returns
+        -------
+        sums : ndarray, (n_groups, k_vars)
+            sums ordered by group code
+
+        '''
+        x = np.asarray(x)
+        if x.ndim == 1:
+            x = x[:, None]
+        codes, n_groups, order, starts = self._index(dims)
+        if order is not None:
+            x = x.take(order, axis=0)
+        return np.add.reduceat(x, starts, axis=0)
+
+def _as_cluster_groups(groups):
+    if isinstance(groups, ClusterGroups):
+        return groups
+    return ClusterGroups(groups)
+
+def _S_cluster(xu, groups, dims=None):
+    '''sum of outer products of the group sums and number of groups'''
+    n_groups = groups.get_n_groups(dims)
+    if n_groups == xu.shape[0]:
+        # every observation is its own group
+        return np.dot(xu.T, xu), n_groups
+    sums = groups.group_sums(xu, dims)
+    return np.dot(sums.T, sums), n_groups
+
+def _S_cluster_multiway(xu, groups, use_correction=True):
+    '''inner matrix of multiway clustering by inclusion-exclusion
+
+    Returns the total and the one-way matrices for each dimension, each
+    with its small sample correction if use_correction is true.
+    '''
+    from itertools import combinations
+    nobs, k_vars = xu.shape
+    S_total = np.zeros((k_vars, k_vars))
+    S_oneway = []
+    for n_comb in range(1, groups.n_dims + 1):
+        for dims in combinations(range(groups.n_dims), n_comb):
+            S, n_groups = _S_cluster(xu, groups, dims)
+            if use_correction:
+                S *= (n_groups / (n_groups - 1.) *
+                      ((nobs - 1.) / float(nobs - k_vars)))
+            if n_comb == 1:
+                S_oneway.append(S)
+            S_total += (-1)**(n_comb + 1) * S
+    return S_total, S_oneway
+
+def cov_cluster_multiway(results, groups, use_correction=True):
+    '''multiway cluster robust covariance matrix
+
+    Parameters
+    ----------
+    results : result instance
+       result of a regression, GLM or discrete model. Uses the whitened
+       exog and residuals for regression models and the score contributions
+       otherwise.
+    groups : array_like, tuple of array_like or ClusterGroups
+        group labels with one column or array per cluster dimension, see
+        ClusterGroups. Passing a ClusterGroups instance reuses its cached
+        group indexing.
+    use_correction : bool
+       If true (default), then the small sample correction factor is used
+       for each term.
+
+    Returns
+    -------
+    cov : ndarray, (k_vars, k_vars)
+        cluster robust covariance matrix for parameter estimates
+
+    Notes
+    -----
+    This is the estimator of Cameron, Gelbach and Miller (2011) which adds
+    and subtracts the one-way cluster covariances of all intersections of
+    the cluster dimensions. For two dimensions this is the same as the
+    first return of cov_cluster_2groups. The result is not guaranteed to be
+    positive semi-definite.
+
+    '''
+    xu, hessian_inv = _get_sandwich_arrays(results)
+    groups = _as_cluster_groups(groups)
+    S = _S_cluster_multiway(xu, groups, use_correction=use_correction)[0]
+    return _sandwich(hessian_inv, S)
+
+class SandwichCovariance(object):
+    '''sandwich covariance matrices for a results instance
+
+    The score contributions and the inverse Hessian are computed once and
+    shared by all covariance matrices. This works for regression, GLM and
+    discrete models, or directly from given arrays.
+
+    Parameters
+    ----------
+    results : result instance, optional
+        result of a regression, GLM or discrete model, only used if scores
+        or hessian_inv are not given.
+    scores : ndarray, (nobs, k_params), optional
+        score contributions of each observation. For linear regression this
+        is exog * resid[:, None].
+    hessian_inv : ndarray, (k_params, k_params), optional
+        bread of the sandwich, for example results.normalized_cov_params
+
+    Attributes
+    ----------
+    bandwidth : float
+        bandwidth used in the last HAC covariance, None before
+
+    Notes
+    -----
+    Group arguments can be given as ClusterGroups instances, which keep the
+    group coding and sort order for reuse across calls and models.
+
+    Examples
+    --------
+    >>> groups = ClusterGroups((firm, year))
+    >>> sw = SandwichCovariance(res)
+    >>> cov_2way = sw.cov_cluster(groups)
+    >>> cov_dk = sw.cov_nw_groupsum(year, kernel='parzen', bandwidth='auto')
+
+    '''
+
+    def __init__(self, results=None, scores=None, hessian_inv=None):
+        if scores is None or hessian_inv is None:
+            if results is None:
+                raise ValueError('results are required if scores or '
+                                 'hessian_inv are not given')
+            xu, hinv = _get_sandwich_arrays(results)
+            if scores is None:
+                scores = xu
+            if hessian_inv is None:
+                hessian_inv = hinv
+        scores = np.asarray(scores)
+        if scores.ndim == 1:
+            scores = scores[:, None]
+        self.scores = scores
+        self.hessian_inv = np.asarray(hessian_inv)
+        self.nobs, self.k_params = scores.shape
+        self.bandwidth = None
+
+    def _correction_hac(self):
+        return self.nobs / float(self.nobs - self.k_params)
+
+    def _correction_cluster(self, n_groups):
+        return (n_groups / (n_groups - 1.) *
+                ((self.nobs - 1.) / float(self.nobs - self.k_params)))
+
+    def cov_white(self, use_correction=True):
+        '''heteroscedasticity robust covariance matrix
+
+        With use_correction the result is scaled by nobs / (nobs - k_params)
+        as in cov_white_simple.
+        '''
+        cov = _sandwich(self.hessian_inv, S_white_simple(self.scores))
+        if use_correction:
+            cov *= self._correction_hac()
+        return cov
+
+    def cov_cluster(self, groups, use_correction=True):
+        '''one-way or multiway cluster robust covariance matrix
+
+        If groups has several dimensions, then the multiway estimator of
+        Cameron, Gelbach and Miller is used, see cov_cluster_multiway.
+        '''
+        groups = _as_cluster_groups(groups)
+        S = _S_cluster_multiway(self.scores, groups,
+                                use_correction=use_correction)[0]
+        return _sandwich(self.hessian_inv, S)
+
+    def cov_hac(self, kernel='bartlett', bandwidth=None, use_correction=True,
+                use_fft=None):
+        '''heteroscedasticity and autocorrelation robust covariance matrix
+
+        Assumes the observations are a single time series with consecutive,
+        equal spaced time periods. See S_hac_kernel for the options.
+        '''
+        weights, self.bandwidth = _hac_kernel_weights(self.scores, kernel,
+                                                      bandwidth)
+        S = _hac_sum(self.scores, weights, use_fft=use_fft)
+        cov = _sandwich(self.hessian_inv, S)
+        if use_correction:
+            cov *= self._correction_hac()
+        return cov
+
+    def cov_nw_panel(self, groups, kernel='bartlett', bandwidth=None,
+                     use_correction='hac'):
+        '''panel HAC robust covariance matrix
+
+        The observations are assumed to be stacked by panel unit, given by
+        groups, and sorted by time within each unit. Only products of
+        observations of the same unit enter the lagged terms. See
+        cov_nw_panel for the options.
+        '''
+        groups = _as_cluster_groups(groups)
+        codes = groups.group_int()
+        if bandwidth is None:
+            raise ValueError('bandwidth is required for panel HAC')
+        weights, self.bandwidth = _hac_kernel_weights(self.scores, kernel,
+                                                      bandwidth)
+        S = _S_nw_panel_codes(self.scores, weights, codes)
+        cov = _sandwich(self.hessian_inv, S)
+        if use_correction == 'hac':
+            cov *= self._correction_hac()
+        elif use_correction in ['c', 'clu', 'cluster']:
+            cov *= self._correction_cluster(groups.get_n_groups())
+        return cov
+
+    def cov_nw_groupsum(self, time, kernel='bartlett', bandwidth=None,
+                        use_correction=0):
+        '''Driscoll and Kraay panel robust covariance matrix
+
+        The scores are summed within each time period and HAC is applied to
+        the time series of sums. time are the time period labels, sorted
+        labels are assumed to be consecutive periods. See cov_nw_groupsum
+        for the options.
+        '''
+        time = _as_cluster_groups(time)
+        sums = time.group_sums(self.scores)
+        weights, self.bandwidth = _hac_kernel_weights(sums, kernel, bandwidth)
+        S = _hac_sum(sums, weights)
+        cov = _sandwich(self.hessian_inv, S)
+        if use_correction == 'hac':
+            cov *= self._correction_hac()
+        elif use_correction in ['c', 'cluster']:
+            cov *= self._correction_cluster(time.get_n_groups())
+        return cov
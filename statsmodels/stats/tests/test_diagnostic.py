@@ -14,7 +14,7 @@ import os
 import numpy as np
 
 from numpy.testing import (assert_, assert_almost_equal, assert_equal,
-                           assert_approx_equal)
+                           assert_approx_equal, assert_allclose)
 from nose import SkipTest
 
 from statsmodels.regression.linear_model import OLS, GLSAR
@@ -699,6 +699,45 @@ def test_outlier_influence_funcs():
     infl = res2.get_influence()
     infl.summary_table()
 
+def test_influence_chunks():
+    import tempfile
+    import shutil
+    np.random.seed(987125)
+    x = add_constant(np.random.randn(103, 2))
+    y = x.sum(1) + np.random.standard_t(3, 103)
+    res = OLS(y, x).fit()
+    frame = res.get_influence().summary_frame()
+
+    chunks = list(oi.iter_influence_measures(res, chunksize=10))
+    assert_equal([c[0] for c in chunks], np.arange(0, 103, 10))
+    measures = np.concatenate([c[1] for c in chunks])
+    for i, name in enumerate(oi.influence_columns):
+        assert_allclose(measures[:,i], frame[name], rtol=1e-10)
+
+    idx, val = oi.influence_topk(res, k=7, measure='dffits', chunksize=10)
+    idx_sorted = np.argsort(-np.abs(frame['dffits'].values))[:7]
+    assert_equal(idx, idx_sorted)
+    assert_allclose(val, frame['dffits'].values[idx_sorted], rtol=1e-10)
+
+    tmpdir = tempfile.mkdtemp(prefix='influence')
+    try:
+        fname = os.path.join(tmpdir, 'infl.csv')
+        oi.write_influence_measures(res, fname, chunksize=10)
+        data = np.genfromtxt(fname, delimiter=',', names=True)
+        assert_equal(data.dtype.names, tuple(['obs'] + oi.influence_columns))
+        assert_equal(data['obs'], np.arange(103))
+        assert_allclose(data['cooks_d'], frame['cooks_d'], rtol=1e-8)
+
+        fname = os.path.join(tmpdir, 'infl.npy')
+        out = oi.write_influence_measures(res, fname, chunksize=10)
+        del out
+        data = np.load(fname, mmap_mode='r')
+        assert_equal(data[:,0], np.arange(103))
+        assert_allclose(data[:,1:], measures, rtol=1e-13)
+        del data
+    finally:
+        shutil.rmtree(tmpdir)
+
 def test_influence_wrapped():
     from pandas import DataFrame
     from pandas.util.testing import assert_series_equal
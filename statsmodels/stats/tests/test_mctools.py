@@ -0,0 +1,113 @@
+'''Tests for Monte Carlo tools and Monte Carlo critical value tables
+
+'''
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal, assert_
+from scipy import stats
+
+from statsmodels.stats.mctools import StatTestMC, get_crit_table
+from statsmodels.stats.lilliefors import kstest_normal, lillifors_table
+from statsmodels.stats.adnorm import normal_ad
+
+
+def normalsim(nrepl, random_state, nobs):
+    return random_state.randn(nrepl, nobs)
+
+
+def skewkurt(x):
+    return np.column_stack((stats.skew(x, axis=1), stats.kurtosis(x, axis=1)))
+
+
+class TestStatTestMC(object):
+
+    @classmethod
+    def setup_class(cls):
+        cls.mc = mc = StatTestMC(normalsim, skewkurt, batch=True)
+        mc.run(5000, dgpargs=(20,), seed=987125, chunksize=500)
+        cls.frac = np.array([0.01, 0.1, 0.5, 0.95, 0.999])
+        cls.quantiles = mc.quantiles([0, 1], cls.frac)[1]
+        cls.cdf = mc.cdf([-0.5, 0.5], [0, 1])[1]
+
+    def test_n_jobs(self):
+        mc = StatTestMC(normalsim, skewkurt, batch=True)
+        mc.run(5000, dgpargs=(20,), seed=987125, chunksize=500, n_jobs=2)
+        assert_equal(mc.mcres.shape, (5000, 2))
+        assert_equal(mc.quantiles([0, 1], self.frac)[1], self.quantiles)
+
+    def test_histogram(self):
+        mc = StatTestMC(normalsim, skewkurt, batch=True)
+        mc.run(5000, dgpargs=(20,), seed=987125, chunksize=500, store=False)
+        assert_equal(mc.mchist.nobs, 5000)
+        assert_allclose(mc.quantiles([0, 1], self.frac)[1], self.quantiles,
+                        atol=5e-3)
+        # tails outside of range of first chunk are exact
+        assert_equal(mc.quantiles(1, [0.999])[1], self.quantiles[-1, 1])
+        assert_allclose(mc.cdf([-0.5, 0.5], [0, 1])[1], self.cdf, atol=1e-3)
+        counts = mc.histogram(0, critval=[-0.5, 0, 0.5])[0][0]
+        assert_equal(counts.sum(), 5000)
+        assert_allclose(np.cumsum(counts)[[0, 2]] / 5000., self.cdf[:, 0],
+                        atol=1e-3)
+
+    def test_loop(self):
+        # dgp with global random state
+        dgp = lambda nobs: np.random.randn(nobs)
+        np.random.seed(0)
+        state = np.random.get_state()
+        mc = StatTestMC(dgp, stats.skew)
+        mc.run(200, dgpargs=(20,), seed=1, chunksize=50)
+        assert_equal(mc.mcres.shape, (200,))
+        assert_equal(np.random.get_state()[1], state[1])
+        np.random.seed(mc.mcres.argmax())
+        mcres = mc.mcres
+        mc.run(200, dgpargs=(20,), seed=1, chunksize=50)
+        assert_equal(mc.mcres, mcres)
+
+    def test_seed_none(self):
+        # chunk seeds are drawn from the global random state
+        mc = StatTestMC(normalsim, skewkurt, batch=True)
+        np.random.seed(987125)
+        mc.run(1000, dgpargs=(20,), chunksize=200)
+        mcres = mc.mcres
+        np.random.seed(987125)
+        mc.run(1000, dgpargs=(20,), chunksize=200)
+        assert_equal(mc.mcres, mcres)
+        mc.run(1000, dgpargs=(20,), chunksize=200)
+        assert_(np.all(mc.mcres != mcres))
+
+
+def test_crit_table():
+    data_home = tempfile.mkdtemp()
+    try:
+        sizes = [10, 20, 40]
+        table = get_crit_table('kstest_normal', sizes, nrepl=10000, seed=0,
+                               data_home=data_home)
+        assert_equal(len(os.listdir(os.path.join(data_home, 'mc_tables'))),
+                     1)
+        table2 = get_crit_table('kstest_normal', sizes, nrepl=10000, seed=0,
+                                data_home=data_home)
+        assert_equal(table2.crit_table, table.crit_table)
+
+        # Dallal and Wilkinson table for 0.2, 0.1, 0.05, 0.01
+        for n in sizes:
+            crit = table.crit_table[sizes.index(n)]
+            crit_lf = lillifors_table._critvals(n)
+            assert_allclose(crit[[7, 5, 4, 2]], crit_lf[[5, 3, 2, 1]],
+                            atol=0.006)
+
+        x = np.random.RandomState(5).exponential(size=20)
+        res = kstest_normal(x, pvalmethod='table', table=table)
+        assert_allclose(res[1], kstest_normal(x, pvalmethod='approx')[1],
+                        atol=0.01)
+
+        table = get_crit_table('normal_ad', [10, 20], nrepl=10000, seed=0,
+                               cache=False)
+        res = normal_ad(x, table=table)
+        assert_allclose(res, normal_ad(x), atol=0.01)
+        assert_(0.001 < res[1] < 0.99)
+    finally:
+        shutil.rmtree(data_home)
@@ -14,10 +14,13 @@ are tested against R:multtest
 '''
 
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_equal, assert_
+from numpy.testing import (assert_almost_equal, assert_equal, assert_,
+                           assert_allclose)
 
 from statsmodels.stats.multitest import (multipletests, fdrcorrection,
-                                         fdrcorrection_twostage)
+                                         fdrcorrection_twostage,
+                                         multipletests_batch,
+                                         fdrcorrection_stream)
 from statsmodels.stats.multicomp import tukeyhsd
 
 pval0 = np.array([0.838541367553 , 0.642193923795 , 0.680845947633 ,
@@ -276,6 +279,59 @@ def test_hommel():
     assert_almost_equal(pvalscorr, result_ho, 15)
     assert_equal(rej, result_ho < 0.1)  #booleans
 
+def test_hommel_loop():
+    # compare with the O(n**2) loop used in earlier versions
+    np.random.seed(987125)
+    for ii in range(20):
+        pvals = np.sort(np.random.uniform(size=50)**(ii % 4 + 1))
+        if ii % 3 == 0:
+            pvals = np.round(pvals, 2)
+        ntests = len(pvals)
+        a = pvals.copy()
+        for m in range(ntests, 1, -1):
+            cim = np.min(m * pvals[-m:] / np.arange(1,m+1.))
+            a[-m:] = np.maximum(a[-m:], cim)
+            a[:-m] = np.maximum(a[:-m], np.minimum(m * pvals[:-m], cim))
+        a[a > 1] = 1
+        pvalscorr = multipletests(pvals, method='hommel')[1]
+        assert_allclose(pvalscorr, a, rtol=1e-13)
+
+def test_multipletests_batch():
+    np.random.seed(987125)
+    pvals = np.random.uniform(size=(15, 25, 3))**4
+    pvals[0, :3, 0] = 0
+    for method in ['b', 's', 'sh', 'hs', 'h', 'hommel', 'fdr_i', 'fdr_n',
+                   'fdr_tsbky', 'fdr_tsbh', 'fdr_gbs']:
+        for axis in [1, -1]:
+            res = multipletests_batch(pvals, alpha=0.1, method=method,
+                                      axis=axis)
+            assert_equal(res[0].shape, pvals.shape)
+            p = np.rollaxis(pvals, axis, 3).reshape(-1, pvals.shape[axis])
+            rej = np.rollaxis(res[0], axis, 3).reshape(p.shape)
+            pcorr = np.rollaxis(res[1], axis, 3).reshape(p.shape)
+            for i in range(p.shape[0]):
+                res1 = multipletests(p[i], alpha=0.1, method=method)
+                assert_equal(rej[i], res1[0])
+                assert_allclose(pcorr[i], res1[1], rtol=1e-13)
+                assert_allclose(res[2:], res1[2:], rtol=1e-13)
+
+def test_fdrcorrection_stream():
+    np.random.seed(987125)
+    for ii in range(20):
+        pvals = np.random.uniform(size=1000)
+        pvals[:ii * 20] = pvals[:ii * 20]**20
+        if ii % 3 == 0:
+            pvals = np.round(pvals, 3)
+        for method in ['indep', 'negcorr']:
+            rej = fdrcorrection(pvals, alpha=0.1, method=method)[0]
+            res = fdrcorrection_stream(pvals, alpha=0.1, method=method,
+                                       chunksize=300, nbins=1000)
+            assert_equal(res[1:], (rej.sum(), 1000))
+            assert_equal(pvals <= res[0], rej)
+            chunks = lambda: np.array_split(pvals, 7)
+            res2 = fdrcorrection_stream(chunks, alpha=0.1, method=method)
+            assert_equal(res2, res)
+
 def test_fdr_bky():
     # test for fdrcorrection_twostage
     # example from BKY
@@ -291,6 +347,9 @@ def test_fdr_bky():
     res_tst = fdrcorrection_twostage(pvals, alpha=0.05, iter=False)
     assert_almost_equal([0.047619, 0.0649], res_tst[-1][:2],3) #alpha_star for stage 2
     assert_equal(8, res_tst[0].sum())
+    res_iter = fdrcorrection_twostage(pvals, alpha=0.05, iter=True)
+    assert_equal(9, res_iter[0].sum())
+    assert_equal(len(pvals) - 9, res_iter[2])
     #print fdrcorrection_twostage(pvals, alpha=0.05, iter=True)
 
 def test_tukeyhsd():
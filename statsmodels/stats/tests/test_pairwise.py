@@ -8,7 +8,7 @@ Author: Josef Perktold
 
 from statsmodels.compatnp.py3k import BytesIO, asbytes
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_equal
+from numpy.testing import assert_almost_equal, assert_equal, assert_
 
 from statsmodels.stats.libqsturng import qsturng
 
@@ -264,3 +264,103 @@ class TestTuckeyHSD4(CheckTuckeyHSDMixin):
 
     def test_hochberg_intervals(self):
         assert_almost_equal(self.res.halfwidths, self.halfwidth2, 14)
+
+
+class TestAllPairs(object):
+
+    @classmethod
+    def setup_class(self):
+        np.random.seed(987125)
+        ngroups = 12
+        self.groups = groups = np.random.randint(0, ngroups, 400)
+        self.endog = (np.random.randn(400) * (1 + groups % 3) +
+                      0.1 * groups)
+        self.mc = MultiComparison(self.endog, self.groups)
+
+    def test_pairindices(self):
+        from statsmodels.sandbox.stats.multicomp import iter_pairindices
+        for chunksize in [None, 1, 7, 100]:
+            idx = np.concatenate([np.column_stack(pairs) for pairs in
+                                  iter_pairindices(12, chunksize)])
+            assert_equal(idx, np.column_stack(np.triu_indices(12, 1)))
+        assert_equal(len(list(iter_pairindices(1))), 0)
+
+    def test_datali(self):
+        for i, k in enumerate(self.mc.groupsunique):
+            assert_equal(self.mc.datali[i], self.endog[self.groups == k])
+        mc = MultiComparison(self.endog, self.groups,
+                             group_order=[3, 5, 1])
+        for i, k in enumerate([3, 5, 1]):
+            assert_equal(mc.datali[i], self.endog[self.groups == k])
+
+    def test_ttest(self):
+        from scipy import stats
+        mc = self.mc
+        pairs = zip(*mc.pairindices)
+        for method, equal_var in [('ttest', True), ('welch', False)]:
+            res = mc.allpairs(method, multimethod=None, chunksize=10)
+            res0 = np.array([stats.ttest_ind(mc.datali[i], mc.datali[j],
+                                             equal_var=equal_var)
+                             for i, j in pairs])
+            assert_almost_equal(-res['statistic'], res0[:, 0], 12)
+            assert_almost_equal(res['pvalue'], res0[:, 1], 12)
+
+        # vectorized shortcut in allpairtest
+        res = mc.allpairtest(stats.ttest_ind, method='b')[1]
+        res0 = np.array([stats.ttest_ind(mc.datali[i], mc.datali[j])
+                         for i, j in pairs])
+        assert_almost_equal(res[0], res0, 12)
+        res_corr = mc.allpairs('ttest', multimethod='b')
+        assert_almost_equal(res_corr['pval_corr'], res[2], 14)
+        assert_equal(res_corr['reject'], res[1])
+
+    def test_tukey(self):
+        res_hsd = self.mc.tukeyhsd(alpha=0.05)
+        res = self.mc.allpairs('tukey', alpha=0.05, chunksize=13)
+        assert_almost_equal(res['meandiff'], res_hsd.meandiffs, 13)
+        assert_almost_equal(np.column_stack((res['lower'], res['upper'])),
+                            res_hsd.confint, 13)
+        assert_equal(res['reject'], res_hsd.reject)
+        # consistent with the matrix version
+        gs = self.mc.groupstats
+        res_t = tukeyhsd(gs.groupmean, gs.groupnobs, res_hsd.variance,
+                         alpha=0.05)
+        assert_almost_equal(res['std_pair'], res_t[3], 13)
+        assert_almost_equal(res_hsd.confint, res_t[4], 13)
+        # p-values are consistent with the simultaneous intervals
+        assert_equal(res['pvalue'] < 0.05, res['reject'])
+
+    def test_games_howell(self):
+        from scipy import stats
+        mc = self.mc
+        res = mc.allpairs('games-howell')
+        res_welch = mc.allpairs('welch', multimethod=None)
+        assert_almost_equal(res['statistic'],
+                            res_welch['statistic'] * np.sqrt(2), 13)
+        assert_almost_equal(res['df'], res_welch['df'], 13)
+        crit = qsturng(0.95, mc.ngroups, res['df'])
+        assert_almost_equal(res['upper'] - res['meandiff'],
+                            crit * res['std_pair'], 13)
+        assert_equal(res['pvalue'] < 0.05, res['reject'])
+
+    def test_games_howell_small_group(self):
+        # Welch's df is below 2 for pairs with a group of two observations
+        from statsmodels.stats.libqsturng import psturng
+        groups = np.concatenate((self.groups, [12, 12]))
+        endog = np.concatenate((self.endog, [0.5, 3.]))
+        mc = MultiComparison(endog, groups)
+        res = mc.allpairs('games-howell')
+        small = res['df'] < 2
+        assert_equal(small, res['group2'] == 12)
+        assert_(np.isfinite(res['pvalue']).all())
+        crit = qsturng(0.95, mc.ngroups, res['df'][small], exact=True)
+        assert_almost_equal(res['upper'][small] - res['meandiff'][small],
+                            crit * res['std_pair'][small], 13)
+        pvalue = psturng(np.abs(res['statistic'][small]), mc.ngroups,
+                         res['df'][small], exact=True)
+        assert_almost_equal(res['pvalue'][small], pvalue, 13)
+        assert_equal(res['pvalue'] < 0.05, res['reject'])
+        # the other pairs use the approximation
+        pvalue = psturng(np.abs(res['statistic'][~small]), mc.ngroups,
+                         res['df'][~small])
+        assert_almost_equal(res['pvalue'][~small], pvalue, 13)
@@ -751,6 +751,66 @@ def test_power_solver_warn():
 
 
 
+def test_solve_power_vectorized():
+    effect_size = np.array([0.2, 0.5, 0.8])
+    alpha = np.array([[0.01], [0.05]])
+    cases = [(smp.TTestPower(), 'nobs', {}),
+             (smp.TTestIndPower(), 'nobs1', {'ratio': 2}),
+             (smp.NormalIndPower(), 'nobs1', {'ratio': 0.5}),
+             (smp.FTestAnovaPower(), 'nobs', {'k_groups': 3}),
+             (smp.GofChisquarePower(), 'nobs', {'n_bins': 4})]
+    for pow_cls, key, kwds_extra in cases:
+        kwds = {'effect_size': effect_size, 'alpha': alpha, 'power': 0.8,
+                key: None}
+        kwds.update(kwds_extra)
+        res = pow_cls.solve_power(**kwds)
+        assert_equal(res.shape, (2, 3))
+        assert_equal(pow_cls.cache_fit_res[0], np.ones((2, 3), bool))
+        for i in range(2):
+            for j in range(3):
+                kwds_ = dict(kwds, effect_size=effect_size[j],
+                             alpha=alpha[i, 0])
+                res_ = pow_cls.__class__().solve_power(**kwds_)
+                assert_allclose(res[i, j], res_, rtol=1e-5)
+        # roundtrip
+        kwds[key] = res
+        kwds.pop('power')
+        assert_allclose(pow_cls.power(**kwds), 0.8, rtol=1e-8)
+
+    # solve for effect_size, alpha and power
+    nobs = np.array([20, 50, 100])
+    tt = smp.TTestIndPower()
+    es = tt.solve_power(None, nobs, 0.05, 0.8)
+    for n, es_ in zip(nobs, es):
+        assert_allclose(es_, tt.solve_power(None, n, 0.05, 0.8), rtol=1e-4)
+    alpha = tt.solve_power(0.5, nobs, None, 0.8)
+    assert_allclose(tt.power(0.5, nobs, alpha), 0.8, rtol=1e-8)
+    assert_allclose(tt.solve_power(0.5, nobs, alpha, None), 0.8, rtol=1e-8)
+
+def test_solve_power_cache():
+    tt = smp.TTestIndPower()
+    es = np.linspace(0.2, 1, 5)
+    res = tt.solve_power(es, None, 0.05, 0.8)
+    # repeated parameters are solved once
+    res2 = tt.solve_power(np.repeat(es[None, :], 3, 0), None, 0.05, 0.8)
+    assert_equal(res2, np.repeat(res[None, :], 3, 0))
+    # cached values are returned as copies
+    res[:] = 0
+    assert_allclose(tt.solve_power(es, None, 0.05, 0.8), res2[0], rtol=1e-14)
+    assert_equal(len(tt._solve_cache), 2)
+    val = tt.solve_power(0.5, None, 0.05, 0.8)
+    assert_equal(tt.solve_power(0.5, None, 0.05, 0.8), val)
+    assert_equal(len(tt._solve_cache), 3)
+
+    # least recently used are dropped, the scalar and new array remain
+    tt.cache_maxsize = 6
+    tt.solve_power(es[::-1], None, 0.05, 0.8)
+    assert_equal(len(tt._solve_cache), 2)
+    assert_equal(tt._solve_cache_size, 6)
+    tt.cache_maxsize = 0
+    tt.solve_power(0.5, None, 0.05, 0.7)
+    assert_equal(len(tt._solve_cache), 0)
+
 if __name__ == '__main__':
     test_normal_power_explicit()
     nt = TestNormalIndPower1()
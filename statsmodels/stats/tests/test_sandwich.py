@@ -10,9 +10,9 @@ Created on Sat Dec 17 08:39:16 2011
 Author: Josef Perktold
 """
 import numpy as np
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_almost_equal, assert_equal
 
-from statsmodels.regression.linear_model import OLS, GLSAR
+from statsmodels.regression.linear_model import OLS, WLS, GLSAR
 from statsmodels.tools.tools import add_constant
 import statsmodels.stats.sandwich_covariance as sw
 #import statsmodels.sandbox.panel.sandwich_covariance_generic as swg
@@ -89,6 +89,147 @@ def test_hac_simple():
     cov4 = sw.cov_hac_simple(res_olsg, nlags=4, use_correction=False)
     assert_almost_equal(cov3, cov4, decimal=14)
 
+def test_cluster_groups_multiway():
+    import os
+    cur_dir = os.path.abspath(os.path.dirname(__file__))
+    pet = np.genfromtxt(os.path.join(cur_dir, "test_data.txt"))
+    endog = pet[:,-1]
+    group = pet[:,0].astype(int)
+    time = pet[:,1].astype(int)
+    res = OLS(endog, add_constant(pet[:,2])).fit()
+
+    cov01, covg, covt = sw.cov_cluster_2groups(res, group, group2=time)
+    groups = sw.ClusterGroups((group, time))
+    assert_almost_equal(sw.cov_cluster_multiway(res, groups), cov01,
+                        decimal=14)
+    sand = sw.SandwichCovariance(res)
+    assert_almost_equal(sand.cov_cluster(groups), cov01, decimal=14)
+    assert_almost_equal(sand.cov_cluster(groups.codes[0]), covg, decimal=14)
+    assert_almost_equal(sw.cov_cluster(res, sw.ClusterGroups(time)), covt,
+                        decimal=14)
+
+    # group sums in the order of the sorted labels, shuffled rows
+    rs = np.random.RandomState(12345)
+    idx = rs.permutation(len(endog))
+    x = rs.randn(len(endog), 2)
+    groups = sw.ClusterGroups(np.column_stack((group, time))[idx])
+    assert_almost_equal(groups.group_sums(x, dims=[1]),
+                        sw.group_sums(x, time[idx] - 1).T, decimal=12)
+    assert_almost_equal(groups.get_n_groups(), len(endog), decimal=14)
+
+    # three way clustering with a redundant dimension, firm within
+    # intersection is the same as firm by year for the inclusion-exclusion
+    cov3 = sw.cov_cluster_multiway(res, (group, time, group),
+                                   use_correction=False)
+    cov2 = sw.cov_cluster_2groups(res, group, group2=time,
+                                  use_correction=False)[0]
+    assert_almost_equal(cov3, cov2, decimal=14)
+
+    # panel HAC and Driscoll-Kraay with cached groups, data is sorted by
+    # firm and time
+    groupidx = [(i, i + 10) for i in range(0, len(endog), 10)]
+    assert_almost_equal(sand.cov_nw_panel(group, bandwidth=5),
+                        sw.cov_nw_panel(res, 4, groupidx), decimal=14)
+    assert_almost_equal(sand.cov_nw_groupsum(time, bandwidth=5),
+                        sw.cov_nw_groupsum(res, 4, time - 1), decimal=14)
+
+def test_cluster_list_wls():
+    rs = np.random.RandomState(3)
+    nobs = 100
+    exog = add_constant(rs.randn(nobs, 2))
+    endog = exog.sum(1) + rs.randn(nobs)
+    group = np.repeat(np.arange(20), 5)
+    res = WLS(endog, exog, weights=np.linspace(1, 3, nobs)).fit()
+
+    # a list of labels is one cluster dimension
+    assert_almost_equal(sw.cov_cluster(res, list(group)),
+                        sw.cov_cluster(res, group), decimal=14)
+    # scores of regression models use exog and resid
+    xu = exog * res.resid[:, None]
+    n_groups = 20.
+    corr = (n_groups / (n_groups - 1.)) * ((nobs - 1.) / (nobs - 3.))
+    S = sw.S_crosssection(xu, group)
+    cov = sw._HCCM2(res, S) * corr
+    assert_almost_equal(sw.cov_cluster(res, group), cov, decimal=14)
+
+def test_hac_kernels():
+    rs = np.random.RandomState(987)
+    x = rs.randn(300, 3)
+    for nlags in [0, 1, 5, 50, 299]:
+        S_loop = sw.S_hac_simple(x, nlags=nlags, use_fft=False)
+        S_fft = sw.S_hac_simple(x, nlags=nlags, use_fft=True)
+        assert_almost_equal(S_fft, S_loop, decimal=10)
+
+    assert_almost_equal(sw.kernel_weights('bartlett', 5, 6),
+                        np.r_[sw.weights_bartlett(4), 0, 0], decimal=14)
+    assert_almost_equal(sw.kernel_weights('uniform', 5, 6),
+                        np.r_[sw.weights_uniform(4), 0, 0], decimal=14)
+    assert_almost_equal(sw.weights_parzen(3), [1, 0.71875, 0.25, 0.03125],
+                        decimal=14)
+    assert_almost_equal(sw.weights_qs(0), [1], decimal=14)
+    assert_almost_equal(sw.S_hac_kernel(x, bandwidth=3),
+                        sw.S_hac_simple(x, nlags=2), decimal=14)
+    assert_almost_equal(sw.S_hac_kernel(x), sw.S_hac_simple(x), decimal=14)
+
+    # QS uses all lags
+    w = sw.kernel_weights('qs', 4.5, 299)
+    S = w[0] * np.dot(x.T, x)
+    for lag in range(1, 300):
+        s = np.dot(x[lag:].T, x[:-lag])
+        S += w[lag] * (s + s.T)
+    assert_almost_equal(sw.S_hac_kernel(x, kernel='qs', bandwidth=4.5), S,
+                        decimal=10)
+
+    # Newey-West (1994) plug-in, rate of the default rule for bartlett
+    h = x.sum(1)
+    n_pre = int(np.floor(4 * (3.)**(2./9)))
+    sigma = [np.dot(h[j:], h[:300 - j]) for j in range(n_pre + 1)]
+    s0 = sigma[0] + 2 * np.sum(sigma[1:])
+    s1 = 2 * np.dot(np.arange(1, n_pre + 1), sigma[1:])
+    bw = 1.1447 * ((s1 / s0)**2)**(1. / 3) * 300**(1. / 3)
+    assert_almost_equal(sw.hac_bandwidth(x), bw, decimal=12)
+    sand = sw.SandwichCovariance(scores=x, hessian_inv=np.eye(3))
+    assert_almost_equal(sand.cov_hac(bandwidth='auto', use_correction=False),
+                        sw.S_hac_kernel(x, bandwidth=bw), decimal=12)
+    assert_almost_equal(sand.bandwidth, bw, decimal=12)
+
+    # quadratic spectral kernel, q = 2 and 3 (T/100)^(2/25) preliminary lags
+    n_pre = int(np.floor(3 * (3.)**(2./25)))
+    assert_equal(n_pre, 3)
+    sigma = [np.dot(h[j:], h[:300 - j]) for j in range(n_pre + 1)]
+    s0 = sigma[0] + 2 * np.sum(sigma[1:])
+    s2 = 2 * np.dot(np.arange(1, n_pre + 1)**2, sigma[1:])
+    bw_qs = 1.3221 * ((s2 / s0)**2)**(1. / 5) * 300**(1. / 5)
+    assert_almost_equal(sw.hac_bandwidth(x, kernel='qs'), bw_qs, decimal=12)
+
+def test_cov_scores_glm_logit():
+    from statsmodels.genmod.generalized_linear_model import GLM
+    from statsmodels.genmod import families
+    from statsmodels.discrete.discrete_model import Logit
+    rs = np.random.RandomState(5)
+    nobs = 500
+    exog = add_constant(rs.randn(nobs, 2))
+    endog = exog.sum(1) + rs.randn(nobs)
+    group = rs.randint(0, 40, size=nobs)
+
+    res_ols = OLS(endog, exog).fit()
+    res_glm = GLM(endog, exog).fit()
+    assert_almost_equal(sw.cov_cluster(res_glm, group),
+                        sw.cov_cluster(res_ols, group), decimal=12)
+    assert_almost_equal(sw.cov_white_simple(res_glm, use_correction=False),
+                        sw.cov_hc0(res_ols), decimal=12)
+
+    endog = (endog > 1).astype(float)
+    res_logit = Logit(endog, exog).fit(disp=0)
+    res_glm = GLM(endog, exog, family=families.Binomial()).fit()
+    assert_almost_equal(sw.cov_cluster(res_logit, group),
+                        sw.cov_cluster(res_glm, group), decimal=8)
+    score = res_logit.model.jac(res_logit.params)
+    hinv = res_logit.normalized_cov_params
+    assert_almost_equal(sw.cov_white_simple(res_logit, use_correction=False),
+                        np.dot(hinv, np.dot(score.T, score)).dot(hinv),
+                        decimal=12)
+
 if __name__ == '__main__':
     import nose
     nose.runmodule(argv=[__file__, '-vvs', '-x'], exit=False)
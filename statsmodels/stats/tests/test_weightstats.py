@@ -19,7 +19,8 @@ import numpy as np
 from scipy import stats
 from numpy.testing import assert_almost_equal, assert_equal, assert_allclose
 from statsmodels.stats.weightstats import \
-                DescrStatsW, CompareMeans, ttest_ind, ztest, zconfint
+                DescrStatsW, DescrStatsWAccumulator, CompareMeans, \
+                ttest_ind, ztest, zconfint
 #import statsmodels.stats.weightstats as smws
 
 class Holder(object):
@@ -337,6 +338,104 @@ class TestWeightstats2d_nobs(CheckWeightstats2dMixin):
         self.x1r = self.d1w.asrepeats()
         self.x2r = self.d2w.asrepeats()
 
+def _accumulate(x, w, ddof, chunksize=7):
+    # two accumulators with chunked updates, merged
+    nsplit = len(x) // 2
+    acc = DescrStatsWAccumulator()
+    for start in range(0, nsplit, chunksize):
+        stop = min(start + chunksize, nsplit)
+        acc.update(x[start:stop], weights=w[start:stop])
+    acc2 = DescrStatsWAccumulator()
+    for start in range(nsplit, len(x), chunksize):
+        acc2.update(x[start:start + chunksize],
+                    weights=w[start:start + chunksize])
+    return acc.merge(acc2).get_descrstats(ddof=ddof)
+
+
+class TestWeightstats1d_accumulator(CheckWeightstats1dMixin):
+
+    @classmethod
+    def setup_class(self):
+        np.random.seed(9876789)
+        n1, n2 = 20,20
+        m1, m2 = 1, 1.2
+        x1 = m1 + np.random.randn(n1, 1)
+        x2 = m2 + np.random.randn(n2, 1)
+        w1 = np.random.randint(1,4, n1)
+        w2 = np.random.randint(1,4, n2)
+
+        self.x1, self.x2 = x1, x2
+        self.w1, self.w2 = w1, w2
+        self.d1w = _accumulate(x1, w1, ddof=1)
+        self.d2w = _accumulate(x2, w2, ddof=1)
+        self.x1r = DescrStatsW(x1, weights=w1).asrepeats()
+        self.x2r = DescrStatsW(x2, weights=w2).asrepeats()
+
+
+class TestWeightstats2d_accumulator(CheckWeightstats2dMixin):
+
+    @classmethod
+    def setup_class(self):
+        np.random.seed(9876789)
+        n1, n2 = 20,30
+        m1, m2 = 1, 1.2
+        x1 = m1 + np.random.randn(n1, 3)
+        x2 = m2 + np.random.randn(n2, 3)
+        w1 = np.random.randint(1,4, n1)
+        w2 = np.random.randint(1,4, n2)
+
+        self.x1, self.x2 = x1, x2
+        self.w1, self.w2 = w1, w2
+        self.d1w = _accumulate(x1, w1, ddof=0)
+        self.d2w = _accumulate(x2, w2, ddof=1)
+        self.x1r = DescrStatsW(x1, weights=w1).asrepeats()
+        self.x2r = DescrStatsW(x2, weights=w2).asrepeats()
+
+
+def test_accumulator():
+    np.random.seed(987125)
+    x = 1e6 + np.random.randn(500, 2)
+    w = np.random.randint(1, 4, 500)
+    d1 = DescrStatsW(x[:, 0], weights=w, ddof=1)
+    d2 = DescrStatsW(x, weights=w, ddof=1)
+
+    # one observation at a time, Welford
+    acc = DescrStatsWAccumulator()
+    for xi, wi in zip(x[:, 0], w):
+        acc.update(np.atleast_1d(xi), weights=[wi])
+    res1 = acc.get_descrstats(ddof=1)
+    assert_equal(np.ndim(res1.mean), 0)
+    assert_allclose(res1.sum_weights, d1.sum_weights, rtol=1e-13)
+    assert_allclose(res1.mean, d1.mean, rtol=1e-13)
+    assert_allclose(res1.var, d1.var, rtol=1e-9)
+    assert_allclose(res1.ttest_mean(1e6), d1.ttest_mean(1e6), rtol=1e-6)
+    assert_allclose(res1.zconfint_mean(), d1.zconfint_mean(), rtol=1e-13)
+
+    # merge of chunked accumulators, without cross products
+    accs = [DescrStatsWAccumulator(cov=False).update(x[i:i+100], w[i:i+100])
+            for i in range(0, 500, 100)]
+    acc = DescrStatsWAccumulator(cov=False)
+    for acc_i in accs:
+        acc.merge(acc_i)
+    res2 = acc.get_descrstats(ddof=1)
+    assert_allclose(res2.mean, d2.mean, rtol=1e-13)
+    assert_allclose(res2.std, d2.std, rtol=1e-9)
+    assert_allclose(res2.std_mean, d2.std_mean, rtol=1e-9)
+    # cov=False does not have the cross products
+    np.testing.assert_raises(ValueError, getattr, res2, 'cov')
+    np.testing.assert_raises(ValueError, getattr, res2, 'corrcoef')
+    cm_acc = CompareMeans(res2, res1)
+    cm = CompareMeans(d2, d1)
+    assert_allclose(cm_acc.ttest_ind(usevar='unequal'),
+                    cm.ttest_ind(usevar='unequal'), rtol=1e-6, atol=1e-6)
+
+    acc_cov = DescrStatsWAccumulator().update(x, w)
+    assert_allclose(acc_cov.get_descrstats(ddof=1).cov, d2.cov, rtol=1e-9)
+    np.testing.assert_raises(ValueError, acc_cov.merge, accs[0])
+    np.testing.assert_raises(ValueError,
+                             DescrStatsWAccumulator().get_descrstats)
+
+
 def test_ttest_ind_with_uneq_var():
 
     #from scipy
@@ -112,6 +112,49 @@ class DescrStatsW(object):
             self.weights = np.asarray(weights).squeeze().astype(float)
         self.ddof = ddof
 
+    @classmethod
+    def from_moments(cls, sum_weights, mean, sumsquares, cov_sumsquares=None,
+                     ddof=0):
+        '''create an instance from summary statistics without the data
+
+        Parameters
+        ----------
+        sum_weights : float
+            sum of the weights, number of observations for case weights
+        mean : float or ndarray
+            weighted mean of each variable
+        sumsquares : float or ndarray
+            weighted sum of squares of the demeaned data of each variable
+        cov_sumsquares : None or ndarray
+            weighted cross products of the demeaned data. If given, then
+            `cov` and `corrcoef` are available.
+        ddof : int
+            degrees of freedom correction used for second moments
+
+        Returns
+        -------
+        d : instance of DescrStatsW
+            The descriptive statistics, tests and confidence intervals are
+            available, methods that need the data, like `asrepeats`, are
+            not.
+
+        See Also
+        --------
+        DescrStatsWAccumulator
+        '''
+        self = cls.__new__(cls)
+        self.data = None
+        self.weights = None
+        self.ddof = ddof
+        # set the attributes of the OneTimeProperty
+        self.sum_weights = sum_weights
+        self.nobs = sum_weights
+        self.mean = mean
+        self.sum = mean * sum_weights
+        self.sumsquares = sumsquares
+        if cov_sumsquares is not None:
+            self.cov = cov_sumsquares / (sum_weights - ddof)
+        return self
 
     @OneTimeProperty
     def sum_weights(self):
@@ -201,6 +244,11 @@ class DescrStatsW(object):
         assumes variables in columns and observations in rows
         uses default ddof
         '''
+        if self.data is None:
+            # instance created by from_moments without cov_sumsquares
+            raise ValueError('the covariance was not accumulated, use '
+                             'DescrStatsWAccumulator(cov=True) or give '
+                             'cov_sumsquares to from_moments')
         cov_ = np.dot(self.weights * self.demeaned.T, self.demeaned)
         cov_ /= (self.sum_weights - self.ddof)
         return cov_
@@ -515,6 +563,170 @@ class DescrStatsW(object):
 
 
 
+class DescrStatsWAccumulator(object):
+    '''one-pass weighted means, variances and covariances of streamed data
+
+    The data can be added in chunks with `update`, and accumulators of
+    separate parts of the data, for example from different files or
+    workers, can be combined with `merge`. The combination of the chunk
+    statistics uses the pairwise updating formulas of Chan, Golub and
+    LeVeque, which are numerically stable. No data is kept in memory.
+
+    Parameters
+    ----------
+    cov : bool
+        If True (default), then the weighted cross products of all pairs of
+        variables are accumulated for the covariance matrix, otherwise only
+        the sums of squares of each variable.
+
+    Attributes
+    ----------
+    sum_weights : float
+        sum of the weights of all observations so far
+    mean : ndarray
+        weighted mean of each variable
+    comoment : ndarray
+        weighted cross products, or sums of squares if cov is False, of the
+        data demeaned by the weighted mean
+
+    Examples
+    --------
+    >>> acc = DescrStatsWAccumulator()
+    >>> for x, w in chunks:
+    ...     acc.update(x, weights=w)
+    >>> acc.merge(acc_other)
+    >>> d1 = acc.get_descrstats(ddof=1)
+    >>> d1.ttest_mean(0)
+
+    Notes
+    -----
+    For chunk sizes of one observation this reduces to Welford's algorithm.
+
+    References
+    ----------
+    Chan, Tony F., Gene H. Golub, and Randall J. LeVeque. 1983. "Algorithms
+    for Computing the Sample Variance: Analysis and Recommendations."
+    The American Statistician 37 (3): 242-247.
+    '''
+
+    def __init__(self, cov=True):
+        self.use_cov = cov
+        self.sum_weights = 0.
+        self.mean = None
+        self.comoment = None
+        self._ndim = None
+
+    def update(self, data, weights=None):
+        '''add a chunk of data
+
+        Parameters
+        ----------
+        data : array_like, 1-D or 2-D
+            observations in rows, variables in columns. The number of
+            variables has to be the same in all chunks.
+        weights : None or 1-D array_like
+            weights for each observation
+
+        Returns
+        -------
+        self : the updated instance
+        '''
+        data = np.asarray(data, dtype=float)
+        ndim = data.ndim
+        x = data.reshape(data.shape[0], -1)
+        if weights is None:
+            w = np.ones(x.shape[0])
+        else:
+            w = np.asarray(weights, dtype=float).ravel()
+        sum_weights = w.sum()
+        if sum_weights == 0:
+            return self
+
+        # two-pass statistics of the chunk
+        mean = np.dot(w, x) / sum_weights
+        xd = x - mean
+        if self.use_cov:
+            comoment = np.dot(xd.T * w, xd)
+        else:
+            comoment = np.dot(w, xd**2)
+        self._combine(sum_weights, mean, comoment, ndim)
+        return self
+
+    def merge(self, other):
+        '''add the statistics of another accumulator
+
+        Parameters
+        ----------
+        other : instance of DescrStatsWAccumulator
+
+        Returns
+        -------
+        self : the updated instance
+        '''
+        if other.sum_weights == 0:
+            return self
+        if other.use_cov != self.use_cov:
+            raise ValueError('both accumulators need the same cov option')
+        self._combine(other.sum_weights, other.mean, other.comoment,
+                      other._ndim)
+        return self
+
+    def _combine(self, sum_weights, mean, comoment, ndim):
+        if self.sum_weights == 0:
+            self.sum_weights = sum_weights
+            self.mean = mean.copy()
+            self.comoment = comoment.copy()
+            self._ndim = ndim
+            return
+        if mean.shape != self.mean.shape:
+            raise ValueError('number of variables does not match')
+
+        sum_weights_total = self.sum_weights + sum_weights
+        delta = mean - self.mean
+        if self.use_cov:
+            cross = np.outer(delta, delta)
+        else:
+            cross = delta**2
+        self.comoment += comoment + cross * (self.sum_weights * sum_weights /
+                                             sum_weights_total)
+        self.mean += delta * (sum_weights / sum_weights_total)
+        self.sum_weights = sum_weights_total
+
+    def get_descrstats(self, ddof=0):
+        '''descriptive statistics and tests of the accumulated data
+
+        Parameters
+        ----------
+        ddof : int
+            default ddof, degrees of freedom correction used for second
+            moments, var, std, cov, corrcoef.
+
+        Returns
+        -------
+        d : instance of DescrStatsW
+            instance without data, see `DescrStatsW.from_moments`, that
+            can be used for the one sample tests and confidence intervals
+            and in `CompareMeans`.
+        '''
+        if self.sum_weights == 0:
+            raise ValueError('no data has been added')
+        if self.use_cov:
+            sumsquares = np.diag(self.comoment).copy()
+            cov_sumsquares = self.comoment.copy()
+        else:
+            sumsquares = self.comoment.copy()
+            cov_sumsquares = None
+        mean = self.mean.copy()
+        if self._ndim == 1:
+            # same shapes as DescrStatsW with 1-D data
+            mean, sumsquares = mean[0], sumsquares[0]
+            if cov_sumsquares is not None:
+                cov_sumsquares = cov_sumsquares[0, 0]
+        return DescrStatsW.from_moments(self.sum_weights, mean, sumsquares,
+                                        cov_sumsquares=cov_sumsquares,
+                                        ddof=ddof)
+
+
 def _tstat_generic(value1, value2, std_diff, dof, alternative, diff=0):
     '''generic ttest to save typing'''
 
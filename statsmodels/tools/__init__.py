@@ -1,4 +1,7 @@
-from tools import add_constant, categorical
-
 from statsmodels import NoseWrapper as Tester
 test = Tester().test
+
+# add_constant and categorical are imported on first access
+from .lazy import lazy_module as _lazy_module
+_lazy_module(__name__, attributes=[
+    ('statsmodels.tools.tools', ['add_constant', 'categorical'])])
@@ -1,12 +1,167 @@
 from numpy.testing import assert_equal
+import threading
 import warnings
+import weakref
+from statsmodels.compatnp.collections import OrderedDict
 
-__all__ = ['resettable_cache','cache_readonly', 'cache_writable']
+__all__ = ['resettable_cache','cache_readonly', 'cache_writable',
+           'set_cache_budget', 'cache_usage']
 
 class CacheWriteWarning(UserWarning):
     pass
 
 
+def _nbytes(value):
+    """memory of an array, or of the arrays in a tuple or list, in bytes"""
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(val) for val in value)
+    nbytes = getattr(value, 'nbytes', 0)
+    return nbytes if isinstance(nbytes, (int, long)) else 0
+
+
+class _CacheBudget(object):
+    """
+    Least recently used entries of all caches with a global memory budget
+
+    Only computed values of cached attributes with at least `min_nbytes`
+    bytes are tracked. If the total exceeds `max_bytes`, then the least
+    recently used values are evicted from their caches.
+
+    The budget is shared by all threads. The updates are guarded by a
+    reentrant lock, evicting a value calls back into the budget and the
+    weak reference callbacks can run while the lock is held.
+    """
+
+    def __init__(self):
+        self.max_bytes = None
+        self.min_nbytes = 2**20
+        self.nbytes = 0
+        # (id of cache, key) -> nbytes, least recently used first
+        self._entries = OrderedDict()
+        # id of cache -> (weak reference to cache, set of keys)
+        self._caches = {}
+        self._lock = threading.RLock()
+
+    def add(self, cache, key, nbytes):
+        if self.max_bytes is None or nbytes < self.min_nbytes:
+            return
+        cid = id(cache)
+        with self._lock:
+            if cid not in self._caches:
+                ref = weakref.ref(cache, lambda ref: self._remove_cache(cid))
+                self._caches[cid] = (ref, set())
+            self.discard(cache, key)
+            self._entries[(cid, key)] = nbytes
+            self._caches[cid][1].add(key)
+            self.nbytes += nbytes
+            self.enforce(keep=(cid, key))
+
+    def touch(self, cache, key):
+        entry = (id(cache), key)
+        with self._lock:
+            nbytes = self._entries.pop(entry, None)
+            if nbytes is not None:
+                self._entries[entry] = nbytes
+
+    def discard(self, cache, key):
+        cid = id(cache)
+        with self._lock:
+            nbytes = self._entries.pop((cid, key), None)
+            if nbytes is not None:
+                self.nbytes -= nbytes
+                self._caches[cid][1].discard(key)
+
+    def _remove_cache(self, cid):
+        # callback of the weak reference, the cache has been deleted
+        with self._lock:
+            ref, keys = self._caches.pop(cid, (None, ()))
+            for key in keys:
+                self.nbytes -= self._entries.pop((cid, key), 0)
+
+    def enforce(self, keep=None):
+        """evict least recently used values until the total is in budget"""
+        with self._lock:
+            while self.max_bytes is not None and self.nbytes > self.max_bytes:
+                for entry in self._entries:
+                    if entry != keep:
+                        break
+                else:
+                    # only the newest value is left, it is kept even if it
+                    # is larger than the budget
+                    return
+                cid, key = entry
+                cache = self._caches[cid][0]()
+                if cache is None:
+                    self._remove_cache(cid)
+                else:
+                    cache._evict_key(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._caches.clear()
+            self.nbytes = 0
+
+_budget = _CacheBudget()
+
+
+def set_cache_budget(max_bytes=None, min_nbytes=2**20):
+    """
+    Set a global memory budget for cached attributes of results
+
+    Parameters
+    ----------
+    max_bytes : int or None
+        Maximum total size in bytes of the tracked cached values of all
+        results instances. If it is exceeded, then the least recently used
+        values are removed from their cache and computed again when they are
+        used. None, the default, disables the budget.
+    min_nbytes : int
+        Only arrays with at least this size in bytes are tracked, e.g. the
+        nobs-sized resid and fittedvalues. Smaller values stay in the cache.
+
+    Returns
+    -------
+    previous : tuple
+        the previous max_bytes and min_nbytes
+
+    Notes
+    -----
+    Values that are computed before the budget is set are not tracked.
+    Values that are set directly, e.g. by remove_data or with cache_writable
+    attributes, are not evicted. Results whose data have been removed with
+    remove_data cannot compute evicted values again.
+
+    See Also
+    --------
+    cache_usage
+    """
+    with _budget._lock:
+        previous = (_budget.max_bytes, _budget.min_nbytes)
+        _budget.max_bytes = max_bytes
+        _budget.min_nbytes = min_nbytes
+        if max_bytes is None:
+            _budget.clear()
+        else:
+            _budget.enforce()
+    return previous
+
+
+def cache_usage():
+    """
+    Memory of the cached values that are tracked by the budget
+
+    Returns
+    -------
+    usage : dict
+        `nbytes`, the total size in bytes of the tracked values, `entries`,
+        the number of tracked values, and the settings `max_bytes` and
+        `min_nbytes`.
+    """
+    return {'nbytes': _budget.nbytes, 'entries': len(_budget._entries),
+            'max_bytes': _budget.max_bytes, 'min_nbytes': _budget.min_nbytes}
+
+
 class ResettableCache(dict):
     """
     Dictionary whose elements mey depend one from another.
@@ -41,24 +196,86 @@ class ResettableCache(dict):
     >>> print "Try deleting b"
     >>> del(cache['a'])
     >>> assert_equal(cache, {})
+
+    Notes
+    -----
+    Values that are computed by cached attributes are recorded with their
+    size, see `nbytes`. They can be removed with `evict` and are computed
+    again on the next access. A global budget for these values is set with
+    `set_cache_budget`.
     """
 
     def __init__(self, reset=None, **items):
         self._resetdict = reset or {}
+        # sizes of the values that were computed by cached attributes
+        self._nbytes = {}
         dict.__init__(self, **items)
 
     def __setitem__(self, key, value):
         dict.__setitem__(self, key, value)
         #if hasattr needed for unpickling with protocol=2
         if hasattr(self, '_resetdict'):
+            self._forget(key)
             for mustreset in self._resetdict.get(key, []):
                 self[mustreset] = None
 
     def __delitem__(self, key):
         dict.__delitem__(self, key)
+        self._forget(key)
         for mustreset in self._resetdict.get(key, []):
             del(self[mustreset])
 
+    def _forget(self, key):
+        # the value is not a computed value anymore
+        computed = getattr(self, '_nbytes', None)
+        if computed and key in computed:
+            del computed[key]
+            _budget.discard(self, key)
+
+    def _add_computed(self, key, value):
+        """set the value that was computed by a cached attribute"""
+        self[key] = value
+        nbytes = _nbytes(value)
+        if nbytes:
+            if not hasattr(self, '_nbytes'):
+                self._nbytes = {}
+            self._nbytes[key] = nbytes
+            _budget.add(self, key, nbytes)
+
+    def _evict_key(self, key):
+        # removing a computed value does not reset the values that depend on
+        # it, they are still valid
+        if key in self:
+            dict.__delitem__(self, key)
+        self._forget(key)
+
+    @property
+    def nbytes(self):
+        """total size in bytes of the computed values in the cache"""
+        return sum(getattr(self, '_nbytes', {}).values())
+
+    def evict(self, min_nbytes=0):
+        """
+        Remove computed values, they are computed again when they are used
+
+        Parameters
+        ----------
+        min_nbytes : int
+            only values with at least this size in bytes are removed
+
+        Returns
+        -------
+        nbytes : int
+            total size in bytes of the removed values
+        """
+        computed = getattr(self, '_nbytes', {})
+        keys = [key for key, nbytes in computed.items()
+                if nbytes >= min_nbytes]
+        total = sum(computed[key] for key in keys)
+        for key in keys:
+            self._evict_key(key)
+        return total
+
 #    def __getstate__(self):
 #        print 'pickling wrapper', self.__dict__
 #        return self.__dict__
@@ -95,10 +312,13 @@ class CachedAttribute(object):
             _cachedval = self.fget(obj)
             # Set the attribute in obj
 #            print "Setting %s in cache to %s" % (name, _cachedval)
-            try:
-                _cache[name] = _cachedval
-            except KeyError:
-                setattr(_cache, name, _cachedval)
+            if isinstance(_cache, ResettableCache):
+                _cache._add_computed(name, _cachedval)
+            else:
+                try:
+                    _cache[name] = _cachedval
+                except KeyError:
+                    setattr(_cache, name, _cachedval)
             # Update the reset list if needed (and possible)
             resetlist = self.resetlist
             if resetlist is not ():
@@ -106,8 +326,8 @@ class CachedAttribute(object):
                     _cache._resetdict[name] = self.resetlist
                 except AttributeError:
                     pass
-#        else:
-#            print "Reading %s from cache (%s)" % (name, _cachedval)
+        elif _budget.max_bytes is not None:
+            _budget.touch(_cache, name)
         return _cachedval
 
     def __set__(self, obj, value):
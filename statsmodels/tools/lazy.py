@@ -0,0 +1,100 @@
+'''Lazy loading of the attributes of api modules
+
+Python 2 does not support ``__getattr__`` for modules. `lazy_module`
+replaces a module in ``sys.modules`` by a LazyModule that has the same
+attributes, and that imports the lazy attributes when they are accessed
+for the first time. This keeps ``import statsmodels.api`` fast, only the
+models and functions that are used are imported.
+
+License: BSD-3
+'''
+
+import sys
+from types import ModuleType
+
+
+class LazyModule(ModuleType):
+    '''module that imports attributes on first access
+
+    Parameters
+    ----------
+    module : module
+        the original module, its attributes are copied
+    attributes : dict
+        maps attribute names to tuples (module name, attribute). The
+        attribute is a dotted name in the module, or None if the attribute
+        is the module itself.
+    '''
+
+    def __init__(self, module, attributes):
+        super(LazyModule, self).__init__(module.__name__)
+        self.__dict__.update(module.__dict__)
+        # the functions of the original module use its dict as globals, the
+        # dict is cleared if the module is garbage collected
+        self.__dict__['_LazyModule__module'] = module
+        self.__dict__['_LazyModule__attributes'] = attributes
+
+    def __getattr__(self, name):
+        # only called if the attribute is not found in __dict__
+        try:
+            modname, attr = self.__attributes[name]
+        except KeyError:
+            raise AttributeError("'module' object has no attribute '%s'"
+                                 % name)
+        __import__(modname)
+        value = sys.modules[modname]
+        if attr is not None:
+            for a in attr.split('.'):
+                value = getattr(value, a)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self.__attributes))
+
+
+def lazy_module(name, modules=None, attributes=None):
+    '''replace module `name` by a LazyModule
+
+    Parameters
+    ----------
+    name : string
+        name of the module, usually ``__name__``
+    modules : dict
+        maps attribute names to the full names of modules
+    attributes : list of tuples
+        each tuple is a module name and a list of attributes of that module.
+        An item of the list is either a name or a tuple of name and dotted
+        attribute in the module, e.g. ``('ols', 'OLS.from_formula')``
+
+    Returns
+    -------
+    module : LazyModule
+        the module that replaces the module `name` in ``sys.modules``
+
+    Notes
+    -----
+    If the module does not define ``__all__``, then it is set to all public
+    attributes, eager and lazy, so that ``from module import *`` still
+    imports all of them.
+    '''
+    lazy = {}
+    for alias, modname in (modules or {}).items():
+        lazy[alias] = (modname, None)
+    for modname, names in (attributes or []):
+        for attr in names:
+            if isinstance(attr, tuple):
+                alias, attr = attr
+            else:
+                alias = attr
+            lazy[alias] = (modname, attr)
+
+    module = sys.modules[name]
+    if not hasattr(module, '__all__'):
+        public = [k for k, v in module.__dict__.items()
+                  if not k.startswith('_') and
+                  getattr(v, '__module__', None) != __name__]
+        module.__all__ = sorted(set(public) | set(lazy))
+    lazy_mod = LazyModule(module, lazy)
+    sys.modules[name] = lazy_mod
+    return lazy_mod
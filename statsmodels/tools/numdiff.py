@@ -37,6 +37,27 @@ import numpy as np
 #NOTE: we only do double precision internally so far
 EPS = np.MachAr().eps
 
+# maximum number of parameter vectors in one call of a vectorized function
+_BLOCKSIZE = 256
+
+_batch_params_doc = """vectorized : bool
+        If True, then `f` is called with a 2-dim array that has one
+        perturbed parameter vector in each row, and it has to return the
+        function values with the rows in the first axis. Each call gets at
+        most 256 rows.
+    n_jobs : int
+        Number of jobs used to evaluate `f` in parallel with joblib. The
+        default 1 evaluates the function in a loop. If `vectorized` is also
+        True, then each job gets a block of rows.
+    backend : None or string
+        joblib backend used if `n_jobs` is not 1, e.g. 'threading' for
+        functions that release the GIL. The default is the default backend
+        of joblib."""
+
+_f0_param_doc = """f0 : None or float
+        function value at x if it is already known, e.g. the log-likelihood
+        at the same parameters"""
+
 _hessian_docs = """
     Calculate Hessian with finite difference derivative approximation
 
@@ -54,6 +75,7 @@ _hessian_docs = """
     kwargs : dict
         Keyword arguments for function `f`.
     %(extra_params)s
+    %(batch_params)s
 
     Returns
     -------
@@ -70,6 +92,10 @@ _hessian_docs = """
     where e[j] is a vector with element j == 1 and the rest are zero and
     d[i] is epsilon[i].
 
+    The perturbed points are created and evaluated in blocks of at most
+    256 points, so that the memory does not grow with the number of
+    evaluations. If the center x is needed, it is evaluated only once.
+
     References
     ----------:
 
@@ -91,7 +117,57 @@ def _get_epsilon(x, s, epsilon, n):
                         " shape as x.")
     return h
 
-def approx_fprime(x, f, epsilon=None, args=(), kwargs={}, centered=False):
+def _steps(h, idx):
+    '''rows idx of np.diag(h)'''
+    steps = np.zeros((len(idx), len(h)), dtype=h.dtype)
+    steps[np.arange(len(idx)), idx] = h[idx]
+    return steps
+
+def _evaluate(f, points, args=(), kwargs={}, vectorized=False):
+    '''function values for each row of points, rows in the first axis'''
+    if vectorized:
+        # blocks of rows limit the size of the temporary arrays in f
+        return np.concatenate([np.asarray(f(*((points[k:k+_BLOCKSIZE],) +
+                                              args), **kwargs))
+                               for k in range(0, len(points), _BLOCKSIZE)])
+    return np.array([f(*((xi,) + args), **kwargs) for xi in points])
+
+def _step_block(idx, x, h, f, args, kwargs, vectorized):
+    '''function values at x + h[k]*e[k] for k in idx'''
+    return _evaluate(f, x + _steps(h, idx), args, kwargs, vectorized)
+
+def _pair_block(i, j, x, hi, hj, f, args, kwargs, vectorized):
+    '''function values at x + hi[i]*e[i] + hj[j]*e[j] for the pairs (i, j)'''
+    return _evaluate(f, x + _steps(hi, i) + _steps(hj, j), args, kwargs,
+                     vectorized)
+
+def _evaluate_blocks(func, indices, fargs, n_jobs=1, backend=None):
+    '''
+    call func for consecutive blocks of the index arrays and concatenate
+
+    func is called as ``func(*(block of each index array) + fargs)`` and
+    creates the points of the block itself, so that at most _BLOCKSIZE
+    points exist at a time in each job.
+    '''
+    nitems = len(indices[0])
+    if nitems == 0:
+        return np.array([])
+    if n_jobs != 1:
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(func, n_jobs, verbose=0,
+                                                 backend=backend)
+    # at least one block for each job
+    size = min(_BLOCKSIZE, -(-nitems // max(n_jobs, 1)))
+    blocks = [tuple(index[start:start+size] for index in indices) + fargs
+              for start in range(0, nitems, size)]
+    if n_jobs == 1 or len(blocks) == 1:
+        values = [func(*block) for block in blocks]
+    else:
+        values = parallel(p_func(*block) for block in blocks)
+    return np.concatenate(values)
+
+def approx_fprime(x, f, epsilon=None, args=(), kwargs={}, centered=False,
+                  vectorized=False, n_jobs=1, backend=None, f0=None):
     '''
     Gradient of function, or Jacobian if function f returns 1d array
 
@@ -111,6 +187,10 @@ def approx_fprime(x, f, epsilon=None, args=(), kwargs={}, centered=False):
     centered : bool
         Whether central difference should be returned. If not, does forward
         differencing.
+    %s
+    f0 : None or float or array
+        function value at x if it is already known. It is only used by the
+        forward differences, centered differences do not evaluate f at x.
 
     Returns
     -------
@@ -124,28 +204,33 @@ def approx_fprime(x, f, epsilon=None, args=(), kwargs={}, centered=False):
     with the Jacobian of each observation with shape xk x nobs x xk. I.e.,
     the Jacobian of the first observation would be [:, 0, :]
     '''
+    x = np.asarray(x)
     n = len(x)
+    idx = np.arange(n)
+    fargs = (f, args, kwargs, vectorized)
     #TODO:  add scaled stepsize
-    f0 = f(*((x,)+args), **kwargs)
-    dim = np.atleast_1d(f0).shape # it could be a scalar
-    grad = np.zeros((n,) + dim, float)
-    ei = np.zeros((n,), float)
     if not centered:
         epsilon = _get_epsilon(x, 2, epsilon, n)
-        for k in range(n):
-            ei[k] = epsilon[k]
-            grad[k,:] = (f(*((x+ei,)+args), **kwargs) - f0)/epsilon[k]
-            ei[k] = 0.0
+        if f0 is None:
+            f0 = _evaluate(f, x[None, :], args, kwargs, vectorized)[0]
+        f0 = np.asarray(f0)
+        values = _evaluate_blocks(_step_block, (idx,), (x, epsilon) + fargs,
+                                  n_jobs, backend)
+        h = epsilon.reshape((n,) + (1,) * np.ndim(f0))
+        grad = (values - f0) / h
     else:
         epsilon = _get_epsilon(x, 3, epsilon, n) / 2.
-        for k in range(len(x)):
-            ei[k] = epsilon[k]
-            grad[k,:] = (f(*((x+ei,)+args), **kwargs) - \
-                         f(*((x-ei,)+args), **kwargs))/(2 * epsilon[k])
-            ei[k] = 0.0
-    return grad.squeeze().T
-
-def approx_fprime_cs(x, f, epsilon=None, args=(), kwargs={}):
+        fp = _evaluate_blocks(_step_block, (idx,), (x, epsilon) + fargs,
+                              n_jobs, backend)
+        fm = _evaluate_blocks(_step_block, (idx,), (x, -epsilon) + fargs,
+                              n_jobs, backend)
+        h = epsilon.reshape((n,) + (1,) * (fp.ndim - 1))
+        grad = (fp - fm) / (2 * h)
+    return grad.astype(float).squeeze().T
+approx_fprime.__doc__ = approx_fprime.__doc__ % _batch_params_doc
+
+def approx_fprime_cs(x, f, epsilon=None, args=(), kwargs={},
+                     vectorized=False, n_jobs=1, backend=None):
     '''
     Calculate gradient or Jacobian with complex step derivative approximation
 
@@ -162,6 +247,7 @@ def approx_fprime_cs(x, f, epsilon=None, args=(), kwargs={}):
         Tuple of additional arguments for function `f`.
     kwargs : dict
         Dictionary of additional keyword arguments for function `f`.
+    %s
 
     Returns
     -------
@@ -178,15 +264,19 @@ def approx_fprime_cs(x, f, epsilon=None, args=(), kwargs={}):
     #From Guilherme P. de Freitas, numpy mailing list
     #May 04 2010 thread "Improvement of performance"
     #http://mail.scipy.org/pipermail/numpy-discussion/2010-May/050250.html
+    x = np.asarray(x)
     n = len(x)
     epsilon = _get_epsilon(x, 1, epsilon, n)
-    increments = np.identity(n) * 1j * epsilon
-    #TODO: see if this can be vectorized, but usually dim is small
-    partials = [f(x+ih, *args, **kwargs).imag / epsilon[i]
-                for i,ih in enumerate(increments)]
-    return np.array(partials).T
-
-def approx_hess_cs(x, f, epsilon=None, args=(), kwargs={}):
+    values = _evaluate_blocks(_step_block, (np.arange(n),),
+                              (x, 1j * epsilon, f, args, kwargs, vectorized),
+                              n_jobs, backend)
+    h = epsilon.reshape((n,) + (1,) * (values.ndim - 1))
+    partials = values.imag / h
+    return partials.T
+approx_fprime_cs.__doc__ = approx_fprime_cs.__doc__ % _batch_params_doc
+
+def approx_hess_cs(x, f, epsilon=None, args=(), kwargs={}, vectorized=False,
+                   n_jobs=1, backend=None):
     '''Calculate Hessian with complex-step derivative approximation
 
     Parameters
@@ -212,48 +302,50 @@ def approx_hess_cs(x, f, epsilon=None, args=(), kwargs={}):
     The stepsize is the same for the complex and the finite difference part.
     '''
     #TODO: might want to consider lowering the step for pure derivatives
+    x = np.asarray(x)
     n = len(x)
     h = _get_epsilon(x, 3, epsilon, n)
-    ee = np.diag(h)
     hess = np.outer(h,h)
+    i, j = np.triu_indices(n)
+    fargs = (f, args, kwargs, vectorized)
 
-    n = len(x)
-
-    for i in range(n):
-        for j in range(i,n):
-            hess[i,j] = (f(*((x + 1j*ee[i,:] + ee[j,:],)+args), **kwargs)
-                    - f(*((x + 1j*ee[i,:] - ee[j,:],)+args), **kwargs)).imag/\
-                       2./hess[i,j]
-            hess[j,i] = hess[i,j]
+    fp = _evaluate_blocks(_pair_block, (i, j), (x, 1j*h, h) + fargs,
+                          n_jobs, backend).reshape(-1)
+    fm = _evaluate_blocks(_pair_block, (i, j), (x, 1j*h, -h) + fargs,
+                          n_jobs, backend).reshape(-1)
+    hess[i,j] = (fp - fm).imag/2./hess[i,j]
+    hess[j,i] = hess[i,j]
 
     return hess
 approx_hess_cs.__doc__ = "Calculate Hessian with complex-step derivative " +\
                          "approximation\n" +\
                          "\n".join(_hessian_docs.split("\n")[1:]) % dict(
                                  scale="3", extra_params="",
+                                 batch_params=_batch_params_doc,
                                  extra_returns="", equation_number="10",
 equation = """1/(2*d_j*d_k) * imag(f(x + i*d[j]*e[j] + d[k]*e[k]) -
                      f(x + i*d[j]*e[j] - d[k]*e[k]))
 """)
 
-def approx_hess1(x, f, epsilon=None, args=(), kwargs={}, return_grad=False):
+def approx_hess1(x, f, epsilon=None, args=(), kwargs={}, return_grad=False,
+                 vectorized=False, n_jobs=1, backend=None, f0=None):
+    x = np.asarray(x)
     n = len(x)
     h = _get_epsilon(x, 3, epsilon, n)
-    ee = np.diag(h)
+    i, j = np.triu_indices(n)
+    fargs = (f, args, kwargs, vectorized)
 
-    f0 = f(*((x,)+args), **kwargs)
-    # Compute forward step
-    g = np.zeros(n);
-    for i in range(n):
-        g[i] = f(*((x+ee[i,:],)+args), **kwargs)
+    # f0, forward step and "double" forward step
+    if f0 is None:
+        f0 = _evaluate(f, x[None, :], args, kwargs, vectorized).reshape(-1)[0]
+    g = _evaluate_blocks(_step_block, (np.arange(n),), (x, h) + fargs,
+                         n_jobs, backend).reshape(-1)
+    fpp = _evaluate_blocks(_pair_block, (i, j), (x, h, h) + fargs,
+                           n_jobs, backend).reshape(-1)
 
     hess = np.outer(h,h) # this is now epsilon**2
-    # Compute "double" forward step
-    for i in range(n):
-        for j in range(i,n):
-            hess[i,j] = (f(*((x + ee[i,:] + ee[j,:],) + args), **kwargs) - \
-                         g[i] - g[j] + f0)/hess[i,j]
-            hess[j,i] = hess[i,j]
+    hess[i,j] = (fpp - g[i] - g[j] + f0)/hess[i,j]
+    hess[j,i] = hess[i,j]
     if return_grad:
         grad = (g - f0)/h
         return hess, grad
@@ -263,7 +355,8 @@ def approx_hess1(x, f, epsilon=None, args=(), kwargs={}, return_grad=False):
 approx_hess1.__doc__ = _hessian_docs % dict(scale="3",
 extra_params = """return_grad : bool
         Whether or not to also return the gradient
-""",
+    """ + _f0_param_doc,
+batch_params = _batch_params_doc,
 extra_returns = """grad : nparray
         Gradient if return_grad == True
 """,
@@ -271,30 +364,34 @@ equation_number = "7",
 equation = """1/(d_j*d_k) * ((f(x + d[j]*e[j] + d[k]*e[k]) - f(x + d[j]*e[j])))
 """)
 
-def approx_hess2(x, f, epsilon=None, args=(), kwargs={}, return_grad=False):
+def approx_hess2(x, f, epsilon=None, args=(), kwargs={}, return_grad=False,
+                 vectorized=False, n_jobs=1, backend=None, f0=None):
     #
+    x = np.asarray(x)
     n = len(x)
     #NOTE: ridout suggesting using eps**(1/4)*theta
     h = _get_epsilon(x, 3, epsilon, n)
-    ee = np.diag(h)
-    f0 = f(*((x,)+args), **kwargs)
-    # Compute forward step
-    g = np.zeros(n)
-    gg = np.zeros(n)
-    for i in range(n):
-        g[i] = f(*((x+ee[i,:],)+args), **kwargs)
-        gg[i] = f(*((x-ee[i,:],)+args), **kwargs)
+    i, j = np.triu_indices(n)
+    idx = np.arange(n)
+    fargs = (f, args, kwargs, vectorized)
+
+    # f0, forward and backward steps, "double" forward and backward steps
+    if f0 is None:
+        f0 = _evaluate(f, x[None, :], args, kwargs, vectorized).reshape(-1)[0]
+    g = _evaluate_blocks(_step_block, (idx,), (x, h) + fargs,
+                         n_jobs, backend).reshape(-1)
+    gg = _evaluate_blocks(_step_block, (idx,), (x, -h) + fargs,
+                          n_jobs, backend).reshape(-1)
+    fpp = _evaluate_blocks(_pair_block, (i, j), (x, h, h) + fargs,
+                           n_jobs, backend).reshape(-1)
+    fmm = _evaluate_blocks(_pair_block, (i, j), (x, -h, -h) + fargs,
+                           n_jobs, backend).reshape(-1)
 
     hess = np.outer(h,h) # this is now epsilon**2
-    # Compute "double" forward step
-    for i in range(n):
-        for j in range(i,n):
-            hess[i,j] = (f(*((x + ee[i,:] + ee[j,:],) + args), **kwargs) - \
-                         g[i] - g[j] + f0 + \
-                         f(*((x - ee[i,:] - ee[j,:],) + args), **kwargs) - \
-                         gg[i] - gg[j] + f0
-                         )/(2*hess[i,j])
-            hess[j,i] = hess[i,j]
+    hess[i,j] = (fpp - g[i] - g[j] + f0 +
+                 fmm - gg[i] - gg[j] + f0
+                 )/(2*hess[i,j])
+    hess[j,i] = hess[i,j]
     if return_grad:
         grad = (g - f0)/h
         return hess, grad
@@ -303,7 +400,8 @@ def approx_hess2(x, f, epsilon=None, args=(), kwargs={}, return_grad=False):
 approx_hess2.__doc__ = _hessian_docs % dict(scale="3",
 extra_params = """return_grad : bool
         Whether or not to also return the gradient
-""",
+    """ + _f0_param_doc,
+batch_params = _batch_params_doc,
 extra_returns = """grad : nparray
         Gradient if return_grad == True
 """,
@@ -314,24 +412,39 @@ equation = """1/(2*d_j*d_k) * ((f(x + d[j]*e[j] + d[k]*e[k]) - f(x + d[j]*e[j]))
                  (f(x - d[k]*e[k]) - f(x)))
 """)
 
-def approx_hess3(x, f, epsilon=None, args=(), kwargs={}):
+def approx_hess3(x, f, epsilon=None, args=(), kwargs={}, vectorized=False,
+                 n_jobs=1, backend=None, f0=None):
+    x = np.asarray(x)
     n = len(x)
     h = _get_epsilon(x, 4, epsilon, n)
-    ee = np.diag(h)
     hess = np.outer(h,h)
-
-    for i in range(n):
-        for j in range(i,n):
-            hess[i,j] = (f(*((x + ee[i,:] + ee[j,:],)+args), **kwargs)
-                             - f(*((x + ee[i,:] - ee[j,:],)+args), **kwargs)
-                          - (f(*((x - ee[i,:] + ee[j,:],)+args), **kwargs)
-                          - f(*((x - ee[i,:] - ee[j,:],)+args), **kwargs),)
-                          )/(4.*hess[i,j])
-            hess[j,i] = hess[i,j]
+    i, j = np.triu_indices(n)
+    fargs = (f, args, kwargs, vectorized)
+
+    fpp = _evaluate_blocks(_pair_block, (i, j), (x, h, h) + fargs,
+                           n_jobs, backend).reshape(-1)
+    fmm = _evaluate_blocks(_pair_block, (i, j), (x, -h, -h) + fargs,
+                           n_jobs, backend).reshape(-1)
+    # the mixed steps of the diagonal are the center x, evaluated once
+    off = i != j
+    fpm = np.empty(len(i), fpp.dtype)
+    fmp = np.empty(len(i), fpp.dtype)
+    if f0 is None and not off.all():
+        f0 = _evaluate(f, x[None, :], args, kwargs, vectorized).reshape(-1)[0]
+    fpm[~off] = fmp[~off] = f0
+    fpm[off] = _evaluate_blocks(_pair_block, (i[off], j[off]),
+                                (x, h, -h) + fargs, n_jobs,
+                                backend).reshape(-1)
+    fmp[off] = _evaluate_blocks(_pair_block, (i[off], j[off]),
+                                (x, -h, h) + fargs, n_jobs,
+                                backend).reshape(-1)
+    hess[i,j] = (fpp - fpm - (fmp - fmm))/(4.*hess[i,j])
+    hess[j,i] = hess[i,j]
     return hess
 
-approx_hess3.__doc__ = _hessian_docs % dict(scale="4", extra_params="",
-        extra_returns="", equation_number = "9",
+approx_hess3.__doc__ = _hessian_docs % dict(scale="4",
+        extra_params=_f0_param_doc,
+        batch_params=_batch_params_doc, extra_returns="", equation_number = "9",
 equation = """1/(4*d_j*d_k) * ((f(x + d[j]*e[j] + d[k]*e[k]) - f(x + d[j]*e[j]
                                                      - d[k]*e[k])) -
                  (f(x - d[j]*e[j] + d[k]*e[k]) - f(x - d[j]*e[j]
@@ -11,7 +11,7 @@ changes for statsmodels (Josef Perktold)
 '''
 
 
-def parallel_func(func, n_jobs, verbose=5):
+def parallel_func(func, n_jobs, verbose=5, backend=None):
     """Return parallel instance with delayed function
 
     Util function to use joblib only if available
@@ -24,6 +24,9 @@ def parallel_func(func, n_jobs, verbose=5):
         Number of jobs to run in parallel
     verbose: int
         Verbosity level
+    backend: None or string
+        joblib backend, e.g. 'threading'. If None, then the default backend
+        of joblib is used.
 
     Returns
     -------
@@ -48,7 +51,10 @@ def parallel_func(func, n_jobs, verbose=5):
         except ImportError:
             from sklearn.externals.joblib import Parallel, delayed
 
-        parallel = Parallel(n_jobs, verbose=verbose)
+        if backend is None:
+            parallel = Parallel(n_jobs, verbose=verbose)
+        else:
+            parallel = Parallel(n_jobs, backend=backend, verbose=verbose)
         my_func = delayed(func)
 
         if n_jobs == -1:
@@ -0,0 +1,180 @@
+'''Mixed precision products with single precision data
+
+Models with ``precision='mixed'`` store exog in float32, which halves the
+memory of the design and the memory bandwidth of each pass over it. The
+products with the design, X'X, X'y, X b and the score and hessian of the
+discrete models, are accumulated in float64 over chunks of rows, so the
+temporary float64 copies are bounded by the chunk size. Least squares
+problems are solved by the normal equations in float64 with iterative
+refinement.
+
+The results are the float64 results for the design rounded to float32. They
+differ from the float64 results for the original design by the effect of
+this rounding, a relative change of at most 2**-24 in each element of exog.
+For designs with a moderate condition number, params and bse agree with the
+float64 results to a relative tolerance of about ``cond(exog) * 1e-7``, e.g.
+1e-6 for standardized regressors.
+
+The functions fall back to the plain numpy products if the arrays have the
+same precision, so they can be used in the models for any data.
+
+License: BSD-3
+'''
+
+import numpy as np
+
+# number of rows that are converted to float64 at a time
+_CHUNKSIZE = 2**14
+
+
+def _upcast(x, other):
+    '''True if a product of x with other would copy x to higher precision'''
+    return np.result_type(x, other) != x.dtype
+
+
+def dot(x, params, chunksize=_CHUNKSIZE):
+    '''
+    x times params, in chunks of rows if x has lower precision than params
+
+    Parameters
+    ----------
+    x : ndarray, 2d
+        data, e.g. exog in float32
+    params : ndarray, 1d or 2d
+    chunksize : int
+        number of rows in a chunk
+
+    Returns
+    -------
+    prod : ndarray
+        ``np.dot(x, params)`` without a copy of x in the precision of params
+    '''
+    x = np.asarray(x)
+    params = np.asarray(params)
+    if x.ndim != 2 or not _upcast(x, params) or len(x) <= chunksize:
+        return np.dot(x, params)
+    prod = np.empty((len(x),) + params.shape[1:],
+                    dtype=np.result_type(x, params))
+    for start in range(0, len(x), chunksize):
+        prod[start:start+chunksize] = np.dot(x[start:start+chunksize],
+                                             params)
+    return prod
+
+
+def tdot(x, v, chunksize=_CHUNKSIZE):
+    '''
+    x transposed times v, accumulated in chunks of rows if x has lower
+    precision than v
+
+    Parameters
+    ----------
+    x : ndarray, 2d
+        data, e.g. exog in float32
+    v : ndarray, 1d or 2d
+        with the same number of rows as x
+
+    Returns
+    -------
+    prod : ndarray
+        ``np.dot(v.T, x).T``, e.g. the score ``X'(y - mu)``
+    '''
+    v = np.asarray(v)
+    if not _upcast(x, v) or len(x) <= chunksize:
+        return np.dot(v.T, x).T
+    prod = 0
+    for start in range(0, len(x), chunksize):
+        stop = start + chunksize
+        prod = prod + np.dot(v[start:stop].T, x[start:stop]).T
+    return prod
+
+
+def gram(x, weights=None, chunksize=_CHUNKSIZE):
+    '''
+    x' diag(weights) x, accumulated in float64 in chunks of rows
+
+    Parameters
+    ----------
+    x : ndarray, 2d
+        data, e.g. exog in float32
+    weights : None or ndarray, 1d
+        weights of the rows, e.g. the variance weights of the hessian
+
+    Returns
+    -------
+    xtx : ndarray, 2d
+        float64 array of shape (k, k)
+    '''
+    if x.dtype == np.float64 or len(x) <= chunksize:
+        x64 = np.asarray(x, dtype=np.float64)
+        if weights is None:
+            return np.dot(x64.T, x64)
+        return np.dot(weights * x64.T, x64)
+    k = x.shape[1]
+    xtx = np.zeros((k, k))
+    for start in range(0, len(x), chunksize):
+        chunk = x[start:start+chunksize].astype(np.float64)
+        if weights is None:
+            xtx += np.dot(chunk.T, chunk)
+        else:
+            xtx += np.dot(weights[start:start+chunksize] * chunk.T, chunk)
+    return xtx
+
+
+def lstsq(x, y, weights=None, normalized_cov_params=None, maxiter=3,
+          tol=1e-12, chunksize=_CHUNKSIZE):
+    '''
+    Weighted least squares by the normal equations with iterative refinement
+
+    Parameters
+    ----------
+    x : ndarray, 2d
+        design, e.g. exog in float32
+    y : ndarray, 1d
+        float64 response
+    weights : None or ndarray, 1d
+        weights of the rows, the solution minimizes the sum of
+        ``weights * (y - x b)**2``
+    normalized_cov_params : None or ndarray
+        pseudoinverse of the weighted gram matrix if it is already known
+    maxiter : int
+        maximum number of refinement steps
+    tol : float
+        the refinement stops if the largest correction relative to the
+        largest parameter is smaller than tol
+    chunksize : int
+        number of rows in a chunk
+
+    Returns
+    -------
+    params : ndarray
+        float64 solution
+    normalized_cov_params : ndarray
+        ``pinv(x' diag(weights) x)``
+    n_iter : int
+        number of refinement steps
+
+    Notes
+    -----
+    Each refinement step computes the residual ``y - x b`` and the correction
+    from ``x' diag(weights)`` times the residual in float64. The refinement
+    removes the rounding error of solving the normal equations, so that the
+    accuracy of params is that of a solution by QR.
+    '''
+    if normalized_cov_params is None:
+        normalized_cov_params = np.linalg.pinv(gram(x, weights,
+                                                    chunksize=chunksize))
+    wy = y if weights is None else weights * y
+    params = np.dot(normalized_cov_params,
+                    tdot(x, wy, chunksize=chunksize))
+    n_iter = 0
+    while n_iter < maxiter:
+        resid = y - dot(x, params, chunksize=chunksize)
+        if weights is not None:
+            resid *= weights
+        delta = np.dot(normalized_cov_params,
+                       tdot(x, resid, chunksize=chunksize))
+        params += delta
+        n_iter += 1
+        if np.max(np.abs(delta)) <= tol * np.max(np.abs(params)):
+            break
+    return params, normalized_cov_params, n_iter
@@ -0,0 +1,318 @@
+'''Profiling of the fit methods of models
+
+The fit methods of the models are instrumented, but the instrumentation is
+only active inside a `FitProfiler` context. Each fit that runs in the context
+produces a record with the total wall time, the time and the number of calls
+of the stages of the fit, e.g. the optimizer and the loglike, score and
+hessian evaluations, the number of iterations and a convergence trace.
+
+>>> from statsmodels.tools.profiling import FitProfiler
+>>> with FitProfiler() as prof:
+...     res = sm.GLM(endog, exog, family=sm.families.Poisson()).fit()
+>>> prof.records[0]['stages']['wls']['count']
+>>> prof.to_frame()
+
+The record is also attached to the results, as ``mle_retvals['profile']``
+if the results have `mle_retvals`, and as ``fit_history['profile']`` if the
+results have a `fit_history`.
+
+Fits that are called inside of a profiled fit, e.g. the WLS fits in the
+iterations of GLM, are not recorded separately, their stages are added to the
+record of the outer fit.
+
+Memory is measured by the peak resident set size of the process, which is
+not available on all platforms. The increase of the peak within a stage is
+an upper bound for the size of the temporary arrays that are allocated in
+the stage, but it is zero if the memory that was freed before could be
+reused.
+
+Profilers are local to a thread, a profiler records the fits that run in the
+thread in which its context was entered.
+
+License: BSD-3
+'''
+
+import sys
+import time
+import threading
+from functools import wraps
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+class _ThreadState(threading.local):
+    '''profilers that are active and stack of running fits of a thread'''
+    def __init__(self):
+        self.profilers = []
+        self.running = []
+
+_state = _ThreadState()
+
+
+def _maxrss():
+    '''peak resident set size of the process in MB, nan if not available'''
+    if resource is None:
+        return np.nan
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on OSX, kilobytes on other unix
+    if sys.platform == 'darwin':
+        return maxrss / 2.**20
+    return maxrss / 2.**10
+
+
+class _Stage(object):
+    '''context manager that adds the time of a block to a stage'''
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def __enter__(self):
+        self._t0 = time.time()
+        self._rss0 = _maxrss()
+        return self
+
+    def __exit__(self, *exc):
+        stats = self.stats
+        stats['time'] += time.time() - self._t0
+        stats['count'] += 1
+        stats['maxrss_increase'] = max(stats['maxrss_increase'],
+                                       _maxrss() - self._rss0)
+        return False
+
+
+class _NullStage(object):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FitTrace(object):
+    '''
+    Record of one fit, used by the fit methods to add to the record
+
+    Parameters
+    ----------
+    model : Model instance
+    fit : string
+        name of the fit, e.g. ``'GLM.fit'``
+    '''
+
+    def __init__(self, model, fit):
+        self.record = {'model': model.__class__.__name__, 'fit': fit,
+                       'method': None, 'time': 0., 'stages': {},
+                       'iterations': 0, 'trace': [], 'converged': None,
+                       'maxrss': np.nan, 'maxrss_increase': np.nan}
+        self._t0 = time.time()
+        self._rss0 = _maxrss()
+        # number of nested fits that are running
+        self._depth = 0
+
+    def stage(self, name):
+        '''context manager that records the time of a stage'''
+        stages = self.record['stages']
+        if name not in stages:
+            stages[name] = {'time': 0., 'count': 0, 'maxrss_increase': 0.}
+        return _Stage(stages[name])
+
+    def counted(self, name, func):
+        '''wraps func so that each call is recorded in stage `name`'''
+        def counted_func(*args, **kwds):
+            with self.stage(name):
+                return func(*args, **kwds)
+        return counted_func
+
+    def iteration(self, criterion=None):
+        '''count an iteration and add the convergence criterion to the trace
+        '''
+        self.record['iterations'] += 1
+        if criterion is not None:
+            self.record['trace'].append(float(criterion))
+
+    def wrap_callback(self, callback, start_params):
+        '''optimizer callback that also records the iterations
+
+        The trace is the maximum absolute change of the parameters.
+        '''
+        last = [np.asarray(start_params, dtype=float)]
+        def trace_callback(xk, *args):
+            params = np.array(xk, dtype=float)
+            self.iteration(np.max(np.abs(params - last[0])))
+            last[0] = params
+            if callback is not None:
+                return callback(xk, *args)
+        return trace_callback
+
+    def update(self, **kwds):
+        '''set items of the record, e.g. method and converged
+
+        Nested fits cannot change the items.
+        '''
+        if not self._depth:
+            self.record.update(kwds)
+
+    def _finish(self):
+        record = self.record
+        record['time'] = time.time() - self._t0
+        record['maxrss'] = _maxrss()
+        record['maxrss_increase'] = record['maxrss'] - self._rss0
+        if record['converged'] is not None:
+            record['converged'] = bool(record['converged'])
+        return record
+
+
+class _NullTrace(object):
+    '''trace that does not record, used if no profiler is active'''
+
+    record = None
+    _stage = _NullStage()
+
+    def stage(self, name):
+        return self._stage
+
+    def counted(self, name, func):
+        return func
+
+    def iteration(self, criterion=None):
+        pass
+
+    def wrap_callback(self, callback, start_params):
+        return callback
+
+    def update(self, **kwds):
+        pass
+
+
+_null_trace = _NullTrace()
+
+
+def current_trace():
+    '''the trace of the running fit, a trace that does nothing if no fit is
+    profiled'''
+    if _state.running:
+        return _state.running[-1]
+    return _null_trace
+
+
+def _attach(results, record):
+    results = getattr(results, '_results', results)
+    for name in ['mle_retvals', 'fit_history']:
+        value = getattr(results, name, None)
+        if isinstance(value, dict):
+            value['profile'] = record
+            return
+
+
+def fit_profiling(fit):
+    '''decorator for fit methods that records the fit if a profiler is active
+    '''
+    @wraps(fit)
+    def profiled_fit(self, *args, **kwds):
+        if not _state.profilers:
+            return fit(self, *args, **kwds)
+        if _state.running:
+            # stages of nested fits are added to the running outer fit
+            _state.running[-1]._depth += 1
+            try:
+                return fit(self, *args, **kwds)
+            finally:
+                _state.running[-1]._depth -= 1
+        trace = FitTrace(self, '%s.%s' % (self.__class__.__name__,
+                                          fit.__name__))
+        _state.running.append(trace)
+        try:
+            results = fit(self, *args, **kwds)
+        finally:
+            _state.running.pop()
+            record = trace._finish()
+            for profiler in list(_state.profilers):
+                profiler._add(record)
+        _attach(results, record)
+        return results
+    return profiled_fit
+
+
+class FitProfiler(object):
+    '''
+    Context manager that records the fits of models
+
+    Parameters
+    ----------
+    callback : callable, optional
+        called with the record of each fit when the fit is finished
+
+    Attributes
+    ----------
+    records : list of dict
+        one record for each fit in the context. The items are `model`, `fit`,
+        `method`, `time`, the total wall time in seconds, `iterations`,
+        `trace`, the change of the convergence criterion, e.g. of the params
+        or the deviance, in each iteration, `converged`,
+        `maxrss` and `maxrss_increase`, the peak resident set size of the
+        process and its increase during the fit in MB, and `stages`. Stages
+        is a dictionary that contains for each stage the `time`, the number
+        of calls, `count`, and `maxrss_increase`. Stages can be nested, for
+        example the time of the optimizer includes the time of the loglike
+        calls.
+
+    Notes
+    -----
+    Fits are recorded by all active profilers, the profilers can be nested.
+    '''
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.records = []
+
+    def __enter__(self):
+        _state.profilers.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        _state.profilers.remove(self)
+        return False
+
+    def _add(self, record):
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+    def to_records(self):
+        '''
+        flat records with one row for each fit and stage
+
+        Returns
+        -------
+        records : list of dict
+            The items are `fit_id`, the index of the fit in `records`,
+            `model`, `fit`, `method`, `stage`, `time`, `count` and
+            `maxrss_increase`. The row with stage ``'total'`` has the total of
+            the fit, its count is the number of iterations.
+        '''
+        rows = []
+        for i, record in enumerate(self.records):
+            common = {'fit_id': i, 'model': record['model'],
+                      'fit': record['fit'], 'method': record['method']}
+            row = dict(common, stage='total', time=record['time'],
+                       count=record['iterations'],
+                       maxrss_increase=record['maxrss_increase'])
+            rows.append(row)
+            for name in sorted(record['stages']):
+                row = dict(common, stage=name)
+                row.update(record['stages'][name])
+                rows.append(row)
+        return rows
+
+    def to_frame(self):
+        '''records as pandas DataFrame, see `to_records`'''
+        from pandas import DataFrame
+        columns = ['fit_id', 'model', 'fit', 'method', 'stage', 'time',
+                   'count', 'maxrss_increase']
+        return DataFrame(self.to_records(), columns=columns)
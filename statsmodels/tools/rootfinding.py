@@ -224,6 +224,198 @@ def brentq_expanding(func, low=None, upp=None, args=(), xtol=1e-5,
     else:
         return res
 
+def brentq_expanding_vec(func, n, low=None, upp=None, start_low=None,
+                         start_upp=None, increasing=None, xtol=1e-10,
+                         rtol=1e-12, max_it=100, maxiter=200, factor=10):
+    '''find the roots of n monotonic functions by expanding and regula falsi
+
+    This is an elementwise vectorized version of ``brentq_expanding``. All
+    n problems are solved simultaneously with array operations: the
+    bracketing intervals are expanded as in ``brentq_expanding`` and the
+    roots are then found with the Illinois variant of regula falsi,
+    with a bisection step whenever the bracket shrinks by less than half,
+    instead of brentq.
 
+    Parameters
+    ----------
+    func : callable
+        ``func(x, idx)`` evaluates the functions with indices ``idx`` at
+        the array ``x`` of the same length and returns an array.
+    n : int
+        number of functions or problems
+    low, upp : None, float or array
+        lower and upper bound, see ``brentq_expanding``
+    start_low, start_upp : None, float or array
+        starting bounds for the expansion, see ``brentq_expanding``
+    increasing : None, bool or array of bool
+        If None, then this is determined separately for each function
+        from the initial bounds.
+    xtol, rtol : float
+        absolute and relative tolerance for the width of the bracket
+    max_it : int
+        maximum number of expansion steps.
+    maxiter : int
+        maximum number of regula falsi iterations.
+    factor : float
+        expansion factor for step of shifting the bounds interval, default
+        is 10.
+
+    Returns
+    -------
+    x : ndarray
+        roots of the functions, nan if no root was found.
+    converged : ndarray, bool
+        True for the elements that converged.
+
+    Notes
+    -----
+    Elements for which the functions returns nan at the bounds, or for
+    which the expansion did not find a sign change, are not converged.
+    '''
+    idx_all = np.arange(n)
+    def f(x, idx):
+        return np.asarray(func(x, idx), dtype=float) * np.ones(len(idx))
+
+    ones = np.ones(n)
+    low_given, upp_given = low is not None, upp is not None
+    if upp_given:
+        su = upp * ones
+    elif start_upp is not None:
+        if np.any(np.asarray(start_upp) < 0):
+            raise ValueError('start_upp needs to be positive')
+        su = start_upp * ones
+    else:
+        su = ones.copy()
 
+    if low_given:
+        sl = low * ones
+    elif start_low is not None:
+        if np.any(np.asarray(start_low) > 0):
+            raise ValueError('start_low needs to be negative')
+        sl = start_low * ones
+    else:
+        sl = np.minimum(-1., su - 1.)
 
+    # need sl < su
+    if not upp_given:
+        su = np.maximum(su, sl + 1.)
+
+    if (not low_given or not upp_given) and increasing is None:
+        f_low = f(sl, idx_all)
+        f_upp = f(su, idx_all)
+        # special case for functions that are symmetric around zero
+        symm = (np.abs(f_upp - f_low) < 1e-15) & (sl == -1) & (su == 1)
+        if symm.any():
+            sl[symm] = 1e-8
+            f_low[symm] = f(sl[symm], np.nonzero(symm)[0])
+        # possibly func returns nan, try 3 more points
+        delta = su - sl
+        for fraction in [0.25, 0.5, 0.75]:
+            nan_low = np.nonzero(np.isnan(f_low))[0]
+            if len(nan_low):
+                f_low[nan_low] = f(sl[nan_low] + fraction * delta[nan_low],
+                                   nan_low)
+            nan_upp = np.nonzero(np.isnan(f_upp))[0]
+            if len(nan_upp):
+                f_upp[nan_upp] = f(su[nan_upp] + fraction * delta[nan_upp],
+                                   nan_upp)
+        increasing = f_low < f_upp
+    elif increasing is None:
+        # bracket is given, the direction does not matter
+        increasing = True
+    increasing = np.ones(n, bool) & increasing
+
+    # left has negative and right has positive function value
+    left = np.where(increasing, sl, su)
+    right = np.where(increasing, su, sl)
+    left_given = np.where(increasing, low_given, upp_given)
+    right_given = np.where(increasing, upp_given, low_given)
+
+    expand = np.nonzero(~left_given & (left != 0))[0]
+    fx = f(left[expand], expand)
+    for n_it in range(max_it):
+        # condition is also false if func returns nan
+        move = fx > 0
+        if not move.any():
+            break
+        expand, fx = expand[move], fx[move]
+        right[expand] = left[expand]
+        right_given[expand] = True
+        left[expand] *= factor
+        fx = f(left[expand], expand)
+
+    expand = np.nonzero(~right_given & (right != 0))[0]
+    fx = f(right[expand], expand)
+    for n_it in range(max_it):
+        move = fx < 0
+        if not move.any():
+            break
+        expand, fx = expand[move], fx[move]
+        left[expand] = right[expand]
+        right[expand] *= factor
+        fx = f(right[expand], expand)
+
+    return _illinois_vec(f, left, right, xtol=xtol, rtol=rtol,
+                         maxiter=maxiter)
+
+def _illinois_vec(f, a, b, xtol=1e-10, rtol=1e-12, maxiter=200, fa=None,
+                  fb=None):
+    '''elementwise Illinois regula falsi on the brackets [a, b]
+
+    f(x, idx) is the vectorized function of the elements idx. fa and fb are
+    the function values at a and b if they are already known. Returns the
+    roots and the convergence indicator.
+    '''
+    n = len(a)
+    a, b = np.array(a, dtype=float), np.array(b, dtype=float)
+    idx_all = np.arange(n)
+    fa = f(a, idx_all) if fa is None else np.array(fa, dtype=float)
+    fb = f(b, idx_all) if fb is None else np.array(fb, dtype=float)
+    x = np.empty(n)
+    x.fill(np.nan)
+    converged = np.zeros(n, bool)
+    for root, f_root in [(a, fa), (b, fb)]:
+        zero = f_root == 0
+        x[zero] = root[zero]
+        converged |= zero
+    # no sign change or nan at the bounds cannot be solved
+    active = np.nonzero(~converged & (fa * fb < 0))[0]
+    side = np.zeros(n, int)
+    width = np.abs(b - a)
+    bisect = np.zeros(n, bool)
+    for it in range(maxiter):
+        if len(active) == 0:
+            break
+        ai, bi, fai, fbi = a[active], b[active], fa[active], fb[active]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            c = bi - fbi * (bi - ai) / (fbi - fai)
+        c = np.where(np.isfinite(c) & ~bisect[active], c, (ai + bi) / 2.)
+        # guard against rounding outside of the bracket
+        c = np.clip(c, np.minimum(ai, bi), np.maximum(ai, bi))
+        fc = f(c, active)
+
+        # c replaces the bound with the same sign, the function value at
+        # the other bound is halved if it is retained twice in a row
+        b_side = np.sign(fc) == np.sign(fbi)
+        a_side = np.sign(fc) == np.sign(fai)
+        ib, ia = active[b_side], active[a_side]
+        b[ib], fb[ib] = c[b_side], fc[b_side]
+        fa[ib[side[ib] == -1]] /= 2.
+        side[ib] = -1
+        a[ia], fa[ia] = c[a_side], fc[a_side]
+        fb[ia[side[ia] == 1]] /= 2.
+        side[ia] = 1
+
+        x[active] = c
+        width_new = np.abs(b[active] - a[active])
+        bisect[active] = width_new > 0.5 * width[active]
+        width[active] = width_new
+        done = (fc == 0) | (width_new <= xtol + rtol * np.abs(c))
+        converged[active[done]] = True
+        # nan function value, not solved
+        failed = ~done & ~(a_side | b_side)
+        x[active[failed]] = np.nan
+        active = active[~done & ~failed]
+
+    x[~converged] = np.nan
+    return x, converged
@@ -0,0 +1,155 @@
+'''Tests for the size accounting and eviction of the results cache
+
+'''
+
+import gc
+import threading
+
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_, assert_equal, assert_allclose
+
+import statsmodels.api as sm
+from statsmodels.tools.decorators import (resettable_cache, cache_readonly,
+                                          set_cache_budget, cache_usage)
+
+
+class Example(object):
+
+    def __init__(self, n):
+        self._cache = resettable_cache()
+        self.n = n
+        self.calls = 0
+
+    @cache_readonly
+    def a(self):
+        self.calls += 1
+        return np.ones(self.n)
+
+    @cache_readonly
+    def b(self):
+        return self.a.sum()
+
+
+def test_resettable_cache():
+    ex = Example(1000)
+    ex.b
+    cache = ex._cache
+    # b is a numpy scalar
+    assert_equal(cache.nbytes, 8008)
+    assert_equal(cache.evict(min_nbytes=10**4), 0)
+    assert_equal(cache.evict(min_nbytes=8000), 8000)
+    assert_equal(cache.nbytes, 8)
+    assert_('a' not in cache)
+    assert_equal(cache['b'], 1000)
+    assert_allclose(ex.a, 1)
+    assert_equal(ex.calls, 2)
+
+    # values that are set directly are not evicted
+    cache['a'] = np.zeros(1000)
+    assert_equal(cache.nbytes, 8)
+    assert_equal(cache.evict(min_nbytes=8000), 0)
+    assert_equal(ex.a, 0)
+
+
+class TestBudget(object):
+
+    @classmethod
+    def setup_class(cls):
+        rs = np.random.RandomState(0)
+        cls.exog = sm.add_constant(rs.randn(1000, 3))
+        cls.endog = cls.exog.sum(1) + rs.randn(1000)
+
+    def setup(self):
+        self.previous = set_cache_budget(3 * 8000, min_nbytes=8000)
+
+    def teardown(self):
+        set_cache_budget(*self.previous)
+
+    def test_lru(self):
+        results = [sm.OLS(self.endog, self.exog).fit() for _ in range(3)]
+        for res in results:
+            res.resid
+        assert_equal(cache_usage()['nbytes'], 3 * 8000)
+        assert_equal(cache_usage()['entries'], 3)
+        results[0].resid
+        results[1].fittedvalues
+        # resid of the second results was least recently used
+        assert_(all('resid' in res._cache for res in results[::2]))
+        assert_('resid' not in results[1]._cache)
+        assert_equal(cache_usage()['nbytes'], 3 * 8000)
+        # evicted values are computed again
+        assert_allclose(results[1].resid, results[0].resid)
+
+        # the budget is released when results are deleted
+        del results, res
+        gc.collect()
+        assert_equal(cache_usage()['nbytes'], 0)
+        assert_equal(cache_usage()['entries'], 0)
+
+    def test_small_values(self):
+        res = sm.OLS(self.endog, self.exog).fit()
+        res.resid, res.bse
+        large = [key for key, nbytes in res._cache._nbytes.items()
+                 if nbytes >= 8000]
+        assert_('resid' in large)
+        assert_('bse' not in large)
+        assert_equal(cache_usage()['entries'], len(large))
+        res.evict_cache(min_nbytes=8000)
+        assert_equal(cache_usage()['entries'], 0)
+        assert_('resid' not in res._cache)
+        assert_('bse' in res._cache)
+
+    def test_wrapper(self):
+        endog = pd.Series(self.endog)
+        res = sm.OLS(endog, self.exog).fit()
+        resid = res.resid
+        assert_(isinstance(resid, pd.Series))
+        # the wrapped value of an evictable array is not memoized
+        assert_('resid' not in res._wrapped_cache)
+        res.params
+        assert_('params' in res._wrapped_cache)
+        assert_(res.evict_cache() > 0)
+        assert_equal(res._wrapped_cache, {})
+        assert_allclose(res.resid, resid)
+
+    def test_glm_discrete(self):
+        family = sm.families.Poisson()
+        endog = np.round(np.exp(0.1 * self.endog))
+        res_glm = sm.GLM(endog, self.exog, family=family).fit()
+        res_poi = sm.Poisson(endog, self.exog).fit(disp=0)
+        resid_pearson = res_glm.resid_pearson.copy()
+        resid = res_poi.resid.copy()
+        res_glm.resid_deviance
+        assert_(cache_usage()['nbytes'] <= 3 * 8000)
+        assert_allclose(res_glm.resid_pearson, resid_pearson)
+        assert_allclose(res_poi.resid, resid)
+
+    def test_disable(self):
+        res = sm.OLS(self.endog, self.exog).fit()
+        res.resid
+        set_cache_budget(None)
+        assert_equal(cache_usage()['nbytes'], 0)
+        assert_('resid' in res._cache)
+        assert_equal(res._cache.nbytes, 8000)
+
+    def test_threads(self):
+        results = [sm.OLS(self.endog, self.exog).fit() for _ in range(8)]
+
+        def use(res):
+            for _ in range(50):
+                res.resid, res.fittedvalues, res.wresid
+
+        threads = [threading.Thread(target=use, args=(res,))
+                   for res in results]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        usage = cache_usage()
+        tracked = sum(nbytes for res in results
+                      for key, nbytes in res._cache._nbytes.items()
+                      if key in res._cache and nbytes >= 8000)
+        assert_equal(usage['nbytes'], 3 * 8000)
+        assert_equal(usage['nbytes'], tracked)
+        assert_allclose(results[-1].resid, results[0].resid)
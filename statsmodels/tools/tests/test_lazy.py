@@ -0,0 +1,88 @@
+'''Tests for lazy loading of the api modules and import time benchmark
+
+Run as a script to print the import times.
+'''
+
+import sys
+import subprocess
+
+from numpy.testing import assert_, assert_equal
+
+import statsmodels.api as sm
+import statsmodels.formula.api as smf
+import statsmodels.graphics.api as smg
+import statsmodels.stats.api as sms
+import statsmodels.tsa.api as smt
+
+# import time of statsmodels.api relative to importing OLS directly, which
+# imports numpy, scipy and pandas
+IMPORT_TIME_RATIO_MAX = 0.5
+
+_heavy = ['pandas', 'patsy', 'matplotlib', 'scipy.stats',
+          'statsmodels.regression', 'statsmodels.tsa.arima_model',
+          'statsmodels.graphics.gofplots']
+
+_timer = '''\
+import sys, time
+t0 = time.time()
+import %s
+t1 = time.time() - t0
+print t1
+print ' '.join(m for m in %r if m in sys.modules)
+'''
+
+
+def import_time(module, nrep=3):
+    '''best time of nrep imports of module in a new python process
+
+    returns the import time and the list of heavy modules that were imported
+    '''
+    times = []
+    for _ in range(nrep):
+        proc = subprocess.Popen([sys.executable, '-c',
+                                 _timer % (module, _heavy)],
+                                stdout=subprocess.PIPE)
+        out = proc.communicate()[0]
+        assert_equal(proc.returncode, 0)
+        out = out.splitlines()
+        times.append(float(out[0]))
+    return min(times), out[1].split()
+
+
+def test_lazy_names():
+    for mod in [sm, smf, smg, sms, smt]:
+        for name in mod.__all__:
+            assert_(getattr(mod, name) is not None)
+            assert_(name in dir(mod))
+    assert_(sm.tsa is smt)
+    assert_(sm.stats is sms)
+    assert_(sm.formula.ols == sm.OLS.from_formula)
+    assert_(sm.add_constant is sm.tools.add_constant)
+    assert_(sm.load is sm.iolib.smpickle.load_pickle)
+    # the models are also in formula.api
+    assert_(smf.OLS is sm.OLS)
+    assert_(smf.QuantReg.from_formula == smf.quantreg)
+    # the helper is not exported
+    for mod in [sm, smf, smg, sms, smt, sm.tools, sm.formula]:
+        assert_(not hasattr(mod, 'lazy_module'))
+    try:
+        sm.not_a_name
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError('AttributeError not raised')
+
+
+def test_import_time():
+    t_api, imported = import_time('statsmodels.api')
+    assert_equal(imported, [])
+    t_ols = import_time('statsmodels.regression.linear_model')[0]
+    assert_(t_api < IMPORT_TIME_RATIO_MAX * t_ols, (t_api, t_ols))
+
+
+if __name__ == '__main__':
+    for module in ['numpy', 'statsmodels.api', 'statsmodels.formula.api',
+                   'statsmodels.tsa.api', 'statsmodels.stats.api',
+                   'statsmodels.regression.linear_model',
+                   'statsmodels.tsa.arima_model']:
+        print '%-40s %8.4f' % (module, import_time(module)[0])
@@ -8,7 +8,8 @@ Should Hessian also work per observation, if fun returns 2d
 '''
 
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_allclose
+from numpy.testing import (assert_almost_equal, assert_allclose,
+                           assert_equal)
 import statsmodels.api as sm
 from statsmodels.tools import numdiff
 from statsmodels.tools.numdiff import (approx_fprime, approx_fprime_cs,
@@ -285,6 +286,124 @@ class TestDerivativeFun1(CheckDerivativeMixin):
         return (-x*2*(y-np.dot(x, params))[:,None])  #TODO: check shape
 
 
+def fun2_batch(params, y, x):
+    # fun2 for a stack of parameter vectors, one in each row
+    return ((y[:,None] - np.dot(x, params.T))**2).sum(0)
+
+class TestBatched(object):
+    @classmethod
+    def setup_class(cls):
+        np.random.seed(187678)
+        cls.x = np.random.randn(200, 4)
+        cls.y = np.dot(cls.x, np.ones(4)) + 0.1*np.random.randn(200)
+        cls.params = np.array([1., 0.5, -1., 2.])
+        cls.args = (cls.y, cls.x)
+
+    def test_vectorized(self):
+        params, args = self.params, self.args
+        for func in [numdiff.approx_fprime, numdiff.approx_fprime_cs,
+                     numdiff.approx_hess1, numdiff.approx_hess2,
+                     numdiff.approx_hess3, numdiff.approx_hess_cs]:
+            res = func(params, fun2, args=args)
+            res_v = func(params, fun2_batch, args=args, vectorized=True)
+            # function values differ in rounding, forward differences are
+            # not precise
+            assert_allclose(res_v, res, rtol=1e-3, atol=0.1)
+            res_p = func(params, fun2, args=args, n_jobs=2,
+                         backend='threading')
+            assert_equal(res_p, res)
+        jac = approx_fprime(params, fun1, args=args, centered=True)
+        jac_p = approx_fprime(params, fun1, args=args, centered=True,
+                              n_jobs=2, backend='threading')
+        assert_equal(jac_p, jac)
+
+    def test_evaluations(self):
+        # identical points, the center in approx_hess3, are evaluated once
+        points = []
+        def f(params):
+            points.append(params)
+            return fun2(params, *self.args)
+        he = numdiff.approx_hess3(self.params, f)
+        k = len(self.params)
+        assert_equal(len(points), 2 * k * (k + 1) - 2 * k + 1)
+        assert_allclose(he, 2 * np.dot(self.x.T, self.x), rtol=1e-5)
+
+    def test_blocks(self):
+        # points are created in blocks, a vectorized f never gets more
+        # than _BLOCKSIZE rows
+        nrows = []
+        def f(params):
+            nrows.append(len(params))
+            return fun2_batch(params, *self.args)
+        blocksize = numdiff._BLOCKSIZE
+        try:
+            numdiff._BLOCKSIZE = 2
+            he = numdiff.approx_hess3(self.params, f, vectorized=True)
+        finally:
+            numdiff._BLOCKSIZE = blocksize
+        assert_equal(max(nrows), 2)
+        assert_allclose(he, 2 * np.dot(self.x.T, self.x), rtol=1e-5)
+
+    def test_generic_model(self):
+        from statsmodels.base.model import GenericLikelihoodModel
+        x, y = self.x, self.y
+
+        class LeastSquares(GenericLikelihoodModel):
+            def loglike(self, params):
+                if params.ndim == 2:
+                    return -fun2_batch(params, y, x)
+                return -fun2(params, y, x)
+
+        mod = LeastSquares(y, x)
+        mod_v = LeastSquares(y, x, numdiff_kwds=dict(vectorized=True))
+        assert_allclose(mod_v.score(self.params), mod.score(self.params),
+                        rtol=1e-8)
+        assert_allclose(mod_v.hessian(self.params),
+                        mod.hessian(self.params), rtol=1e-4)
+        assert_allclose(mod.hessian(self.params), -2 * np.dot(x.T, x),
+                        rtol=1e-5)
+        # options are not shared between instances
+        assert_equal(mod.numdiff_kwds, {})
+        assert_equal(LeastSquares(y, x).numdiff_kwds, {})
+
+    def test_reuse_center(self):
+        # the loglike at the center is evaluated once by the forward score
+        # and the hessian at the same params
+        from statsmodels.base.model import GenericLikelihoodModel
+        x, y = self.x, self.y
+        k = len(self.params)
+
+        class LeastSquares(GenericLikelihoodModel):
+            points = []
+            def loglike(self, params):
+                self.points.append(params)
+                return -fun2(params, y, x)
+
+        mod = LeastSquares(y, x, numdiff_kwds=dict(centered=False))
+        score = mod.score(self.params)
+        assert_equal(len(mod.points), k + 1)
+        hess = mod.hessian(self.params)
+        # the hessian without the center
+        n_hess = 2 * k * (k + 1) - 2 * k
+        assert_equal(len(mod.points), k + 1 + n_hess)
+        assert_allclose(score, approx_fprime(self.params, lambda p: -fun2(p,
+                        y, x)), rtol=1e-12)
+        assert_allclose(hess, -2 * np.dot(x.T, x), rtol=1e-5)
+        # other params evaluate the center again
+        mod.hessian(self.params + 1)
+        assert_equal(len(mod.points), k + 1 + 2 * n_hess + 1)
+
+        f0 = fun2(self.params, y, x)
+        assert_equal(numdiff.approx_hess3(self.params, fun2, args=(y, x),
+                                          f0=f0),
+                     numdiff.approx_hess3(self.params, fun2, args=(y, x)))
+        h = numdiff._get_epsilon(self.params, 3, None, k)
+        assert_equal(numdiff.approx_hess1(self.params, fun2, args=(y, x),
+                                          f0=f0, return_grad=True)[1],
+                     approx_fprime(self.params, fun2, epsilon=h,
+                                   args=(y, x), f0=f0))
+
+
 if __name__ == '__main__':
 
     epsilon = 1e-6
@@ -0,0 +1,62 @@
+'''Tests for the mixed precision products
+
+'''
+
+import numpy as np
+from numpy.testing import assert_, assert_equal, assert_allclose
+
+from statsmodels.tools import precision
+
+
+class TestPrecision(object):
+
+    @classmethod
+    def setup_class(cls):
+        rs = np.random.RandomState(0)
+        cls.x = rs.randn(103, 4)
+        cls.x32 = cls.x.astype(np.float32)
+        # float64 data with the values of the float32 data
+        cls.x64 = cls.x32.astype(np.float64)
+        cls.y = np.dot(cls.x, [1, 0.5, -1, 2]) + rs.randn(103)
+        cls.weights = rs.uniform(0.5, 2, size=103)
+
+    def test_products(self):
+        x32, x64, y = self.x32, self.x64, self.y
+        params = np.array([1, 0.5, -1, 2.])
+        for chunksize in [10, 1000]:
+            prod = precision.dot(x32, params, chunksize=chunksize)
+            assert_equal(prod.dtype, np.float64)
+            assert_allclose(prod, np.dot(x64, params), rtol=1e-13)
+            prod = precision.tdot(x32, y, chunksize=chunksize)
+            assert_allclose(prod, np.dot(y, x64), rtol=1e-13)
+            prod = precision.dot(x32, np.column_stack((params, params)),
+                                 chunksize=chunksize)
+            assert_allclose(prod[:, 1], np.dot(x64, params), rtol=1e-13)
+            xtx = precision.gram(x32, self.weights, chunksize=chunksize)
+            assert_allclose(xtx, np.dot(self.weights * x64.T, x64),
+                            rtol=1e-13)
+            assert_allclose(precision.gram(x32, chunksize=chunksize),
+                            np.dot(x64.T, x64), rtol=1e-13)
+
+    def test_same_precision(self):
+        # arrays of the same precision use the numpy products
+        x, y = self.x, self.y
+        assert_equal(precision.dot(x, y[:4], chunksize=10), np.dot(x, y[:4]))
+        assert_equal(precision.tdot(x, y, chunksize=10), np.dot(y, x))
+        assert_equal(precision.gram(x, self.weights, chunksize=10),
+                     np.dot(self.weights * x.T, x))
+        prod = precision.dot(self.x32, y[:4].astype(np.float32))
+        assert_equal(prod.dtype, np.float32)
+
+    def test_lstsq(self):
+        x32, x64, y, weights = self.x32, self.x64, self.y, self.weights
+        params, cov_params, n_iter = precision.lstsq(x32, y, chunksize=10)
+        assert_(n_iter >= 1)
+        assert_allclose(params, np.linalg.lstsq(x64, y)[0], rtol=1e-12)
+        assert_allclose(cov_params, np.linalg.inv(np.dot(x64.T, x64)),
+                        rtol=1e-12)
+
+        sw = np.sqrt(weights)
+        params = precision.lstsq(x32, y, weights, chunksize=10)[0]
+        params_wls = np.linalg.lstsq(sw[:, None] * x64, sw * y)[0]
+        assert_allclose(params, params_wls, rtol=1e-12)
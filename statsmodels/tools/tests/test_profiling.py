@@ -0,0 +1,142 @@
+'''Tests for the profiling of fit methods
+
+'''
+
+import json
+
+import numpy as np
+from numpy.testing import assert_, assert_equal
+
+import statsmodels.api as sm
+from statsmodels.tools.profiling import FitProfiler
+from statsmodels.tools import profiling
+
+
+class TestFitProfiler(object):
+
+    @classmethod
+    def setup_class(cls):
+        data = sm.datasets.spector.load()
+        cls.endog = data.endog
+        cls.exog = sm.add_constant(data.exog, prepend=False)
+
+    def test_not_active(self):
+        res = sm.Logit(self.endog, self.exog).fit(disp=0)
+        assert_('profile' not in res.mle_retvals)
+        res = sm.GLM(self.endog, self.exog).fit()
+        assert_('profile' not in res.fit_history)
+        assert_(profiling.current_trace() is profiling._null_trace)
+
+    def test_models(self):
+        records = []
+        with FitProfiler(callback=records.append) as prof:
+            sm.OLS(self.endog, self.exog).fit(method='qr')
+            res_glm = sm.GLM(self.endog, self.exog,
+                             family=sm.families.Binomial()).fit()
+            res_rlm = sm.RLM(self.endog, self.exog).fit()
+            res_logit = sm.Logit(self.endog, self.exog).fit(disp=0,
+                                                            method='bfgs')
+        sm.OLS(self.endog, self.exog).fit()
+        assert_equal(len(prof.records), 4)
+        assert_(records == prof.records)
+        assert_equal([r['fit'] for r in prof.records],
+                     ['OLS.fit', 'GLM.fit', 'RLM.fit', 'Logit.fit'])
+        assert_equal([r['method'] for r in prof.records],
+                     ['qr', 'IRLS', 'IRLS', 'bfgs'])
+
+        rec = prof.records[0]
+        assert_equal(rec['stages']['qr']['count'], 1)
+        assert_(rec['time'] >= rec['stages']['qr']['time'])
+
+        # the WLS fits of IRLS are added to the GLM record
+        rec = res_glm.fit_history['profile']
+        assert_(rec is prof.records[1])
+        niter = res_glm.fit_history['iteration']
+        assert_equal(rec['iterations'], niter)
+        assert_equal(rec['stages']['wls']['count'], niter)
+        assert_equal(rec['stages']['pinv']['count'], niter)
+        assert_equal(rec['converged'], True)
+        assert_equal(len(rec['trace']), niter)
+        assert_(rec['trace'][-1] <= 1e-8)
+
+        rec = res_rlm.fit_history['profile']
+        assert_equal(rec['stages']['wls']['count'],
+                     res_rlm.fit_history['iteration'] - 1)
+        assert_equal(rec['converged'], True)
+
+        rec = res_logit.mle_retvals['profile']
+        assert_equal(rec['converged'], True)
+        assert_(rec['iterations'] > 0)
+        assert_equal(len(rec['trace']), rec['iterations'])
+        stages = rec['stages']
+        assert_equal(stages['loglike']['count'],
+                     res_logit.mle_retvals['fcalls'])
+        assert_equal(stages['score']['count'],
+                     res_logit.mle_retvals['gcalls'])
+        assert_(stages['optimizer']['time'] >= stages['loglike']['time'])
+
+        rows = prof.to_records()
+        assert_equal(len(rows), 4 + sum(len(r['stages'])
+                                        for r in prof.records))
+        assert_equal(rows[0]['stage'], 'total')
+        json.dumps(rows)
+        frame = prof.to_frame()
+        assert_equal(list(frame['fit_id'].unique()), [0, 1, 2, 3])
+
+    def test_nested_profilers(self):
+        with FitProfiler() as prof:
+            sm.OLS(self.endog, self.exog).fit()
+            with FitProfiler() as prof2:
+                sm.GLM(self.endog, self.exog).fit()
+        assert_equal(len(prof.records), 2)
+        assert_equal(len(prof2.records), 1)
+        assert_(prof2.records[0] is prof.records[1])
+
+    def test_exception(self):
+        with FitProfiler() as prof:
+            try:
+                sm.Logit(self.endog, self.exog).fit(method='unknown')
+            except ValueError:
+                pass
+            sm.OLS(self.endog, self.exog).fit()
+        assert_equal([r['fit'] for r in prof.records],
+                     ['Logit.fit', 'OLS.fit'])
+        assert_equal(profiling._state.running, [])
+        assert_equal(profiling._state.profilers, [])
+
+    def test_threads(self):
+        # a profiler only records the fits of its own thread
+        import threading
+        results = []
+        def fit():
+            with FitProfiler() as prof_thread:
+                sm.GLM(self.endog, self.exog).fit()
+            results.append(prof_thread)
+        with FitProfiler() as prof:
+            thread = threading.Thread(target=fit)
+            thread.start()
+            sm.OLS(self.endog, self.exog).fit()
+            thread.join()
+        assert_equal([r['fit'] for r in prof.records], ['OLS.fit'])
+        assert_equal([r['fit'] for r in results[0].records], ['GLM.fit'])
+
+    def test_arma_kde(self):
+        from statsmodels.tsa.arima_process import arma_generate_sample
+        from statsmodels.tsa.arima_model import ARMA
+        np.random.seed(12345)
+        y = arma_generate_sample([1, -.5], [1, .3], 250)
+        x = np.random.randn(50, 1)
+        with FitProfiler() as prof:
+            res = ARMA(y, (1, 1)).fit(disp=-1)
+            sm.nonparametric.KDEMultivariate(x, 'c', bw='cv_ml')
+        rec = res.mle_retvals['profile']
+        assert_equal(rec['method'], 'css-mle')
+        assert_equal(rec['converged'], True)
+        assert_equal(rec['stages']['loglike']['count'],
+                     res.mle_retvals['funcalls'])
+        assert_equal(rec['stages']['start_params']['count'], 1)
+
+        rec = prof.records[1]
+        assert_equal(rec['fit'], 'KDEMultivariate._compute_bw')
+        assert_equal(rec['method'], 'cv_ml')
+        assert_(rec['stages']['loo_likelihood']['count'] >= rec['iterations'])
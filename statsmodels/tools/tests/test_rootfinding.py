@@ -7,7 +7,8 @@ Author: Josef Perktold
 """
 
 import numpy as np
-from statsmodels.tools.rootfinding import brentq_expanding
+from statsmodels.tools.rootfinding import (brentq_expanding,
+                                           brentq_expanding_vec)
 
 from numpy.testing import assert_allclose, assert_equal, assert_raises
 
@@ -84,3 +85,27 @@ def test_brentq_expanding():
         assert_equal(info1[k], info.__dict__[k])
 
     assert_allclose(info.root, a, rtol=1e-5)
+
+
+def test_brentq_expanding_vec():
+    a = np.array([0, 50, -50, 500000, -50000, 3.3])
+    cases = [({}, a),
+             (dict(low=-10), np.where(a < -10, np.nan, a)),
+             (dict(low=-1e6, upp=1e6), a)]
+
+    for f in [func, funcn]:
+        for kwds, res_expected in cases:
+            res, converged = brentq_expanding_vec(lambda x, idx: f(x, a[idx]),
+                                                  len(a), **kwds)
+            assert_allclose(res, res_expected, rtol=1e-8, atol=1e-8)
+            assert_equal(converged, ~np.isnan(res_expected))
+
+    # bounds can differ across elements
+    res, converged = brentq_expanding_vec(lambda x, idx: func(x, a[idx]),
+                                          len(a), low=a - 1, upp=a + 5)
+    assert_allclose(res, a, rtol=1e-8, atol=1e-8)
+
+    # increasing for all elements
+    res, converged = brentq_expanding_vec(lambda x, idx: func(x, a[idx]),
+                                          len(a), increasing=True)
+    assert_allclose(res, a, rtol=1e-8, atol=1e-8)
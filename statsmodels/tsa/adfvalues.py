@@ -1,5 +1,5 @@
 from scipy.stats import norm
-from numpy import array, polyval, inf, asarray
+from numpy import array, polyval, inf, asarray, where
 
 __all__ = ['mackinnonp','mackinnoncrit']
 
@@ -174,7 +174,7 @@ def mackinnonp(teststat, regression="c", N=1, lags=None):
 
     Parameters
     ----------
-    teststat : float
+    teststat : float or array_like
         "T-value" from an Augmented Dickey-Fuller regression.
     regression : str {"c", "nc", "ct", "ctt"}
         This is the method of regression that was used.  Following MacKinnon's
@@ -186,8 +186,10 @@ def mackinnonp(teststat, regression="c", N=1, lags=None):
 
     Returns
     -------
-    p-value : float
+    p-value : float or ndarray
         The p-value for the ADF statistic estimated using MacKinnon 1994.
+        If teststat is an array, then an array of p-values of the same shape
+        is returned.
 
     References
     ----------
@@ -204,17 +206,29 @@ def mackinnonp(teststat, regression="c", N=1, lags=None):
     maxstat = eval("tau_max_"+regression)
     minstat = eval("tau_min_"+regression)
     starstat = eval("tau_star_"+regression)
-    if teststat > maxstat[N-1]:
-        return 1.0
-    elif teststat < minstat[N-1]:
-        return 0.0
-    if teststat <= starstat[N-1]:
-        tau_coef = eval("tau_" + regression + "_smallp["+str(N-1)+"]")
-#        teststat = np.log(np.abs(teststat))
+    if not hasattr(teststat, '__len__'):
+        if teststat > maxstat[N-1]:
+            return 1.0
+        elif teststat < minstat[N-1]:
+            return 0.0
+        if teststat <= starstat[N-1]:
+            tau_coef = eval("tau_" + regression + "_smallp["+str(N-1)+"]")
+#            teststat = np.log(np.abs(teststat))
 #above is only for z stats
-    else:
-        tau_coef = eval("tau_" + regression + "_largep["+str(N-1)+"]")
-    return norm.cdf(polyval(tau_coef[::-1], teststat))
+        else:
+            tau_coef = eval("tau_" + regression + "_largep["+str(N-1)+"]")
+        return norm.cdf(polyval(tau_coef[::-1], teststat))
+
+    # vectorized version for arrays of test statistics
+    teststat = asarray(teststat, dtype=float)
+    tau_small = eval("tau_" + regression + "_smallp["+str(N-1)+"]")
+    tau_large = eval("tau_" + regression + "_largep["+str(N-1)+"]")
+    pvalue = where(teststat <= starstat[N-1],
+                   norm.cdf(polyval(tau_small[::-1], teststat)),
+                   norm.cdf(polyval(tau_large[::-1], teststat)))
+    pvalue = where(teststat > maxstat[N-1], 1.0, pvalue)
+    pvalue = where(teststat < minstat[N-1], 0.0, pvalue)
+    return pvalue
 
 # These are the new estimates from MacKinnon 2010
 # the first axis is N -1
@@ -1,14 +1,28 @@
-from .ar_model import AR
-from .arima_model import ARMA, ARIMA
-import vector_ar as var
-from .vector_ar.var_model import VAR
-from .vector_ar.svar_model import SVAR
-from .vector_ar.dynamic import DynamicVAR
-import filters
-import tsatools
-from .tsatools import (add_trend, detrend, lagmat, lagmat2ds, add_lag)
-import interp
-import stattools
-from .stattools import (adfuller, acovf, q_stat, acf, pacf_yw, pacf_ols, pacf,
-                            ccovf, ccf, periodogram, grangercausalitytests)
-from .base import datetools
+# imported on first access, see statsmodels.tools.lazy
+from statsmodels.tools.lazy import lazy_module as _lazy_module
+
+_lazy_module(__name__,
+    modules={'var': 'statsmodels.tsa.vector_ar',
+             'filters': 'statsmodels.tsa.filters',
+             'tsatools': 'statsmodels.tsa.tsatools',
+             'interp': 'statsmodels.tsa.interp',
+             'stattools': 'statsmodels.tsa.stattools',
+             'datetools': 'statsmodels.tsa.base.datetools',
+             },
+    attributes=[
+        ('statsmodels.tsa.ar_model', ['AR']),
+        ('statsmodels.tsa.arima_model', ['ARMA', 'ARIMA']),
+        ('statsmodels.tsa.vector_ar.var_model', ['VAR']),
+        ('statsmodels.tsa.vector_ar.svar_model', ['SVAR']),
+        ('statsmodels.tsa.vector_ar.dynamic', ['DynamicVAR']),
+        ('statsmodels.tsa.tsatools', ['add_trend', 'detrend', 'lagmat',
+                                      'lagmat2ds', 'add_lag']),
+        ('statsmodels.tsa.stattools', ['adfuller', 'acovf', 'q_stat', 'acf',
+                                       'pacf_yw', 'pacf_ols', 'pacf',
+                                       'ccovf', 'ccf', 'periodogram',
+                                       'grangercausalitytests',
+                                       'acovf_batch', 'acf_batch',
+                                       'pacf_batch', 'ccovf_batch',
+                                       'ccf_batch', 'adfuller_batch',
+                                       'coint_batch']),
+        ])
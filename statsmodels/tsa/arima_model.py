@@ -27,6 +27,7 @@ from statsmodels.tools.numdiff import (approx_fprime, approx_fprime_cs,
         approx_hess_cs)
 from statsmodels.tsa.base.datetools import _index_date
 from statsmodels.tsa.kalmanf import KalmanFilter
+from statsmodels.tools.profiling import fit_profiling, current_trace
 from .kalmanf import kalman_loglike
 
 _armax_notes = """
@@ -700,6 +701,7 @@ class ARMA(tsbase.TimeSeriesModel):
         llf = -nobs/2.*(log(2*pi) + log(sigma2)) - ssr/(2*sigma2)
         return llf
 
+    @fit_profiling
     def fit(self, order=None, start_params=None, trend='c', method = "css-mle",
             transparams=True, solver=None, maxiter=35, full_output=1,
             disp=5, callback=None, **kwargs):
@@ -820,12 +822,15 @@ class ARMA(tsbase.TimeSeriesModel):
         if method == 'css':
             self.nobs = len(self.endog) - k_ar
         loglike = lambda params: -self.loglike(params)
+        trace = current_trace()
+        trace.update(method=method)
 
         if start_params is not None:
             start_params = np.asarray(start_params)
 
         else: # estimate starting parameters
-            start_params = self._fit_start_params((k_ar,k_ma,k), method)
+            with trace.stage('start_params'):
+                start_params = self._fit_start_params((k_ar,k_ma,k), method)
 
         if transparams: # transform initial parameters to ensure invertibility
             start_params = self._invtransparams(start_params)
@@ -835,11 +840,17 @@ class ARMA(tsbase.TimeSeriesModel):
             pgtol = kwargs.get('pgtol', 1e-8)
             factr = kwargs.get('factr', 1e2)
             m = kwargs.get('m', 12)
-            mlefit = optimize.fmin_l_bfgs_b(loglike, start_params,
-                    approx_grad=True, m=m, pgtol=pgtol, factr=factr,
-                    bounds=bounds, iprint=disp)
+            with trace.stage('optimizer'):
+                mlefit = optimize.fmin_l_bfgs_b(trace.counted('loglike',
+                                                              loglike),
+                        start_params, approx_grad=True, m=m, pgtol=pgtol,
+                        factr=factr, bounds=bounds, iprint=disp)
             self.mlefit = mlefit
             params = mlefit[0]
+            mle_retvals = mlefit[2]
+            mle_retvals['converged'] = mle_retvals['warnflag'] == 0
+            trace.update(iterations=mle_retvals.get('nit', 0),
+                         converged=mle_retvals['converged'])
 
         else:   # call the solver from LikelihoodModel
             mlefit = super(ARMA, self).fit(start_params, method=solver,
@@ -847,6 +858,9 @@ class ARMA(tsbase.TimeSeriesModel):
                         callback = callback, **kwargs)
             self.mlefit = mlefit
             params = mlefit.params
+            mle_retvals = getattr(mlefit, 'mle_retvals', None)
+            if mle_retvals is not None:
+                trace.update(converged=mle_retvals.get('converged'))
 
         if transparams: # transform parameters back
             params = self._transparams(params)
@@ -855,6 +869,7 @@ class ARMA(tsbase.TimeSeriesModel):
 
         normalized_cov_params = None #TODO: fix this
         armafit = ARMAResults(self, params, normalized_cov_params)
+        armafit.mle_retvals = mle_retvals
         return ARMAResultsWrapper(armafit)
 
 
@@ -1004,8 +1019,10 @@ class ARIMA(ARMA):
                                method, transparams, solver, maxiter,
                                full_output, disp, callback, **kwargs)
         normalized_cov_params = None #TODO: fix this?
+        mle_retvals = getattr(arima_fit._results, 'mle_retvals', None)
         arima_fit = ARIMAResults(self, arima_fit._results.params,
                                        normalized_cov_params)
+        arima_fit.mle_retvals = mle_retvals
         arima_fit.k_diff = self.k_diff
         return ARIMAResultsWrapper(arima_fit)
 
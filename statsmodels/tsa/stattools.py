@@ -86,6 +86,181 @@ def _autolag(mod, endog, exog, startlag, maxlag, method, modargs=(),
     else:
         return icbest, bestlag, results
 
+def _autolag_ols(endog, exog, startlag, maxlag, method):
+    """
+    Lag length selection for OLS from a single QR of the largest design
+
+    This returns the same icbest and bestlag as
+    ``_autolag(OLS, endog, exog, startlag, maxlag, method)`` without fitting
+    a model for each lag. All candidate regressions use the same
+    observations and the leading columns of exog, so the sum of squared
+    residuals and the t-value of the last regressor of each nested model
+    can be read off the QR decomposition of exog.
+    """
+    method = method.lower()
+    nobs = exog.shape[0]
+    kmax = startlag + maxlag
+    q, r = np.linalg.qr(exog[:,:kmax])
+    qy = np.dot(q.T, endog)
+    resid = endog - np.dot(q, qy)
+    # ssr of the regression on the first j columns is at index j-1
+    qy2 = qy**2
+    ssr = np.dot(resid, resid) + np.concatenate((np.cumsum(qy2[::-1])[::-1][1:],
+                                                 [0.]))
+    lags = np.arange(startlag, kmax+1)
+    ssr = ssr[lags-1]
+    llf = -nobs/2. * (np.log(2*np.pi) + np.log(ssr/nobs) + 1)
+
+    if method == "aic":
+        ic = -2*llf + 2*lags
+    elif method == "bic":
+        ic = -2*llf + np.log(nobs)*lags
+    elif method == "t-stat":
+        #stop = stats.norm.ppf(.95)
+        stop = 1.6448536269514722
+        tvalues = np.abs(qy[lags-1] / np.sqrt(ssr / (nobs - lags)))
+        signif = np.nonzero(tvalues >= stop)[0]
+        idx = signif[-1] if len(signif) else 0
+        return tvalues[idx], lags[idx]
+    else:
+        raise ValueError("Information Criterion %s not understood." % method)
+    idx = np.argmin(ic)
+    return ic[idx], lags[idx]
+
+def _trend_columns(nobs, regression):
+    """deterministic terms of the ADF regression, columns ordered c, t, tt"""
+    trendorder = {'nc' : -1, 'c' : 0, 'ct' : 1, 'ctt' : 2}[regression]
+    trend = np.arange(1, nobs+1, dtype=float)[:,None]
+    return trend ** np.arange(trendorder+1)
+
+def _adfuller_qr(x, maxlag, regression, autolag):
+    """
+    ADF statistic for one series using QR decompositions instead of OLS
+
+    Returns adfstat, usedlag, nobs and icbest (nan if autolag is None).
+    """
+    xdiff = np.diff(x)
+    xdall = lagmat(xdiff[:,None], maxlag, trim='both', original='in')
+    nobs = xdall.shape[0]
+    xdall[:,0] = x[-nobs-1:-1] # replace 0 xdiff with level of x
+    xdshort = xdiff[-nobs:]
+    trend = _trend_columns(nobs, regression)
+
+    if autolag:
+        fullRHS = np.column_stack((trend, xdall))
+        startlag = trend.shape[1] + 1
+        icbest, bestlag = _autolag_ols(xdshort, fullRHS, startlag, maxlag,
+                                       autolag)
+        usedlag = bestlag - startlag
+        xdall = lagmat(xdiff[:,None], usedlag, trim='both', original='in')
+        nobs = xdall.shape[0]
+        xdall[:,0] = x[-nobs-1:-1]
+        xdshort = xdiff[-nobs:]
+        trend = _trend_columns(nobs, regression)
+    else:
+        usedlag = maxlag
+        icbest = np.nan
+
+    # put the lagged level last, its t-value is then read off the QR
+    exog = np.column_stack((trend, xdall[:,1:usedlag+1], xdall[:,0]))
+    k = exog.shape[1]
+    q, r = np.linalg.qr(exog)
+    qy = np.dot(q.T, xdshort)
+    resid = xdshort - np.dot(q, qy)
+    scale = np.dot(resid, resid) / (nobs - k)
+    adfstat = qy[-1] * np.sign(r[-1,-1]) / np.sqrt(scale)
+    return adfstat, usedlag, nobs, icbest
+
+def _adfuller_columns(x, maxlag, regression, autolag):
+    """ADF results for each column of x, one row per column"""
+    return np.array([_adfuller_qr(x[:,i], maxlag, regression, autolag)
+                     for i in range(x.shape[1])]).reshape(-1, 4)
+
+def adfuller_batch(x, maxlag=None, regression="c", autolag='AIC', n_jobs=1):
+    '''Augmented Dickey-Fuller unit root test for each column of x
+
+    Parameters
+    ----------
+    x : array_like, 2d
+        data series in columns, observations in rows
+    maxlag : int
+        Maximum lag which is included in test, default 12*(nobs/100)^{1/4}
+    regression : str {'c','ct','ctt','nc'}
+        Constant and trend order to include in regression, see adfuller
+    autolag : {'AIC', 'BIC', 't-stat', None}
+        Method for the lag length selection of each series, see adfuller
+    n_jobs : int
+        The columns are split in n_jobs chunks that are processed in parallel
+        if joblib is available. -1 uses all cpus. Default is 1, no parallel
+        processing.
+
+    Returns
+    -------
+    adf : ndarray
+        Test statistic for each series
+    pvalue : ndarray
+        MacKinnon's approximate p-values based on MacKinnon (1994)
+    usedlag : ndarray
+        Number of lags used for each series.
+    nobs : ndarray
+        Number of observations used for the ADF regression and calculation of
+        the critical values.
+    critical values : dict
+        Critical values for the test statistic at the 1 %, 5 %, and 10 %
+        levels, arrays with one value for each series.
+    icbest : ndarray
+        The maximized information criterion if autolag is not None.
+
+    See Also
+    --------
+    adfuller
+
+    Notes
+    -----
+    The results are the same as those of adfuller applied to each column.
+    The lag length is selected from a single QR decomposition of the design
+    matrix with maxlag lags, since the candidate regressions are nested and
+    use the same observations. The sum of squared residuals, information
+    criteria and the t-value of the last lag of each candidate follow from
+    the QR factors.
+    '''
+    trenddict = {None:'nc', 0:'c', 1:'ct', 2:'ctt'}
+    if regression is None or isinstance(regression, int):
+        regression = trenddict[regression]
+    regression = regression.lower()
+    if regression not in ['c','nc','ct','ctt']:
+        raise ValueError("regression option %s not understood" % regression)
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 1:
+        x = x[:,None]
+    nobs, nseries = x.shape
+    if maxlag is None:
+        #from Greene referencing Schwert 1989
+        maxlag = int(np.ceil(12. * np.power(nobs/100., 1/4.)))
+
+    if n_jobs == 1 or nseries == 1:
+        res = _adfuller_columns(x, maxlag, regression, autolag)
+    else:
+        from statsmodels.tools.parallel import parallel_func
+        parallel, p_func, n_jobs = parallel_func(_adfuller_columns,
+                                                 n_jobs=n_jobs, verbose=0)
+        chunks = np.array_split(np.arange(nseries), min(n_jobs, nseries))
+        res = np.concatenate(parallel(p_func(x[:,idx], maxlag, regression,
+                                             autolag) for idx in chunks))
+
+    adfstat = res[:,0]
+    usedlag = res[:,1].astype(int)
+    nobs = res[:,2].astype(int)
+    pvalue = mackinnonp(adfstat, regression=regression, N=1)
+    crit = np.empty((nseries, 3))
+    for n in np.unique(nobs):
+        crit[nobs == n] = mackinnoncrit(N=1, regression=regression, nobs=n)
+    critvalues = {"1%" : crit[:,0], "5%" : crit[:,1], "10%" : crit[:,2]}
+    if not autolag:
+        return adfstat, pvalue, usedlag, nobs, critvalues
+    else:
+        return adfstat, pvalue, usedlag, nobs, critvalues, res[:,3]
+
 #this needs to be converted to a class like HetGoldfeldQuandt, 3 different returns are a mess
 # See:
 #Ng and Perron(2001), Lag length selection and the construction of unit root
@@ -217,8 +392,8 @@ def adfuller(x, maxlag=None, regression="c", autolag='AIC',
         #aic and bic: smaller is better
 
         if not regresults:
-            icbest, bestlag = _autolag(OLS, xdshort, fullRHS, startlag,
-                                       maxlag, autolag)
+            icbest, bestlag = _autolag_ols(xdshort, fullRHS, startlag,
+                                           maxlag, autolag)
         else:
             icbest, bestlag, alres = _autolag(OLS, xdshort, fullRHS, startlag,
                                         maxlag, autolag, regresults=regresults)
@@ -319,6 +494,8 @@ def q_stat(x,nobs, type="ljungbox"):
 
     x : array-like
         Array of autocorrelation coefficients.  Can be obtained from acf.
+        If x is 2d, then the lags are in rows and each column is treated as
+        a separate series, as returned by acf_batch.
     nobs : int
         Number of observations in the entire sample (ie., not just the length
         of the autocorrelation function results.
@@ -335,12 +512,28 @@ def q_stat(x,nobs, type="ljungbox"):
     Written to be used with acf.
     """
     x = np.asarray(x)
+    # lags run along the first axis, broadcast over any remaining axes
+    shape = (len(x),) + (1,) * (x.ndim - 1)
+    df = np.arange(1, len(x)+1).reshape(shape)
     if type=="ljungbox":
-        ret = nobs*(nobs+2)*np.cumsum((1./(nobs-np.arange(1,
-            len(x)+1)))*x**2)
-    chi2 = stats.chi2.sf(ret,np.arange(1,len(x)+1))
+        ret = nobs*(nobs+2)*np.cumsum((1./(nobs-df))*x**2, axis=0)
+    chi2 = stats.chi2.sf(ret, df)
     return ret,chi2
 
+def _acf_confint(acf, nobs, alpha):
+    """
+    Bartlett confidence intervals for the acf, lags in the first axis
+
+    The intervals are stacked in a new last axis, (lower, upper).
+    """
+    varacf = np.ones(acf.shape)/nobs
+    varacf[0] = 0
+    varacf[1] = 1./nobs
+    varacf[2:] *= 1 + 2*np.cumsum(acf[1:-1]**2, axis=0)
+    interval = stats.norm.ppf(1-alpha/2.)*np.sqrt(varacf)
+    return np.concatenate(((acf-interval)[...,None],
+                           (acf+interval)[...,None]), axis=-1)
+
 #NOTE: Changed unbiased to False
 #see for example
 # http://www.itl.nist.gov/div898/handbook/eda/section3/autocopl.htm
@@ -427,12 +620,7 @@ def acf(x, unbiased=False, nlags=40, confint=None, qstat=False, fft=False,
         if not qstat:
             return acf, confint
     if alpha is not None:
-        varacf = np.ones(nlags+1)/nobs
-        varacf[0] = 0
-        varacf[1] = 1./nobs
-        varacf[2:] *= 1 + 2*np.cumsum(acf[1:-1]**2)
-        interval = stats.norm.ppf(1-alpha/2.)*np.sqrt(varacf)
-        confint = np.array(zip(acf-interval, acf+interval))
+        confint = _acf_confint(acf, nobs, alpha)
         if not qstat:
             return acf, confint
     if qstat:
@@ -488,7 +676,10 @@ def pacf_ols(x, nlags=40):
 
     Notes
     -----
-    This solves a separate OLS estimation for each desired lag.
+    This solves a separate OLS estimation for each desired lag, using all
+    available observations for each of them. The estimates are obtained
+    from a single QR decomposition of the lag matrix, updated with the
+    additional initial observations of each shorter regression.
     '''
     #TODO: add warnings for Yule-Walker
     #NOTE: demeaning and not using a constant gave incorrect answers?
@@ -497,13 +688,21 @@ def pacf_ols(x, nlags=40):
     xlags, x0 = lagmat(x, nlags, original='sep')
     #xlags = sm.add_constant(lagmat(x, nlags), prepend=True)
     xlags = add_constant(xlags)
-    pacf = [1.]
+    x0 = x0[:,0]
+    # The regression for lag k uses the columns :k+1 and the rows k:. All
+    # of them share the rows nlags:, so we do one QR of the full lag matrix
+    # on these rows. The leading (k+1, k+1) block of R and of Q'y is the QR
+    # of the column subset, and only the nlags-k initial rows that are not
+    # in the common block are stacked below it for a small least squares.
+    q, r = np.linalg.qr(xlags[nlags:])
+    qy = np.dot(q.T, x0[nlags:])
+    pacf = np.empty(nlags+1)
+    pacf[0] = 1.
     for k in range(1, nlags+1):
-        res = OLS(x0[k:], xlags[k:,:k+1]).fit()
-         #np.take(xlags[k:], range(1,k+1)+[-1],
-
-        pacf.append(res.params[-1])
-    return np.array(pacf)
+        a = np.vstack((r[:k+1,:k+1], xlags[k:nlags,:k+1]))
+        b = np.concatenate((qy[:k+1], x0[k:nlags]))
+        pacf[k] = np.linalg.lstsq(a, b)[0][-1]
+    return pacf
 
 def pacf(x, nlags=40, method='ywunbiased', alpha=None):
     '''Partial autocorrelation estimated
@@ -632,6 +831,316 @@ def ccf(x, y, unbiased=True):
     return cvf / (np.std(x) * np.std(y))
 
 
+def _acovf_use_fft(nobs, nlags):
+    """
+    Choose between FFT and direct summation for the lagged cross products
+
+    The direct computation costs about nobs * (nlags + 1) operations per
+    series while the FFT costs a few nfft * log2(nfft) with nfft >= 2 * nobs.
+    """
+    nfft = 2 ** int(np.ceil(np.log2(2 * nobs - 1)))
+    return 4. * nfft * np.log2(nfft) < nobs * (nlags + 1.)
+
+def _lagged_crossprod(xo, yo, nlags, fft):
+    """
+    sum_t xo[t+k] * yo[t] for k = 0, ..., nlags along the first axis
+
+    If yo is None, then the autocovariance of xo is computed. The columns of
+    xo and yo need to broadcast against each other.
+    """
+    nobs = xo.shape[0]
+    if fft is None:
+        fft = _acovf_use_fft(nobs, nlags)
+    if fft:
+        nfft = 2 ** int(np.ceil(np.log2(2 * nobs - 1)))
+        Frf = np.fft.rfft(xo, n=nfft, axis=0)
+        if yo is None:
+            Frf = Frf.real**2 + Frf.imag**2
+        else:
+            Frf = Frf * np.conjugate(np.fft.rfft(yo, n=nfft, axis=0))
+        return np.fft.irfft(Frf, n=nfft, axis=0)[:nlags+1]
+    else:
+        if yo is None:
+            yo = xo
+        shape = (nlags+1,) + np.broadcast(xo[:1], yo[:1]).shape[1:]
+        cross = np.empty(shape)
+        for k in range(nlags+1):
+            cross[k] = (xo[k:] * yo[:nobs-k]).sum(0)
+        return cross
+
+def acovf_batch(x, unbiased=False, demean=True, fft=None, nlags=None):
+    '''
+    Autocovariance for each column of a 2d array
+
+    Parameters
+    ----------
+    x : array
+        Time series data, observations in rows and series in columns. A 1d
+        array is treated as a single series.
+    unbiased : bool
+        If True, then denominators is n-k, otherwise n
+    demean : bool
+        If True, then subtract the mean of each column
+    fft : bool or None
+        If True, use FFT convolution, if False, use direct summation of the
+        lagged products. If None (default), then the method is chosen based
+        on the number of observations and lags.
+    nlags : int or None
+        Largest lag for which the autocovariance is returned. If None, then
+        all nobs lags are returned as in acovf.
+
+    Returns
+    -------
+    acovf : array
+        autocovariance function, shape (nlags+1, nseries) for 2d x, lags in
+        rows, and shape (nlags+1,) for 1d x.
+
+    Notes
+    -----
+    All series are processed with a single FFT or with one vectorized sum
+    of products per lag, so there is no loop over the columns.
+    '''
+    x = np.asarray(x, dtype=float)
+    if x.ndim > 2:
+        raise ValueError("x must be 1d or 2d. Got %d dims." % x.ndim)
+    nobs = x.shape[0]
+    if nlags is None:
+        nlags = nobs - 1
+    nlags = min(nlags, nobs - 1)
+
+    if demean:
+        xo = x - x.mean(0)
+    else:
+        xo = x
+    acov = _lagged_crossprod(xo, None, nlags, fft)
+    if unbiased:
+        d = nobs - np.arange(nlags+1.)
+        if x.ndim == 2:
+            d = d[:,None]
+    else:
+        d = nobs
+    return acov / d
+
+def acf_batch(x, unbiased=False, nlags=40, qstat=False, fft=None,
+              alpha=None):
+    '''
+    Autocorrelation function for each column of a 2d array
+
+    Parameters
+    ----------
+    x : array
+       Time series data, observations in rows and series in columns
+    unbiased : bool
+       If True, then denominators for autocovariance are n-k, otherwise n
+    nlags: int, optional
+        Number of lags to return autocorrelation for.
+    qstat : bool, optional
+        If True, returns the Ljung-Box q statistic for each autocorrelation
+        coefficient.  See q_stat for more information.
+    fft : bool or None, optional
+        If True, computes the ACF via FFT, if False by direct summation. If
+        None (default), then the method is chosen based on the size of the
+        problem.
+    alpha : scalar, optional
+        If a number is given, the confidence intervals for the given level are
+        returned. For instance if alpha=.05, 95 % confidence intervals are
+        returned where the standard deviation is computed according to
+        Bartlett\'s formula.
+
+    Returns
+    -------
+    acf : array
+        autocorrelation function, shape (nlags+1, nseries)
+    confint : array, optional
+        Confidence intervals for the ACF, shape (nlags+1, nseries, 2).
+        Returned if alpha is not None.
+    qstat : array, optional
+        The Ljung-Box Q-Statistic, shape (nlags, nseries).  Returned if
+        qstat is True.
+    pvalues : array, optional
+        The p-values associated with the Q-statistics.  Returned if qstat is
+        True.
+
+    See Also
+    --------
+    acf : autocorrelation for a single series
+
+    Notes
+    -----
+    The results for each column are the same as the results of acf for that
+    column, up to floating point differences between the FFT and the direct
+    computation.
+    '''
+    x = np.asarray(x, dtype=float)
+    nobs = x.shape[0]
+    avf = acovf_batch(x, unbiased=unbiased, demean=True, fft=fft,
+                      nlags=nlags)
+    acf = avf / avf[0]
+    if not (qstat or alpha is not None):
+        return acf
+    ret = (acf,)
+    if alpha is not None:
+        ret += (_acf_confint(acf, nobs, alpha),)
+    if qstat:
+        ret += q_stat(acf[1:], nobs=nobs)
+    return ret
+
+def _levinson_durbin_pacf(acov, nlags):
+    """
+    Levinson-Durbin recursion for the pacf vectorized over columns of acov
+    """
+    acov = np.asarray(acov)
+    pacf = np.empty((nlags+1,) + acov.shape[1:])
+    pacf[0] = 1.
+    phi = np.zeros(pacf.shape)
+    phi[1] = acov[1] / acov[0]
+    pacf[1] = phi[1]
+    sig = acov[0] - phi[1] * acov[1]
+    for k in range(2, nlags+1):
+        phikk = (acov[k] - (phi[1:k] * acov[1:k][::-1]).sum(0)) / sig
+        phi[1:k] = phi[1:k] - phikk * phi[1:k][::-1]
+        phi[k] = phikk
+        sig = sig * (1 - phikk**2)
+        pacf[k] = phikk
+    return pacf
+
+def pacf_batch(x, nlags=40, method='ywunbiased', alpha=None):
+    '''Partial autocorrelation for each column of a 2d array
+
+    Parameters
+    ----------
+    x : array
+        observations of the time series in rows, one series per column
+    nlags : int
+        largest lag for which pacf is returned
+    method : str
+        specifies which method for the calculations to use, see pacf.
+        The Yule-Walker and Levinson-Durbin methods are computed for all
+        series at once from acovf_batch, 'ols' uses pacf_ols for each column.
+    alpha : scalar, optional
+        If a number is given, the confidence intervals for the given level are
+        returned. For instance if alpha=.05, 95 % confidence intervals are
+        returned where the standard deviation is computed according to
+        1/sqrt(nobs)
+
+    Returns
+    -------
+    pacf : array
+        partial autocorrelations, shape (nlags+1, nseries), including lag zero
+    confint : array, optional
+        Confidence intervals for the PACF, shape (nlags+1, nseries, 2).
+        Returned if alpha is not None.
+
+    Notes
+    -----
+    The Yule-Walker equations for all lags are solved by the Levinson-Durbin
+    recursion, which gives the same solution as pacf_yw.
+    '''
+    x = np.asarray(x, dtype=float)
+    x2d = x[:,None] if x.ndim == 1 else x
+    if method == 'ols':
+        ret = np.column_stack([pacf_ols(x2d[:,i], nlags=nlags)
+                               for i in range(x2d.shape[1])])
+    elif method in ['yw', 'ywu', 'ywunbiased', 'yw_unbiased',
+                    'ld', 'ldu', 'ldunbiase', 'ld_unbiased']:
+        acv = acovf_batch(x2d, unbiased=True, nlags=nlags)
+        ret = _levinson_durbin_pacf(acv, nlags)
+    elif method in ['ywm', 'ywmle', 'yw_mle', 'ldb', 'ldbiased', 'ld_biased']:
+        acv = acovf_batch(x2d, unbiased=False, nlags=nlags)
+        ret = _levinson_durbin_pacf(acv, nlags)
+    else:
+        raise ValueError('method not available')
+    if x.ndim == 1:
+        ret = ret[:,0]
+    if alpha is not None:
+        interval = stats.norm.ppf(1. - alpha/2.) * np.sqrt(1./len(x))
+        confint = np.concatenate(((ret-interval)[...,None],
+                                  (ret+interval)[...,None]), axis=-1)
+        return ret, confint
+    else:
+        return ret
+
+def ccovf_batch(x, y, unbiased=True, demean=True, fft=None, nlags=None):
+    ''' crosscovariance for each pair of columns of x and y
+
+    Parameters
+    ----------
+    x, y : arrays
+       time series data, observations in rows. The columns of x and y are
+       paired, a 1d y or y with a single column is used for all columns of x.
+    unbiased : boolean
+       if True, then denominators is n-k, otherwise n
+    demean : boolean
+       if True, then subtract the mean of each column
+    fft : bool or None
+        If True, use FFT convolution, if False, use direct summation of the
+        lagged products. If None (default), then the method is chosen based
+        on the number of observations and lags.
+    nlags : int or None
+        Largest lag for which the crosscovariance is returned. If None, then
+        all nobs lags are returned as in ccovf.
+
+    Returns
+    -------
+    ccovf : array
+        crosscovariance function, lags in rows
+    '''
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.shape[0] != y.shape[0]:
+        raise ValueError("x and y need to have the same number of "
+                         "observations")
+    if x.ndim == 2 and y.ndim == 1:
+        y = y[:,None]
+    elif x.ndim == 1 and y.ndim == 2:
+        x = x[:,None]
+    nobs = x.shape[0]
+    if nlags is None:
+        nlags = nobs - 1
+    nlags = min(nlags, nobs - 1)
+    if demean:
+        xo = x - x.mean(0)
+        yo = y - y.mean(0)
+    else:
+        xo = x
+        yo = y
+    ccov = _lagged_crossprod(xo, yo, nlags, fft)
+    if unbiased:
+        d = nobs - np.arange(nlags+1.)
+        if ccov.ndim == 2:
+            d = d[:,None]
+    else:
+        d = nobs
+    return ccov / d
+
+def ccf_batch(x, y, unbiased=True, fft=None, nlags=None):
+    '''cross-correlation function for each pair of columns of x and y
+
+    Parameters
+    ----------
+    x, y : arrays
+       time series data, observations in rows, see ccovf_batch
+    unbiased : boolean
+       if True, then denominators for autocovariance is n-k, otherwise n
+    fft : bool or None
+        If True, use FFT convolution, if False, use direct summation. If None
+        (default), then the method is chosen based on the size of the
+        problem.
+    nlags : int or None
+        Largest lag for which the crosscorrelation is returned.
+
+    Returns
+    -------
+    ccf : array
+        cross-correlation function, lags in rows
+    '''
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    cvf = ccovf_batch(x, y, unbiased=unbiased, demean=True, fft=fft,
+                      nlags=nlags)
+    return cvf / (np.std(x, 0) * np.std(y, 0))
+
+
 def periodogram(X):
     """
     Returns the periodogram for the natural frequency of X
@@ -912,8 +1421,75 @@ def coint(y1, y2, regression="c"):
     crit_value = mackinnoncrit(N=1, regression="c", nobs=len(y1))
     return coint_t, pvalue, crit_value
 
+def coint_batch(y1, y2, regression="c"):
+    """
+    Cointegration test for each column of y1 against y2
+
+    This computes the same statistic as coint for many bivariate systems
+    at once, using closed form simple regressions for both stages.
+
+    Parameters
+    ----------
+    y1 : array_like, 1d or 2d
+        first element in cointegrating vector, one system per column
+    y2 : array_like, 1d or 2d
+        second element in cointegrating vector. If 1d, then it is used for
+        all columns of y1, otherwise it needs to have the same shape as y1
+        and the columns are paired.
+    regression : str {'c', 'nc'}
+        * 'c' : Constant included in the first stage regression
+        * 'nc' : no constant
+
+    Returns
+    -------
+    coint_t : ndarray
+        t-statistic of unit-root test on residuals
+    pvalue : ndarray
+        MacKinnon's approximate p-value based on MacKinnon (1994)
+    crit_value : ndarray
+        Critical values for the test statistic at the 1 %, 5 %, and 10 %
+        levels.
+
+    See Also
+    --------
+    coint
+    """
+    regression = regression.lower()
+    if regression not in ['c','nc','ct','ctt']:
+        raise ValueError("regression option %s not understood" % regression)
+    y1 = np.asarray(y1, dtype=float)
+    y2 = np.asarray(y2, dtype=float)
+    if y1.ndim == 1:
+        y1 = y1[:,None]
+    if y2.ndim == 1:
+        y2 = y2[:,None]
+    if y2.shape[1] not in (1, y1.shape[1]) or len(y2) != len(y1):
+        raise ValueError("y2 needs to be 1d or have the same shape as y1")
+    nobs = y1.shape[0]
+
+    # stage one: regress y1 on y2
+    if regression == 'c':
+        y1 = y1 - y1.mean(0)
+        y2 = y2 - y2.mean(0)
+    beta = (y1 * y2).sum(0) / (y2**2).sum(0)
+    st1_resid = y1 - y2 * beta
+
+    # stage two: regress resid on lagged resid and constant
+    e1 = st1_resid[1:]
+    e0 = st1_resid[:-1] - st1_resid[:-1].mean(0)
+    e0ss = (e0**2).sum(0)
+    rho = (e0 * e1).sum(0) / e0ss
+    uresid = e1 - e1.mean(0) - e0 * rho
+    scale = (uresid**2).sum(0) / (nobs - 1 - 2)
+    coint_t = (rho - 1) / np.sqrt(scale / e0ss)
+    pvalue = mackinnonp(coint_t, regression="c", N=2, lags=None)
+    crit_value = mackinnoncrit(N=1, regression="c", nobs=nobs)
+    return coint_t, pvalue, crit_value
+
 __all__ = ['acovf', 'acf', 'pacf', 'pacf_yw', 'pacf_ols', 'ccovf', 'ccf',
-           'periodogram', 'q_stat', 'coint']
+           'acovf_batch', 'acf_batch', 'pacf_batch', 'ccovf_batch',
+           'ccf_batch', 'periodogram', 'q_stat', 'coint', 'adfuller_batch',
+           'coint_batch']
 
 if __name__=="__main__":
     import statsmodels.api as sm
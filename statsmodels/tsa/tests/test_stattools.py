@@ -1,6 +1,14 @@
 from statsmodels.tsa.stattools import (adfuller, acf, pacf_ols, pacf_yw,
                                                pacf, grangercausalitytests,
-                                               coint, acovf)
+                                               coint, acovf, ccovf, ccf,
+                                               q_stat, acovf_batch, acf_batch,
+                                               pacf_batch, ccovf_batch,
+                                               ccf_batch, adfuller_batch,
+                                               coint_batch, _autolag,
+                                               _autolag_ols)
+from statsmodels.tsa.adfvalues import mackinnonp
+from statsmodels.tsa.tsatools import lagmat, add_trend
+from statsmodels.regression.linear_model import OLS
 from statsmodels.tsa.base.datetools import dates_from_range
 import numpy as np
 from numpy.testing import assert_almost_equal, assert_equal, assert_raises
@@ -214,6 +222,72 @@ class TestCoint_t(CheckCoint):
         self.teststat = -1.8208817
 
 
+def test_autolag_ols():
+    x = np.log(macrodata.load().data['realgdp'])
+    maxlag = 8
+    xdiff = np.diff(x)
+    xdall = lagmat(xdiff[:,None], maxlag, trim='both', original='in')
+    nobs = xdall.shape[0]
+    xdall[:,0] = x[-nobs-1:-1]
+    xdshort = xdiff[-nobs:]
+    for regression in ['c', 'ct', 'ctt']:
+        fullRHS = add_trend(xdall, regression, prepend=True)
+        startlag = fullRHS.shape[1] - xdall.shape[1] + 1
+        for method in ['aic', 'bic', 't-stat']:
+            res1 = _autolag_ols(xdshort, fullRHS, startlag, maxlag, method)
+            res2 = _autolag(OLS, xdshort, fullRHS, startlag, maxlag, method)
+            assert_almost_equal(res1[0], res2[0], DECIMAL_8)
+            assert_equal(res1[1], res2[1])
+
+class TestADFBatch(object):
+    def __init__(self):
+        mdata = macrodata.load().data
+        self.x = np.column_stack((np.log(mdata['realgdp']), mdata['infl'],
+                                  mdata['realint']))
+
+    def test_adfuller(self):
+        x = self.x
+        for regression in ['nc', 'c', 'ct', 'ctt']:
+            for autolag in ['aic', 'bic', None]:
+                res1 = adfuller_batch(x, regression=regression,
+                                      autolag=autolag)
+                for i in range(x.shape[1]):
+                    res2 = adfuller(x[:,i], regression=regression,
+                                    autolag=autolag)
+                    assert_almost_equal(res1[0][i], res2[0], DECIMAL_8)
+                    assert_almost_equal(res1[1][i], res2[1], DECIMAL_8)
+                    assert_equal(res1[2][i], res2[2])
+                    assert_equal(res1[3][i], res2[3])
+                    for level in ['1%', '5%', '10%']:
+                        assert_almost_equal(res1[4][level][i],
+                                            res2[4][level], DECIMAL_8)
+                    if autolag is not None:
+                        assert_almost_equal(res1[5][i], res2[5], DECIMAL_8)
+
+    def test_n_jobs(self):
+        res1 = adfuller_batch(self.x, maxlag=4, n_jobs=2)
+        res2 = adfuller_batch(self.x, maxlag=4)
+        for r1, r2 in zip(res1[:4] + res1[5:], res2[:4] + res2[5:]):
+            assert_almost_equal(r1, r2, DECIMAL_8)
+
+    def test_mackinnonp(self):
+        stats = np.array([-30., -3.5, -2., 0.5, 3.])
+        res = mackinnonp(stats, regression='c')
+        assert_almost_equal(res, [mackinnonp(st) for st in stats], DECIMAL_8)
+
+def test_coint_batch():
+    mdata = macrodata.load().data
+    y1 = np.column_stack((mdata['realcons'], mdata['realinv']))
+    y2 = mdata['realgdp']
+    res1 = coint_batch(y1, y2)
+    for i in range(2):
+        res2 = coint(y1[:,i], y2)
+        assert_almost_equal(res1[0][i], res2[0], DECIMAL_8)
+        assert_almost_equal(res1[1][i], res2[1], DECIMAL_8)
+        assert_almost_equal(res1[2], res2[2], DECIMAL_8)
+    res3 = coint_batch(y1, np.column_stack((y2, y2)))
+    assert_almost_equal(res3[0], res1[0], DECIMAL_8)
+
 def test_grangercausality():
     # some example data
     mdata = macrodata.load().data
@@ -241,6 +315,76 @@ def test_acovf2d():
     X = np.random.random((10,2))
     assert_raises(ValueError, acovf, X)
 
+class TestBatch(object):
+    """
+    Batched acovf, acf, pacf and ccf compared to the single series versions
+    """
+    def __init__(self):
+        mdata = macrodata.load().data
+        self.x = np.column_stack((mdata['realgdp'], mdata['infl'],
+                                  mdata['realint']))
+
+    def test_acovf(self):
+        x = self.x
+        for unbiased in [False, True]:
+            res2 = np.column_stack([acovf(xi, unbiased=unbiased)
+                                    for xi in x.T])
+            for fft in [True, False, None]:
+                res1 = acovf_batch(x, unbiased=unbiased, fft=fft)
+                assert_almost_equal(res1 / res2[0], res2 / res2[0],
+                                    DECIMAL_8)
+            res1 = acovf_batch(x, unbiased=unbiased, nlags=5)
+            assert_almost_equal(res1, res2[:6], DECIMAL_8)
+        assert_almost_equal(acovf_batch(x[:,1]), acovf(x[:,1]), DECIMAL_8)
+
+    def test_acf(self):
+        x = self.x
+        acf1, confint1, qstat1, pvalue1 = acf_batch(x, nlags=20, qstat=True,
+                                                    alpha=.05)
+        for i in range(x.shape[1]):
+            acf2, confint2, qstat2, pvalue2 = acf(x[:,i], nlags=20,
+                                                  qstat=True, alpha=.05)
+            assert_almost_equal(acf1[:,i], acf2, DECIMAL_8)
+            assert_almost_equal(confint1[:,i], confint2, DECIMAL_8)
+            assert_almost_equal(qstat1[:,i], qstat2, DECIMAL_8)
+            assert_almost_equal(pvalue1[:,i], pvalue2, DECIMAL_8)
+        res = acf_batch(x, nlags=20, unbiased=True, fft=True)
+        assert_almost_equal(res[:,0], acf(x[:,0], nlags=20, unbiased=True),
+                            DECIMAL_8)
+
+    def test_pacf(self):
+        x = self.x
+        for method in ['ols', 'yw', 'ywm', 'ldb', 'ldu']:
+            res1, confint1 = pacf_batch(x, nlags=10, method=method,
+                                        alpha=.05)
+            for i in range(x.shape[1]):
+                res2, confint2 = pacf(x[:,i], nlags=10, method=method,
+                                      alpha=.05)
+                assert_almost_equal(res1[:,i], res2, DECIMAL_8)
+                assert_almost_equal(confint1[:,i], confint2, DECIMAL_8)
+        assert_raises(ValueError, pacf_batch, x, method='none')
+
+    def test_ccf(self):
+        x = self.x
+        for fft in [True, False]:
+            res1 = ccovf_batch(x, x[:,0], fft=fft)
+            res2 = ccf_batch(x, x[::-1], fft=fft, unbiased=False)
+            for i in range(x.shape[1]):
+                assert_almost_equal(res1[:,i] / res1[0,i],
+                                    ccovf(x[:,i], x[:,0]) / res1[0,i],
+                                    DECIMAL_8)
+                assert_almost_equal(res2[:,i],
+                                    ccf(x[:,i], x[::-1,i], unbiased=False),
+                                    DECIMAL_8)
+
+def test_qstat_2d():
+    acfs = np.array([[.5, .1], [.3, .2], [.1, -.3]])
+    qstat, pvalue = q_stat(acfs, nobs=50)
+    for i in range(2):
+        qstat1, pvalue1 = q_stat(acfs[:,i], nobs=50)
+        assert_almost_equal(qstat[:,i], qstat1, DECIMAL_8)
+        assert_almost_equal(pvalue[:,i], pvalue1, DECIMAL_8)
+
 if __name__=="__main__":
     import nose
 #    nose.runmodule(argv=[__file__, '-vvs','-x','-pdb'], exit=False)
@@ -266,7 +266,7 @@ class IRAnalysis(BaseIRAnalysis):
         return covs
 
     def errband_mc(self, orth=False, svar=False, repl=1000,
-                   signif=0.05, seed=None, burn=100):
+                   signif=0.05, seed=None, burn=100, n_jobs=1):
         """
         IRF Monte Carlo integrated error bands
         """
@@ -279,9 +279,10 @@ class IRAnalysis(BaseIRAnalysis):
         else:
             return model.irf_errband_mc(orth=orth, repl=repl, T=periods,
                                         signif=signif, seed=seed,
-                                        burn=burn, cum=False)
+                                        burn=burn, cum=False, n_jobs=n_jobs)
     def err_band_sz1(self, orth=False, svar=False, repl=1000,
-                     signif=0.05, seed=None, burn=100, component=None):
+                     signif=0.05, seed=None, burn=100, component=None,
+                     n_jobs=1):
         """
         IRF Sims-Zha error band method 1. Assumes symmetric error bands around
         mean.
@@ -302,6 +303,8 @@ class IRAnalysis(BaseIRAnalysis):
             Index of column of eigenvector/value to use for each error band
             Note: period of impulse (t=0) is not included when computing
             principle component
+        n_jobs : int, default 1
+            Number of processes used for the Monte Carlo replications
 
         References
         ----------
@@ -319,7 +322,7 @@ class IRAnalysis(BaseIRAnalysis):
             irfs = self.irfs
         neqs = self.neqs
         irf_resim = model.irf_resim(orth=orth, repl=repl, T=periods, seed=seed,
-                                   burn=100)
+                                   burn=burn, n_jobs=n_jobs)
         q = util.norm_signif_level(signif)
 
         W, eigva, k =self._eigval_decomp_SZ(irf_resim)
@@ -344,7 +347,8 @@ class IRAnalysis(BaseIRAnalysis):
         return lower, upper
 
     def err_band_sz2(self, orth=False, repl=1000, signif=0.05,
-                     seed=None, burn=100, component=None):
+                     seed=None, burn=100, component=None, svar=False,
+                     n_jobs=1):
         """
         IRF Sims-Zha error band method 2.
 
@@ -366,6 +370,8 @@ class IRAnalysis(BaseIRAnalysis):
             Index of column of eigenvector/value to use for each error band
             Note: period of impulse (t=0) is not included when computing
             principle component
+        n_jobs : int, default 1
+            Number of processes used for the Monte Carlo replications
 
         References
         ----------
@@ -382,7 +388,7 @@ class IRAnalysis(BaseIRAnalysis):
             irfs = self.irfs
         neqs = self.neqs
         irf_resim = model.irf_resim(orth=orth, repl=repl, T=periods, seed=seed,
-                                   burn=100)
+                                   burn=burn, n_jobs=n_jobs)
 
         W, eigva, k = self._eigval_decomp_SZ(irf_resim)
 
@@ -394,14 +400,16 @@ class IRAnalysis(BaseIRAnalysis):
             else:
                 k = component
 
+        # eigenvector of the chosen component for each response, periods last
+        k = np.asarray(k, dtype=int)
+        idx = np.arange(neqs)
+        Wk = W[idx[:,None], idx, k]
         gamma = np.zeros((repl, periods+1, neqs, neqs))
-        for p in xrange(repl):
-            for i in xrange(neqs):
-                for j in xrange(neqs):
-                    gamma[p,1:,i,j] = W[i,j,k[i,j],:] * irf_resim[p,1:,i,j]
+        gamma[:,1:] = Wk.transpose(2, 0, 1) * irf_resim[:,1:]
 
         gamma_sort = np.sort(gamma, axis=0) #sort to get quantiles
-        indx = round(signif/2*repl)-1,round((1-signif/2)*repl)-1
+        indx = (int(round(signif/2*repl)-1),
+                int(round((1-signif/2)*repl)-1))
 
         lower = np.copy(irfs)
         upper = np.copy(irfs)
@@ -413,7 +421,8 @@ class IRAnalysis(BaseIRAnalysis):
         return lower, upper
 
     def err_band_sz3(self, orth=False, repl=1000, signif=0.05,
-                     seed=None, burn=100, component=None):
+                     seed=None, burn=100, component=None, svar=False,
+                     n_jobs=1):
         """
         IRF Sims-Zha error band method 3. Does not assume symmetric error bands around mean.
 
@@ -433,6 +442,8 @@ class IRAnalysis(BaseIRAnalysis):
             Index of column of eigenvector/value to use for each error band
             Note: period of impulse (t=0) is not included when computing
             principle component
+        n_jobs : int, default 1
+            Number of processes used for the Monte Carlo replications
 
         References
         ----------
@@ -450,14 +461,10 @@ class IRAnalysis(BaseIRAnalysis):
             irfs = self.irfs
         neqs = self.neqs
         irf_resim = model.irf_resim(orth=orth, repl=repl, T=periods, seed=seed,
-                                   burn=100)
-        stack = np.zeros((neqs, repl, periods*neqs))
-
+                                   burn=burn, n_jobs=n_jobs)
         #stack left to right, up and down
-
-        for p in xrange(repl):
-            for i in xrange(neqs):
-                stack[i, p,:] = np.ravel(irf_resim[p,1:,:,i].T)
+        stack = irf_resim[:,1:].transpose(3, 0, 2, 1).reshape(neqs, repl,
+                                                               periods*neqs)
 
         stack_cov=np.zeros((neqs, periods*neqs, periods*neqs))
         W = np.zeros((neqs, periods*neqs, periods*neqs))
@@ -477,17 +484,15 @@ class IRAnalysis(BaseIRAnalysis):
             stack_cov[i] = np.cov(stack[i],rowvar=0)
             W[i], eigva[i], k[i] = util.eigval_decomp(stack_cov[i])
 
+        # Wk[t,i,j] is the weight of period t of response i to shock j
+        k = np.asarray(k, dtype=int)
+        Wk = W[np.arange(neqs), k].reshape(neqs, neqs, periods)
         gamma = np.zeros((repl, periods+1, neqs, neqs))
-        for p in xrange(repl):
-            c=0
-            for j in xrange(neqs):
-                for i in xrange(neqs):
-                        gamma[p,1:,i,j] = W[j,k[j],i*periods:(i+1)*periods] * irf_resim[p,1:,i,j]
-                        if i == neqs-1:
-                            gamma[p,1:,i,j] = W[j,k[j],i*periods:] * irf_resim[p,1:,i,j]
+        gamma[:,1:] = Wk.transpose(2, 1, 0) * irf_resim[:,1:]
 
         gamma_sort = np.sort(gamma, axis=0) #sort to get quantiles
-        indx = round(signif/2*repl)-1,round((1-signif/2)*repl)-1
+        indx = (int(round(signif/2*repl)-1),
+                int(round((1-signif/2)*repl)-1))
 
         lower = np.copy(irfs)
         upper = np.copy(irfs)
@@ -625,14 +630,15 @@ class IRAnalysis(BaseIRAnalysis):
         return covs
 
     def cum_errband_mc(self, orth=False, repl=1000,
-                          signif=0.05, seed=None, burn=100):
+                          signif=0.05, seed=None, burn=100, n_jobs=1):
         """
         IRF Monte Carlo integrated error bands of cumulative effect
         """
         model = self.model
         periods = self.periods
         return model.irf_errband_mc(orth=orth, repl=repl,
-                                    T=periods, signif=signif, seed=seed, burn=burn, cum=True)
+                                    T=periods, signif=signif, seed=seed, burn=burn, cum=True,
+                                    n_jobs=n_jobs)
 
     def lr_effect_cov(self, orth=False):
         """
@@ -23,6 +23,7 @@ from statsmodels.compatnp.py3k import BytesIO
 from numpy.testing import assert_almost_equal, assert_equal, assert_
 
 DECIMAL_12 = 12
+DECIMAL_10 = 10
 DECIMAL_6 = 6
 DECIMAL_5 = 5
 DECIMAL_4 = 4
@@ -371,6 +372,22 @@ class TestVARResults(CheckIRF, CheckFEVD):
         model = VAR(self.model.endog)
         model.select_order()
 
+    def test_lag_order_ics(self):
+        maxlags = 6
+        for trend in ['c', 'ct']:
+            ics = self.model._lag_order_ics(maxlags, trend=trend)
+            for p in range(maxlags + 1):
+                res = self.model._estimate_var(p, offset=maxlags-p,
+                                               trend=trend)
+                for k, v in res.info_criteria.iteritems():
+                    assert_almost_equal(ics[k][p], v, DECIMAL_10)
+
+    def test_get_var_endog(self):
+        y = self.res.y
+        z = util.get_var_endog(y, 3, trend='nc')
+        z2 = np.array([y[t-3 : t][::-1].ravel() for t in range(3, len(y))])
+        assert_equal(z, z2)
+
     def test_is_stable(self):
         # may not necessarily be true for other datasets
         assert(self.res.is_stable(verbose=True))
@@ -441,6 +458,41 @@ class TestVARResults(CheckIRF, CheckFEVD):
         assert_almost_equal(res2.bic, res3.bic)
         assert_almost_equal(res2.stderr, res3.stderr)
 
+    def test_estimate_var_batch(self):
+        res = self.res
+        sims = util.varsim(res.coefs, res.intercept, res.sigma_u, steps=150,
+                           seed=np.random.RandomState(12345),
+                           nsimulations=3)
+        coefs, sigma_u = model._estimate_var_batch(sims, self.p)
+        ma_reps = model._ma_rep_batch(coefs, maxn=5)
+        for i in range(3):
+            res_sim = VAR(sims[i]).fit(maxlags=self.p)
+            assert_almost_equal(coefs[i], res_sim.coefs, DECIMAL_10)
+            assert_almost_equal(sigma_u[i], res_sim.sigma_u, DECIMAL_10)
+            assert_almost_equal(ma_reps[i], res_sim.ma_rep(maxn=5),
+                                DECIMAL_10)
+
+    def test_irf_resim(self):
+        res = self.res
+        resim1 = res.irf_resim(orth=True, repl=150, T=5, seed=987,
+                               chunksize=40)
+        assert_equal(resim1.shape, (150, 6, self.k, self.k))
+        resim2 = res.irf_resim(orth=True, repl=150, T=5, seed=987,
+                               chunksize=40, n_jobs=2)
+        assert_almost_equal(resim1, resim2, DECIMAL_10)
+        resim_cum = res.irf_resim(orth=True, repl=150, T=5, seed=987,
+                                  chunksize=40, cum=True)
+        assert_almost_equal(resim_cum, resim1.cumsum(1), DECIMAL_10)
+        # orthogonalized responses at impact are the cholesky factors
+        assert_(np.allclose(np.triu(resim1[:,0], 1), 0))
+
+        lower, upper = res.irf_errband_mc(repl=100, T=5, seed=987)
+        assert_((lower <= upper).all())
+        lower2, upper2 = self.irf.err_band_sz2(orth=True, repl=100, seed=1)
+        lower3, upper3 = self.irf.err_band_sz3(orth=True, repl=100, seed=1)
+        assert_((lower2 <= upper2).all())
+        assert_((lower3 <= upper3).all())
+
     def test_pickle(self):
         from statsmodels.compatnp.py3k import BytesIO
         fh = BytesIO()
@@ -23,7 +23,10 @@ def get_var_endog(y, lags, trend='c'):
     """
     nobs = len(y)
     # Ravel C order, need to put in descending order
-    Z = np.array([y[t-lags : t][::-1].ravel() for t in xrange(lags, nobs)])
+    # row t is y[t-lags : t][::-1].ravel(), stacked by lag instead of by row
+    Z = np.zeros((nobs - lags, 0))
+    if lags > 0:
+        Z = np.column_stack([y[lags-i : nobs-i] for i in range(1, lags+1)])
 
     # Add constant, trend, etc.
     if trend != 'nc':
@@ -184,15 +187,36 @@ def acf_to_acorr(acf):
     return acf / np.sqrt(np.outer(diag, diag))
 
 
-def varsim(coefs, intercept, sig_u, steps=100, initvalues=None, seed=None):
+def varsim(coefs, intercept, sig_u, steps=100, initvalues=None, seed=None,
+           nsimulations=None):
     """
     Simulate simple VAR(p) process with known coefficients, intercept, white
     noise covariance, etc.
+
+    If seed is a RandomState instance, then it is used to draw the errors,
+    otherwise seed is used to seed the global numpy random state.
+
+    If nsimulations is not None, then an array (nsimulations x steps x k)
+    of independent simulations is returned. The replications are generated
+    together, the recursion loops only over time periods.
     """
-    if seed is not None:
-        np.random.seed(seed=seed)
-    from numpy.random import multivariate_normal as rmvnorm
+    if isinstance(seed, np.random.RandomState):
+        rmvnorm = seed.multivariate_normal
+    else:
+        if seed is not None:
+            np.random.seed(seed=seed)
+        from numpy.random import multivariate_normal as rmvnorm
     p, k, k = coefs.shape
+    if nsimulations is not None:
+        ugen = rmvnorm(np.zeros(len(sig_u)), sig_u, (nsimulations, steps))
+        result = np.zeros((nsimulations, steps, k))
+        result[:, p:] = intercept + ugen[:, p:]
+        for t in xrange(p, steps):
+            ygen = result[:, t]
+            for j in xrange(p):
+                ygen += np.dot(result[:, t-j-1], coefs[j].T)
+        return result
+
     ugen = rmvnorm(np.zeros(len(sig_u)), sig_u, steps)
     result = np.zeros((steps, k))
     result[p:] = intercept + ugen[p:]
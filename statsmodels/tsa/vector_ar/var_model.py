@@ -76,6 +76,78 @@ def ma_rep(coefs, maxn=10):
 
     return phis
 
+def _ma_rep_batch(coefs, maxn=10):
+    """
+    MA(\infty) representation for a stack of VAR(p) coefficient arrays
+
+    coefs is (nsim x p x k x k), returns phis (nsim x maxn + 1 x k x k), see
+    ma_rep.
+    """
+    nsim, p, k, k = coefs.shape
+    phis = np.zeros((nsim, maxn+1, k, k))
+    phis[:, 0] = np.eye(k)
+
+    # recursively compute Phi matrices
+    for i in xrange(1, maxn + 1):
+        for j in xrange(1, min(i, p) + 1):
+            phis[:, i] += np.einsum('nij,njk->nik', phis[:, i-j],
+                                    coefs[:, j-1])
+
+    return phis
+
+def _estimate_var_batch(y, lags):
+    """
+    OLS estimation of VAR(p) processes with constant for a stack of samples
+
+    Parameters
+    ----------
+    y : ndarray (nsim x nobs x k)
+    lags : int
+
+    Returns
+    -------
+    coefs : ndarray (nsim x lags x k x k)
+    sigma_u : ndarray (nsim x k x k)
+        Estimates as in VAR(y[i]).fit(lags), computed by stacked least
+        squares without creating model or results instances.
+    """
+    nsim, nobs, k = y.shape
+    y_sample = y[:, lags:]
+    z = np.concatenate([np.ones((nsim, nobs - lags, 1))] +
+                       [y[:, lags-i:nobs-i] for i in range(1, lags+1)],
+                       axis=2)
+    zz = np.einsum('nti,ntj->nij', z, z)
+    zy = np.einsum('nti,ntj->nij', z, y_sample)
+    params = np.linalg.solve(zz, zy)
+    resid = y_sample - np.einsum('nti,nij->ntj', z, params)
+
+    df_resid = nobs - lags - (k * lags + 1)
+    sigma_u = np.einsum('nti,ntj->nij', resid, resid) / df_resid
+    coefs = params[:, 1:].reshape((nsim, lags, k, k)).swapaxes(2, 3)
+    return coefs, sigma_u
+
+def _irf_resim_chunk(coefs, intercept, sigma_u, nobs, T, orth, cum, burn,
+                     repl, seed):
+    """
+    Simulate and reestimate repl VAR processes, returns their (orth) ma_rep
+
+    Module level function so that chunks can be sent to worker processes.
+    """
+    rs = np.random.RandomState(seed)
+    k_ar = len(coefs)
+    sim = util.varsim(coefs, intercept, sigma_u, steps=nobs+burn, seed=rs,
+                      nsimulations=repl)
+    #discard first burn to eliminate correct for starting bias
+    sim = sim[:, burn:]
+    coefs_sim, sigma_sim = _estimate_var_batch(sim, k_ar)
+    ma_coll = _ma_rep_batch(coefs_sim, maxn=T)
+    if orth:
+        P = npl.cholesky(sigma_sim)
+        ma_coll = np.einsum('ntij,njk->ntik', ma_coll, P)
+    if cum:
+        ma_coll = ma_coll.cumsum(axis=1)
+    return ma_coll
+
 def is_stable(coefs, verbose=False):
     """
     Determine stability of VAR(p) system by examining the eigenvalues of the
@@ -485,6 +557,58 @@ class VAR(tsbase.TimeSeriesModel):
                           trend=trend, dates=self.data.dates, model=self)
         return VARResultsWrapper(varfit)
 
+    def _lag_order_ics(self, maxlags, trend='c'):
+        """
+        Information criteria for all lag orders from 0 to maxlags
+
+        Returns a dict {info_crit -> list of values by lag order}, the same
+        values as the info_criteria of ``self._estimate_var(p,
+        offset=maxlags-p)``.
+
+        Notes
+        -----
+        All lag orders are estimated on the same observations and the
+        regressors of lag order p are the leading columns of the design for
+        maxlags. The lagged design is built and decomposed by QR only once,
+        the residual cross products of shorter lag orders are obtained by
+        adding back the contributions of the dropped lags, one block of neqs
+        rows of Q'y at a time.
+        """
+        k_trend = util.get_trendorder(trend)
+        neqs = self.neqs
+        y = self.y
+        z = util.get_var_endog(y, maxlags, trend=trend)
+        y_sample = y[maxlags:]
+        nobs = len(y_sample)
+
+        q, r = np.linalg.qr(z)
+        qy = np.dot(q.T, y_sample)
+        resid = y_sample - np.dot(q, qy)
+        sse = np.dot(resid.T, resid)
+
+        ics = defaultdict(list)
+        for p in range(maxlags, -1, -1):
+            if p < maxlags:
+                block = qy[k_trend + neqs*p : k_trend + neqs*(p+1)]
+                sse = sse + np.dot(block.T, block)
+
+            df_model = neqs * p + k_trend
+            df_resid = nobs - df_model
+            free_params = p * neqs ** 2 + neqs * k_trend
+            ld = util.get_logdet(sse / nobs)
+
+            # See Lutkepohl pp. 146-150, same as VARResults.info_criteria
+            ics['aic'].append(ld + (2. / nobs) * free_params)
+            ics['bic'].append(ld + (np.log(nobs) / nobs) * free_params)
+            ics['hqic'].append(ld + (2. * np.log(np.log(nobs)) / nobs) *
+                               free_params)
+            ics['fpe'].append(((nobs + df_model) / df_resid) ** neqs *
+                              np.exp(ld))
+
+        for v in ics.itervalues():
+            v.reverse()
+        return ics
+
     def select_order(self, maxlags=None, verbose=True):
         """
         Compute lag order selections based on each of the available information
@@ -504,14 +628,7 @@ class VAR(tsbase.TimeSeriesModel):
         if maxlags is None:
             maxlags = int(round(12*(len(self.endog)/100.)**(1/4.)))
 
-        ics = defaultdict(list)
-        for p in range(maxlags + 1):
-            # exclude some periods to same amount of data used for each lag
-            # order
-            result = self._estimate_var(p, offset=maxlags-p)
-
-            for k, v in result.info_criteria.iteritems():
-                ics[k].append(v)
+        ics = self._lag_order_ics(maxlags)
 
         selected_orders = dict((k, mat(v).argmin())
                                for k, v in ics.iteritems())
@@ -1062,7 +1179,8 @@ class VARResults(VARProcess):
 
     #Monte Carlo irf standard errors
     def irf_errband_mc(self, orth=False, repl=1000, T=10,
-                       signif=0.05, seed=None, burn=100, cum=False):
+                       signif=0.05, seed=None, burn=100, cum=False,
+                       n_jobs=1):
         """
         Compute Monte Carlo integrated error bands assuming normally
         distributed for impulse response functions
@@ -1078,11 +1196,13 @@ class VARResults(VARProcess):
         signif: float (0 < signif <1)
             Significance level for error bars, defaults to 95% CI
         seed: int
-            np.random.seed for replications
+            seed for the random number generator of the replications
         burn: int
             number of initial observations to discard for simulation
         cum: bool, default False
             produce cumulative irf error bands
+        n_jobs : int, default 1
+            Number of processes to use for the replications, see irf_resim
 
         Notes
         -----
@@ -1093,44 +1213,19 @@ class VARResults(VARProcess):
         Tuple of lower and upper arrays of ma_rep monte carlo standard errors
 
         """
-        neqs = self.neqs
-        mean = self.mean()
-        k_ar = self.k_ar
-        coefs = self.coefs
-        sigma_u = self.sigma_u
-        intercept = self.intercept
-        df_model = self.df_model
-        nobs = self.nobs
-
-        ma_coll = np.zeros((repl, T+1, neqs, neqs))
-
-        if (orth == True and cum == True):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              orth_ma_rep(maxn=T).cumsum(axis=0)
-        elif (orth == True and cum == False):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              orth_ma_rep(maxn=T)
-        elif (orth == False and cum == True):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              ma_rep(maxn=T).cumsum(axis=0)
-        elif (orth == False and cum == False):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              ma_rep(maxn=T)
-
-        for i in range(repl):
-            #discard first hundred to eliminate correct for starting bias
-            sim = util.varsim(coefs, intercept, sigma_u, steps=nobs+burn)
-            sim = sim[burn:]
-            ma_coll[i,:,:,:] = fill_coll(sim)
+        ma_coll = self.irf_resim(orth=orth, repl=repl, T=T, seed=seed,
+                                 burn=burn, cum=cum, n_jobs=n_jobs)
 
         ma_sort = np.sort(ma_coll, axis=0) #sort to get quantiles
-        index = round(signif/2*repl)-1,round((1-signif/2)*repl)-1
+        index = (int(round(signif/2*repl)-1),
+                 int(round((1-signif/2)*repl)-1))
         lower = ma_sort[index[0],:, :, :]
         upper = ma_sort[index[1],:, :, :]
         return lower, upper
 
     def irf_resim(self, orth=False, repl=1000, T=10,
-                      seed=None, burn=100, cum=False):
+                      seed=None, burn=100, cum=False, n_jobs=1,
+                      chunksize=100):
 
         """
         Simulates impulse response function, returning an array of simulations.
@@ -1144,57 +1239,56 @@ class VARResults(VARProcess):
             number of Monte Carlo replications to perform
         T: int, default 10
             number of impulse response periods
-        signif: float (0 < signif <1)
-            Significance level for error bars, defaults to 95% CI
         seed: int
-            np.random.seed for replications
+            seed for the random number generator of the replications. If
+            None, then the seeds of the chunks are drawn from the global
+            numpy random state.
         burn: int
             number of initial observations to discard for simulation
         cum: bool, default False
             produce cumulative irf error bands
+        n_jobs : int, default 1
+            Number of processes for the chunks of replications. -1 uses all
+            cpus. Requires joblib, otherwise the chunks run sequentially.
+        chunksize : int, default 100
+            Number of replications that are simulated and estimated together.
 
         Notes
         -----
         Sims, Christoper A., and Tao Zha. 1999. "Error Bands for Impulse Response." Econometrica 67: 1113-1155.
 
+        The replications are simulated, estimated by least squares and their
+        moving average representation computed in stacked arrays of
+        chunksize replications, without creating VAR instances. Each chunk
+        uses its own random state seeded from `seed`, so the results do not
+        depend on n_jobs.
+
         Returns
         -------
         Array of simulated impulse response functions
 
         """
-        neqs = self.neqs
-        mean = self.mean()
-        k_ar = self.k_ar
-        coefs = self.coefs
-        sigma_u = self.sigma_u
-        intercept = self.intercept
-        df_model = self.df_model
-        nobs = self.nobs
-        if seed is not None:
-            np.random.seed(seed=seed)
-
-        ma_coll = np.zeros((repl, T+1, neqs, neqs))
-
-        if (orth == True and cum == True):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              orth_ma_rep(maxn=T).cumsum(axis=0)
-        elif (orth == True and cum == False):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              orth_ma_rep(maxn=T)
-        elif (orth == False and cum == True):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              ma_rep(maxn=T).cumsum(axis=0)
-        elif (orth == False and cum == False):
-            fill_coll = lambda sim : VAR(sim).fit(maxlags=k_ar).\
-                              ma_rep(maxn=T)
-
-        for i in range(repl):
-            #discard first hundred to eliminate correct for starting bias
-            sim = util.varsim(coefs, intercept, sigma_u, steps=nobs+burn)
-            sim = sim[burn:]
-            ma_coll[i,:,:,:] = fill_coll(sim)
-
-        return ma_coll
+        if seed is None:
+            rs = np.random
+        else:
+            rs = np.random.RandomState(seed)
+        nchunks = int(np.ceil(repl / chunksize))
+        seeds = rs.randint(0, 2**31 - 1, size=nchunks)
+        sizes = [min(chunksize, repl - i * chunksize) for i in range(nchunks)]
+        args = (self.coefs, self.intercept, self.sigma_u, self.nobs, T,
+                orth, cum, burn)
+
+        if n_jobs == 1 or nchunks == 1:
+            ma_coll = [_irf_resim_chunk(*(args + (size, chunk_seed)))
+                       for size, chunk_seed in zip(sizes, seeds)]
+        else:
+            from statsmodels.tools.parallel import parallel_func
+            parallel, p_func, n_jobs = parallel_func(_irf_resim_chunk,
+                                                     n_jobs=n_jobs, verbose=0)
+            ma_coll = parallel(p_func(*(args + (size, chunk_seed)))
+                               for size, chunk_seed in zip(sizes, seeds))
+
+        return np.concatenate(ma_coll)
 
 
     def _omega_forc_cov(self, steps):